@@ -30,7 +30,7 @@ from .fpdf import (
     FPDF_VERSION as _FPDF_VERSION,
     TitleStyle,
 )
-from .html import HTML2FPDF, HTMLMixin
+from .html import HTML2FPDF, HTMLMixin, HTMLProgram
 from .prefs import ViewerPreferences
 from .template import FlexTemplate, Template
 from .util import get_scale_factor
@@ -79,6 +79,7 @@ __all__ = [
     "YPos",
     "Template",
     "FlexTemplate",
+    "HTMLProgram",
     "TitleStyle",
     "TextStyle",
     "ViewerPreferences",
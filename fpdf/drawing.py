@@ -9,6 +9,7 @@ Usage documentation at: <https://py-pdf.github.io/fpdf2/Drawing.html>
 """
 
 import math
+from array import array
 from collections import OrderedDict
 from contextlib import contextmanager
 from copy import deepcopy
@@ -50,12 +51,14 @@ from .enums import (
     GradientSpreadMethod,
     GradientUnits,
     IntersectionRule,
+    MarkerShape,
     PathPaintRule,
     PDFResourceType,
     PDFStyleKeys,
     StrokeCapStyle,
     StrokeJoinStyle,
 )
+from .number_formatting import DRAWING_FORMATTER
 from .pattern import (
     Gradient,
     LinearGradient,
@@ -67,7 +70,12 @@ from .pattern import (
     shape_radial_gradient,
 )
 from .syntax import Name, PDFObject, Raw, render_pdf_primitive
-from .util import FloatTolerance, Number, NumberClass, number_to_str
+from .util import (
+    FloatTolerance,
+    Number,
+    NumberClass,
+    number_to_str,
+)
 
 if TYPE_CHECKING:
     from fontTools.ttLib import ttGlyphSet
@@ -398,7 +406,7 @@ class BoundingBox(NamedTuple):
 
     def to_pdf_array(self) -> str:
         """Convert bounding box to a PDF array string."""
-        return f"[{number_to_str(self.x0)} {number_to_str(self.y0)} {number_to_str(self.x1)} {number_to_str(self.y1)}]"
+        return f"[{DRAWING_FORMATTER.join((self.x0, self.y0, self.x1, self.y1))}]"
 
     def corners(
         self,
@@ -2641,6 +2649,269 @@ class Close(NamedTuple):
         return "h", Move(initial_point), initial_point
 
 
+class PathSegments:
+    """
+    A compact sequence of absolute path elements.
+
+    Instead of storing one `Move`, `Line`, `BezierCurve`, `Close` or `ImplicitClose`
+    tuple of `Point` objects per path element, the elements are stored as an array of
+    opcodes and a flat array of coordinates. This requires a fraction of the memory,
+    and allows to transform, measure & render all the elements in a single pass.
+
+    The rendered output is identical to the one of the equivalent path elements.
+
+    See: `PaintedPath`, when created with `compact=True`
+    """
+
+    __slots__ = ("opcodes", "coords")
+
+    MOVE = 0
+    LINE = 1
+    CURVE = 2
+    CLOSE = 3
+    IMPLICIT_CLOSE = 4
+
+    _COORDS_COUNTS = (2, 2, 6, 0, 0)
+
+    def __init__(self) -> None:
+        self.opcodes: array[int] = array("B")
+        self.coords: array[float] = array("d")
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "PathSegments":
+        copied = self.__class__()
+        copied.opcodes = array("B", self.opcodes)
+        copied.coords = array("d", self.coords)
+        return copied
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathSegments):
+            return NotImplemented
+        return self.opcodes == other.opcodes and self.coords == other.coords
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __iter__(self) -> Iterator[Renderable]:
+        """Yield the path elements equivalent to the stored ones."""
+        coords = self.coords
+        index = 0
+        for opcode in self.opcodes:
+            if opcode == self.MOVE:
+                yield Move(Point(coords[index], coords[index + 1]))
+            elif opcode == self.LINE:
+                yield Line(Point(coords[index], coords[index + 1]))
+            elif opcode == self.CURVE:
+                yield BezierCurve(
+                    Point(coords[index], coords[index + 1]),
+                    Point(coords[index + 2], coords[index + 3]),
+                    Point(coords[index + 4], coords[index + 5]),
+                )
+            elif opcode == self.CLOSE:
+                yield Close()
+            else:
+                yield ImplicitClose()
+            index += self._COORDS_COUNTS[opcode]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def append(self, item: Renderable) -> bool:
+        """
+        Append a path element to this sequence, if it can be stored compactly.
+
+        A `RelativeMove` is resolved to an absolute `Move` when possible.
+
+        Returns:
+            True if the element was appended, False if it must be stored as is.
+        """
+        if isinstance(item, (Move, Line)):
+            self.opcodes.append(self.MOVE if isinstance(item, Move) else self.LINE)
+            self.coords.extend((item.pt.x, item.pt.y))
+        elif isinstance(item, BezierCurve):
+            self.opcodes.append(self.CURVE)
+            self.coords.extend(
+                (item.c1.x, item.c1.y, item.c2.x, item.c2.y, item.end.x, item.end.y)
+            )
+        elif isinstance(item, (Close, ImplicitClose)) and self.opcodes:
+            self.opcodes.append(
+                self.CLOSE if isinstance(item, Close) else self.IMPLICIT_CLOSE
+            )
+        elif isinstance(item, RelativeMove) and self.opcodes:
+            current_point, _ = self._end_points(None)
+            if current_point is None:
+                return False
+            self.opcodes.append(self.MOVE)
+            self.coords.extend(
+                (current_point.x + item.pt.x, current_point.y + item.pt.y)
+            )
+        else:
+            return False
+        return True
+
+    def pop(self) -> None:
+        """Remove the last path element of this sequence."""
+        opcode = self.opcodes.pop()
+        del self.coords[len(self.coords) - self._COORDS_COUNTS[opcode] :]
+
+    def _end_points(
+        self, initial_point: Optional[Point]
+    ) -> tuple[Optional[Point], Optional[Point]]:
+        """
+        Return the current point and the current subpath starting point once all
+        the elements have been rendered, given the subpath starting point before them.
+        """
+        coords = self.coords
+        end = len(coords)
+        current_point = None
+        closed = False
+        for opcode in reversed(self.opcodes):
+            if opcode == self.MOVE:
+                initial_point = Point(coords[end - 2], coords[end - 1])
+                break
+            if opcode == self.CLOSE:
+                closed = closed or current_point is None
+            elif opcode != self.IMPLICIT_CLOSE and current_point is None and not closed:
+                current_point = Point(coords[end - 2], coords[end - 1])
+            end -= self._COORDS_COUNTS[opcode]
+        if closed or current_point is None:
+            current_point = initial_point
+        return current_point, initial_point
+
+    @property
+    def end_point(self) -> Point:
+        """The end point of the last path element, if it can be determined."""
+        current_point, _ = self._end_points(None)
+        if current_point is None:
+            raise NotImplementedError
+        return current_point
+
+    def operators_template(self, auto_close: bool = False) -> str:
+        """
+        Return the PDF operators of all the path elements, with a `%s`
+        placeholder for each coordinate, to be %-formatted with formatted `coords`.
+
+        Args:
+            auto_close (bool): whether implicit closes must be rendered.
+        """
+        point = "%s %s"
+        operators = (
+            f"{point} m",
+            f"{point} l",
+            f"{point} {point} {point} c",
+            "h",
+            "h" if auto_close else "",
+        )
+        return " ".join(filter(None, (operators[opcode] for opcode in self.opcodes)))
+
+    def _transformed_coords(self, tf: Transform) -> "array[float]":
+        coords = self.coords
+        xs, ys = coords[0::2], coords[1::2]
+        transformed = array("d", coords)
+        transformed[0::2] = array(
+            "d", [tf.a * x + tf.c * y + tf.e for x, y in zip(xs, ys)]
+        )
+        transformed[1::2] = array(
+            "d", [tf.b * x + tf.d * y + tf.f for x, y in zip(xs, ys)]
+        )
+        return transformed
+
+    def transformed(self, tf: Transform) -> "PathSegments":
+        """
+        Return a new sequence, with the given transform applied to all its points.
+
+        Args:
+            tf (Transform): the transform to apply.
+        """
+        copied = self.__class__()
+        copied.opcodes = array("B", self.opcodes)
+        copied.coords = self._transformed_coords(tf)
+        return copied
+
+    def bounding_box(
+        self, start: Point, tf: Optional[Transform] = None
+    ) -> tuple[BoundingBox, Point]:
+        """
+        Compute the bounding box of all the path elements, in a single pass.
+
+        Args:
+            start (Point): the current point before the first element.
+            tf (Transform): optional transform applied to the points before
+                measuring them. The returned end point is never transformed.
+        """
+        coords = self.coords
+        cur_x, cur_y = float(start.x), float(start.y)
+        if tf is not None:
+            coords = self._transformed_coords(tf)
+            cur_x, cur_y = (
+                tf.a * cur_x + tf.c * cur_y + tf.e,
+                tf.b * cur_x + tf.d * cur_y + tf.f,
+            )
+        init_x, init_y = cur_x, cur_y
+        x0 = y0 = math.inf
+        x1 = y1 = -math.inf
+        index = 0
+        for opcode in self.opcodes:
+            if opcode == self.MOVE:
+                cur_x, cur_y = init_x, init_y = coords[index], coords[index + 1]
+            elif opcode == self.LINE:
+                x, y = coords[index], coords[index + 1]
+                x0 = min(x0, cur_x, x)
+                y0 = min(y0, cur_y, y)
+                x1 = max(x1, cur_x, x)
+                y1 = max(y1, cur_y, y)
+                cur_x, cur_y = x, y
+            elif opcode == self.CURVE:
+                px = (cur_x, coords[index], coords[index + 2], coords[index + 4])
+                py = (cur_y, coords[index + 1], coords[index + 3], coords[index + 5])
+                xs = [
+                    _eval_cubic_bezier_1d(t, *px)
+                    for t in [0, 1] + _cubic_bezier_critical_ts_1d(*px)
+                ]
+                ys = [
+                    _eval_cubic_bezier_1d(t, *py)
+                    for t in [0, 1] + _cubic_bezier_critical_ts_1d(*py)
+                ]
+                x0 = min(x0, *xs)
+                y0 = min(y0, *ys)
+                x1 = max(x1, *xs)
+                y1 = max(y1, *ys)
+                cur_x, cur_y = px[3], py[3]
+            elif opcode == self.CLOSE:
+                cur_x, cur_y = init_x, init_y
+            index += self._COORDS_COUNTS[opcode]
+        end_point, _ = self._end_points(None)
+        return BoundingBox(x0, y0, x1, y1), end_point or start
+
+    @force_nodocument
+    def render(
+        self,
+        resource_registry: "ResourceCatalog",
+        style: GraphicsStyle,
+        last_item: Renderable,
+        initial_point: Point,
+    ) -> tuple[str, Renderable, Point]:
+        """
+        Render all the path elements to their PDF representation.
+
+        Args:
+            resource_registry (ResourceCatalog): the owner's graphics state
+                dictionary registry.
+            style (GraphicsStyle): the current resolved graphics style
+            last_item: the previous path element.
+            initial_point: last position set by a "M" or "m" command
+
+        Returns:
+            a tuple of `(str, new_last_item)`, where `new_last_item` is a `Move` to the
+            current point
+        """
+        # pylint: disable=unused-argument
+        template = self.operators_template(auto_close=bool(style.auto_close))
+        rendered = DRAWING_FORMATTER.fill(template, self.coords)
+        current_point, subpath_start = self._end_points(initial_point)
+        assert current_point is not None and subpath_start is not None
+        return rendered, Move(current_point), subpath_start
+
+
 if TYPE_CHECKING:
     # Validate all path items conform to the Renderable protocol
     move: Renderable = Move(pt=Point(0, 0))
@@ -2681,6 +2952,7 @@ if TYPE_CHECKING:
     )
     implicit_close: Renderable = ImplicitClose()
     close: Renderable = Close()
+    path_segments: Renderable = PathSegments()
 
 
 class DrawingContext:
@@ -2788,6 +3060,15 @@ class DrawingContext:
         if len(render_list) == 2:
             return ""
 
+        render_list[2:2] = self._render_style_prereqs(resource_registry, style)
+        render_list.append("Q")
+
+        return " ".join(render_list)
+
+    @staticmethod
+    def _render_style_prereqs(
+        resource_registry: "ResourceCatalog", style: GraphicsStyle
+    ) -> list[str]:
         if (
             not isinstance(style.soft_mask, InheritType)
             and style.soft_mask.object_id == 0
@@ -2796,19 +3077,15 @@ class DrawingContext:
                 style.soft_mask
             )
         style_dict_name = resource_registry.register_graphics_style(style)
-        if style_dict_name is not None:
-            assert not isinstance(style.stroke_dash_pattern, InheritType)
-            assert not isinstance(style.stroke_dash_phase, InheritType)
-            render_list.insert(2, f"{render_pdf_primitive(style_dict_name)} gs")
-            render_list.insert(
-                3,
-                render_pdf_primitive(style.stroke_dash_pattern)
-                + f" {number_to_str(style.stroke_dash_phase)} d",
-            )
-
-        render_list.append("Q")
-
-        return " ".join(render_list)
+        if style_dict_name is None:
+            return []
+        assert not isinstance(style.stroke_dash_pattern, InheritType)
+        assert not isinstance(style.stroke_dash_phase, InheritType)
+        return [
+            f"{render_pdf_primitive(style_dict_name)} gs",
+            render_pdf_primitive(style.stroke_dash_pattern)
+            + f" {number_to_str(style.stroke_dash_phase)} d",
+        ]
 
 
 PP = TypeVar("PP", bound="PaintedPath")
@@ -2822,6 +3099,10 @@ class PaintedPath:
     which include the primitive path elements (`Move`, `Line`, `BezierCurve`, ...) as
     well as arbitrarily nested `GraphicsContext` containing their own sequence of
     primitive path elements and `GraphicsContext`.
+
+    When `compact` is true, consecutive moves, lines, cubic Bézier curves and closes
+    are stored in `PathSegments` arrays instead of individual path elements. This is
+    recommended for paths made of many thousands of elements, like charts.
     """
 
     __slots__ = (
@@ -2830,9 +3111,11 @@ class PaintedPath:
         "_closed",
         "_close_context",
         "_starter_move",
+        "_compact",
     )
 
-    def __init__(self, x: float = 0, y: float = 0) -> None:
+    def __init__(self, x: float = 0, y: float = 0, compact: bool = False) -> None:
+        self._compact = compact
         self._root_graphics_context: GraphicsContext = GraphicsContext()
         self._graphics_context: GraphicsContext = self._root_graphics_context
 
@@ -2849,6 +3132,7 @@ class PaintedPath:
             raise RuntimeError(f"cannot copy path {self} while it is being modified")
 
         copied = self.__class__()
+        copied._compact = self._compact
         copied._root_graphics_context = deepcopy(self._root_graphics_context, memo)
         copied._graphics_context = copied._root_graphics_context
         copied._closed = self._closed
@@ -2938,13 +3222,36 @@ class PaintedPath:
         """
         if self._starter_move is not None:
             self._closed = False
-            self._graphics_context.add_item(self._starter_move, clone=False)
+            self._add_item(self._graphics_context, self._starter_move)
             self._close_context = self._graphics_context
             self._starter_move = None
 
-        self._graphics_context.add_item(item, clone=clone)
+        if not self._add_compact_item(self._graphics_context, item):
+            self._graphics_context.add_item(item, clone=clone)
+
+    def _add_compact_item(self, context: "GraphicsContext", item: Renderable) -> bool:
+        if not self._compact:
+            return False
+        path_items = context.path_items
+        if path_items and isinstance(path_items[-1], PathSegments):
+            if path_items[-1].append(item):
+                return True
+        segments = PathSegments()
+        if not segments.append(item):
+            return False
+        context.add_item(segments, clone=False)
+        return True
+
+    def _add_item(self, context: "GraphicsContext", item: Renderable) -> None:
+        if not self._add_compact_item(context, item):
+            context.add_item(item, clone=False)
 
     def remove_last_path_element(self) -> None:
+        path_items = self._graphics_context.path_items
+        if path_items and isinstance(path_items[-1], PathSegments):
+            path_items[-1].pop()
+            if path_items[-1]:
+                return
         self._graphics_context.remove_last_item()
 
     def rectangle(
@@ -3061,7 +3368,7 @@ class PaintedPath:
         self._insert_implicit_close_if_open()
         if self._starter_move is not None:
             self._closed = False
-            self._graphics_context.add_item(self._starter_move, clone=False)
+            self._add_item(self._graphics_context, self._starter_move)
             self._close_context = self._graphics_context
         self._starter_move = RelativeMove(Point(float(x), float(y)))
         return self
@@ -3435,7 +3742,7 @@ class PaintedPath:
 
     def _insert_implicit_close_if_open(self) -> None:
         if not self._closed:
-            self._close_context.add_item(ImplicitClose(), clone=False)
+            self._add_item(self._close_context, ImplicitClose())
             self._close_context = self._graphics_context
             self._closed = True
 
@@ -3499,8 +3806,8 @@ class ClippingPath(PaintedPath):
     # In general, the expectation is that painted clipping paths are likely to be very
     # uncommon, so it's an edge case that isn't worth worrying too much about.
 
-    def __init__(self, x: Number = 0, y: Number = 0) -> None:
-        super().__init__(x=float(x), y=float(y))
+    def __init__(self, x: Number = 0, y: Number = 0, compact: bool = False) -> None:
+        super().__init__(x=float(x), y=float(y), compact=compact)
         self.paint_rule = PathPaintRule.DONT_PAINT
 
     def render(
@@ -3547,6 +3854,39 @@ class ClippingPath(PaintedPath):
         return " ".join(render_list), last_item, initial_point
 
 
+def marker_path(shape: MarkerShape, size: float) -> PaintedPath:
+    """
+    Build the compact path of a marker centered on (0, 0),
+    in a coordinate system whose Y axis points upwards.
+
+    Args:
+        shape (MarkerShape): the marker shape.
+        size (float): the width & height of the marker.
+    """
+    r = size / 2
+    path = PaintedPath(compact=True)
+    if shape == MarkerShape.CIRCLE:
+        # Same approximation as FPDF.ellipse():
+        lr = 4 / 3 * (math.sqrt(2) - 1) * r
+        path.move_to(r, 0)
+        path.curve_to(r, lr, lr, r, 0, r)
+        path.curve_to(-lr, r, -r, lr, -r, 0)
+        path.curve_to(-r, -lr, -lr, -r, 0, -r)
+        path.curve_to(lr, -r, r, -lr, r, 0)
+        path.close()
+    elif shape == MarkerShape.SQUARE:
+        path.move_to(-r, -r).line_to(r, -r).line_to(r, r).line_to(-r, r).close()
+    elif shape == MarkerShape.DIAMOND:
+        path.move_to(0, -r).line_to(r, 0).line_to(0, r).line_to(-r, 0).close()
+    elif shape == MarkerShape.TRIANGLE:
+        half_side = r * math.sqrt(3) / 2
+        path.move_to(0, r).line_to(half_side, -r / 2).line_to(-half_side, -r / 2)
+        path.close()
+    else:
+        path.move_to(-r, 0).line_to(r, 0).move_to(0, -r).line_to(0, r)
+    return path
+
+
 GC = TypeVar("GC", bound="GraphicsContext")
 
 
@@ -3576,6 +3916,7 @@ class GraphicsContext:
             | PaintedPath
             | PaintComposite
             | PaintBlendComposite
+            | SharedGraphicsContext
         ] = []
 
         self._transform: Optional[Transform] = None
@@ -3584,7 +3925,11 @@ class GraphicsContext:
     def __deepcopy__(self: GC, memo: dict[int, Any]) -> GC:
         copied = self.__class__()
         copied.style = deepcopy(self.style, memo)
-        copied.path_items = deepcopy(self.path_items, memo)
+        # Path elements are immutable named tuples, that can be shared:
+        copied.path_items = [
+            item if isinstance(item, tuple) else deepcopy(item, memo)
+            for item in self.path_items
+        ]
         copied._transform = deepcopy(self.transform, memo)
         copied._clipping_path = deepcopy(self.clipping_path, memo)
         return copied
@@ -3614,6 +3959,7 @@ class GraphicsContext:
             PaintedPath,
             "PaintComposite",
             "PaintBlendComposite",
+            "SharedGraphicsContext",
         ],
         clone: bool = True,
     ) -> None:
@@ -3626,9 +3972,9 @@ class GraphicsContext:
             clone (bool): if true (the default), the item will be copied before being
                 appended. This prevents modifications to a referenced object from
                 "retroactively" altering its style/shape and should be disabled with
-                caution.
+                caution. Immutable path elements are never copied.
         """
-        if clone:
+        if clone and not isinstance(item, tuple):
             item = deepcopy(item)
 
         self.path_items.append(item)
@@ -3880,6 +4226,8 @@ class GraphicsContext:
             for item in ctx.path_items:
                 if isinstance(item, (PaintComposite, PaintBlendComposite)):
                     continue
+                if isinstance(item, SharedGraphicsContext):
+                    item = item.context
                 if isinstance(item, GraphicsContext):
                     child_bbox, end_point, cnx, cny = walk(
                         item, current_point, merged_style, tf
@@ -3888,6 +4236,12 @@ class GraphicsContext:
                     current_point = end_point
                     max_nx = max(max_nx, cnx)
                     max_ny = max(max_ny, cny)
+                elif isinstance(item, PathSegments):
+                    # transforming the points, rather than the resulting bbox,
+                    # so that it remains tight:
+                    item_bbox, end_point = item.bounding_box(current_point, tf)
+                    bbox = bbox.merge(item_bbox)
+                    current_point = end_point
                 elif hasattr(item, "bounding_box"):
                     item_bbox, end_point = item.bounding_box(current_point)
                     bbox = bbox.merge(item_bbox.transformed(tf))
@@ -4224,10 +4578,7 @@ class ImageSoftMask:
     def render(self, _resource_registry: "ResourceCatalog") -> str:
         m = self.matrix
         return (
-            "q "
-            f"{number_to_str(m.a)} {number_to_str(m.b)} "
-            f"{number_to_str(m.c)} {number_to_str(m.d)} "
-            f"{number_to_str(m.e)} {number_to_str(m.f)} cm "
+            f"q {DRAWING_FORMATTER.join((m.a, m.b, m.c, m.d, m.e, m.f))} cm "
             f"/I{self.image_index} Do Q"
         )
 
@@ -4310,6 +4661,9 @@ def clone_structure(
         "_starter_move",
         node._starter_move,  # pyright: ignore[reportPrivateUsage]
     )
+    object.__setattr__(
+        new, "_compact", node._compact  # pyright: ignore[reportPrivateUsage]
+    )
     return new
 
 
@@ -4418,13 +4772,25 @@ class PaintComposite:
         return " ".join(parts), last_item, initial_point
 
 
-class BlendGroup:
-    __slots__ = ("context", "base_style", "resources")
+class FormGroup:
+    """
+    Drawing content rendered once into a Form XObject,
+    that can then be painted any number of times by a `FormXObjectReference`.
+    """
+
+    __slots__ = ("context", "base_style", "resources", "bounds")
 
-    def __init__(self, context: GraphicsContext, base_style: GraphicsStyle) -> None:
+    def __init__(
+        self,
+        context: GraphicsContext,
+        base_style: GraphicsStyle,
+        bounds: Optional[tuple[float, float, float, float]] = None,
+    ) -> None:
         self.context = context
         self.base_style = deepcopy(base_style)
         self.resources: set[tuple[PDFResourceType, str]] = set()
+        # Optional (x0, y0, x1, y1) region that the Form XObject /BBox must include:
+        self.bounds = bounds
 
     def render(self, resource_registry: "ResourceCatalog") -> str:
         stream, _, _ = self.context.render(
@@ -4440,6 +4806,8 @@ class BlendGroup:
         bbox, _ = self.context.bounding_box(
             Point(0, 0), style=self.base_style, expand_for_stroke=True
         )
+        if self.bounds is not None:
+            bbox = bbox.merge(BoundingBox(*self.bounds))
         if not bbox.is_valid():
             return (0.0, 0.0, 0.0, 0.0)
         return bbox.to_tuple()
@@ -4511,6 +4879,69 @@ class BlendGroup:
         return "<<" + "".join(parts) + ">>" if parts else "<<>>"
 
 
+class BlendGroup(FormGroup):
+    "Content of the isolated transparency group painted by a `PaintBlendComposite`"
+
+    __slots__ = ()
+
+
+class FormXObjectReference(NamedTuple):
+    "Paints a Form XObject registered in the document `ResourceCatalog`"
+
+    form_index: int
+    b_box: BoundingBox
+
+    @property
+    def end_point(self) -> Point:
+        return Point(0, 0)
+
+    def bounding_box(self, start: Point) -> tuple[BoundingBox, Point]:
+        return self.b_box, start
+
+    # pylint: disable=unused-argument
+    def render(
+        self,
+        resource_registry: "ResourceCatalog",
+        style: GraphicsStyle,
+        last_item: Renderable,
+        initial_point: Point,
+    ) -> tuple[str, Renderable, Point]:
+        return f"/I{self.form_index} Do", last_item, initial_point
+
+
+class SharedGraphicsContext:
+    """
+    A `GraphicsContext` painted at several places, like SVG elements reused by `<use>`.
+
+    Its content is rendered once into a Form XObject, for each inherited style
+    it is rendered with, and each placement only paints this Form XObject.
+    The shared context is never copied, and must not be modified once shared.
+    """
+
+    __slots__ = ("context",)
+
+    def __init__(self, context: GraphicsContext) -> None:
+        self.context = context
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "SharedGraphicsContext":
+        return self
+
+    def render(
+        self,
+        resource_registry: "ResourceCatalog",
+        style: GraphicsStyle,
+        last_item: Renderable,
+        initial_point: Point,
+    ) -> tuple[str, Renderable, Point]:
+        render_form = resource_registry.shared_form_renderer
+        form_index = None if render_form is None else render_form(self.context, style)
+        if form_index is None:
+            return self.context.render(
+                resource_registry, style, last_item, initial_point
+            )
+        return f"/I{form_index} Do", last_item, initial_point
+
+
 class PaintBlendComposite:
     __slots__ = ("backdrop", "source", "blend_mode", "_form_index")
 
@@ -29,6 +29,7 @@ from typing import (
     Union,
 )
 
+from .number_formatting import DRAWING_FORMATTER
 from .util import Number, NumberClass, number_to_str
 
 if TYPE_CHECKING:
@@ -120,7 +121,7 @@ class DeviceRGB:
         return (255 * self.r, 255 * self.g, 255 * self.b)
 
     def serialize(self) -> str:
-        return " ".join(number_to_str(val) for val in self.colors) + f" {self.operator}"
+        return f"{DRAWING_FORMATTER.join(self.colors)} {self.operator}"
 
     def is_achromatic(self) -> bool:
         return abs(self.r - self.g) < 1e-9 and abs(self.g - self.b) < 1e-9
@@ -227,7 +228,7 @@ class DeviceCMYK:
         return self.c, self.m, self.y, self.k
 
     def serialize(self) -> str:
-        return " ".join(number_to_str(val) for val in self.colors) + f" {self.operator}"
+        return f"{DRAWING_FORMATTER.join(self.colors)} {self.operator}"
 
 
 __pdoc__["DeviceCMYK.OPERATOR"] = False
@@ -442,7 +443,7 @@ class Point:
     def render(self) -> str:
         """Render the point to the string `"x y"` for emitting to a PDF."""
 
-        return f"{number_to_str(self.x)} {number_to_str(self.y)}"
+        return DRAWING_FORMATTER.join((self.x, self.y))
 
     def dot(self, other: "Point") -> float:
         """
@@ -1092,12 +1093,8 @@ class Transform:
         Returns:
             A tuple of `(str, last_item)`. `last_item` is returned unchanged.
         """
-        return (
-            f"{number_to_str(self.a)} {number_to_str(self.b)} "
-            f"{number_to_str(self.c)} {number_to_str(self.d)} "
-            f"{number_to_str(self.e)} {number_to_str(self.f)} cm",
-            last_item,
-        )
+        matrix = DRAWING_FORMATTER.join((self.a, self.b, self.c, self.d, self.e, self.f))
+        return f"{matrix} cm", last_item
 
     def __str__(self) -> str:
         return (
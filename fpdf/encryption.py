@@ -17,8 +17,9 @@ import stringprep
 import unicodedata
 from binascii import hexlify
 from codecs import BOM_UTF16_BE
+from copy import copy
 from os import urandom
-from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, Type, Union
+from typing import TYPE_CHECKING, Callable, Optional, Type, Union
 
 from .enums import AccessPermission, EncryptionMethod
 from .errors import FPDFException
@@ -34,12 +35,22 @@ from .syntax import (
 try:
     from cryptography.hazmat.primitives.ciphers import Cipher, modes
     from cryptography.hazmat.primitives.ciphers.algorithms import AES128, AES256
-    from cryptography.hazmat.primitives.padding import PKCS7
 
     import_error = None
 except ImportError as error:
     import_error = error
 
+# RC4 was moved to the "decrepit" module of cryptography in v43:
+try:
+    from cryptography.hazmat.decrepit.ciphers.algorithms import ARC4 as CryptographyARC4
+except ImportError:
+    try:
+        from cryptography.hazmat.primitives.ciphers.algorithms import (
+            ARC4 as CryptographyARC4,
+        )
+    except ImportError:
+        CryptographyARC4 = None  # type: ignore[assignment,misc]
+
 if TYPE_CHECKING:
     from .fpdf import FPDF
 
@@ -55,36 +66,49 @@ class ARC4:
     * http://people.csail.mit.edu/rivest/pubs/RS14.pdf
 
     Having this ARC4 implementation makes it possible to have basic
-    encryption functions without additional dependencies
+    encryption functions without additional dependencies.
+    When the `cryptography` package is available, its native implementation is used instead.
     """
 
     MOD = 256
 
-    def KSA(self, key: bytes) -> list[int]:
+    def KSA(self, key: bytes) -> bytearray:
         key_length = len(key)
-        S = list(range(self.MOD))
+        S = bytearray(range(self.MOD))
         j = 0
         for i in range(self.MOD):
-            j = (j + S[i] + key[i % key_length]) % self.MOD
+            j = (j + S[i] + key[i % key_length]) & 0xFF
             S[i], S[j] = S[j], S[i]
         return S
 
-    def PRGA(self, S: list[int]) -> Iterator[int]:
-        i = 0
-        j = 0
-        while True:
-            i = (i + 1) % self.MOD
-            j = (j + S[i]) % self.MOD
-            S[i], S[j] = S[j], S[i]
-            K = S[(S[i] + S[j]) % self.MOD]
-            yield K
-
-    def encrypt(self, key: bytes, text: bytes | bytearray) -> list[int]:
-        keystream = self.PRGA(self.KSA(key))
-        res: list[int] = []
-        for c in text:
-            res.append(c ^ next(keystream))
-        return res
+    def PRGA(self, S: bytearray, length: int) -> bytearray:
+        "Returns the first `length` bytes of the keystream"
+        keystream = bytearray(length)
+        i = j = 0
+        for n in range(length):
+            i = (i + 1) & 0xFF
+            Si = S[i]
+            j = (j + Si) & 0xFF
+            Sj = S[i] = S[j]
+            S[j] = Si
+            keystream[n] = S[(Si + Sj) & 0xFF]
+        return keystream
+
+    def encrypt(self, key: bytes, text: bytes | bytearray) -> bytes:
+        if (
+            CryptographyARC4 is not None
+            and len(key) * 8 in CryptographyARC4.key_sizes
+        ):
+            encryptor = Cipher(CryptographyARC4(key), mode=None).encryptor()
+            result = encryptor.update(text)
+            encryptor.finalize()  # stream cipher: nothing is buffered
+            return result
+        length = len(text)
+        keystream = self.PRGA(self.KSA(key), length)
+        # XOR-ing both byte strings at once, as big integers, is much faster than byte per byte:
+        return (
+            int.from_bytes(text, "big") ^ int.from_bytes(keystream, "big")
+        ).to_bytes(length, "big")
 
 
 class CryptFilter:
@@ -144,6 +168,8 @@ class StandardSecurityHandler:
     DEFAULT_PADDING = (
         b"(\xbfN^Nu\x8aAd\x00NV\xff\xfa\x01\x08..\x00\xb6\xd0h>\x80/\x0c\xa9\xfedSiz"
     )
+    # Only streams larger than this are encrypted concurrently when workers > 1:
+    PARALLEL_STREAM_MIN_SIZE = 1024 * 1024
 
     def __init__(
         self,
@@ -153,8 +179,10 @@ class StandardSecurityHandler:
         permission: int | AccessPermission = AccessPermission.all(),
         encryption_method: EncryptionMethod = EncryptionMethod.RC4,
         encrypt_metadata: bool = False,
+        workers: Optional[int] = None,
     ):
         self.fpdf = fpdf
+        self.workers = workers
         self.access_permission = 0b11111111111111111111000011000000 | permission
         self.owner_password = owner_password
         self.user_password = user_password if user_password else ""
@@ -195,11 +223,21 @@ class StandardSecurityHandler:
             # if needed, it would be CryptFilter(mode=V2)
 
         self.encrypt_metadata = encrypt_metadata
+        # Cache of the keys derived from the file encryption key, per object ID:
+        self._object_keys: dict[int, bytes] = {}
+
+    def fork(self, fpdf: "FPDF") -> "StandardSecurityHandler":
+        "Returns a handler with the same settings, encrypting another document"
+        handler = copy(self)
+        handler.fpdf = fpdf
+        handler._object_keys = {}
+        return handler
 
     def generate_passwords(self, file_id: str) -> None:
         """File_id is the first hash of the PDF file id"""
         self.file_id = file_id
         self.info_id = file_id[1:33]
+        self._object_keys.clear()
         if self.revision == 6:
             self.k = self.get_random_bytes(32)
             self.generate_user_password_rev6()
@@ -216,7 +254,7 @@ class StandardSecurityHandler:
 
     def encrypt(
         self, text: Union[str, bytearray, bytes], obj_id: int
-    ) -> Union[str, bytes]:
+    ) -> Union[str, bytes, bytearray]:
         """Method invoked by PDFObject and PDFContentStream to encrypt strings and streams"""
         LOGGER.debug("Encrypting %s", text)
         return (
@@ -231,14 +269,16 @@ class StandardSecurityHandler:
         LOGGER.debug("Encrypting string: %s", string)
         try:
             string.encode("latin-1")
-            return f"<{bytes(self.encrypt_bytes(string.encode('latin-1'), obj_id)).hex().upper()}>"
+            return f"<{self.encrypt_bytes(string.encode('latin-1'), obj_id).hex().upper()}>"
         except UnicodeEncodeError:
-            return f'<{hexlify(bytearray(self.encrypt_bytes(BOM_UTF16_BE + string.encode("utf-16-be"), obj_id))).decode("latin-1")}>'
+            return f'<{hexlify(self.encrypt_bytes(BOM_UTF16_BE + string.encode("utf-16-be"), obj_id)).decode("latin-1")}>'
 
-    def encrypt_stream(self, stream: bytes | bytearray, obj_id: int) -> bytes:
+    def encrypt_stream(
+        self, stream: bytes | bytearray, obj_id: int
+    ) -> bytes | bytearray:
         if self.encryption_method == EncryptionMethod.NO_ENCRYPTION:
             return bytes(stream)
-        return bytes(self.encrypt_bytes(stream, obj_id))
+        return self.encrypt_bytes(stream, obj_id)
 
     def is_aes_algorithm(self) -> bool:
         return self.encryption_method in (
@@ -246,12 +286,23 @@ class StandardSecurityHandler:
             EncryptionMethod.AES_256,
         )
 
-    def encrypt_bytes(self, data: bytes | bytearray, obj_id: int) -> Sequence[int]:
+    def encrypt_bytes(
+        self, data: bytes | bytearray, obj_id: int
+    ) -> bytes | bytearray:
         """
         PDF32000 reference - Algorithm 1: Encryption of data using the RC4 or AES algorithms
         Append object ID and generation ID to the key and encrypt the data
         Generation ID is fixed as 0. Will need to revisit if the application start changing generation ID
         """
+        key = self._object_keys.get(obj_id)
+        if key is None:
+            key = self._object_keys[obj_id] = self.object_key(obj_id)
+        if self.is_aes_algorithm():
+            return self.encrypt_AES_cryptography(key, data)
+        return ARC4().encrypt(key, data)
+
+    def object_key(self, obj_id: int) -> bytes:
+        "Derives the key used to encrypt the strings & streams of a given object"
         h = hashlib.new("md5", usedforsecurity=False)
         h.update(self.k)
         h.update(
@@ -262,29 +313,38 @@ class StandardSecurityHandler:
         )  # generation id
         if self.is_aes_algorithm():
             h.update(bytes([0x73, 0x41, 0x6C, 0x54]))  # add salt (sAlT) for AES
-        key = h.digest()
-
-        if self.is_aes_algorithm():
-            return self.encrypt_AES_cryptography(key, data)
-        return ARC4().encrypt(key, data)
+        return h.digest()
 
     def encrypt_AES_cryptography(
         self, key: bytes, data: bytes | bytearray
     ) -> bytearray:
-        """Encrypts an array of bytes using AES algorithms (AES 128 or AES 256)"""
-        iv = bytearray(self.get_random_bytes(16))
-        padder = PKCS7(128).padder()
-        padded_data = padder.update(data)
-        padded_data += padder.finalize()
+        """
+        Encrypts an array of bytes using AES algorithms (AES 128 or AES 256)
+
+        The initialization vector & the ciphertext are written into a single preallocated buffer,
+        and only the last block is padded, so that the input data is never copied.
+        """
+        iv = self.get_random_bytes(16)
         cipher = (
             Cipher(AES128(key), modes.CBC(iv))
             if self.encryption_method == EncryptionMethod.AES_128
             else Cipher(AES256(self.k), modes.CBC(iv))
         )
         encryptor = cipher.encryptor()
-        data = encryptor.update(padded_data) + encryptor.finalize()
-        iv.extend(data)
-        return iv
+        full_blocks_length = len(data) - len(data) % 16
+        # IV + ciphertext of the full blocks + last padded block (PKCS #7):
+        result = bytearray(16 + full_blocks_length + 16)
+        result[:16] = iv
+        with memoryview(data) as data_view, memoryview(result) as result_view:
+            # update_into() requires an output buffer of len(input) + 15 bytes at least:
+            encryptor.update_into(data_view[:full_blocks_length], result_view[16:])
+            padding_length = 16 - len(data) % 16
+            last_block = bytes(data_view[full_blocks_length:]) + bytes(
+                [padding_length] * padding_length
+            )
+            result_view[16 + full_blocks_length :] = encryptor.update(last_block)
+        encryptor.finalize()
+        return result
 
     @classmethod
     def get_random_bytes(cls: Type["StandardSecurityHandler"], size: int) -> bytes:
@@ -399,10 +459,8 @@ class StandardSecurityHandler:
         rc4key = m[: (math.ceil(self.key_length / 8))]
         result = self.padded_password(self.user_password)
         for i in range(20):
-            new_key: list[int] = []
-            for k in rc4key:
-                new_key.append(k ^ i)
-            result = bytearray(ARC4().encrypt(bytes(new_key), result))
+            new_key = bytes(k ^ i for k in rc4key)
+            result = bytearray(ARC4().encrypt(new_key, result))
         return bytes(result).hex()
 
     def generate_user_password(self) -> str:
@@ -416,10 +474,8 @@ class StandardSecurityHandler:
         result = bytearray(m.digest())
         key = self.k
         for i in range(20):
-            new_key: list[int] = []
-            for k in key:
-                new_key.append(k ^ i)
-            result = bytearray(ARC4().encrypt(bytes(new_key), result))
+            new_key = bytes(k ^ i for k in key)
+            result = bytearray(ARC4().encrypt(new_key, result))
         result.extend(
             (result[x] ^ self.DEFAULT_PADDING[x]) for x in range(16)
         )  # add 16 bytes of random padding
@@ -15,6 +15,7 @@ from typing import (
 )
 
 from .drawing_primitives import convert_to_device_color
+from .number_formatting import CONTENT_FORMATTER
 from .syntax import Name, wrap_in_local_context
 
 if TYPE_CHECKING:
@@ -472,7 +473,9 @@ class TableBorderStyle:
     ) -> list[str]:
         """Return list with string for the draw command to change thickness (empty if no change)"""
         thickness = self.thickness if pdf is None else pdf.line_width
-        return [] if thickness is None else [f"{thickness * scale:.2f} w"]
+        if thickness is None:
+            return []
+        return [f"{CONTENT_FORMATTER.format(thickness * scale)} w"]
 
     def _get_change_line_color_command(self, pdf: Optional["FPDF"] = None) -> list[str]:
         """Return list with string for the draw command to change color (empty if no change)"""
@@ -512,7 +515,8 @@ class TableBorderStyle:
     @staticmethod
     def get_line_command(x1: float, y1: float, x2: float, y2: float) -> list[str]:
         """Return list with string for the command to draw a line at the specified endpoints"""
-        return [f"{x1:.2f} {y1:.2f} m {x2:.2f} {y2:.2f} l S"]
+        start, end = CONTENT_FORMATTER.join((x1, y1)), CONTENT_FORMATTER.join((x2, y2))
+        return [f"{start} m {end} l S"]
 
     def get_draw_commands(
         self, pdf: "FPDF", x1: float, y1: float, x2: float, y2: float
@@ -637,7 +641,8 @@ class TableCellStyle:
             if fill_color != pdf.fill_color:
                 needs_wrap = True
                 draw_commands.extend(self.get_change_fill_color_command(fill_color))
-            draw_commands.append(f"{x1:.2f} {y2:.2f} {x2 - x1:.2f} {y1 - y2:.2f} re f")
+            rect = CONTENT_FORMATTER.join((x1, y2, x2 - x1, y1 - y2))
+            draw_commands.append(f"{rect} re f")
         # draw the individual borders
         draw_commands.extend(
             TableBorderStyle.from_bool(self.left).get_draw_commands(pdf, x1, y2, x1, y1)
@@ -670,7 +675,8 @@ class TableCellStyle:
             if fill_color != pdf.fill_color:
                 needs_wrap = True
                 draw_commands.extend(self.get_change_fill_color_command(fill_color))
-            draw_commands.append(f"{x1:.2f} {y2:.2f} {x2 - x1:.2f} {y1 - y2:.2f} re f")
+            rect = CONTENT_FORMATTER.join((x1, y2, x2 - x1, y1 - y2))
+            draw_commands.append(f"{rect} re f")
         return draw_commands, needs_wrap
 
     def _draw_all_borders_the_same(
@@ -699,10 +705,12 @@ class TableCellStyle:
             if fill_color != pdf.fill_color:
                 needs_wrap = True
                 draw_commands.extend(self.get_change_fill_color_command(fill_color))
-            draw_commands.append(f"{x1:.2f} {y2:.2f} {x2 - x1:.2f} {y1 - y2:.2f} re B")
+            rect = CONTENT_FORMATTER.join((x1, y2, x2 - x1, y1 - y2))
+            draw_commands.append(f"{rect} re B")
         else:
             # draw empty rectangle
-            draw_commands.append(f"{x1:.2f} {y2:.2f} {x2 - x1:.2f} {y1 - y2:.2f} re S")
+            rect = CONTENT_FORMATTER.join((x1, y2, x2 - x1, y1 - y2))
+            draw_commands.append(f"{rect} re S")
         return draw_commands, needs_wrap
 
     def override_cell_border(self, cell_border: CellBordersLayout) -> "TableCellStyle":
@@ -1117,6 +1125,18 @@ class RenderStyle(CoerciveEnum):
         )
 
 
+class MarkerShape(CoerciveEnum):
+    "Shapes of the markers drawn by `fpdf.fpdf.FPDF.markers()`"
+
+    CIRCLE = intern("CIRCLE")
+    SQUARE = intern("SQUARE")
+    DIAMOND = intern("DIAMOND")
+    TRIANGLE = intern("TRIANGLE")
+    "An equilateral triangle pointing upwards"
+    CROSS = intern("CROSS")
+    "A + sign, that can only be drawn, not filled"
+
+
 class TextMode(CoerciveIntEnum):
     "Values described in PDF spec section 'Text Rendering Mode'"
 
@@ -15,12 +15,18 @@ different color font technologies, including:
 
 import logging
 import math
-from collections import UserList
+import re
+import threading
+from collections import OrderedDict, UserList
+from copy import deepcopy
 from io import BytesIO
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Hashable,
     Literal,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
@@ -62,8 +68,16 @@ from .enums import (
     GradientSpreadMethod,
     GradientUnits,
     PathPaintRule,
+    PDFResourceType,
+)
+from .image_datastructures import RasterImageInfo
+from .number_formatting import CONTENT_FORMATTER, DRAWING_FORMATTER, PATTERN_FORMATTER
+from .pattern import (
+    Pattern,
+    SweepGradient,
+    shape_linear_gradient,
+    shape_radial_gradient,
 )
-from .pattern import SweepGradient, shape_linear_gradient, shape_radial_gradient
 
 try:
     from PIL import Image
@@ -73,6 +87,7 @@ except ImportError:
 if TYPE_CHECKING:
     from .fonts import TTFFont
     from .fpdf import FPDF
+    from .output import ResourceTypes
     from .svg import SVGObject
 
 LOGGER = logging.getLogger(__name__)
@@ -201,9 +216,16 @@ class Type3Font:
         g.glyph_id = char_id
         g.unicode = char_id
         g.glyph_name = glyph_name
-        self.load_glyph_image(g)
+        COLOR_GLYPH_CACHE.load_glyph(self, g)
         self.glyphs.append(g)
 
+    def glyph_cache_variant(self) -> Hashable:
+        """
+        Returns what, besides the font & glyph name, determines how glyphs are rendered,
+        in order to identify them in `COLOR_GLYPH_CACHE`.
+        """
+        return None
+
     @classmethod
     def get_target_ppem(cls, font_size_pt: float) -> float:
         # Calculating the target ppem:
@@ -1048,6 +1070,10 @@ class EBDTBitmapFont(Type3Font):
         self._glyph_strike_indexes[glyph_name] = strike_index
         return strike_index
 
+    def glyph_cache_variant(self) -> Hashable:
+        # The strikes selected depend on the biggest font size used:
+        return self.get_target_ppem(self.base_font.biggest_size_pt)
+
     @staticmethod
     def _ppem_x(strikes: Sequence[Any], strike_index: int) -> int:
         return int(strikes[strike_index].bitmapSizeTable.ppemX)
@@ -1263,6 +1289,9 @@ class SBIXColorFont(Type3Font):
             return max(list(self.base_font.ttfont["sbix"].strikes.keys()))  # type: ignore[no-any-return]
         return min(ppem_list)
 
+    def glyph_cache_variant(self) -> Hashable:
+        return self.get_strike_index()
+
     def load_glyph_image(self, glyph: Type3FontGlyph) -> None:
         ppem = self.get_strike_index()
         sbix_glyph = (
@@ -1302,6 +1331,263 @@ class SBIXColorFont(Type3Font):
         glyph.glyph_width = w
 
 
+class CachedColorGlyph(NamedTuple):
+    "A color glyph rendered once, along with the document resources it requires"
+
+    glyph: str
+    glyph_width: int
+    # Minimal PDF version required by the glyph:
+    pdf_version: str
+    # Resources invoked by the glyph content stream, as found by `scan_stream()`:
+    resources: frozenset[tuple[PDFResourceType, str]]
+    # Names & serialized dictionaries of the graphics styles registered, in order:
+    graphics_styles: tuple[tuple[str, str], ...]
+    # Indices, identifiers, information & number of usages of the raster images:
+    images: tuple[tuple[int, str, RasterImageInfo, int], ...]
+    # Shadings & named patterns registered, in order:
+    shadings: tuple["ResourceTypes", ...]
+    patterns: tuple[tuple[str, Pattern], ...]
+
+
+class ColorGlyphCache:
+    """
+    Process-wide cache of the color font glyphs rendered as Type 3 font procedures.
+
+    Building the content stream of a COLR, SVG or bitmap color glyph is costly.
+    When several documents use the same glyphs of a font file,
+    their content streams are built once, and the graphics states, gradients
+    & images they require are registered again in each document.
+
+    Glyphs that depend on document-specific objects, like soft masks,
+    are not cached.
+
+    Args:
+        max_size (int): maximum number of glyphs kept in cache.
+            0 disables the cache. Defaults to 4096.
+    """
+
+    _RESOURCE_NAME_REGEX = re.compile(r"/((?:GS|P|I)\d+)(?=\s+(?:gs|scn|SCN|Do)\b)")
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._glyphs: OrderedDict[Hashable, CachedColorGlyph] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def clear(self) -> None:
+        "Empties the cache & resets its statistics"
+        with self._lock:
+            self._glyphs.clear()
+            self.hits = self.misses = 0
+
+    def load_glyph(self, font: "Type3Font", glyph: Type3FontGlyph) -> None:
+        "Renders a glyph of the given font, or reuses a cached rendering of it"
+        key = self._key(font, glyph.glyph_name) if self.max_size > 0 else None
+        if key is None:
+            font.load_glyph_image(glyph)
+            return
+        with self._lock:
+            cached = self._glyphs.get(key)
+            if cached is None:
+                self.misses += 1
+            else:
+                self._glyphs.move_to_end(key)
+                self.hits += 1
+        if cached is not None:
+            self._reuse(font, glyph, cached)
+            return
+        cached = self._render(font, glyph)
+        if cached is not None:
+            with self._lock:
+                self._glyphs[key] = cached
+                while len(self._glyphs) > self.max_size:
+                    self._glyphs.popitem(last=False)
+
+    @staticmethod
+    def _key(font: "Type3Font", glyph_name: str) -> Optional[Hashable]:
+        # pylint: disable=import-outside-toplevel
+        from .image_parsing import SETTINGS
+
+        base_font = font.base_font
+        try:
+            font_path = Path(base_font.ttffile).resolve()
+            font_stat = font_path.stat()
+        except (OSError, TypeError):
+            return None
+        fpdf = font.fpdf
+        return (
+            str(font_path),
+            font_stat.st_mtime_ns,
+            font_stat.st_size,
+            base_font.collection_font_number,
+            base_font.variation_axes,
+            base_font.palette_index,
+            type(font),
+            glyph_name,
+            font.glyph_cache_variant(),
+            CONTENT_FORMATTER.decimals,
+            DRAWING_FORMATTER.decimals,
+            PATTERN_FORMATTER.decimals,
+            fpdf.image_cache.image_filter,
+            SETTINGS.compression_level,
+            fpdf.resource_access_policy,
+            fpdf.svg_limits,
+        )
+
+    @staticmethod
+    def _render(
+        font: "Type3Font", glyph: Type3FontGlyph
+    ) -> Optional[CachedColorGlyph]:
+        "Renders a glyph, and returns it with its resources if they can be cached"
+        fpdf = font.fpdf
+        catalog = fpdf._resource_catalog  # pylint: disable=protected-access
+        image_cache = fpdf.image_cache
+
+        def other_resources_count() -> tuple[int, ...]:
+            return (
+                len(catalog.soft_mask_xobjects),
+                len(catalog.form_xobjects),
+                catalog.last_reserved_object_id,
+                image_cache.form_xobjects_count,
+            )
+
+        initial_counts = other_resources_count()
+        image_usages = {
+            name: cast(int, info["usages"]) for name, info in image_cache.images.items()
+        }
+        shadings_count = len(catalog.resources[PDFResourceType.SHADING])
+        patterns_count = len(catalog.resources[PDFResourceType.PATTERN])
+        # The glyph is rendered as if the document was using the default PDF version,
+        # in order to know which version it requires:
+        pdf_version, fpdf.pdf_version = fpdf.pdf_version, "1.3"
+        recorded_styles: list[str] = []
+        catalog.graphics_styles_recorder = recorded_styles
+        try:
+            font.load_glyph_image(glyph)
+        finally:
+            catalog.graphics_styles_recorder = None
+            required_pdf_version = fpdf.pdf_version
+            fpdf.pdf_version = max(pdf_version, required_pdf_version)
+        if other_resources_count() != initial_counts:
+            return None
+
+        graphics_styles = tuple(
+            (str(catalog.graphics_styles[style_str]), style_str)
+            for style_str in dict.fromkeys(recorded_styles)
+        )
+        # Styles referencing other PDF objects, like soft masks, are document-specific:
+        if any(" 0 R" in style_str for _, style_str in graphics_styles):
+            return None
+        shadings = tuple(catalog.resources[PDFResourceType.SHADING])[shadings_count:]
+        patterns = tuple(
+            (name, cast(Pattern, pattern))
+            for pattern, name in catalog.resources[PDFResourceType.PATTERN].items()
+        )[patterns_count:]
+        images_per_index = {
+            info["i"]: (name, info)
+            for name, info in image_cache.images.items()
+            if isinstance(info, RasterImageInfo)
+        }
+        resources = frozenset(catalog.scan_stream(glyph.glyph))
+        images = []
+        for resource_type, resource_id in resources:
+            if resource_type == PDFResourceType.X_OBJECT:
+                image = images_per_index.get(int(resource_id))
+                if image is None:
+                    return None
+                name, info = image
+                if not all(
+                    isinstance(info.get(key), (bytes, bytearray, type(None)))
+                    for key in ("data", "smask")
+                ):  # the image payloads have been moved to an image store
+                    return None
+                cached_info = RasterImageInfo(info)
+                if info.get("iccp_i") is not None:
+                    cached_info["iccp"] = next(
+                        iccp
+                        for iccp, iccp_i in image_cache.icc_profiles.items()
+                        if iccp_i == info["iccp_i"]
+                    )
+                usages = cast(int, info["usages"]) - image_usages.get(name, 0)
+                images.append((int(resource_id), name, cached_info, usages))
+            elif resource_type == PDFResourceType.EXT_G_STATE:
+                if all(name != resource_id for name, _ in graphics_styles):
+                    return None
+            elif resource_type == PDFResourceType.PATTERN:
+                if all(name != resource_id for name, _ in patterns):
+                    return None
+            else:
+                return None
+        shadings, patterns = deepcopy((shadings, patterns))
+        return CachedColorGlyph(
+            glyph=glyph.glyph,
+            glyph_width=glyph.glyph_width,
+            pdf_version=required_pdf_version,
+            resources=resources,
+            graphics_styles=graphics_styles,
+            images=tuple(sorted(images, key=lambda image: image[0])),
+            shadings=shadings,
+            patterns=patterns,
+        )
+
+    @classmethod
+    def _reuse(
+        cls, font: "Type3Font", glyph: Type3FontGlyph, cached: CachedColorGlyph
+    ) -> None:
+        "Registers the resources of a cached glyph in the document, and renames them"
+        # pylint: disable=import-outside-toplevel
+        from .image_parsing import _insert_image_info
+
+        fpdf = font.fpdf
+        catalog = fpdf._resource_catalog  # pylint: disable=protected-access
+        image_cache = fpdf.image_cache
+        new_names: dict[str, str] = {}
+        for name, style_str in cached.graphics_styles:
+            new_names[name] = str(catalog.register_serialized_graphics_style(style_str))
+        for index, image_name, info, usages in cached.images:
+            image_info = image_cache.images.get(image_name)
+            if image_info is None:
+                image_info = RasterImageInfo(info)
+                _insert_image_info(image_cache, image_name, image_info, usages)
+            else:
+                image_info["usages"] = cast(int, image_info["usages"]) + usages
+            new_names[f"I{index}"] = f"I{image_info['i']}"
+        # Patterns are modified when the document is output, so they are copied:
+        shadings, patterns = deepcopy((cached.shadings, cached.patterns))
+        for shading in shadings:
+            catalog.add(PDFResourceType.SHADING, shading, None)
+        for name, pattern in patterns:
+            new_names[name] = str(catalog.add(PDFResourceType.PATTERN, pattern, None))
+        new_names = {name: new for name, new in new_names.items() if name != new}
+
+        glyph.glyph = cached.glyph
+        if new_names:
+            glyph.glyph = cls._RESOURCE_NAME_REGEX.sub(
+                lambda match: "/" + new_names.get(match.group(1), match.group(1)),
+                cached.glyph,
+            )
+        glyph.glyph_width = cached.glyph_width
+        for resource_type, resource_id in cached.resources:
+            if resource_type == PDFResourceType.X_OBJECT:
+                name = f"I{resource_id}"
+                font.images_used.add(int(new_names.get(name, name)[1:]))
+            elif resource_type == PDFResourceType.EXT_G_STATE:
+                font.graphics_style_used.add(new_names.get(resource_id, resource_id))
+            elif resource_type == PDFResourceType.PATTERN:
+                font.patterns_used.add(new_names.get(resource_id, resource_id))
+        fpdf._set_min_pdf_version(  # pylint: disable=protected-access
+            cached.pdf_version
+        )
+
+
+COLOR_GLYPH_CACHE = ColorGlyphCache()
+"Cache of the color font glyphs rendered, shared by all `FPDF` instances"
+
+
 # pylint: disable=too-many-return-statements
 def get_color_font_object(
     fpdf: "FPDF", base_font: "TTFFont", palette_index: int = 0
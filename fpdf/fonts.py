@@ -17,7 +17,7 @@ import re
 import warnings
 from bisect import bisect_left
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, replace
 from functools import cache
 from io import BytesIO
@@ -348,6 +348,9 @@ class TTFFont:
         "is_symbol",
         "cff_ros",
         "collection_font_number",
+        "variation_axes",
+        "_is_modified",
+        "_sfnt_data",
     )
 
     def __init__(
@@ -369,6 +372,9 @@ class TTFFont:
         self.fontkey = fontkey
         self.biggest_size_pt: float = 0
         self.collection_font_number = collection_font_number
+        self.variation_axes: Optional[tuple[tuple[str, float], ...]] = (
+            tuple(sorted(axes_dict.items())) if axes_dict is not None else None
+        )
 
         # recalcTimestamp=False means that it doesn't modify the "modified" timestamp in head table
         # if we leave recalcTimestamp=True the tests will break every time
@@ -409,6 +415,9 @@ class TTFFont:
         if self.is_compressed:
             # Normalize to SFNT output for embedding and HarfBuzz.
             self.ttfont.flavor = None
+        # Set if self.ttfont differs from the font file, cf. fork():
+        self._is_modified = axes_dict is not None or self.is_compressed
+        self._sfnt_data: Optional[bytes] = None
         self.is_cff = "CFF " in self.ttfont or "CFF2" in self.ttfont
         self.is_cid_keyed = False
         self.is_symbol = False
@@ -472,6 +481,7 @@ class TTFFont:
                 xMax - xMin,
                 yMax - yMin,
             )
+            self._is_modified = True
 
         default_width: float = round(
             self.scale * self.ttfont["hmtx"].metrics[".notdef"][0]
@@ -575,10 +585,7 @@ class TTFFont:
             if self.is_compressed:
                 # HarfBuzz cannot load compressed WOFF/WOFF2 files directly, so we
                 # re-serialize the fontTools TTFont to a raw SFNT byte buffer.
-                buf = BytesIO()
-                self.ttfont.save(buf)
-                buf.seek(0)
-                ttfont_bytes = buf.read()
+                ttfont_bytes = self._sfnt_data or self._serialize_ttfont()
 
                 # Try to create a HarfBuzz blob from bytes; if not available, write a
                 # temporary file as a last resort.
@@ -653,6 +660,9 @@ class TTFFont:
         copy.is_symbol = self.is_symbol
         copy.cff_ros = self.cff_ros
         copy.collection_font_number = self.collection_font_number
+        copy.variation_axes = self.variation_axes
+        copy._is_modified = self._is_modified
+        copy._sfnt_data = self._sfnt_data
         # Attributes shared, to improve FPDFRecorder performances:
         copy.ttfont = self.ttfont
         copy.cmap = self.cmap
@@ -668,6 +678,45 @@ class TTFFont:
         copy.palette_index = self.palette_index
         return copy
 
+    def fork(self, fpdf: "FPDF") -> "TTFFont":
+        """
+        Returns an instance of this font for another document, sharing its metrics
+        but with its own subset & fontTools object, as this one is subsetted in place
+        when the document is produced. Used by `FPDF.from_prototype()`.
+        """
+        forked = TTFFont.__new__(TTFFont)
+        for attr in TTFFont.__slots__:
+            if hasattr(self, attr):
+                setattr(forked, attr, getattr(self, attr))
+        if self._is_modified and self._sfnt_data is None:
+            # Variable font instances, WOFF fonts & fallback .notdef glyphs
+            # are computed once, then shared by all forks:
+            self._sfnt_data = forked._sfnt_data = self._serialize_ttfont()
+        forked.ttfont = (
+            ttLib.TTFont(BytesIO(self._sfnt_data), recalcTimestamp=False, lazy=True)
+            if self._sfnt_data
+            else ttLib.TTFont(
+                self.ttffile,
+                recalcTimestamp=False,
+                fontNumber=self.collection_font_number,
+                lazy=True,
+            )
+        )
+        forked.desc = copy(self.desc)
+        forked.missing_glyphs = []
+        forked.biggest_size_pt = 0
+        forked.subset = SubsetMap(forked)
+        if self.subset._glyph_id_codes:  # pylint: disable=protected-access
+            forked.subset.use_glyph_ids()
+        if self.color_font:
+            forked.color_font = get_color_font_object(fpdf, forked, self.palette_index)
+        return forked
+
+    def _serialize_ttfont(self) -> bytes:
+        output = BytesIO()
+        self.ttfont.save(output)
+        return output.getvalue()
+
     def close(self) -> None:
         self.ttfont.close()
         self._hbfont = None
@@ -936,6 +985,14 @@ class Glyph:
         return self.glyph_id
 
 
+def _glyph_id_code(glyph_id: int) -> int:
+    # Text is encoded in UTF-16-BE, so character IDs must skip surrogate code points:
+    char_id = glyph_id + 0x800 if glyph_id >= 0xD800 else glyph_id
+    if char_id > 0xFFFF:
+        raise RuntimeError(f"Glyph ID {glyph_id} cannot be used as a character ID")
+    return char_id
+
+
 class SubsetMap:
     """
     Holds a mapping of used characters and their position in the font's subset
@@ -944,14 +1001,15 @@ class SubsetMap:
     `identities` list during object instantiation. These non-negative values should
     only appear once in the list. `pick()` can be used to get the characters
     corresponding position in the subset. If it's not yet part of the object, a new
-    position is acquired automatically. This implementation always tries to return
-    the lowest possible representation.
+    position is acquired automatically. Unless `use_glyph_ids()` has been called,
+    this implementation always tries to return the lowest possible representation.
     """
 
     def __init__(self, font: TTFFont) -> None:
         super().__init__()
         self.font = font
         self._next: int = 0
+        self._glyph_id_codes = False
 
         # 0x00 ".notdef" and 0x20 "space" are reserved
         self._reserved = [0x00, 0x20]
@@ -986,7 +1044,10 @@ class SubsetMap:
 
     def pick_glyph(self, glyph: Optional[Glyph]) -> Optional[int]:
         char_id = self._char_id_per_glyph.get(glyph, None)
-        if glyph is not None and char_id is None:
+        if glyph is not None and char_id is None and self._glyph_id_codes:
+            char_id = _glyph_id_code(glyph.glyph_id)
+            self._char_id_per_glyph[glyph] = char_id
+        elif glyph is not None and char_id is None:
             while self._next in self._reserved:
                 self._next += 1
                 if self._next > self._reserved[0]:
@@ -996,6 +1057,35 @@ class SubsetMap:
             self._next += 1
         return char_id
 
+    def use_glyph_ids(self) -> None:
+        """
+        Derives the character IDs of glyphs from their glyph IDs, instead of the order
+        in which they are picked, so that several instances of this font, used
+        in distinct processes, encode the same text identically.
+        Must be called before any glyph is picked.
+        """
+        if self._next:
+            raise RuntimeError(
+                f"Glyphs of font {self.font.fontkey} have already been picked"
+            )
+        self._glyph_id_codes = True
+        self._char_id_per_glyph = {
+            glyph: _glyph_id_code(glyph.glyph_id)
+            for glyph in self._char_id_per_glyph
+            if glyph is not None
+        }
+
+    def update(self, char_id_per_glyph: dict[Optional[Glyph], int]) -> None:
+        """
+        Adds the glyphs picked by another instance of this font,
+        both instances having called `use_glyph_ids()`.
+        """
+        if not self._glyph_id_codes:
+            raise RuntimeError(
+                f"Glyphs of font {self.font.fontkey} are not identified by their IDs"
+            )
+        self._char_id_per_glyph.update(char_id_per_glyph)
+
     # pylint: disable=method-cache-max-size-none
     @cache
     def get_glyph(
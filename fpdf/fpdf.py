@@ -20,8 +20,9 @@ import types
 import warnings
 from collections import defaultdict
 from contextlib import contextmanager
+from copy import copy, deepcopy
 from datetime import datetime, timezone
-from functools import wraps
+from functools import partial, wraps
 from os.path import splitext
 from pathlib import Path, PurePath
 from typing import (
@@ -30,6 +31,7 @@ from typing import (
     BinaryIO,
     Callable,
     Generator,
+    Iterable,
     Iterator,
     Literal,
     NamedTuple,
@@ -46,10 +48,9 @@ from typing import (
 )
 
 try:
-    from cryptography.hazmat.primitives.serialization import pkcs12
     from endesive import signer
 except ImportError:
-    pkcs12, signer = None, None  # type: ignore[assignment]
+    signer = None
 
 try:
     from PIL.Image import Image  # pyright: ignore[reportAssignmentType]
@@ -77,7 +78,18 @@ from .deprecation import (
     get_stack_level,
     support_deprecated_txt_arg,
 )
-from .drawing import DrawingContext, GraphicsContext, GraphicsStyle, PaintedPath
+from .drawing import (
+    BoundingBox,
+    DrawingContext,
+    FormGroup,
+    FormXObjectReference,
+    GradientPaint,
+    GraphicsContext,
+    GraphicsStyle,
+    PaintedPath,
+    PathSegments,
+    marker_path,
+)
 from .drawing_primitives import (
     Color,
     ColorInput,
@@ -101,6 +113,8 @@ from .enums import (
     DocumentCompliance,
     EncryptionMethod,
     FileAttachmentAnnotationName,
+    IntersectionRule,
+    MarkerShape,
     MethodReturnValue,
     OutputIntentSubType,
     PageLabelStyle,
@@ -127,7 +141,7 @@ from .errors import (
 )
 from .fonts import CORE_FONTS, CoreFont, FontFace, TextStyle, TitleStyle, TTFFont
 from .graphics_state import GraphicsStateMixin, StateStackType
-from .html import HTML2FPDF
+from .html import HTML2FPDF, HTMLProgram, SupportsRead
 from .image_datastructures import (
     ImageCache,
     ImageFilter,
@@ -140,6 +154,7 @@ from .image_parsing import (
     get_img_info,
     load_image,
     preload_image,
+    preload_images,
 )
 from .line_break import (
     Fragment,
@@ -148,6 +163,7 @@ from .line_break import (
     TotalPagesSubstitutionFragment,
 )
 from .linearization import LinearizedOutputProducer
+from .number_formatting import CONTENT_FORMATTER
 from .outline import OutlineSection
 from .output import (
     ZOOM_CONFIGS,
@@ -162,13 +178,15 @@ from .output import (
 )
 from .pattern import Gradient
 from .recorder import FPDFRecorder
-from .sign import Signature
+from .sign import Signature, SigningCredentials
 from .structure_tree import StructElem, StructureTreeBuilder
 from .svg import (
+    IncrementalSVGObject,
     Percent,
     SVGObject,
     SVGLimits,
     apply_svg_transform_to_user_space_gradients,
+    can_render_as_form_xobject,
 )
 from .syntax import DestinationXYZ, Name, PDFArray, PDFDate, PDFString
 from .table import Table, draw_box_borders
@@ -184,10 +202,13 @@ from .util import (
     builtin_srgb2014_bytes,
     get_parsed_unicode_range,
     get_scale_factor,
+    scale_columns,
+    scale_rows,
 )
 
 P = ParamSpec("P")
 R = TypeVar("R")
+FPDFType = TypeVar("FPDFType", bound="FPDF")
 
 if TYPE_CHECKING:
     from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
@@ -361,7 +382,21 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         self.image_cache = ImageCache()
         self.resource_access_policy = ResourceAccessPolicy.DEFAULT
         self.svg_limits: SVGLimits = SVGLimits()
+        # Map SVG images & drawing styles to the Form XObject they are rendered into,
+        # or to None if they are drawn directly on pages:
+        self._svg_forms: dict[
+            tuple[int, tuple[object, ...]], Optional[FormXObjectReference]
+        ] = {}
+        # Map marker shapes, sizes & styles to the index of their Form XObject:
+        self._marker_forms: dict[tuple[object, ...], int] = {}
+        # Map shared graphics contexts & inherited styles to their Form XObject,
+        # the contexts being kept alive so that their id() cannot be reused:
+        self._shared_forms: dict[
+            tuple[int, tuple[object, ...]], tuple[GraphicsContext, int]
+        ] = {}
         self.in_footer = False  # flag set while rendering footer
+        # flag set when the footer of the current page was rendered by a document shard:
+        self._footer_rendered = False
         # indicates that we are inside an .unbreakable() code block:
         self._in_unbreakable = False
         self._lasth: float = 0  # height of last cell printed
@@ -389,7 +424,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         # dict of Output Intents, with keys beings their subtypes:
         self._output_intents: dict[Name, OutputIntentDictionary] = {}
 
-        self._sign_key = None
+        self._sign_credentials: Optional[SigningCredentials] = None
         self.title: Optional[str] = None
         self.section_title_styles: dict[int, TextStyle] = {}  # level -> TextStyle
 
@@ -472,6 +507,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         # map page numbers to a set of GraphicsState names:
         self._record_text_quad_points = False
         self._resource_catalog: ResourceCatalog = ResourceCatalog()
+        self._resource_catalog.shared_form_renderer = self._shared_form
 
         # page number -> array of 8 × n numbers:
         self._text_quad_points: dict[int, list[float]] = defaultdict(list)
@@ -479,6 +515,98 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         # final buffer holding the PDF document in-memory - defined only after calling output():
         self.buffer: Optional[bytearray] = None
 
+    # Attributes holding the content of a document, not copied by from_prototype():
+    _DOCUMENT_ATTRIBUTES = frozenset(
+        (
+            "_GraphicsStateMixin__statestack",
+            "_TextRegionMixin__current_text_region",
+            "_current_draw_context",
+            "_marker_forms",
+            "_outline",
+            "_output_intents",
+            "_resource_catalog",
+            "_security_handler",
+            "_shared_forms",
+            "_svg_forms",
+            "_text_quad_points",
+            "buffer",
+            "creation_date",
+            "embedded_files",
+            "image_cache",
+            "links",
+            "named_destinations",
+            "pages",
+            "struct_builder",
+        )
+    )
+
+    @classmethod
+    def from_prototype(cls: Type[FPDFType], prototype: FPDFType) -> FPDFType:
+        """
+        Returns a new document, without pages, configured like `prototype`:
+        same fonts, fallback fonts, margins, graphics state, section title styles,
+        metadata, output intents, encryption settings & preloaded images.
+
+        Fonts metrics, image payloads & ICC profiles are shared with the prototype
+        instead of being copied, and each document keeps track of the glyphs
+        & images it uses. This makes forking a prototype much cheaper than
+        configuring a new document, and the prototype can be forked repeatedly,
+        for example once per request in a web application.
+
+        The prototype must not have any page.
+        Its `creation_date` is not copied: the new document creation date is the
+        time of the call to this method.
+        SVG images are not shared, and are parsed again by each document using them.
+
+        Args:
+            prototype (FPDF): the document to copy the configuration of.
+                Instances of a subclass of `FPDF` must be forked with this subclass.
+        """
+        # pylint: disable=protected-access
+        if prototype.pages:
+            raise FPDFException(
+                "Only a document without pages can be used as a prototype"
+            )
+        pdf = cls.__new__(cls)
+        FPDF.__init__(pdf)
+        for name, value in vars(prototype).items():
+            if name in cls._DOCUMENT_ATTRIBUTES:
+                continue
+            if isinstance(value, (dict, list, set)):
+                value = copy(value)
+            setattr(pdf, name, value)
+        for fontkey, font in prototype.fonts.items():
+            pdf.fonts[fontkey] = font.fork(pdf) if isinstance(font, TTFFont) else font
+        state = prototype._get_current_graphics_state()
+        if state.current_font is not None:
+            state.current_font = pdf.fonts[state.current_font.fontkey]
+        state.current_font_is_set_on_page = False
+        state.dash_pattern = dict(state.dash_pattern)
+        pdf._pop_local_stack()
+        pdf._push_local_stack(state)
+        pdf.image_cache = prototype.image_cache.fork()
+        if prototype._security_handler:
+            pdf._security_handler = prototype._security_handler.fork(pdf)
+        for subtype, output_intent in prototype._output_intents.items():
+            output_intent = copy(output_intent)
+            if output_intent.dest_output_profile:
+                output_intent.dest_output_profile = copy(
+                    output_intent.dest_output_profile
+                )
+            pdf._output_intents[subtype] = output_intent
+        for embedded_file in prototype.embedded_files:
+            embedded_file = copy(embedded_file)
+            embedded_file._file_spec = None
+            pdf.embedded_files.append(embedded_file)
+        return pdf
+
+    def fork(self: FPDFType) -> FPDFType:
+        """
+        Returns a new document, without pages, configured like this one.
+        Shortcut for `type(pdf).from_prototype(pdf)`: cf. `FPDF.from_prototype()`.
+        """
+        return type(self).from_prototype(self)
+
     @property
     def fonts(self) -> dict[str, CoreFont | TTFFont]:
         return self._resource_catalog.font_registry
@@ -490,6 +618,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         encryption_method: EncryptionMethod = EncryptionMethod.RC4,
         permissions: int = AccessPermission.all(),
         encrypt_metadata: bool = False,
+        workers: Optional[int] = None,
     ) -> None:
         """
         Activate encryption of the document content.
@@ -506,6 +635,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 when the document is opened with user access. Defaults to ALL.
             encrypt_metadata (bool): whether to also encrypt document metadata (author, creation date, etc.).
                 Defaults to False.
+            workers (int): optional number of threads used to encrypt large streams (images, embedded files...)
+                concurrently when the document is produced. By default, streams are encrypted sequentially.
         """
         if self._compliance and self._compliance.profile == "PDFA":
             raise PDFAComplianceError(
@@ -519,15 +650,20 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             permission=permissions,
             encryption_method=encryption_method,
             encrypt_metadata=encrypt_metadata,
+            workers=workers,
         )
 
-    def write_html(self, text: str, *args: Any, **kwargs: Any) -> None:
+    def write_html(
+        self, text: str | SupportsRead | Iterable[str], *args: Any, **kwargs: Any
+    ) -> None:
         """
         Parse HTML and convert it to PDF.
         cf. https://py-pdf.github.io/fpdf2/HTML.html
 
         Args:
-            text (str): HTML content to render
+            text (str, file object or iterable of str): HTML content to render.
+                Text file objects & iterables of chunks are parsed & rendered
+                incrementally, without loading the whole HTML content in memory.
             image_map (function): an optional one-argument function that map `<img>` "src" to new image URLs
             li_tag_indent (int): [**DEPRECATED since v2.7.9**]
                 numeric indentation of `<li>` elements - Set `tag_styles` instead
@@ -549,7 +685,27 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         """
         html2pdf = self.HTML2FPDF_CLASS(self, *args, **kwargs)
         with self.local_context():
-            html2pdf.feed(text)
+            if isinstance(text, str):
+                html2pdf.feed(text)
+            else:
+                html2pdf.feed_stream(text)
+
+    def compile_html(self, text: str, *args: Any, **kwargs: Any) -> HTMLProgram:
+        """
+        Parse HTML once, into a program that can be rendered many times,
+        on this document or others, with `program.render(pdf, context)`.
+        cf. https://py-pdf.github.io/fpdf2/HTML.html#rendering-the-same-html-many-times
+
+        Texts & attribute values can contain `{{name}}` placeholders,
+        replaced on each rendering by the values of the `context` mapping.
+
+        Args:
+            text (str): HTML content to compile
+            *args, **kwargs: the same optional parameters as `write_html()`
+
+        Returns: an instance of `fpdf.html.HTMLProgram`
+        """
+        return HTMLProgram(text, self.HTML2FPDF_CLASS, *args, **kwargs)
 
     def _set_min_pdf_version(self, version: str) -> None:
         self.pdf_version = max(self.pdf_version, version)
@@ -968,7 +1124,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
     def set_creation_date(self, date: Optional[datetime] = None) -> None:
         """Sets Creation of Date time, or current time if None given."""
-        if self._sign_key:
+        if self._sign_credentials:
             raise FPDFException(
                 ".set_creation_date() must always be called before .sign*() methods"
             )
@@ -1204,7 +1360,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         self._out("2 J")  # Set line cap style to square
         self.line_width = lw  # Set line width
-        self._out(f"{lw * self.k:.2f} w")
+        self._out(f"{CONTENT_FORMATTER.format(lw * self.k)} w")
 
         # Set font
         if family:
@@ -1225,7 +1381,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         if self.line_width != lw:  # Restore line width
             self.line_width = lw
-            self._out(f"{lw * self.k:.2f} w")
+            self._out(f"{CONTENT_FORMATTER.format(lw * self.k)} w")
 
         if family:
             self.set_font(family, emphasis, size)  # Restore font
@@ -1249,6 +1405,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         # END Page header
 
     def _render_footer(self) -> None:
+        if self._footer_rendered:
+            return
         self.in_footer = True
         if self.toc_placeholder:
             # The ToC is rendered AFTER the footer,
@@ -1271,6 +1429,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         new_page: bool = True,
     ) -> None:
         self.page += 1
+        self._footer_rendered = False
         if self.in_toc_rendering and self._toc_allow_page_insertion:
             self._toc_inserted_pages += 1
             self.page = len(self.pages) + 1
@@ -1451,7 +1610,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         if width != self.line_width:
             self.line_width = width
             if self.page > 0:
-                self._out(f"{width * self.k:.2f} w")
+                self._out(f"{CONTENT_FORMATTER.format(width * self.k)} w")
 
     def set_page_background(
         self, background: Optional[str | BinaryIO | Image | DeviceRGB | tuple[float]]
@@ -1523,6 +1682,44 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         # The drawing API makes use of features (notably transparency and blending modes) that were introduced in PDF 1.4:
         self._set_min_pdf_version("1.4")
 
+    def _draw_svg_incrementally(self, svg: IncrementalSVGObject) -> None:
+        """
+        Draw a SVG image on the current page while converting it,
+        outputting the PDF operators of each element as soon as it is converted.
+        Its `base_group.transform` must position it on the page.
+        """
+        if self._current_draw_context is not None:
+            raise FPDFException(
+                "cannot create a drawing context while one is already open"
+            )
+        # Same setup as DrawingContext.render():
+        # pylint: disable=protected-access
+        render_list, style, last_item = DrawingContext._setup_render_prereqs(
+            self._current_graphic_style(), Point(self.x, self.y), self.k, self.h
+        )
+        render_list += DrawingContext._render_style_prereqs(
+            self._resource_catalog, style
+        )
+        page_contents = self.pages[self.page].contents
+        assert isinstance(page_contents, bytearray)
+        page_contents_length = len(page_contents)
+        try:
+            for rendered in svg.render_incrementally(
+                self._resource_catalog, style, last_item, Point(self.x, self.y)
+            ):
+                if render_list:
+                    rendered = " ".join(render_list) + "\n" + rendered
+                    render_list = []
+                self._resource_catalog.index_stream_resources(rendered, self.page)
+                self._out(rendered)
+            if not render_list:
+                self._out("Q")
+        except Exception:
+            # Removing the partially drawn image, so that the page content stays valid:
+            del page_contents[page_contents_length:]
+            raise
+        self._set_min_pdf_version("1.4")
+
     @contextmanager
     @check_page
     def use_pattern(self, shading: Gradient) -> Generator[None, None, None]:
@@ -1574,6 +1771,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         y: float = 0,
         paint_rule: PathPaintRule = PathPaintRule.AUTO,
         debug_stream: Optional[bool] = None,  # pylint: disable=unused-argument
+        compact: bool = False,
     ) -> Generator[PaintedPath, None, None]:
         """
         Create a path for appending lines and curves to.
@@ -1584,9 +1782,12 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             paint_rule (PathPaintRule): Optional choice of how the path should
                 be painted. The default (AUTO) automatically selects stroke/fill based
                 on the path style settings.
+            compact (bool): if True, store the path elements in compact arrays.
+                This reduces memory usage & speeds up rendering of paths
+                made of many elements. The output is the same.
         """
         with self.drawing_context() as ctxt:
-            path = PaintedPath(x=x, y=y)
+            path = PaintedPath(x=x, y=y, compact=compact)
             path.style.paint_rule = paint_rule
             yield path
             ctxt.add_item(path)
@@ -1716,8 +1917,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             y2 (float): Ordinate of second point
         """
         self._out(
-            f"{x1 * self.k:.2f} {(self.h - y1) * self.k:.2f} m {x2 * self.k:.2f} "
-            f"{(self.h - y2) * self.k:.2f} l S"
+            f"{self._format_point(x1, y1)} m {self._format_point(x2, y2)} l S"
         )
 
     @check_page
@@ -1761,9 +1961,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 )
         operator = "m"
         for point in point_list:
-            self._out(
-                f"{point[0] * self.k:.2f} {(self.h - point[1]) * self.k:.2f} {operator}"
-            )
+            self._out(f"{self._format_point(point[0], point[1])} {operator}")
             operator = "l"
         if polygon:
             self._out(" h")
@@ -1790,6 +1988,172 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         """
         self.polyline(point_list, fill=fill, polygon=True, style=style)
 
+    @check_page
+    def polylines(
+        self,
+        lines: Iterable[Any],
+        polygon: bool = False,
+        style: Optional[RenderStyle | str] = None,
+    ) -> None:
+        """
+        Draws many polylines at once, as subpaths of a single path.
+
+        This is much faster than calling `polyline()` for each of them,
+        as coordinates are converted & formatted in batches.
+
+        Args:
+            lines: the polylines to draw. Each one can be a sequence of `(x, y)` tuples,
+                a NumPy array of shape (N, 2), or an `array.array` or `memoryview`
+                of N * 2 numbers (ideally doubles, like `array.array("d")`).
+            polygon (bool): If true, close each polyline, to fill their inside
+            style (fpdf.enums.RenderStyle, str): Optional style of rendering. Possible values are:
+
+            * `D` or None: draw border. This is the default value.
+            * `F`: fill
+            * `DF` or `FD`: draw and fill
+        """
+        style = RenderStyle.coerce(style) if style is not None else RenderStyle.D
+        templates, coords = [], []
+        for line in lines:
+            line_coords = scale_rows(line, (self.k, -self.k), (0, self.h * self.k))
+            if not line_coords:
+                continue
+            templates.append(
+                "%s %s m"
+                + " %s %s l" * (len(line_coords) // 2 - 1)
+                + (" h" if polygon else "")
+            )
+            coords.extend(line_coords)
+        if templates:
+            self._out(
+                CONTENT_FORMATTER.fill("\n".join(templates), coords)
+                + f" {style.operator}"
+            )
+
+    @check_page
+    def rects(
+        self,
+        rects: Any,
+        style: Optional[RenderStyle | str] = None,
+    ) -> None:
+        """
+        Draws many rectangles at once, as subpaths of a single path.
+
+        This is much faster than calling `rect()` for each of them,
+        as coordinates are converted & formatted in batches.
+
+        Args:
+            rects: the `(x, y, w, h)` rectangles to draw, `x` & `y` being the
+                coordinates of their upper-left corner. This can be a sequence of
+                tuples, a NumPy array of shape (N, 4), or an `array.array` or
+                `memoryview` of N * 4 numbers (ideally doubles: `array.array("d")`).
+            style (fpdf.enums.RenderStyle, str): Optional style of rendering. Possible values are:
+
+            * `D` or None: draw border. This is the default value.
+            * `F`: fill
+            * `DF` or `FD`: draw and fill
+        """
+        style = RenderStyle.coerce(style) if style is not None else RenderStyle.D
+        k = self.k
+        coords = scale_rows(rects, (k, -k, k, -k), (0, self.h * k, 0, 0))
+        if coords:
+            template = "\n".join(["%s %s %s %s re"] * (len(coords) // 4))
+            self._out(CONTENT_FORMATTER.fill(template, coords) + f" {style.operator}")
+
+    @check_page
+    def markers(
+        self,
+        xs: Any,
+        ys: Any,
+        shape: MarkerShape | str = MarkerShape.CIRCLE,
+        size: float = 1,
+        style: Optional[RenderStyle | str] = None,
+        form_xobject: bool = False,
+    ) -> None:
+        """
+        Draws the same marker at many positions, for example to render a scatter plot.
+
+        By default, the markers are subpaths of a single path, painted at once.
+        With `form_xobject=True`, the marker is defined once in the document,
+        as a Form XObject, and painted at each position:
+        this reduces the size of the page content stream when there are many markers,
+        and overlapping markers are painted one after the other.
+
+        Args:
+            xs: abscissas of the markers centers.
+            ys: ordinates of the markers centers.
+                Both can be sequences of numbers, NumPy arrays, `array.array` or
+                `memoryview` objects (ideally of doubles, like `array.array("d")`),
+                of the same length.
+            shape (fpdf.enums.MarkerShape, str): the shape of the markers:
+                `CIRCLE` (the default), `SQUARE`, `DIAMOND`, `TRIANGLE` or `CROSS`.
+            size (float): width & height of each marker.
+            style (fpdf.enums.RenderStyle, str): Optional style of rendering. Possible values are:
+
+            * `D` or None: draw border. This is the default value.
+            * `F`: fill
+            * `DF` or `FD`: draw and fill
+
+            form_xobject (bool): if True, render the marker once as a Form XObject
+        """
+        shape = MarkerShape.coerce(shape)
+        style = RenderStyle.coerce(style) if style is not None else RenderStyle.D
+        if len(xs) != len(ys):
+            raise ValueError(
+                f"xs & ys must have the same length, got {len(xs)} & {len(ys)}"
+            )
+        if not len(xs):  # pylint: disable=use-implicit-booleaness-not-len
+            return
+        k = self.k
+        if form_xobject:
+            index = self._marker_form(shape, size, style)
+            centers = scale_columns((xs, ys), (k, -k), (0, self.h * k))
+            template = "\n".join(
+                [f"q 1 0 0 1 %s %s cm /I{index} Do Q"] * (len(centers) // 2)
+            )
+            self._out(CONTENT_FORMATTER.fill(template, centers))
+            self._resource_catalog.add(PDFResourceType.X_OBJECT, index, self.page)
+            return
+        (segments,) = marker_path(shape, size * k).get_graphics_context().path_items
+        assert isinstance(segments, PathSegments)
+        points_count = len(segments.coords) // 2
+        coords = scale_columns(
+            (xs, ys) * points_count,
+            (k, -k) * points_count,
+            [
+                offset + (self.h * k if i % 2 else 0)
+                for i, offset in enumerate(segments.coords)
+            ],
+        )
+        markers_count = len(coords) // len(segments.coords)
+        template = "\n".join([segments.operators_template()] * markers_count)
+        self._out(CONTENT_FORMATTER.fill(template, coords) + f" {style.operator}")
+
+    def _marker_form(self, shape: MarkerShape, size: float, style: RenderStyle) -> int:
+        """
+        Returns the index of the Form XObject of a marker, rendering it on first use.
+        Its content is expressed in points, relative to the marker center,
+        and inherits the graphics state of the page, like the current colors.
+        """
+        key = (shape, size, style, self.k, self.line_width)
+        if key not in self._marker_forms:
+            path = marker_path(shape, size * self.k)
+            path.style.paint_rule = PathPaintRule(style.operator)
+            context = GraphicsContext()
+            context.add_item(path, clone=False)
+            base_style = GraphicsStyle()
+            base_style.auto_close = False
+            base_style.stroke_width = self.line_width * self.k
+            # Including the stroke, which extends beyond sharp corners:
+            margin = (size / 2 + self.line_width) * self.k
+            form_group = FormGroup(
+                context, base_style, (-margin, -margin, margin, margin)
+            )
+            index = self.image_cache.reserve_form_xobject_index()
+            self._resource_catalog.register_form(form_group, index, self.compress)
+            self._marker_forms[key] = index
+        return self._marker_forms[key]
+
     @check_page
     def dashed_line(
         self,
@@ -1871,8 +2235,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             self._draw_rounded_rect(x, y, w, h, style, round_corners, corner_radius)
         else:
             self._out(
-                f"{x * self.k:.2f} {(self.h - y) * self.k:.2f} {w * self.k:.2f} "
-                f"{-h * self.k:.2f} re {style.operator}"
+                f"{self._format_point(x, y)} "
+                f"{CONTENT_FORMATTER.join((w * self.k, -h * self.k))} "
+                f"re {style.operator}"
             )
 
     def _draw_rounded_rect(
@@ -1932,31 +2297,31 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         # Build a single continuous path
         # Start at point_1
-        self._out(f"{point_1[0] * self.k:.2f} {(self.h - point_1[1]) * self.k:.2f} m")
+        self._out(f"{self._format_point(point_1[0], point_1[1])} m")
 
         # Top edge: point_1 to point_2
-        self._out(f"{point_2[0] * self.k:.2f} {(self.h - point_2[1]) * self.k:.2f} l")
+        self._out(f"{self._format_point(point_2[0], point_2[1])} l")
 
         # Top-left corner arc
         if Corner.TOP_LEFT in round_corners_list:
             self._draw_arc_segment(x + w - 2 * r, y, 2 * r, 270, 0)
 
         # Right edge: point_3 to point_4
-        self._out(f"{point_4[0] * self.k:.2f} {(self.h - point_4[1]) * self.k:.2f} l")
+        self._out(f"{self._format_point(point_4[0], point_4[1])} l")
 
         # Bottom-left corner arc
         if Corner.BOTTOM_LEFT in round_corners_list:
             self._draw_arc_segment(x + w - 2 * r, y + h - 2 * r, 2 * r, 0, 90)
 
         # Bottom edge: point_5 to point_6
-        self._out(f"{point_6[0] * self.k:.2f} {(self.h - point_6[1]) * self.k:.2f} l")
+        self._out(f"{self._format_point(point_6[0], point_6[1])} l")
 
         # Bottom-right corner arc
         if Corner.BOTTOM_RIGHT in round_corners_list:
             self._draw_arc_segment(x, y + h - 2 * r, 2 * r, 90, 180)
 
         # Left edge: point_7 to point_8
-        self._out(f"{point_8[0] * self.k:.2f} {(self.h - point_8[1]) * self.k:.2f} l")
+        self._out(f"{self._format_point(point_8[0], point_8[1])} l")
 
         # Top-right corner arc
         if Corner.TOP_RIGHT in round_corners_list:
@@ -2037,9 +2402,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             control_point_2 = [p2[0] - alpha * p2_prime[0], p2[1] - alpha * p2_prime[1]]
 
             self._out(
-                f"{control_point_1[0] * self.k:.2f} {(self.h - control_point_1[1]) * self.k:.2f} "
-                f"{control_point_2[0] * self.k:.2f} {(self.h - control_point_2[1]) * self.k:.2f} "
-                f"{p2[0] * self.k:.2f} {(self.h - p2[1]) * self.k:.2f} c"
+                f"{self._format_point(control_point_1[0], control_point_1[1])} "
+                f"{self._format_point(control_point_2[0], control_point_2[1])} "
+                f"{self._format_point(p2[0], p2[1])} c"
             )
 
     @check_page
@@ -2080,34 +2445,59 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         lx = 4 / 3 * (math.sqrt(2) - 1) * rx
         ly = 4 / 3 * (math.sqrt(2) - 1) * ry
 
+        k, page_h = self.k, self.h
         self._out(
-            (
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy) * self.k:.2f} m "
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy + ly) * self.k:.2f} "
-                f"{(cx + lx) * self.k:.2f} {(self.h - cy + ry) * self.k:.2f} "
-                f"{cx * self.k:.2f} {(self.h - cy + ry) * self.k:.2f} c"
+            f"{CONTENT_FORMATTER.join(((cx + rx) * k, (page_h - cy) * k))} m "
+            + CONTENT_FORMATTER.join(
+                (
+                    (cx + rx) * k,
+                    (page_h - cy + ly) * k,
+                    (cx + lx) * k,
+                    (page_h - cy + ry) * k,
+                    cx * k,
+                    (page_h - cy + ry) * k,
+                )
             )
+            + " c"
         )
         self._out(
-            (
-                f"{(cx - lx) * self.k:.2f} {(self.h - cy + ry) * self.k:.2f} "
-                f"{(cx - rx) * self.k:.2f} {(self.h - cy + ly) * self.k:.2f} "
-                f"{(cx - rx) * self.k:.2f} {(self.h - cy) * self.k:.2f} c"
+            CONTENT_FORMATTER.join(
+                (
+                    (cx - lx) * k,
+                    (page_h - cy + ry) * k,
+                    (cx - rx) * k,
+                    (page_h - cy + ly) * k,
+                    (cx - rx) * k,
+                    (page_h - cy) * k,
+                )
             )
+            + " c"
         )
         self._out(
-            (
-                f"{(cx - rx) * self.k:.2f} {(self.h - cy - ly) * self.k:.2f} "
-                f"{(cx - lx) * self.k:.2f} {(self.h - cy - ry) * self.k:.2f} "
-                f"{cx * self.k:.2f} {(self.h - cy - ry) * self.k:.2f} c"
+            CONTENT_FORMATTER.join(
+                (
+                    (cx - rx) * k,
+                    (page_h - cy - ly) * k,
+                    (cx - lx) * k,
+                    (page_h - cy - ry) * k,
+                    cx * k,
+                    (page_h - cy - ry) * k,
+                )
             )
+            + " c"
         )
         self._out(
-            (
-                f"{(cx + lx) * self.k:.2f} {(self.h - cy - ry) * self.k:.2f} "
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy - ly) * self.k:.2f} "
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy) * self.k:.2f} c {operator}"
+            CONTENT_FORMATTER.join(
+                (
+                    (cx + lx) * k,
+                    (page_h - cy - ry) * k,
+                    (cx + rx) * k,
+                    (page_h - cy - ly) * k,
+                    (cx + rx) * k,
+                    (page_h - cy) * k,
+                )
             )
+            + f" c {operator}"
         )
 
     @check_page
@@ -2316,14 +2706,10 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         # Move to the start point
         if start_from_center:
-            self._out(f"{cx * self.k:.2f} {(self.h - cy) * self.k:.2f} m")
-            self._out(
-                f"{start_point[0] * self.k:.2f} {(self.h - start_point[1]) * self.k:.2f} l"
-            )
+            self._out(f"{self._format_point(cx, cy)} m")
+            self._out(f"{self._format_point(start_point[0], start_point[1])} l")
         else:
-            self._out(
-                f"{start_point[0] * self.k:.2f} {(self.h - start_point[1]) * self.k:.2f} m"
-            )
+            self._out(f"{self._format_point(start_point[0], start_point[1])} m")
 
         # Number of curves to use, maximal segment angle is 2*PI/max_curves
         max_curves = 4
@@ -2355,9 +2741,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
             self._out(
                 (
-                    f"{control_point_1[0] * self.k:.2f} {(self.h - control_point_1[1]) * self.k:.2f} "
-                    f"{control_point_2[0] * self.k:.2f} {(self.h - control_point_2[1]) * self.k:.2f} "
-                    f"{p2[0] * self.k:.2f} {(self.h - p2[1]) * self.k:.2f} c" + end
+                    f"{self._format_point(control_point_1[0], control_point_1[1])} "
+                    f"{self._format_point(control_point_2[0], control_point_2[1])} "
+                    f"{self._format_point(p2[0], p2[1])} c" + end
                 )
             )
 
@@ -2365,9 +2751,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             if start_from_center:
                 self._out(f"h {style.operator}")
             else:
-                self._out(
-                    f"{cx * self.k:.2f} {(self.h - cy) * self.k:.2f} l {style.operator}"
-                )
+                self._out(f"{self._format_point(cx, cy)} l {style.operator}")
 
     def solid_arc(
         self,
@@ -2723,7 +3107,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         Set font and size for current page.
         This step is needed before adding text into page and not needed in set_font and set_font_size.
         """
-        sl = f"/F{font.i} {font_size_pt:.2f} Tf"
+        sl = f"/F{font.i} {CONTENT_FORMATTER.format(font_size_pt)} Tf"
         if wrap_in_text_object:
             sl = f"BT {sl} ET"
         self._resource_catalog.add(PDFResourceType.FONT, font.i, self.page)
@@ -2744,7 +3128,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             return
         self.char_spacing = spacing
         if self.page > 0:
-            self._out(f"BT {spacing:.2f} Tc ET")
+            self._out(f"BT {CONTENT_FORMATTER.format(spacing)} Tc ET")
 
     def set_stretching(self, stretching: float) -> None:
         """
@@ -2758,7 +3142,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             return
         self.font_stretching = stretching
         if self.page > 0:
-            self._out(f"BT {stretching:.2f} Tz ET")
+            self._out(f"BT {CONTENT_FORMATTER.format(stretching)} Tz ET")
 
     def set_fallback_fonts(
         self, fallback_fonts: Sequence[str], exact_match: bool = True
@@ -3234,7 +3618,10 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             w * self.k,
             h * self.k,
             contents=text,
-            default_appearance=f"({self.draw_color.serialize()} /F{self.current_font.i} {self.font_size_pt:.2f} Tf)",
+            default_appearance=(
+                f"({self.draw_color.serialize()} /F{self.current_font.i}"
+                f" {CONTENT_FORMATTER.format(self.font_size_pt)} Tf)"
+            ),
             **kwargs,
         )
         self.pages[self.page].add_annotation(annotation)
@@ -3438,9 +3825,10 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         assert self.current_font is not None
         if not self.current_font_is_set_on_page:
             self._out(self._set_font_for_page(self.current_font, self.font_size_pt))
-        sl = [f"BT {x * self.k:.2f} {(self.h - y) * self.k:.2f} Td"]
+        sl = [f"BT {self._format_point(x, y)} Td"]
         if self.text_mode != TextMode.FILL:
-            sl.append(f" {self.text_mode} Tr {self.line_width:.2f} w")
+            line_width = CONTENT_FORMATTER.format(self.line_width)
+            sl.append(f" {self.text_mode} Tr {line_width} w")
         sl.append(f"{self.current_font.encode_text(text)} ET")
         if (
             text != "" and (self.underline or self.strikethrough)
@@ -3495,8 +3883,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             cx = x * self.k
             cy = (self.h - y) * self.k
             output = (
-                f"q {c:.5F} {s:.5F} {-s:.5F} {c:.5F} {cx:.2F} {cy:.2F} cm "
-                f"1 0 0 1 {-cx:.2F} {-cy:.2F} cm"
+                f"q {c:.5F} {s:.5F} {-s:.5F} {c:.5F} "
+                f"{CONTENT_FORMATTER.join((cx, cy))} cm "
+                f"1 0 0 1 {CONTENT_FORMATTER.join((-cx, -cy))} cm"
             )
             self._out(output)
 
@@ -4051,20 +4440,25 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         if fill:
             op = "B" if border == 1 else "f"
-            sl.append(f"{left:.2f} {top:.2f} {right-left:.2f} {bottom-top:.2f} re {op}")
+            rect = CONTENT_FORMATTER.join((left, top, right - left, bottom - top))
+            sl.append(f"{rect} re {op}")
         elif border == 1:
-            sl.append(f"{left:.2f} {top:.2f} {right-left:.2f} {bottom-top:.2f} re S")
+            rect = CONTENT_FORMATTER.join((left, top, right - left, bottom - top))
+            sl.append(f"{rect} re S")
         # pylint: enable=invalid-unary-operand-type
 
         if isinstance(border, str):
+            left_s, top_s, right_s, bottom_s = CONTENT_FORMATTER.format_many(
+                (left, top, right, bottom)
+            )
             if "L" in border:
-                sl.append(f"{left:.2f} {top:.2f} m {left:.2f} {bottom:.2f} l S")
+                sl.append(f"{left_s} {top_s} m {left_s} {bottom_s} l S")
             if "T" in border:
-                sl.append(f"{left:.2f} {top:.2f} m {right:.2f} {top:.2f} l S")
+                sl.append(f"{left_s} {top_s} m {right_s} {top_s} l S")
             if "R" in border:
-                sl.append(f"{right:.2f} {top:.2f} m {right:.2f} {bottom:.2f} l S")
+                sl.append(f"{right_s} {top_s} m {right_s} {bottom_s} l S")
             if "B" in border:
-                sl.append(f"{left:.2f} {bottom:.2f} m {right:.2f} {bottom:.2f} l S")
+                sl.append(f"{left_s} {bottom_s} m {right_s} {bottom_s} l S")
 
         if self._record_text_quad_points:
             self._add_quad_points(self.x, self.y, w, h)
@@ -4096,10 +4490,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 word_spacing = (
                     w - l_c_margin - r_c_margin - styled_txt_width
                 ) / text_line.number_of_spaces
-            sl.append(
-                f"BT {(self.x + dx) * k:.2f} "
-                f"{(self.h - self.y - 0.5 * h - 0.3 * max_font_size) * k:.2f} Td"
-            )
+            td_x = (self.x + dx) * k
+            td_y = (self.h - self.y - 0.5 * h - 0.3 * max_font_size) * k
+            sl.append(f"BT {CONTENT_FORMATTER.join((td_x, td_y))} Td")
             if (
                 not prevent_font_change
                 and not self.current_font_is_set_on_page
@@ -4150,17 +4543,18 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                     frag_ws = word_spacing
                 if current_font_stretching != frag.font_stretching:
                     current_font_stretching = frag.font_stretching
-                    sl.append(f"{frag.font_stretching:.2f} Tz")
+                    sl.append(f"{CONTENT_FORMATTER.format(frag.font_stretching)} Tz")
                 if current_char_spacing != frag.char_spacing:
                     current_char_spacing = frag.char_spacing
-                    sl.append(f"{frag.char_spacing:.2f} Tc")
+                    sl.append(f"{CONTENT_FORMATTER.format(frag.char_spacing)} Tc")
                 if not self.current_font_is_set_on_page:
                     if prevent_font_change:
                         # This is "local" to the current BT / ET context:
                         current_font = frag.font
                         current_font_size_pt = frag.font_size_pt
                         current_font_style = frag.font_style
-                        sl.append(f"/F{current_font.i} {current_font_size_pt:.2f} Tf")
+                        size_pt = CONTENT_FORMATTER.format(current_font_size_pt)
+                        sl.append(f"/F{current_font.i} {size_pt} Tf")
                         self._resource_catalog.add(
                             PDFResourceType.FONT, current_font.i, self.page
                         )
@@ -4201,14 +4595,15 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 lift = frag.lift
                 if lift != current_lift:
                     # Use text rise operator:
-                    sl.append(f"{lift:.2f} Ts")
+                    sl.append(f"{CONTENT_FORMATTER.format(lift)} Ts")
                     current_lift = lift
                 if (
                     frag.text_mode != TextMode.FILL
                     or frag.text_mode != current_text_mode
                 ):
                     current_text_mode = frag.text_mode
-                    sl.append(f"{frag.text_mode} Tr {frag.line_width:.2f} w")
+                    line_width = CONTENT_FORMATTER.format(frag.line_width)
+                    sl.append(f"{frag.text_mode} Tr {line_width} w")
 
                 r_text = frag.render_pdf_text(
                     frag_ws,
@@ -5326,6 +5721,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         dims: Optional[tuple[float, float]] = None,
         keep_aspect_ratio: bool = False,
         resource_access_policy: Optional[ResourceAccessPolicy] = None,
+        image_key: Optional[str] = None,
+        incremental_svg: bool = False,
     ) -> RasterImageInfo | VectorImageInfo:
         """
         Put an image on the page.
@@ -5374,6 +5771,15 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             resource_access_policy (fpdf.enums.ResourceAccessPolicy, optional): override
                 the document-level policy used to load local or remote image resources
                 for this call, including nested raster images referenced by SVG files.
+            image_key (str): optional unique identifier of the image, used to find it in the image cache.
+                By default, raster images that are not file paths or URLs (bytes, `io.BytesIO`, `PIL.Image.Image`...)
+                are identified by a hash of their content. Providing a key avoids computing this hash
+                every time the same image is inserted.
+            incremental_svg (bool): for SVG images, convert the image element by element
+                while drawing it, instead of parsing it entirely first.
+                This bounds memory usage when inserting very large drawings,
+                but such images are not cached and have some limitations,
+                cf. [SVG documentation](https://py-pdf.github.io/fpdf2/SVG.html).
 
         If `y` is provided, this method will not trigger any page break;
         otherwise, auto page break detection will be performed.
@@ -5401,6 +5807,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             dims,
             resource_access_policy=resource_access_policy,
             svg_limits=self.svg_limits,
+            image_key=image_key,
+            incremental_svg=incremental_svg,
         )
         if isinstance(info, VectorImageInfo):
             return self._vector_image(
@@ -5452,6 +5860,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
     ) -> RasterImageInfo:
         if "smask" in info:
             self._set_min_pdf_version("1.4")
+        if info.get("bpc") == 16:
+            self._set_min_pdf_version("1.5")
 
         # Automatic width and height calculation if needed
         w, h = info.size_in_document_units(w, h, scale=self.k)
@@ -5533,12 +5943,14 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         alt_text: Optional[str] = None,
         keep_aspect_ratio: bool = False,
     ) -> VectorImageInfo:
-        if not svg.viewbox and svg.width and svg.height:
+        # The parsed SVG image is cached, hence its own viewBox must not be altered:
+        viewbox = svg.viewbox
+        if not viewbox and svg.width and svg.height:
             warnings.warn(
                 '<svg> has no "viewBox", using its "width" & "height" as default "viewBox"',
                 stacklevel=get_stack_level(),
             )
-            svg.viewbox = [float(0), float(0), svg.width, svg.height]
+            viewbox = [float(0), float(0), svg.width, svg.height]
         if w == 0 and h == 0:
             if svg.width and svg.height:
                 w = (
@@ -5551,8 +5963,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                     if isinstance(svg.height, Percent)
                     else svg.height
                 )
-            elif svg.viewbox:
-                _, _, w, h = svg.viewbox
+            elif viewbox:
+                _, _, w, h = viewbox
             else:
                 svg_id = "<svg>" if isinstance(name, bytes) else name
                 raise ValueError(
@@ -5561,8 +5973,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         elif w == 0 or h == 0:
             if svg.width and svg.height:
                 svg_width, svg_height = svg.width, svg.height
-            elif svg.viewbox:
-                _, _, svg_width, svg_height = svg.viewbox
+            elif viewbox:
+                _, _, svg_width, svg_height = viewbox
             else:
                 raise ValueError(
                     '<svg> has no "viewBox" nor "height" / "width": w= and h= must be provided to FPDF.image()'
@@ -5587,11 +5999,26 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             x, y, w, h = info.scale_inside_box(x, y, w, h)
 
         _, _, path = svg.transform_to_rect_viewport(
-            scale=1, width=w, height=h, ignore_svg_top_attrs=True
+            scale=1, width=w, height=h, ignore_svg_top_attrs=True, viewbox=viewbox
         )
         assert path.transform is not None
-        path.transform = path.transform @ Transform.translation(x, y)
-        apply_svg_transform_to_user_space_gradients(path)
+        transform = path.transform @ Transform.translation(x, y)
+        draw: Callable[[], None]
+        if isinstance(svg, IncrementalSVGObject):
+            path.transform = transform
+            draw = partial(self._draw_svg_incrementally, svg)
+        else:
+            form = self._svg_form(svg, path, viewbox)
+            if form is None:
+                # Parsed SVG images are cached, and gradients are modified in place:
+                path = deepcopy(path)
+                path.transform = transform
+                apply_svg_transform_to_user_space_gradients(path)
+            else:
+                path = GraphicsContext()
+                path.transform = transform
+                path.add_item(form, clone=False)
+            draw = partial(self.draw_path, path, copy=False)
 
         old_x, old_y = self.x, self.y
         try:
@@ -5600,9 +6027,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 # Alt text of vector graphics does NOT show as tool-tip in viewers, but should
                 # be processed by screen readers.
                 with self._marked_sequence(title=title, alt_text=alt_text):
-                    self.draw_path(path, copy=False)
+                    draw()
             else:
-                self.draw_path(path, copy=False)
+                draw()
         finally:
             self.set_xy(old_x, old_y)
         if link:
@@ -5610,6 +6037,96 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         return VectorImageInfo(rendered_width=w, rendered_height=h)
 
+    def _svg_form(
+        self, svg: SVGObject, path: GraphicsContext, viewbox: Optional[list[float]]
+    ) -> Optional[FormXObjectReference]:
+        """
+        Returns a reference to the Form XObject that a SVG image is rendered into,
+        with the current drawing style, rendering it on first use.
+        Returns None if the SVG image must be drawn directly on the page.
+        """
+        # The SVG objects are kept alive by .image_cache.svg_images,
+        # hence their id() cannot be reused by other objects:
+        key = (
+            id(svg),
+            (
+                self.allow_images_transparency,
+                self.line_width,
+                self.draw_color,
+                self.fill_color,
+                tuple(self.dash_pattern.values()),
+            ),
+        )
+        if key in self._svg_forms:
+            return self._svg_forms[key]
+        form = None
+        bounds = None
+        if viewbox:
+            vx, vy, vw, vh = viewbox
+            bounds = (vx, vy, vx + vw, vy + vh)
+        # Without a viewBox, the bounding box of texts is only estimated:
+        if can_render_as_form_xobject(path, allow_text=bounds is not None):
+            # Same starting style as the one set up by DrawingContext.render():
+            style = self._current_graphic_style()
+            style.auto_close = True
+            style.paint_rule = PathPaintRule.AUTO
+            style.intersection_rule = IntersectionRule.NONZERO
+            # The Form XObject content is expressed in the SVG user space,
+            # the viewport transform being applied on each placement:
+            transform, path.transform = path.transform, None
+            try:
+                form_group = FormGroup(path, style, bounds)
+                form = FormXObjectReference(
+                    self.image_cache.reserve_form_xobject_index(),
+                    BoundingBox(*form_group.get_bounding_box()),
+                )
+                self._resource_catalog.register_form(
+                    form_group, form.form_index, self.compress
+                )
+            finally:
+                path.transform = transform
+        self._svg_forms[key] = form
+        return form
+
+    def _shared_form(
+        self, context: GraphicsContext, style: GraphicsStyle
+    ) -> Optional[int]:
+        """
+        Returns the index of the Form XObject that a shared graphics context
+        is rendered into, with the given inherited style, rendering it on first use.
+        Returns None if the context must be rendered inline.
+        """
+        if isinstance(style.fill_color, GradientPaint) or isinstance(
+            style.stroke_color, GradientPaint
+        ):  # gradient patterns are positioned in page space
+            return None
+        # The Form XObject inherits the colors, opacities & line styles in effect
+        # where it is painted: only the style properties altering its content matter.
+        try:
+            key = (
+                id(context),
+                (
+                    style.paint_rule,
+                    style.allow_transparency,
+                    style.auto_close,
+                    style.intersection_rule,
+                    style.fill_color is None,
+                    style.stroke_color is None,
+                    style.stroke_width,
+                    style.stroke_dash_pattern,
+                    style.stroke_dash_phase,
+                ),
+            )
+            cached = self._shared_forms.get(key)
+        except TypeError:  # unhashable style property
+            return None
+        if cached is None:
+            form_group = FormGroup(context, style)
+            index = self.image_cache.reserve_form_xobject_index()
+            self._resource_catalog.register_form(form_group, index, self.compress)
+            cached = self._shared_forms[key] = (context, index)
+        return cached[1]
+
     def _downscale_image(
         self,
         name: str,
@@ -5671,12 +6188,14 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                                 or load_image(
                                     name,
                                     resource_access_policy=resource_access_policy,
+                                    remote_fetcher=self.image_cache.remote_fetcher,
                                 ),
                                 self.image_cache.image_filter,
                                 dims,
                                 resource_access_policy=resource_access_policy,
                             )
                         )
+                        self.image_cache.store_payloads(info)
                         LOGGER.debug(
                             "OVERSIZED: Updated low-res image with name=%s id=%d to dims=%s",
                             lowres_name,
@@ -5692,14 +6211,16 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                             or load_image(
                                 name,
                                 resource_access_policy=resource_access_policy,
+                                remote_fetcher=self.image_cache.remote_fetcher,
                             ),
                             self.image_cache.image_filter,
                             dims,
                             resource_access_policy=resource_access_policy,
                         )
                     )
-                    info["i"] = len(images) + 1
+                    info["i"] = self.image_cache.next_xobject_index()
                     info["usages"] = 1
+                    self.image_cache.store_payloads(info)
                     images[lowres_name] = info
                     LOGGER.debug(
                         "OVERSIZED: Generated new low-res image with name=%s dims=%s id=%d",
@@ -5745,6 +6266,43 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             svg_limits=self.svg_limits,
         )
 
+    def preload_images(
+        self,
+        names: Iterable[ImageType],
+        dims: Optional[tuple[float, float]] = None,
+        workers: Optional[int] = None,
+    ) -> list[
+        tuple[
+            str,
+            SVGObject | Image | bytes | BinaryIO | Path | None,
+            RasterImageInfo | VectorImageInfo,
+        ]
+    ]:
+        """
+        Read several images concurrently and insert them in the image cache,
+        so that subsequent calls to `FPDF.image()` with the same images do not need
+        to decode them again. Raster images are processed on a thread pool.
+
+        Preloaded images are only embedded in the document if they are placed on a page.
+
+        Args:
+            names: an iterable of images, in any format accepted by `FPDF.image()`
+            dims (Tuple[float]): optional dimensions as a tuple (width, height) to resize
+                the images before storing them in the PDF.
+            workers (int): optional maximum number of threads used to process the images.
+                Pass 1 to process them sequentially.
+
+        Returns: a list of tuples (name, image data, `ImageInfo` instance), one per image.
+        """
+        return preload_images(  # pyright: ignore[reportReturnType]
+            self.image_cache,
+            names,
+            dims,
+            workers=workers,
+            resource_access_policy=self.resource_access_policy,
+            svg_limits=self.svg_limits,
+        )
+
     def preload_glyph_image(self, glyph_image_bytes: bytes | BinaryIO) -> tuple[
         str,
         SVGObject | Image | bytes | BinaryIO | Path | None,
@@ -5942,18 +6500,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             raise EnvironmentError(
                 "endesive.signer not available - PDF cannot be signed - Try: pip install endesive"
             )
-        with open(pkcs_filepath, "rb") as pkcs_file:
-            key, cert, extra_certs = (
-                pkcs12.load_key_and_certificates(  # pyright: ignore[reportOptionalMemberAccess]
-                    pkcs_file.read(), password
-                )
-            )
-        assert cert is not None
-        self.sign(
-            key=key,
-            cert=cert,
-            extra_certs=extra_certs,
-            hashalgo=hashalgo,
+        self.sign_with_credentials(
+            SigningCredentials.from_pkcs12(pkcs_filepath, password, hashalgo),
             contact_info=contact_info,
             location=location,
             signing_time=signing_time,
@@ -5961,7 +6509,6 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             flags=flags,
         )
 
-    @check_page
     def sign(
         self,
         key: Optional["PrivateKeyTypes"],
@@ -5990,17 +6537,49 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             reason (str): optional signing reason
             flags (Tuple[fpdf.enums.AnnotationFlag], Tuple[str]): optional list of flags defining annotation properties
         """
+        self.sign_with_credentials(
+            SigningCredentials(key, cert, extra_certs, hashalgo),
+            contact_info=contact_info,
+            location=location,
+            signing_time=signing_time,
+            reason=reason,
+            flags=flags,
+        )
+
+    @check_page
+    def sign_with_credentials(
+        self,
+        credentials: SigningCredentials,
+        contact_info: Optional[str] = None,
+        location: Optional[str] = None,
+        signing_time: Optional[datetime] = None,
+        reason: Optional[str] = None,
+        flags: tuple[AnnotationFlag | str, ...] = (
+            AnnotationFlag.PRINT,
+            AnnotationFlag.LOCKED,
+        ),
+    ) -> None:
+        """
+        Sign the document with a key & certificates loaded beforehand,
+        that can be reused to sign many documents.
+
+        Args:
+            credentials (fpdf.sign.SigningCredentials): private key & certificates
+            contact_info (str): optional information provided by the signer to enable
+                a recipient to contact the signer to verify the signature
+            location (str): optional CPU host name or physical location of the signing
+            signing_time (datetime): optional time of signing
+            reason (str): optional signing reason
+            flags (Tuple[fpdf.enums.AnnotationFlag], Tuple[str]): optional list of flags defining annotation properties
+        """
         if not signer:
             raise EnvironmentError(
                 "endesive.signer not available - PDF cannot be signed - Try: pip install endesive"
             )
-        if self._sign_key:
+        if self._sign_credentials:
             raise FPDFException(".sign* methods should be called only once")
 
-        self._sign_key = key
-        self._sign_cert = cert
-        self._sign_extra_certs = extra_certs if extra_certs is not None else []
-        self._sign_hashalgo = hashalgo
+        self._sign_credentials = credentials
         self._sign_time: datetime = signing_time or self.creation_date
 
         annotation = PDFAnnotation(
@@ -6137,10 +6716,15 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             font = self.current_font
         assert font is not None
         return (
-            f"{x * self.k:.2f} "
-            f"{(self.h - y + font.up / 1000 * self.font_size) * self.k:.2f} "  # pyright: ignore[reportUnknownMemberType]
-            f"{w * self.k:.2f} "
-            f"{-font.ut / 1000 * self.font_size_pt:.2f} re f"  # pyright: ignore[reportUnknownMemberType]
+            CONTENT_FORMATTER.join(
+                (
+                    x * self.k,
+                    (self.h - y + font.up / 1000 * self.font_size) * self.k,  # pyright: ignore[reportUnknownMemberType]
+                    w * self.k,
+                    -font.ut / 1000 * self.font_size_pt,  # pyright: ignore[reportUnknownMemberType]
+                )
+            )
+            + " re f"
         )
 
     def _do_strikethrough(
@@ -6154,10 +6738,15 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             font = self.current_font
         assert font is not None
         return (
-            f"{x * self.k:.2f} "
-            f"{(self.h - y + font.sp / 1000 * self.font_size) * self.k:.2f} "  # pyright: ignore[reportUnknownMemberType]
-            f"{w * self.k:.2f} "
-            f"{-font.ss / 1000 * self.font_size_pt:.2f} re f"  # pyright: ignore[reportUnknownMemberType]
+            CONTENT_FORMATTER.join(
+                (
+                    x * self.k,
+                    (self.h - y + font.sp / 1000 * self.font_size) * self.k,  # pyright: ignore[reportUnknownMemberType]
+                    w * self.k,
+                    -font.ss / 1000 * self.font_size_pt,  # pyright: ignore[reportUnknownMemberType]
+                )
+            )
+            + " re f"
         )
 
     def _out(self, s: str | bytes) -> None:
@@ -6178,6 +6767,10 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         else:
             page_contents += s + b"\n"  # type: ignore[operator]
 
+    def _format_point(self, x: float, y: float) -> str:
+        "Converts a point in user units to the coordinates of page content streams"
+        return CONTENT_FORMATTER.join((x * self.k, (self.h - y) * self.k))
+
     @check_page
     @support_deprecated_txt_arg
     def interleaved2of5(
@@ -6325,10 +6918,11 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             h (float): height of the clipping region
         """
         self._out(
-            (
-                f"q {x * self.k:.2f} {(self.h - y - h) * self.k:.2f} {w * self.k:.2f} "
-                f"{h * self.k:.2f} re W n"
+            "q "
+            + CONTENT_FORMATTER.join(
+                (x * self.k, (self.h - y - h) * self.k, w * self.k, h * self.k)
             )
+            + " re W n"
         )
         yield
         self._out("Q")
@@ -6719,6 +7313,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         Args:
             name (str): optional File object or file path where to save the PDF under
+            linearize (bool): produce a linearized PDF file, _a.k.a._ "optimized for
+                fast web view", whose first page can be displayed before the whole file
+                is downloaded. Not supported for encrypted documents.
             output_producer_class (class): use a custom class for PDF file generation
         """
         # Clear cache of cached functions to free up memory after output
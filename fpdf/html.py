@@ -13,13 +13,25 @@ Usage documentation at: <https://py-pdf.github.io/fpdf2/HTML.html>
 import logging
 import re
 import warnings
+from functools import partial
 from html.parser import HTMLParser
 from string import ascii_lowercase, ascii_uppercase
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
 
 from .deprecation import get_stack_level
 from .drawing_primitives import (
     ColorInput,
+    DeviceCMYK,
     DeviceGray,
     DeviceRGB,
     color_from_hex_string,
@@ -37,6 +49,8 @@ if TYPE_CHECKING:
     from .text_region import Paragraph
 
 LOGGER = logging.getLogger(__name__)
+# Number of characters read at once from file objects passed to write_html():
+STREAM_CHUNK_SIZE = 64 * 1024
 MESSAGE_WAITING_WIN1252 = "\x95"  # MESSAGE WAITING character in Windows-1252 encoding
 BULLET_UNICODE = "•"  # U+2022
 DEGREE_SIGN_WIN1252 = "\xb0"  # DEGREE SIGN character in Windows-1252 encoding
@@ -298,6 +312,13 @@ COLOR_DICT = {
 }
 
 
+@runtime_checkable
+class SupportsRead(Protocol):
+    "A text file object"
+
+    def read(self, size: int = -1, /) -> str: ...
+
+
 def color_as_decimal(
     color: Optional[str] = "#000000",
 ) -> Optional[DeviceRGB | DeviceGray]:
@@ -400,6 +421,12 @@ class HTML2FPDF(HTMLParser):
             style=self.font_emphasis.style,
         )
         self.style_stack: list[FontFace] = []  # list of FontFace
+        # Large generated documents repeat the same inline styles, colors & tags,
+        # hence those caches, that only live as long as this parser:
+        self._css_styles: dict[str, dict[str, str]] = {}
+        self._colors: dict[str, Optional[DeviceRGB | DeviceGray]] = {}
+        self._font_faces: dict[tuple[Any, ...], FontFace] = {}
+        self._resolved_tag_styles: dict[tuple[Any, ...], tuple[Any, ...]] = {}
         self._page_break_after_paragraph = False
         self.follows_trailing_space = False  # The last write has ended with a space.
         self.follows_heading = False  # We don't want extra space below a heading.
@@ -667,7 +694,7 @@ class HTML2FPDF(HTMLParser):
             bgcolor_str = self.td_th.get("bgcolor")
             if bgcolor_str is None and self.tr is not None:
                 bgcolor_str = self.tr.get("bgcolor")
-            bgcolor = color_as_decimal(bgcolor_str)
+            bgcolor = self._color_as_decimal(bgcolor_str)
             colspan = int(self.td_th.get("colspan") or "1")
             rowspan = int(self.td_th.get("rowspan") or "1")
             emphasis = 0
@@ -687,12 +714,8 @@ class HTML2FPDF(HTMLParser):
             )
             font_style = None
             if font_family or emphasis or font_size_pt or bgcolor:
-                font_style = FontFace(
-                    family=font_family,
-                    emphasis=emphasis,
-                    size_pt=font_size_pt,
-                    color=self.pdf.text_color,
-                    fill_color=bgcolor,
+                font_style = self._font_face(
+                    font_family, emphasis, font_size_pt, self.pdf.text_color, bgcolor
                 )
             assert self.table_row is not None
             self.table_row.cell(
@@ -739,11 +762,98 @@ class HTML2FPDF(HTMLParser):
                 self.pdf.start_section(data, self.heading_level - 1, strict=False)
             self._write_paragraph(data)
 
+    def _parse_css_style(self, style_attr: Optional[str]) -> dict[str, str]:
+        "Cached version of `parse_css_style()`: the dicts returned must not be mutated"
+        if not style_attr:
+            return {}
+        css_style = self._css_styles.get(style_attr)
+        if css_style is None:
+            css_style = self._css_styles[style_attr] = parse_css_style(style_attr)
+        return css_style
+
+    def _color_as_decimal(
+        self, color: Optional[str]
+    ) -> Optional[DeviceRGB | DeviceGray]:
+        "Cached version of `color_as_decimal()`"
+        if not color:
+            return None
+        try:
+            return self._colors[color]
+        except KeyError:
+            decimal_color = self._colors[color] = color_as_decimal(color)
+            return decimal_color
+
+    def _font_face(
+        self,
+        family: Optional[str],
+        emphasis: Optional[TextEmphasis | int],
+        size_pt: Optional[float],
+        color: Optional[DeviceRGB | DeviceGray | DeviceCMYK],
+        fill_color: Optional[DeviceRGB | DeviceGray | DeviceCMYK] = None,
+    ) -> FontFace:
+        """
+        Returns a `FontFace` with those properties, that is shared with the other
+        callers requesting the same ones: it must not be mutated.
+        """
+        key = (family, emphasis, size_pt, color, fill_color)
+        font_face = self._font_faces.get(key)
+        if font_face is None:
+            font_face = self._font_faces[key] = FontFace(
+                family=family,
+                emphasis=emphasis,
+                size_pt=size_pt,
+                color=color,
+                fill_color=fill_color,
+            )
+        return font_face
+
+    def _current_font_face(self) -> FontFace:
+        return self._font_face(
+            self.font_family, self.font_emphasis, self.font_size_pt, self.font_color
+        )
+
+    def _apply_tag_style(self, tag: str) -> FontFace | TextStyle:
+        """
+        Merges the style of an inline tag into the current font properties.
+        The resolution is memoized per (tag, parent font properties),
+        and invalidated whenever the entry of `tag_styles` for this tag is replaced.
+        """
+        tag_style = self.tag_styles[tag]
+        parent = (
+            self.font_family,
+            self.font_emphasis,
+            self.font_size_pt,
+            self.font_color,
+        )
+        resolved = self._resolved_tag_styles.get((tag, *parent))
+        if resolved is None or resolved[0] is not tag_style:
+            family, emphasis, size_pt, color = parent
+            if tag_style.color:
+                color = tag_style.color
+            family = tag_style.family or family
+            size_pt = tag_style.size_pt or size_pt
+            if tag_style.emphasis:
+                emphasis |= tag_style.emphasis
+            resolved = (tag_style, family, emphasis, size_pt, color)
+            self._resolved_tag_styles[(tag, *parent)] = resolved
+        (
+            _,
+            self.font_family,
+            self.font_emphasis,
+            self.font_size_pt,
+            self.font_color,
+        ) = resolved
+        return tag_style
+
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        self._pre_started = False
         attrs_dict: dict[str, str | None] = dict(attrs)
         del attrs
-        css_style = parse_css_style(attrs_dict.get("style") or "")
+        self._start_tag(tag, attrs_dict, self._parse_css_style(attrs_dict.get("style")))
+
+    def _start_tag(
+        self, tag: str, attrs_dict: dict[str, str | None], css_style: dict[str, str]
+    ) -> None:
+        self._pre_started = False
         self._tags_stack.append(tag)
         if css_style.get("break-before") == "page":
             self._end_paragraph()
@@ -780,14 +890,7 @@ class HTML2FPDF(HTMLParser):
             )
             self._write_paragraph("\n")
         if tag == "p":
-            self.style_stack.append(
-                FontFace(
-                    family=self.font_family,
-                    emphasis=self.font_emphasis,
-                    size_pt=self.font_size_pt,
-                    color=self.font_color,
-                )
-            )
+            self.style_stack.append(self._current_font_face())
             align: Optional[Align] = None
             if "align" in attrs_dict:
                 try:
@@ -832,14 +935,7 @@ class HTML2FPDF(HTMLParser):
                 indent=l_margin,
             )
         if tag in HEADING_TAGS:
-            self.style_stack.append(
-                FontFace(
-                    family=self.font_family,
-                    emphasis=self.font_emphasis,
-                    size_pt=self.font_size_pt,
-                    color=self.font_color,
-                )
-            )
+            self.style_stack.append(self._current_font_face())
             self.heading_level = 0 if tag == "title" else int(tag[1:])
             tag_style = self.tag_styles[tag]
             hsize = (tag_style.size_pt or self.font_size_pt) / self.pdf.k
@@ -864,11 +960,11 @@ class HTML2FPDF(HTMLParser):
                 indent=l_margin,
             )
             if "color" in css_style:
-                self.font_color = color_as_decimal(css_style["color"])
+                self.font_color = self._color_as_decimal(css_style["color"])
             elif "color" in attrs_dict:
                 # "color" attributes are not valid in HTML,
                 # but we support it for backward compatibility:
-                self.font_color = color_as_decimal(attrs_dict["color"])
+                self.font_color = self._color_as_decimal(attrs_dict["color"])
             elif tag_style.color is not None and tag_style.color != self.font_color:
                 self.font_color = tag_style.color
             if tag_style.family is not None and tag_style.family != self.font_family:
@@ -894,21 +990,8 @@ class HTML2FPDF(HTMLParser):
         ):
             if tag in BLOCK_TAGS:
                 self._end_paragraph()
-            self.style_stack.append(
-                FontFace(
-                    family=self.font_family,
-                    emphasis=self.font_emphasis,
-                    size_pt=self.font_size_pt,
-                    color=self.font_color,
-                )
-            )
-            tag_style = self.tag_styles[tag]
-            if tag_style.color:
-                self.font_color = tag_style.color
-            self.font_family = tag_style.family or self.font_family
-            self.font_size_pt = tag_style.size_pt or self.font_size_pt
-            if tag_style.emphasis:
-                self.font_emphasis |= tag_style.emphasis
+            self.style_stack.append(self._current_font_face())
+            tag_style = self._apply_tag_style(tag)
             if tag == "pre":
                 self._pre_formatted = True
                 self._pre_started = True
@@ -1047,16 +1130,9 @@ class HTML2FPDF(HTMLParser):
             )
             self.pdf.text_color = prev_text_color
         if tag == "font":
-            self.style_stack.append(
-                FontFace(
-                    family=self.font_family,
-                    emphasis=self.font_emphasis,
-                    size_pt=self.font_size_pt,
-                    color=self.font_color,
-                )
-            )
+            self.style_stack.append(self._current_font_face())
             if "color" in attrs_dict:
-                self.font_color = color_as_decimal(attrs_dict["color"])
+                self.font_color = self._color_as_decimal(attrs_dict["color"])
             if "font-size" in css_style:
                 font_size_str = css_style.get("font-size") or ""
                 try:
@@ -1303,10 +1379,12 @@ class HTML2FPDF(HTMLParser):
             )
             if "inserted" not in self.td_th:
                 # handle_data() was not called => we call it to produce an empty cell:
-                bgcolor = color_as_decimal(
+                bgcolor = self._color_as_decimal(
                     self.td_th.get("bgcolor") or self.tr.get("bgcolor", None)
                 )
-                style = FontFace(fill_color=bgcolor) if bgcolor else None
+                style = None
+                if bgcolor:
+                    style = self._font_face(None, None, None, None, bgcolor)
                 colspan = int(self.td_th.get("colspan", "1"))
                 rowspan = int(self.td_th.get("rowspan", "1"))
                 self.table_row.cell(
@@ -1329,6 +1407,63 @@ class HTML2FPDF(HTMLParser):
 
     def feed(self, data: str) -> None:
         super().feed(data)
+        self._end_document()
+
+    def feed_stream(self, source: Union[SupportsRead, Iterable[str]]) -> None:
+        """
+        Parses & renders HTML read from a text file object, or provided as chunks,
+        incrementally: paragraphs & list items are rendered as soon as they end,
+        so that the whole HTML content is never loaded in memory.
+        """
+        chunks: Iterable[str] = (
+            iter(partial(source.read, STREAM_CHUNK_SIZE), "")
+            if isinstance(source, SupportsRead)
+            else source
+        )
+        pending = ""
+        for chunk in chunks:
+            pending += chunk
+            # Data is fed up to the start of the last tag, so that texts are never
+            # split between several calls to handle_data():
+            split = pending.rfind("<")
+            if split > 0:
+                super().feed(pending[:split])
+                pending = pending[split:]
+        super().feed(pending)
+        self._end_document()
+
+    def run(self, program: "HTMLProgram", context: Mapping[str, Any]) -> None:
+        """
+        Renders a program produced by `FPDF.compile_html()`, without parsing HTML,
+        substituting the values provided in `context` to its placeholders.
+        """
+        # Subclasses may customize how start tags are handled:
+        starttag_overridden = (
+            type(self).handle_starttag is not HTML2FPDF.handle_starttag
+        )
+        # pylint: disable=protected-access
+        for operation in program._operations:
+            if operation[0] == _DATA:
+                data = _substitute(operation[1], context)
+                if data:
+                    self.handle_data(data)
+            elif operation[0] == _END_TAG:
+                self.handle_endtag(operation[1])
+            else:
+                _, tag, attrs_dict, css_style, dynamic_attrs = operation
+                if dynamic_attrs:
+                    attrs_dict = dict(attrs_dict)
+                    for name, parts in dynamic_attrs:
+                        attrs_dict[name] = _substitute(parts, context)
+                if starttag_overridden:
+                    self.handle_starttag(tag, list(attrs_dict.items()))
+                    continue
+                if css_style is None:
+                    css_style = self._parse_css_style(attrs_dict.get("style"))
+                self._start_tag(tag, attrs_dict, css_style)
+        self._end_document()
+
+    def _end_document(self) -> None:
         while self._tags_stack and self._tags_stack[-1] in self.HTML_UNCLOSED_TAGS:
             self._tags_stack.pop()
         self._end_paragraph()  # render the final chunk of text and clean up our local context.
@@ -1379,6 +1514,115 @@ class HTML2FPDF(HTMLParser):
         raise RuntimeError(message)
 
 
+_DATA, _START_TAG, _END_TAG = range(3)
+_PLACEHOLDER_PAT = re.compile(r"{{\s*([A-Za-z_][\w.-]*)\s*}}")
+# A text without placeholders, or a tuple alternating texts & placeholder names:
+_Template = Union[str, tuple[str, ...]]
+
+
+def _compile_placeholders(text: str) -> _Template:
+    parts = _PLACEHOLDER_PAT.split(text)
+    return text if len(parts) == 1 else tuple(parts)
+
+
+def _substitute(template: _Template, context: Mapping[str, Any]) -> str:
+    if isinstance(template, str):
+        return template
+    return "".join(
+        part if i % 2 == 0 else str(context[part]) for i, part in enumerate(template)
+    )
+
+
+class _HTMLRecorder(HTMLParser):
+    "Records the tags & texts parsed, in order to build an `HTMLProgram`"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.operations: list[tuple[Any, ...]] = []
+        self.placeholders: set[str] = set()
+
+    def _template(self, text: str) -> _Template:
+        template = _compile_placeholders(text)
+        if not isinstance(template, str):
+            self.placeholders.update(template[1::2])
+        return template
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attrs_dict: dict[str, str | None] = dict(attrs)
+        dynamic_attrs: list[tuple[str, tuple[str, ...]]] = []
+        for name, value in attrs_dict.items():
+            template = self._template(value) if value else value
+            if isinstance(template, tuple):
+                dynamic_attrs.append((name, template))
+        css_style: Optional[dict[str, str]] = None
+        if all(name != "style" for name, _ in dynamic_attrs):
+            css_style = parse_css_style(attrs_dict.get("style") or "")
+        self.operations.append(
+            (_START_TAG, tag, attrs_dict, css_style, tuple(dynamic_attrs))
+        )
+
+    def handle_endtag(self, tag: str) -> None:
+        self.operations.append((_END_TAG, tag))
+
+    def handle_data(self, data: str) -> None:
+        self.operations.append((_DATA, self._template(data)))
+
+    # Subclasses of _markupbase.ParserBase must implement this:
+    def error(self, message: str) -> None:
+        raise RuntimeError(message)
+
+
+class HTMLProgram:
+    """
+    HTML parsed once by `FPDF.compile_html()`, that can then be rendered many times,
+    without parsing HTML nor CSS again.
+
+    Texts & attribute values can contain `{{name}}` placeholders,
+    that are replaced by the values provided to `render()`.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        html2pdf_class: type[HTML2FPDF] = HTML2FPDF,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            text (str): HTML content, optionally containing `{{name}}` placeholders
+            html2pdf_class (type): the `HTML2FPDF` class, or subclass, used to render it
+            *args, **kwargs: parameters passed to the `html2pdf_class` constructor,
+                cf. `FPDF.write_html()`
+        """
+        recorder = _HTMLRecorder()
+        recorder.feed(text)
+        self._operations = tuple(recorder.operations)
+        self.placeholders = frozenset(recorder.placeholders)
+        "Names of the placeholders found in the HTML content"
+        self._html2pdf_class = html2pdf_class
+        self._args = args
+        self._kwargs = kwargs
+
+    def render(self, pdf: "FPDF", context: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Renders the HTML content on a document,
+        as `FPDF.write_html()` would do for the same HTML.
+
+        Args:
+            pdf (fpdf.fpdf.FPDF): the document to render this program on
+            context (dict): the values of the placeholders, converted to strings.
+                Those values are inserted as text: they are not parsed as HTML.
+        """
+        context = context or {}
+        missing = self.placeholders.difference(context)
+        if missing:
+            raise KeyError(f"Missing values for placeholders: {sorted(missing)}")
+        html2pdf = self._html2pdf_class(pdf, *self._args, **self._kwargs)
+        with pdf.local_context():
+            html2pdf.run(self, context)
+
+
 def _scale_units(
     pdf: "FPDF", in_tag_styles: dict[str, FontFace | TextStyle]
 ) -> dict[str, FontFace | TextStyle]:
@@ -1,6 +1,16 @@
 # pyright: reportUnknownVariableType=false
-from dataclasses import dataclass, field
-from typing import Literal, TypeAlias, cast
+import mmap
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeAlias, cast
+
+if TYPE_CHECKING:
+    from .enums import ResourceAccessPolicy
+    from .image_disk_cache import ImageDiskCache
+    from .remote_fetcher import RemoteResourceFetcher
+    from .svg import SVGLimits, SVGObject
 
 ImageFilter: TypeAlias = Literal[
     "AUTO",
@@ -87,6 +97,96 @@ class VectorImageInfo(ImageInfo):
     # pass
 
 
+class StoredImagePayload:
+    """
+    Reference to some image data stored by a `DiskImageStore`.
+    The data is only read back when calling `bytes()` on this object,
+    which happens when the PDF document is serialized.
+    """
+
+    __slots__ = ("store", "offset", "length")  # RAM usage optimization
+
+    def __init__(self, store: "DiskImageStore", offset: int, length: int) -> None:
+        self.store = store
+        self.offset = offset
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bytes__(self) -> bytes:
+        return self.store.read(self.offset, self.length)
+
+    def __repr__(self) -> str:
+        return f"StoredImagePayload(offset={self.offset}, length={self.length})"
+
+
+class DiskImageStore:
+    """
+    Stores the compressed payloads of raster images in a temporary file,
+    instead of keeping them in memory until the document is produced.
+    They are read back through a memory map, one image at a time, during `FPDF.output()`.
+
+    The temporary file is deleted when `close()` is called,
+    or when this object is garbage collected.
+    """
+
+    def __init__(self, directory: Optional[str | os.PathLike[str]] = None) -> None:
+        """
+        Args:
+            directory: optional folder where the temporary file is created.
+                By default, the platform temporary directory is used.
+        """
+        # pylint: disable=consider-using-with
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._size = 0
+        self._mmap: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        "Total size in bytes of the payloads stored"
+        return self._size
+
+    def store(self, data: bytes | bytearray) -> StoredImagePayload:
+        "Appends some data to the temporary file, and returns a reference to it"
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+        return StoredImagePayload(self, offset, len(data))
+
+    def read(self, offset: int, length: int) -> bytes:
+        "Reads some data previously stored"
+        if length == 0:
+            return b""
+        with self._lock:
+            if self._mmap is None or len(self._mmap) < offset + length:
+                # The file grew since it was last mapped:
+                self._file.flush()
+                if self._mmap is not None:
+                    self._mmap.close()
+                self._mmap = mmap.mmap(
+                    self._file.fileno(), self._size, access=mmap.ACCESS_READ
+                )
+            return self._mmap[offset : offset + length]
+
+    def close(self) -> None:
+        "Deletes the temporary file: stored payloads cannot be read anymore"
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._file.close()
+
+    def __enter__(self) -> "DiskImageStore":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
 @dataclass
 class ImageCache:
     # Map image identifiers to dicts describing raster or vector images
@@ -95,7 +195,55 @@ class ImageCache:
     icc_profiles: dict[bytes, int] = field(default_factory=dict)
     # Must be one of SUPPORTED_IMAGE_FILTERS values
     image_filter: ImageFilter = "AUTO"
+    # Optional persistent cache of processed raster images, shared across processes
+    disk_cache: Optional["ImageDiskCache"] = None
+    # Optional store where image payloads are moved out of memory until output
+    image_store: Optional[DiskImageStore] = None
+    # Optional pooled & cached fetcher of remote images
+    remote_fetcher: Optional["RemoteResourceFetcher"] = None
+    # Map SVG content hashes, resource access policies & limits to parsed SVG images:
+    svg_images: dict[
+        tuple[str, "ResourceAccessPolicy", Optional["SVGLimits"]],
+        tuple["SVGObject", VectorImageInfo],
+    ] = field(default_factory=dict)
+    # Number of Form XObjects whose indices are allocated among image indices:
+    form_xobjects_count: int = 0
 
     def reset_usages(self) -> None:
         for img in self.images.values():
             img["usages"] = 0
+
+    def fork(self) -> "ImageCache":
+        """
+        Returns a cache for another document, sharing the image payloads & ICC profiles
+        of this one, but tracking its own image usages & indices.
+        Parsed SVG images are not shared, as they are bound to a single image cache
+        while being rendered.
+        """
+        return replace(
+            self,
+            images={
+                name: type(info)(info, usages=0) for name, info in self.images.items()
+            },
+            icc_profiles=dict(self.icc_profiles),
+            svg_images={},
+        )
+
+    def next_xobject_index(self) -> int:
+        "Returns the index to give to the next raster image inserted in `images`"
+        return len(self.images) + self.form_xobjects_count + 1
+
+    def reserve_form_xobject_index(self) -> int:
+        "Allocates an XObject index, distinct from all image indices, for a Form XObject"
+        index = self.next_xobject_index()
+        self.form_xobjects_count += 1
+        return index
+
+    def store_payloads(self, info: RasterImageInfo) -> None:
+        "Moves the compressed data & soft mask of an image to `image_store`, if defined"
+        if self.image_store is None:
+            return
+        for key in ("data", "smask"):
+            payload = info.get(key)
+            if isinstance(payload, (bytes, bytearray)):
+                info[key] = self.image_store.store(payload)
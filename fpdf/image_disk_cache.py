@@ -0,0 +1,203 @@
+"""
+Persistent, content-addressed cache of processed raster images.
+
+Parsing a raster image (decoding it with Pillow, splitting its alpha channel,
+re-compressing its pixels...) is usually the most expensive step when inserting images
+in a document. When the same images are embedded across several processes or runs,
+an `ImageDiskCache` can be attached to an `fpdf.image_datastructures.ImageCache`
+in order to store the result of this processing on disk, and to skip Pillow entirely
+the next time the same source bytes are inserted with the same settings.
+
+Usage documentation at: <https://py-pdf.github.io/fpdf2/Images.html#persistent-disk-cache-of-processed-images>
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .image_datastructures import ImageFilter, RasterImageInfo
+
+LOGGER = logging.getLogger(__name__)
+
+# Increment this when the way images are processed changes in a way that alters their payloads:
+CACHE_FORMAT_VERSION = 1
+_MAGIC = b"FPDF2IMG"
+_HEADER_LENGTH = struct.Struct(">I")
+_FILE_SUFFIX = ".img"
+# Once the cache is full, entries are evicted until its size goes down to this ratio
+# of max_size, so that the directory is not scanned again on every following insert:
+EVICTION_TARGET_RATIO = 0.8
+
+
+class ImageDiskCache:
+    """
+    Content-addressed disk cache of `RasterImageInfo` payloads.
+
+    Entries are keyed by a hash of the source image bytes, the image filter,
+    the optional resizing dimensions and the compression level.
+    Every entry is written to a temporary file then atomically renamed,
+    so that several processes or threads can safely share the same directory.
+    Once the total size of the entries exceeds `max_size`,
+    the least recently used entries are evicted.
+    In order not to scan the directory on every insert, the size of the cache is
+    estimated from the entries written since the last eviction.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_size: int = 512 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            directory: folder where cache entries are stored. It is created if needed.
+            max_size (int): maximum total size in bytes of the cache entries. Defaults to 512 MiB.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be strictly positive, got: {max_size}")
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size_estimate: Optional[int] = None
+
+    @staticmethod
+    def key(
+        source: bytes,
+        image_filter: ImageFilter,
+        dims: Optional[tuple[float, float]],
+        compression_level: int,
+    ) -> str:
+        "Compute the cache key of an image, from its source bytes & processing settings"
+        settings = f"{CACHE_FORMAT_VERSION}|{image_filter}|{dims}|{compression_level}"
+        img_hash = hashlib.sha256(source)
+        img_hash.update(settings.encode())
+        return img_hash.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[RasterImageInfo]:
+        "Returns the `RasterImageInfo` stored for this key, or None on a cache miss"
+        path = self._path(key)
+        try:
+            with path.open("rb") as cache_file:
+                content = cache_file.read()
+        except OSError:
+            return None
+        try:
+            info = _deserialize(content)
+        except (ValueError, KeyError, TypeError, struct.error) as error:
+            LOGGER.warning("Ignoring corrupted image cache entry %s: %s", path, error)
+            _unlink(path)
+            return None
+        try:  # Marking the entry as recently used, for LRU eviction:
+            os.utime(path)
+        except OSError:
+            pass
+        return info
+
+    def put(self, key: str, info: RasterImageInfo) -> None:
+        """
+        Stores a `RasterImageInfo` in the cache, then evicts entries if it is full.
+        Entries holding values that cannot be serialized are not stored.
+        """
+        try:
+            content = _serialize(info)
+        except TypeError as error:
+            LOGGER.warning("Not storing image %s in the disk cache: %s", key, error)
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            _unlink(Path(tmp_path))
+            raise
+        if self._size_estimate is None:
+            self.evict()
+            return
+        self._size_estimate += len(content)
+        if self._size_estimate > self.max_size:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Measures the size of the cache, and if it exceeds `max_size`, removes the least
+        recently used entries until it is below `EVICTION_TARGET_RATIO * max_size`
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total_size = 0
+        for path in self.directory.glob(f"*/*{_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:  # concurrently evicted
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+        if total_size > self.max_size:
+            target_size = self.max_size * EVICTION_TARGET_RATIO
+            entries.sort()
+            for _, size, path in entries:
+                _unlink(path)
+                total_size -= size
+                if total_size <= target_size:
+                    break
+        self._size_estimate = total_size
+
+    def clear(self) -> None:
+        "Removes all the entries of the cache"
+        for path in self.directory.glob(f"*/*{_FILE_SUFFIX}"):
+            _unlink(path)
+        self._size_estimate = 0
+
+
+def _serialize(info: RasterImageInfo) -> bytes:
+    fields: dict[str, object] = {}
+    blobs: list[tuple[str, bytes]] = []
+    for name, value in info.items():
+        if isinstance(value, (bytes, bytearray)):
+            blobs.append((name, bytes(value)))
+        elif value is None or isinstance(value, (bool, int, float, str)):
+            fields[name] = value
+        else:
+            raise TypeError(
+                f"unsupported value type for {name}: {type(value).__name__}"
+            )
+    header = json.dumps(
+        {"fields": fields, "blobs": [(name, len(blob)) for name, blob in blobs]}
+    ).encode()
+    return b"".join(
+        (_MAGIC, _HEADER_LENGTH.pack(len(header)), header, *(blob for _, blob in blobs))
+    )
+
+
+def _deserialize(content: bytes) -> RasterImageInfo:
+    if not content.startswith(_MAGIC):
+        raise ValueError("invalid magic number")
+    offset = len(_MAGIC)
+    (header_length,) = _HEADER_LENGTH.unpack_from(content, offset)
+    offset += _HEADER_LENGTH.size
+    header = json.loads(content[offset : offset + header_length])
+    offset += header_length
+    info = RasterImageInfo(header["fields"])
+    for name, length in header["blobs"]:
+        if offset + length > len(content):
+            raise ValueError("truncated entry")
+        info[name] = content[offset : offset + length]
+        offset += length
+    if offset != len(content):
+        raise ValueError("unexpected trailing data")
+    return info
+
+
+def _unlink(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
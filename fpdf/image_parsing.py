@@ -6,8 +6,12 @@ import http.client
 import ipaddress
 import io
 import logging
+import math
+import re
 import socket
+import struct
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
 from math import ceil
@@ -41,7 +45,7 @@ from .image_datastructures import (
     RasterImageInfo,
     VectorImageInfo,
 )
-from .svg import SVGObject, SVGLimits
+from .svg import IncrementalSVGObject, SVGObject, SVGLimits
 from .util import ImageType
 
 try:
@@ -62,6 +66,8 @@ except (ImportError, AttributeError):
 if TYPE_CHECKING:
     from PIL.Image import Image as PILImage
     from PIL.ImageCms import ImageCmsProfile
+
+    from .remote_fetcher import RemoteResourceFetcher
 else:
     PILImage: TypeAlias = Any
 
@@ -82,6 +88,7 @@ class ImageSettings:
 LOGGER = logging.getLogger(__name__)
 SUPPORTED_IMAGE_FILTERS = ("AUTO", "FlateDecode", "DCTDecode", "JPXDecode", "LZWDecode")
 SETTINGS = ImageSettings()
+SVG_START_REGEX = re.compile(rb"\s*<(?:\?xml|svg) ")
 
 
 def _resource_scope_for_ip(
@@ -355,6 +362,8 @@ def preload_image(
     dims: Optional[tuple[float, float]] = None,
     resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
     svg_limits: Optional[SVGLimits] = None,
+    image_key: Optional[str] = None,
+    incremental_svg: bool = False,
 ) -> tuple[
     str,
     Union[SVGObject, "PILImage", bytes, BinaryIO, Path, None],
@@ -374,6 +383,12 @@ def preload_image(
             an io.BytesIO, or a instance of `PIL.Image.Image`.
         dims (tuple[int, int]): optional dimensions as a tuple (width, height) to resize the image
             (raster only) before storing it in the PDF.
+        image_key (str): optional identifier of the image in `image_cache.images`,
+            for raster images that are not file paths or URLs.
+            If not provided, such images are identified by a hash of their content.
+        incremental_svg (bool): if True, SVG images are not parsed by this function,
+            but returned as `fpdf.svg.IncrementalSVGObject` instances,
+            converted while they are drawn.
 
     Returns: A tuple, consisting of 3 values: the name, the image data,
         and an instance of a subclass of `ImageInfo`.
@@ -397,10 +412,15 @@ def preload_image(
         try:
             return get_svg_info(
                 name,
-                load_image(name, resource_access_policy=resource_access_policy),
+                load_image(
+                    name,
+                    resource_access_policy=resource_access_policy,
+                    remote_fetcher=image_cache.remote_fetcher,
+                ),
                 image_cache=image_cache,
                 resource_access_policy=resource_access_policy,
                 svg_limits=svg_limits,
+                incremental=incremental_svg,
             )
         except FPDFResourceAccessError:
             raise
@@ -408,78 +428,298 @@ def preload_image(
             raise
         except Exception as error:
             raise ValueError(f"Could not parse file: {name}") from error
-    if isinstance(name, bytes) and _is_svg(name.strip()):
+    if isinstance(name, bytes) and _is_svg(name):
         return get_svg_info(
             "vector_image",
             io.BytesIO(name),
             image_cache=image_cache,
             resource_access_policy=resource_access_policy,
             svg_limits=svg_limits,
+            incremental=incremental_svg,
         )
-    if isinstance(name, io.BytesIO) and _is_svg(name.getvalue().strip()):
+    if isinstance(name, io.BytesIO) and _is_svg_bytesio(name):
         return get_svg_info(
             "vector_image",
             name,
             image_cache=image_cache,
             resource_access_policy=resource_access_policy,
             svg_limits=svg_limits,
+            incremental=incremental_svg,
         )
 
     # Load raster data.
-    img: Union["PILImage", bytes, BinaryIO, Path, None]
-    raster_name: str
-    if isinstance(name, str):
-        raster_name, img = name, None
-    elif _is_pil_image(name):
-        bytes_ = name.tobytes()
-        img_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
-        img_hash.update(bytes_)
-        raster_name, img = img_hash.hexdigest(), name
-    elif isinstance(name, (bytes, io.BytesIO)):
-        bytes_ = name.getvalue() if isinstance(name, io.BytesIO) else name
-        bytes_ = bytes_.strip()
-        img_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
-        img_hash.update(bytes_)
-        raster_name, img = img_hash.hexdigest(), name
-    elif _is_binary_stream(name):
-        raster_name, img = str(name), name
-    else:
-        raster_name, img = str(name), None
+    raster_name, img = _raster_image_key(name, image_key)
     info = image_cache.images.get(raster_name)
     if info is not None:
         info["usages"] = info["usages"] + 1  # type: ignore[operator]
     else:
-        info = get_img_info(
+        info = _get_cached_img_info(
+            image_cache, raster_name, img, dims, resource_access_policy
+        )
+        _insert_image_info(image_cache, raster_name, info, usages=1)
+    return raster_name, img, info
+
+
+def preload_images(
+    image_cache: ImageCache,
+    names: Iterable[ImageType],
+    dims: Optional[tuple[float, float]] = None,
+    workers: Optional[int] = None,
+    resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
+    svg_limits: Optional[SVGLimits] = None,
+) -> list[
+    tuple[
+        str,
+        Union[SVGObject, "PILImage", bytes, BinaryIO, Path, None],
+        RasterImageInfo | VectorImageInfo,
+    ]
+]:
+    """
+    Read several images concurrently and load them into memory.
+
+    Raster images that are not already in `image_cache.images` are decoded & compressed
+    on a thread pool (Pillow & zlib release the GIL for most of this work),
+    then inserted in the cache in the order of `names`, so that image indices are deterministic.
+    Following calls to `fpdf.fpdf.FPDF.image()` with the same images are then simple cache hits.
+
+    Preloading an image does not count as an usage:
+    an image that is preloaded but never placed on a page is not embedded in the document.
+
+    Args:
+        image_cache: an `ImageCache` instance, usually the `.image_cache` attribute of a `FPDF` instance.
+        names: an iterable of image sources, in any format accepted by `preload_image()`.
+        dims (tuple[int, int]): optional dimensions as a tuple (width, height) to resize
+            all the raster images before storing them in the PDF.
+        workers (int): optional maximum number of threads used to process images.
+            Defaults to the `concurrent.futures.ThreadPoolExecutor` default.
+            Use 1 to process images sequentially in the calling thread.
+
+    Returns: a list of tuples, one per entry in `names`, with the same format
+        as the value returned by `preload_image()`.
+    """
+    names = list(names)
+    keys: list[Optional[tuple[str, Union["PILImage", bytes, BinaryIO, None]]]] = []
+    pending: dict[str, Union["PILImage", bytes, BinaryIO, None]] = {}
+    for name in names:
+        _validate_resource_access(name, resource_access_policy)
+        if _is_svg_source(name):
+            # Vector images are not stored in the image cache:
+            keys.append(None)
+            continue
+        raster_name, img = _raster_image_key(
+            str(name) if isinstance(name, Path) else name
+        )
+        keys.append((raster_name, img))
+        if raster_name not in image_cache.images and raster_name not in pending:
+            pending[raster_name] = img
+
+    def load(raster_name: str) -> RasterImageInfo:
+        return _get_cached_img_info(
+            image_cache,
+            raster_name,
+            pending[raster_name],
+            dims,
+            resource_access_policy,
+        )
+
+    if workers == 1 or len(pending) < 2:
+        infos = [load(raster_name) for raster_name in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            infos = list(executor.map(load, pending))
+    # Images are only inserted once all of them have been successfully processed:
+    for raster_name, info in zip(pending, infos):
+        _insert_image_info(image_cache, raster_name, info, usages=0)
+
+    results: list[
+        tuple[
+            str,
+            Union[SVGObject, "PILImage", bytes, BinaryIO, Path, None],
+            RasterImageInfo | VectorImageInfo,
+        ]
+    ] = []
+    for name, key in zip(names, keys):
+        if key is None:
+            results.append(
+                preload_image(
+                    image_cache,
+                    name,
+                    dims,
+                    resource_access_policy=resource_access_policy,
+                    svg_limits=svg_limits,
+                )
+            )
+        else:
+            raster_name, img = key
+            results.append((raster_name, img, image_cache.images[raster_name]))
+    return results
+
+
+def _raster_image_key(
+    name: ImageType,
+    image_key: Optional[str] = None,
+) -> tuple[str, Union["PILImage", bytes, BinaryIO, None]]:
+    """
+    Returns the identifier of a raster image in the image cache, and its data if any.
+
+    File paths & URLs are identified by their name.
+    Other images are identified by `image_key` if provided,
+    or else by a hash of their content.
+    """
+    if isinstance(name, str):
+        return name, None
+    if _is_pil_image(name):
+        return image_key or _pil_image_hash(name), name
+    if isinstance(name, bytes):
+        if image_key:
+            return image_key, name
+        img_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
+        img_hash.update(name)
+        return img_hash.hexdigest(), name
+    if isinstance(name, io.BytesIO):
+        if image_key:
+            return image_key, name
+        img_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
+        with name.getbuffer() as buffer:
+            img_hash.update(buffer)
+        return img_hash.hexdigest(), name
+    if _is_binary_stream(name):
+        return image_key or str(name), name
+    return str(name), None
+
+
+def _pil_image_hash(img: "PILImage") -> str:
+    """
+    Hash the pixels of a `PIL.Image.Image` chunk by chunk,
+    instead of building a full copy of its pixel buffer with `Image.tobytes()`.
+    """
+    img_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
+    img_hash.update(f"{img.mode} {img.width}x{img.height} ".encode())
+    if img.mode in ("P", "PA"):
+        img_hash.update(bytes(img.getpalette() or ()))
+    if not img.width or not img.height:
+        return img_hash.hexdigest()
+    img.load()
+    get_encoder = getattr(Image, "_getencoder", None)
+    if get_encoder is None:  # should not happen, but this is a private Pillow API
+        img_hash.update(img.tobytes())
+        return img_hash.hexdigest()
+    # This is what Image.tobytes() does, except that chunks are not joined:
+    encoder = get_encoder(img.mode, "raw", img.mode)
+    encoder.setimage(img.im, (0, 0) + img.size)
+    bufsize = max(65536, img.width * 4)
+    while True:
+        _, errcode, data = encoder.encode(bufsize)
+        img_hash.update(data)
+        if errcode:
+            break
+    if errcode < 0:
+        raise RuntimeError(f"Encoder error {errcode} while hashing image")
+    return img_hash.hexdigest()
+
+
+def _get_cached_img_info(
+    image_cache: ImageCache,
+    raster_name: str,
+    img: Union["PILImage", bytes, BinaryIO, None],
+    dims: Optional[tuple[float, float]],
+    resource_access_policy: ResourceAccessPolicy,
+) -> RasterImageInfo:
+    """
+    Calls `get_img_info()`, going through `image_cache.disk_cache` if it is defined.
+    `PIL.Image.Image` instances are never stored in the disk cache,
+    as they have no source bytes to derive a key from.
+    Remote images are fetched through `image_cache.remote_fetcher` if it is defined.
+    """
+    if (
+        img is None
+        and image_cache.remote_fetcher is not None
+        and raster_name.startswith(("http://", "https://"))
+    ):
+        img = image_cache.remote_fetcher.fetch(raster_name, resource_access_policy)
+    disk_cache = image_cache.disk_cache
+    if disk_cache is None or _is_pil_image(img):
+        return get_img_info(
             raster_name,
             img,
             image_cache.image_filter,
             dims,
             resource_access_policy=resource_access_policy,
         )
-        info["i"] = len(image_cache.images) + 1
-        info["usages"] = 1
-        info["iccp_i"] = None
-        iccp = info.get("iccp")
-        if iccp is not None:
-            LOGGER.debug(
-                "ICC profile found for image %s - It will be inserted in the PDF document",
-                raster_name,
-            )
-            if iccp in image_cache.icc_profiles:
-                info["iccp_i"] = image_cache.icc_profiles[
-                    iccp
-                ]  # pyright: ignore[reportArgumentType]
-            else:
-                iccp_i = len(image_cache.icc_profiles)
-                image_cache.icc_profiles[iccp] = iccp_i  # type: ignore[index]
-                info["iccp_i"] = iccp_i
-            info["iccp"] = None
-        image_cache.images[raster_name] = info
-    return raster_name, img, info
+    if img is None:
+        source = load_image(
+            raster_name, resource_access_policy=resource_access_policy
+        ).read()
+    elif isinstance(img, bytes):
+        source = img
+    elif isinstance(img, BytesIO):
+        source = img.getvalue()
+    else:
+        assert _is_binary_stream(img)
+        source = img.read()
+    key = disk_cache.key(
+        source, image_cache.image_filter, dims, SETTINGS.compression_level
+    )
+    info = disk_cache.get(key)
+    if info is not None:
+        LOGGER.debug("Image %s loaded from disk cache", raster_name)
+        return info
+    info = get_img_info(
+        raster_name,
+        source,
+        image_cache.image_filter,
+        dims,
+        resource_access_policy=resource_access_policy,
+    )
+    disk_cache.put(key, info)
+    return info
 
 
-def _is_svg(bytes_: bytes) -> bool:
-    return bytes_.startswith(b"<?xml ") or bytes_.startswith(b"<svg ")
+def _insert_image_info(
+    image_cache: ImageCache, raster_name: str, info: RasterImageInfo, usages: int
+) -> None:
+    "Registers a freshly parsed raster image in the image cache"
+    info["i"] = image_cache.next_xobject_index()
+    info["usages"] = usages
+    info["iccp_i"] = None
+    iccp = info.get("iccp")
+    if iccp is not None:
+        LOGGER.debug(
+            "ICC profile found for image %s - It will be inserted in the PDF document",
+            raster_name,
+        )
+        if iccp in image_cache.icc_profiles:
+            info["iccp_i"] = image_cache.icc_profiles[
+                iccp
+            ]  # pyright: ignore[reportArgumentType]
+        else:
+            iccp_i = len(image_cache.icc_profiles)
+            image_cache.icc_profiles[iccp] = iccp_i  # type: ignore[index]
+            info["iccp_i"] = iccp_i
+        info["iccp"] = None
+    image_cache.store_payloads(info)
+    image_cache.images[raster_name] = info
+
+
+def _is_svg_source(name: Any) -> bool:
+    "Returns True if `preload_image()` would handle this image source as a vector image"
+    if isinstance(name, (str, Path)):
+        return str(name).endswith(".svg")
+    if isinstance(name, bytes):
+        return _is_svg(name)
+    if isinstance(name, io.BytesIO):
+        return _is_svg_bytesio(name)
+    return False
+
+
+def _is_svg(bytes_: bytes | memoryview) -> bool:
+    # Leading whitespaces are skipped without copying the data, unlike bytes.strip():
+    return SVG_START_REGEX.match(bytes_) is not None
+
+
+def _is_svg_bytesio(bytes_io: BytesIO) -> bool:
+    with bytes_io.getbuffer() as buffer:
+        return _is_svg(buffer)
 
 
 def _is_pil_image(obj: Any) -> TypeGuard[PILImage]:
@@ -493,11 +733,13 @@ def _is_binary_stream(obj: Any) -> TypeGuard[BinaryIO]:
 def load_image(
     filename: str | Path | BinaryIO,
     resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
+    remote_fetcher: Optional["RemoteResourceFetcher"] = None,
 ) -> BinaryIO:
     """
     This method is used to load external resources, such as images.
     It is automatically called when resource added to document by `fpdf.fpdf.FPDF.image()`.
     It always return a BytesIO buffer.
+    If a `remote_fetcher` is provided, it is used to retrieve HTTP(S) resources.
     """
     # if a file-like object is passed in, use it directly or copy it into a BytesIO buffer
     if isinstance(filename, (BytesIO, io.BufferedIOBase, BinaryIO)):
@@ -509,6 +751,8 @@ def load_image(
         filename = str(filename)
     # Resource access is governed by the active resource_access_policy.
     if filename.startswith(("http://", "https://")):
+        if remote_fetcher is not None:
+            return BytesIO(remote_fetcher.fetch(filename, resource_access_policy))
         pinned_addresses_by_url = {
             filename: _validate_remote_url_access(filename, resource_access_policy)
         }
@@ -563,15 +807,38 @@ def get_svg_info(
     image_cache: ImageCache,
     resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
     svg_limits: Optional[SVGLimits] = None,
+    incremental: bool = False,
 ) -> tuple[str, SVGObject, VectorImageInfo]:
+    """
+    Parses a SVG image, or retrieves it from `image_cache.svg_images`
+    if the same SVG content has already been parsed.
+    If `incremental` is True, only the <svg> start tag is parsed:
+    the image is converted while being drawn, and is not cached.
+    """
     img.seek(0)
-    svg_data = img.read()
-    svg = SVGObject(
-        svg_data,
-        image_cache=image_cache,
-        resource_access_policy=resource_access_policy,
-        svg_limits=svg_limits,
-    )
+    cache_key = None
+    svg: SVGObject
+    if incremental:
+        svg = IncrementalSVGObject(
+            img,
+            image_cache=image_cache,
+            resource_access_policy=resource_access_policy,
+            svg_limits=svg_limits,
+        )
+    else:
+        svg_data = img.read()
+        svg_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
+        svg_hash.update(svg_data)
+        cache_key = (svg_hash.hexdigest(), resource_access_policy, svg_limits)
+        cached = image_cache.svg_images.get(cache_key)
+        if cached is not None:
+            return filename, cached[0], cached[1]
+        svg = SVGObject(
+            svg_data,
+            image_cache=image_cache,
+            resource_access_policy=resource_access_policy,
+            svg_limits=svg_limits,
+        )
     if svg.viewbox:
         _, _, w, h = svg.viewbox
     else:
@@ -581,6 +848,8 @@ def get_svg_info(
     if svg.height:
         h = svg.height
     info = VectorImageInfo(data=svg, w=w, h=h)
+    if cache_key is not None:
+        image_cache.svg_images[cache_key] = (svg, info)
     return filename, svg, info
 
 
@@ -639,6 +908,38 @@ def get_img_info(
         else:
             image_filter = "FlateDecode"
 
+    if (
+        img_raw_data is not None
+        and not img_altered
+        and img.format == "PNG"
+        and image_filter == "FlateDecode"
+    ):
+        # If possible, we copy the compressed pixels of the PNG file as they are:
+        img_raw_data.seek(0)
+        png_info = _png_passthrough_info(img_raw_data.read())
+        if png_info is not None:
+            iccp = img.info.get("icc_profile")
+            if iccp is not None and not is_iccp_valid(iccp, filename):
+                iccp = None
+            w, h = img.size
+            if not is_pil_img:
+                if keep_bytes_io_open:
+                    setattr(img, "fp", None)
+                else:
+                    img.close()
+            info = RasterImageInfo(png_info)
+            info.update(
+                {
+                    "w": w,
+                    "h": h,
+                    "iccp": iccp,
+                    "f": image_filter,
+                    "inverted": False,
+                    "dp": f"/Predictor 15 /Colors {png_info['dpn']} /Columns {w}",
+                }
+            )
+            return info
+
     if img.mode in ("P", "PA") and image_filter != "FlateDecode":
         img = img.convert("RGBA")
 
@@ -821,6 +1122,86 @@ def get_img_info(
     return info
 
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Maps PNG color types that can be embedded without decoding to (colors count, color space, allowed bit depths):
+PNG_PASSTHROUGH_COLOR_TYPES = {
+    0: (1, "DeviceGray", (2, 4, 8, 16)),
+    2: (3, "DeviceRGB", (8, 16)),
+    3: (1, "Indexed", (1, 2, 4, 8)),
+}
+# The IDAT data of a PNG file is only embedded as is if its size does not exceed
+# this ratio of the size of the pixels that would otherwise be compressed again,
+# with at most 8 bits per component:
+PNG_PASSTHROUGH_MAX_SIZE_RATIO = 0.75
+
+
+def _png_passthrough_info(png_bytes: bytes) -> Optional[dict[str, object]]:
+    """
+    If the concatenated IDAT chunks of this PNG file can be embedded as-is in a PDF
+    FlateDecode stream with a /Predictor 15 (PNG predictors), returns the corresponding
+    image information: "data", "cs", "bpc", "dpn" & "pal" (for indexed images).
+
+    This is only possible for non-interlaced images without any transparency:
+    grayscale, RGB or palette-based, and only worth it if their pixels are well
+    compressed: cf. PNG_PASSTHROUGH_MAX_SIZE_RATIO. Otherwise, None is returned.
+    """
+    if not png_bytes.startswith(PNG_SIGNATURE):
+        return None
+    view = memoryview(png_bytes)
+    offset = len(PNG_SIGNATURE)
+    header: Optional[tuple[int, ...]] = None
+    palette = None
+    idat_chunks: list[memoryview] = []
+    while offset + 12 <= len(view):
+        (length,) = struct.unpack_from(">I", view, offset)
+        chunk_type = bytes(view[offset + 4 : offset + 8])
+        chunk_end = offset + 8 + length
+        if chunk_end + 4 > len(view):
+            return None  # truncated file
+        chunk_data = view[offset + 8 : chunk_end]
+        (crc,) = struct.unpack_from(">I", view, chunk_end)
+        if zlib.crc32(view[offset + 4 : chunk_end]) != crc:
+            return None  # corrupted chunk: letting Pillow handle it
+        offset = chunk_end + 4
+        if chunk_type == b"IHDR":
+            if length != 13:
+                return None
+            header = struct.unpack(">IIBBBBB", chunk_data)
+        elif chunk_type == b"PLTE":
+            palette = bytes(chunk_data)
+        elif chunk_type == b"tRNS":
+            return None
+        elif chunk_type == b"IDAT":
+            idat_chunks.append(chunk_data)
+        elif chunk_type == b"IEND":
+            break
+    if header is None or not idat_chunks:
+        return None
+    width, height, bit_depth, color_type, compression, filter_method, interlace = header
+    if compression != 0 or filter_method != 0 or interlace != 0:
+        return None
+    if color_type not in PNG_PASSTHROUGH_COLOR_TYPES:
+        return None
+    dpn, colspace, bit_depths = PNG_PASSTHROUGH_COLOR_TYPES[color_type]
+    if bit_depth not in bit_depths:
+        return None
+    data = b"".join(idat_chunks)
+    pixels_size = height * math.ceil(width * dpn * min(bit_depth, 8) / 8)
+    if len(data) > pixels_size * PNG_PASSTHROUGH_MAX_SIZE_RATIO:
+        return None  # compressing the pixels again produces a smaller image
+    info: dict[str, object] = {
+        "data": data,
+        "cs": colspace,
+        "bpc": bit_depth,
+        "dpn": dpn,
+    }
+    if color_type == 3:
+        if not palette:
+            return None
+        info["pal"] = palette
+    return info
+
+
 class temp_attr:
     """
     temporary change the attribute of an object using a context manager
@@ -29,6 +29,7 @@ from .enums import Align, CharVPos, TextDirection, TextMode, WrapMode
 from .errors import FPDFException
 from .fonts import CoreFont, TTFFont
 from .graphics_state import GraphicsState
+from .number_formatting import CONTENT_FORMATTER
 from .util import FloatTolerance, escape_parens
 
 StateStackType = GraphicsState
@@ -382,9 +383,8 @@ class Fragment:
                     text = ""
                 offsetx = pos_x + adjust_pos(ti["x_offset"])
                 offsety = pos_y - adjust_pos(ti["y_offset"])
-                ret += (
-                    f"1 0 0 1 {(offsetx) * self.k:.2f} {(h - offsety) * self.k:.2f} Tm "
-                )
+                position = ((offsetx) * self.k, (h - offsety) * self.k)
+                ret += f"1 0 0 1 {CONTENT_FORMATTER.join(position)} Tm "
             text += char
             pos_x += adjust_pos(ti["x_advance"]) + char_spacing
             pos_y += adjust_pos(ti["y_advance"])
@@ -398,7 +398,8 @@ class Fragment:
                 if text:
                     ret += f"({text}) Tj "
                     text = ""
-                ret += f"1 0 0 1 {(pos_x) * self.k:.2f} {(h - pos_y) * self.k:.2f} Tm "
+                position = ((pos_x) * self.k, (h - pos_y) * self.k)
+                ret += f"1 0 0 1 {CONTENT_FORMATTER.join(position)} Tm "
 
         if text:
             ret += f"({text}) Tj"
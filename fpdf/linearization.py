@@ -1,24 +1,38 @@
 # pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false
-# pylint: disable=fixme,protected-access
+# pylint: disable=protected-access
 """
-This module is in work-in-progress state.
-Hint tables / hint streams have not been implemented yet,
-and there are a few "TODO" comment remaining.
+Production of linearized PDF files, also known as "Fast Web View" files,
+as described in Annex F of the PDF 1.7 specification (ISO 32000-1).
+
+The PDF objects are first built by `fpdf.output.OutputProducer`, as for a regular document,
+then reordered & renumbered so that the objects required to display the first page
+are located at the beginning of the file, followed by the objects of each other page,
+and finally by the objects shared between several pages.
+The primary hint stream describes this layout to PDF readers,
+so that they can fetch any page with HTTP range requests.
 cf. https://github.com/py-pdf/fpdf2/issues/62
+
+The contents of this module are internal to fpdf2, and not part of the public API.
+They may change at any time without prior warning or any deprecation period,
+in non-backward-compatible ways.
 """
 
-from typing import TYPE_CHECKING, Optional
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
-from .output import ContentWithoutID, OutputProducer, PDFCatalog, PDFHeader, PDFInfo
-from .sign import sign_content
-from .syntax import (
-    DestinationXYZ,
-    PDFArray,
-    PDFContentStream,
-    PDFObject,
-    iobj_ref as pdf_ref,
+from .enums import PageMode
+from .errors import FPDFException
+from .output import (
+    ContentWithoutID,
+    OutputProducer,
+    PDFCatalog,
+    PDFHeader,
+    PDFPage,
+    _dimensions_to_mediabox,
 )
-from .util import buffer_subst
+from .sign import sign_content
+from .syntax import PDFContentStream, PDFObject, iobj_ref as pdf_ref
 
 try:
     from endesive import signer
@@ -32,6 +46,16 @@ HINT_STREAM_OFFSET_LENGTH_PLACEHOLDER = "0%1%2%3%4%5%6%7%8%9%a%b%c%d"
 FIRST_PAGE_END_OFFSET_PLACEHOLDER = "1%2%3%4%5%6%"
 MAIN_XREF_1ST_ENTRY_OFFSET_PLACEHOLDER = "2%3%4%5%6%7%"
 FILE_LENGTH_PLACEHOLDER = "3%4%5%6%7%8%"
+FILE_ID_PLACEHOLDER = f"<{'0' * 32}><{'0' * 32}>"
+
+# Tokens of a serialized PDF object that can contain indirect references or enclose them:
+_REFERENCES_TOKENS_REGEX = re.compile(
+    r"\((?:[^\\()]|\\.)*\)"  # literal string
+    r"|<[0-9A-Fa-f\s]*>"  # hexadecimal string
+    r"|\nstream\r?\n"  # start of the stream data, that is never parsed
+    r"|(?<![\w.])(\d+) 0 R\b",  # indirect reference
+    re.DOTALL,
+)
 
 
 class PDFLinearization(PDFObject):
@@ -41,7 +65,7 @@ class PDFLinearization(PDFObject):
         self.n = pages_count
         # Primary hint stream offset and length (part 5):
         self.h = HINT_STREAM_OFFSET_LENGTH_PLACEHOLDER
-        self.o = None  # Object number of first page’s page object (part 6)
+        self.o: Optional[int] = None  # Object number of first page’s page object (part 6)
         self.e = FIRST_PAGE_END_OFFSET_PLACEHOLDER  # Offset of end of first page
         # Offset of first entry in main cross-reference table (part 11):
         self.t = MAIN_XREF_1ST_ENTRY_OFFSET_PLACEHOLDER
@@ -49,84 +73,38 @@ class PDFLinearization(PDFObject):
 
 
 class PDFXrefAndTrailer(ContentWithoutID):
-    PREV_MAIN_XREF_START_PLACEHOLDER = "0%1*2+3-2/1^"
+    "One of the two cross-reference table sections of a linearized PDF, with its trailer"
 
-    def __init__(self, output_builder: OutputProducer) -> None:
+    def __init__(
+        self, output_builder: OutputProducer, start_obj_id: int, count: int
+    ) -> None:
         self.output_builder = output_builder
-        self.count = output_builder.obj_id + 1
-        self.start_obj_id = 1
+        self.start_obj_id = start_obj_id
+        self.count = count
         # Must be set before the call to serialize():
-        self.catalog_obj: Optional[PDFCatalog] = None
-        self.info_obj: Optional[PDFInfo] = None
-        self.first_xref: Optional["PDFXrefAndTrailer"] = None
-        self.main_xref: Optional["PDFXrefAndTrailer"] = None
-        # Computed at serialize() time based on output_builder.buffer size:
-        self.startxref: Optional[str] = None
-
-    @property
-    def is_first_xref(self) -> bool:
-        return bool(self.main_xref)
-
-    @property
-    def is_main_xref(self) -> bool:
-        return bool(self.first_xref)
+        self.trailer: dict[str, str] = {}
+        self.startxref = 0
 
     def serialize(
         self, _security_handler: Optional["StandardSecurityHandler"] = None
     ) -> str:
-        builder = self.output_builder
-        assert builder is not None
-        assert builder.buffer is not None
+        offsets = self.output_builder.offsets
         out: list[str] = []
-        self.startxref = str(len(builder.buffer))
-        if self.is_main_xref:
-            builder.buffer = buffer_subst(
-                builder.buffer,
-                self.PREV_MAIN_XREF_START_PLACEHOLDER,
-                self.startxref.rjust(12, " "),
-            )
         out.append("xref")
-        out.append(f"{0 if self.start_obj_id == 1 else self.start_obj_id} {self.count}")
-        if not self.is_first_xref:
-            out.append("0000000000 65535 f ")
-        assert (
-            len(builder.offsets) > 1
-        ), "TODO: how to know the offsets in the 1st xref at this stage?"
+        out.append(f"{self.start_obj_id} {self.count}")
         for obj_id in range(self.start_obj_id, self.start_obj_id + self.count):
-            out.append(f"{builder.offsets[obj_id]:010} 00000 n ")
+            if obj_id == 0:
+                out.append("0000000000 65535 f ")
+            else:
+                # The offsets of the first-page section objects are not known yet
+                # when its cross-reference table is serialized for the 1st time:
+                out.append(f"{offsets.get(obj_id, 0):010} 00000 n ")
         out.append("trailer")
         out.append("<<")
-        if self.is_main_xref:
-            assert self.first_xref is not None
-            out.append(f"/Size {self.count - self.first_xref.count}")
-        else:
-            if self.is_first_xref:
-                assert self.main_xref is not None
-                out.append(f"/Size {self.main_xref.count}")
-                out.append(f"/Prev {self.PREV_MAIN_XREF_START_PLACEHOLDER}")
-            else:
-                out.append(f"/Size {self.count}")
-            assert self.catalog_obj is not None
-            assert self.info_obj is not None
-            out.append(f"/Root {pdf_ref(self.catalog_obj.id)}")
-            out.append(f"/Info {pdf_ref(self.info_obj.id)}")
-            fpdf = builder.fpdf
-            file_id = fpdf.file_id()
-            if file_id == -1:
-                file_id = fpdf._default_file_id(  # pyright: ignore[reportPrivateUsage]
-                    builder.buffer
-                )
-            if file_id:
-                out.append(f"/ID [{file_id}]")
+        out.extend(f"{key} {value}" for key, value in self.trailer.items())
         out.append(">>")
         out.append("startxref")
-        startxref = self.startxref
-        if self.is_main_xref:
-            assert self.first_xref is not None
-            startxref = str(self.first_xref.startxref or "0")
-        if self.is_first_xref:
-            startxref = "0"
-        out.append(startxref)
+        out.append(str(self.startxref))
         out.append("%%EOF")
         return "\n".join(out)
 
@@ -134,9 +112,9 @@ class PDFXrefAndTrailer(ContentWithoutID):
 class PDFHintStream(PDFContentStream):
     def __init__(self, contents: bytes, compress: bool = False) -> None:
         super().__init__(contents=contents, compress=compress)
-        self.s = None  # (Required) Shared object hint table
+        self.s: Optional[int] = None  # (Required) Shared object hint table
         self.t = None  # (Present only if thumbnail images exist) Thumbnail hint table
-        self.o = None  # (Present only if a document outline exists) Outline hint table
+        self.o: Optional[int] = None  # (Present only if a document outline exists) Outline hint table
         self.a = None  # (Present only if article threads exist) Thread information hint table
         self.e = None  # (Present only if named destinations exist) Named destination hint table
         self.v = None  # (Present only if an interactive form dictionary exists) Interactive form hint table
@@ -147,183 +125,486 @@ class PDFHintStream(PDFContentStream):
         self.b = None  # (Present only if embedded file streams exist; PDF 1.5) Embedded file stream hint table
 
 
+class BitWriter:
+    "Packs unsigned integers of arbitrary bit widths, most significant bit first"
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self._pending = 0
+        self._pending_bits = 0
+
+    def write(self, value: int, bits: int) -> None:
+        assert 0 <= value < 1 << bits or value == bits == 0, f"{value=} {bits=}"
+        self._pending = (self._pending << bits) | value
+        self._pending_bits += bits
+        while self._pending_bits >= 8:
+            self._pending_bits -= 8
+            self.buffer.append(self._pending >> self._pending_bits)
+            self._pending &= (1 << self._pending_bits) - 1
+
+    def write_all(self, values: Iterable[int], bits: int) -> None:
+        "Writes a sequence of values, then pads the last byte: hint table items start on byte boundaries"
+        for value in values:
+            self.write(value, bits)
+        self.flush()
+
+    def flush(self) -> None:
+        if self._pending_bits:
+            self.write(0, 8 - self._pending_bits)
+
+
+class _SerializedObject:
+    "A PDF object serialized with its initial number, and renumbered before being output"
+
+    __slots__ = ("obj_id", "text", "references", "_spans")
+
+    def __init__(self, pdf_obj: PDFObject) -> None:
+        self.obj_id = pdf_obj.id
+        self.text = pdf_obj.serialize()
+        header = f"{self.obj_id} 0 obj"
+        assert self.text.startswith(header), self.text[:80]
+        # Positions of the object number & of all the indirect references in .text:
+        self._spans: list[tuple[int, int, int]] = [
+            (0, len(str(self.obj_id)), self.obj_id)
+        ]
+        for match in _REFERENCES_TOKENS_REGEX.finditer(self.text, len(header)):
+            if match.group(0).startswith("\n"):
+                break  # Stream data is never parsed
+            if match.group(1):
+                self._spans.append((match.start(1), match.end(1), int(match.group(1))))
+        self.references = {obj_id for _, _, obj_id in self._spans[1:]}
+
+    def renumber(self, new_id_per_old_id: dict[int, int]) -> None:
+        parts: list[str] = []
+        prev_end = 0
+        for start, end, obj_id in self._spans:
+            parts.append(self.text[prev_end:start])
+            parts.append(str(new_id_per_old_id[obj_id]))
+            prev_end = end
+        parts.append(self.text[prev_end:])
+        self.text = "".join(parts)
+        self.obj_id = new_id_per_old_id[self.obj_id]
+        self.references = {new_id_per_old_id[obj_id] for obj_id in self.references}
+
+    @property
+    def size(self) -> int:
+        "Number of bytes taken in the output buffer, including the end-of-line marker"
+        return len(self.text) + 1
+
+
+@dataclass
+class _LinearizedParts:
+    "PDF objects of a linearized file, in the order they are output"
+
+    part4: list[_SerializedObject]  # Document catalog
+    part6: list[_SerializedObject]  # First-page section
+    part7: list[list[_SerializedObject]]  # Sections of the remaining pages
+    part8: list[_SerializedObject] = field(default_factory=list)  # Shared objects
+    part9: list[_SerializedObject] = field(default_factory=list)  # Other objects
+    # The outline hierarchy, either in part 6 or at the beginning of part 9:
+    outline: list[_SerializedObject] = field(default_factory=list)
+
+    @property
+    def main_section(self) -> list[_SerializedObject]:
+        "Objects of the parts 7, 8 & 9, listed in the main cross-reference table"
+        objs = [obj for page_section in self.part7 for obj in page_section]
+        return objs + self.part8 + self.part9
+
+
 class LinearizedOutputProducer(OutputProducer):
+    """
+    Produces a linearized PDF, whose parts are ordered as described in section F.3 of the PDF 1.7 specification:
+
+    1. Header
+    2. Linearization parameter dictionary
+    3. First-page cross-reference table and trailer
+    4. Document catalog
+    5. Primary hint stream
+    6. First-page section: the 1st page object, and all the objects it requires
+    7. Remaining pages: for each page, its page object and the objects only it uses
+    8. Shared objects: the objects used by several pages, but not by the 1st one
+    9. Objects not associated with pages
+    10. (Optional overflow hint stream: never produced)
+    11. Main cross-reference table and trailer
+    """
+
     def bufferize(self) -> bytearray:
         fpdf = self.fpdf
+        if fpdf._security_handler is not None:
+            raise FPDFException("Encrypted documents cannot be linearized")
 
-        # 1. Setup - Insert all PDF objects
-        #    (in the order required to build a linearized PDF),
-        #    and assign unique consecutive numeric IDs to all of them
+        # 1. Setup - Insert all PDF objects, as for a non-linearized document:
+        xref, sig_annotation_obj = self._insert_pdf_objects()
+        header = self.pdf_objs[0]
+        assert isinstance(header, PDFHeader)
+        catalog_obj = xref.catalog_obj
+        assert catalog_obj is not None
+        page_objs = list(self._iter_pages_in_order())
+        for page_obj in page_objs:
+            # The first page object must not rely on attributes inherited from the pages root:
+            if page_obj.media_box is None:
+                page_obj.media_box = _dimensions_to_mediabox(page_obj.dimensions())
+        objs = [
+            _SerializedObject(pdf_obj)
+            for pdf_obj in self.pdf_objs
+            if not isinstance(pdf_obj, ContentWithoutID)
+        ]
 
-        # Part 1: Header
-        self.pdf_objs.append(PDFHeader(fpdf.pdf_version))
-        # Part 2: Linearization parameter dictionary
+        # 2. Ordering objects by the first page using them, then renumbering them
+        #    by order of appearance in each cross-reference table section:
+        parts = self._split_in_parts(objs, catalog_obj, page_objs)
+        main_objs = parts.main_section
+        main_xref_count = len(main_objs) + 1
         linearization_obj = PDFLinearization(fpdf.pages_count)
-        self._add_pdf_obj(linearization_obj)
-        # Part 3: First-page cross-reference table and trailer
-        first_xref = PDFXrefAndTrailer(self)
-        self.pdf_objs.append(first_xref)
-        # Part 4: Document catalogue and other required document-level objects
-        catalog_obj = self._add_catalog()
-        # Part 5: Primary hint stream (may precede or follow part 6)
-        hint_stream_obj = PDFHintStream("".encode("latin-1"))  # TODO
-        self.pdf_objs.append(hint_stream_obj)
-        # Part 6: First-page section (may precede or follow part 5)
-        page_objs = self._add_pages(slice(0, 1))
-        # The following objects shall be contained in the first-page section:
-        #   + This page object shall explicitly specify all required attributes, e.g. Resources, MediaBox
-        #   + The entire outline hierarchy, if the PageMode entry in the catalogue is UseOutlines
-        #   + All objects that the page object refers to [including] Contents, Resources, Annots
-        # TODO
-
-        first_xref.count = self.obj_id + 1
-        first_xref_pdf_objs = list(self.pdf_objs)
-        self.obj_id = 0
-
-        # Part 7: Remaining pages
-        page_objs.extend(self._add_pages(slice(1, None)))
-        # Part 8: Shared objects for all pages except the first
-        # = resources, that are referenced from more than one page but [not] from the first page
-        pages_root_obj = self._add_pages_root()
-        sig_annotation_obj = self._add_annotations_as_objects()
-        img_objs_per_index = self._add_images()
-        gfxstate_objs_per_name = self._add_gfxstates()
-        shading_objs_per_name = self._add_shadings()
-        pattern_objs_per_name = self._add_patterns()
-        font_objs_per_index = self._add_fonts(
-            img_objs_per_index,
-            gfxstate_objs_per_name,
-            pattern_objs_per_name,
-        )
-        resources_dict_obj = self._add_resources_dict(
-            font_objs_per_index,
-            img_objs_per_index,
-            gfxstate_objs_per_name,
-            shading_objs_per_name,
-            pattern_objs_per_name,
-        )
-        # Part 9: Objects not associated with pages, if any
-        for embedded_file in fpdf.embedded_files:
-            self._add_pdf_obj(embedded_file, "embedded_files")
-        struct_tree_root_obj = self._add_structure_tree()
-        outline_dict_obj, outline_items = self._add_document_outline()
-        xmp_metadata_obj = self._add_xmp_metadata()
-        info_obj = self._add_info()
-        # Part 11: Main cross-reference table and trailer
-        main_xref = PDFXrefAndTrailer(self)
-        self.pdf_objs.append(main_xref)
-
-        # Re-assigning IDs of all PDF objects in the 1st xref table:
-        first_xref.start_obj_id = self.obj_id + 1
-        for pdf_obj in first_xref_pdf_objs:
-            if (
-                not isinstance(pdf_obj, ContentWithoutID)
-                and pdf_obj is not hint_stream_obj
-            ):
-                self.obj_id += 1
-                pdf_obj.id = self.obj_id
-        # The hint streams shall be assigned the last object numbers in the file:
-        self.obj_id += 1
-        hint_stream_obj.id = self.obj_id
-
-        # 2. Plumbing - Inject all PDF object references required:
-        linearization_obj.o = page_objs[0].id  # type: ignore[assignment]
-        pages_root_obj.kids = PDFArray(page_objs)
-        self._finalize_catalog(
-            catalog_obj,
-            pages_root_obj=pages_root_obj,
-            first_page_obj=page_objs[0],
-            sig_annotation_obj=sig_annotation_obj,
-            xmp_metadata_obj=xmp_metadata_obj,
-            struct_tree_root_obj=struct_tree_root_obj,
-            outline_dict_obj=outline_dict_obj,
+        linearization_obj.id = main_xref_count
+        hint_stream_id = main_xref_count + len(parts.part4) + 1
+        new_id_per_old_id: dict[int, int] = {}
+        for new_id, obj in enumerate(main_objs, start=1):
+            new_id_per_old_id[obj.obj_id] = new_id
+        for new_id, obj in enumerate(parts.part4, start=main_xref_count + 1):
+            new_id_per_old_id[obj.obj_id] = new_id
+        for new_id, obj in enumerate(parts.part6, start=hint_stream_id + 1):
+            new_id_per_old_id[obj.obj_id] = new_id
+        self.trace_labels_per_obj_id = {
+            new_id_per_old_id[obj_id]: label
+            for obj_id, label in self.trace_labels_per_obj_id.items()
+            if obj_id in new_id_per_old_id
+        }
+        for pdf_obj in self.pdf_objs:
+            if isinstance(pdf_obj, PDFObject):
+                pdf_obj.id = new_id_per_old_id[pdf_obj.id]
+        for obj in objs:
+            obj.renumber(new_id_per_old_id)
+        linearization_obj.o = parts.part6[0].obj_id
+        first_xref_count = len(parts.part4) + len(parts.part6) + 2
+        first_xref = PDFXrefAndTrailer(
+            self, start_obj_id=main_xref_count, count=first_xref_count
         )
-        dests: list[DestinationXYZ] = []
-        for page_obj in page_objs:
-            page_obj.parent = pages_root_obj
-            page_obj.resources = resources_dict_obj
-            assert page_obj.annots is not None
-            for annot in page_obj.annots:
-                if annot.dest:
-                    dests.append(annot.dest)
-                if annot.a and hasattr(annot.a, "dest"):
-                    dests.append(annot.a.dest)
-            if not page_obj.annots:
-                # Avoid serializing an empty PDFArray:
-                page_obj.annots = None
-        for outline_item in outline_items:
-            if outline_item.dest is not None:
-                dests.append(outline_item.dest)
-        # Assigning the .page_ref property of all Destination objects:
-        for dest in dests:
-            dest.page_ref = pdf_ref(  # pyright: ignore[reportAttributeAccessIssue]
-                page_objs[
-                    dest.page_number - 1  # pyright: ignore[reportAttributeAccessIssue]
-                ].id
-            )
-        for struct_elem in fpdf.struct_builder.doc_struct_elem.k:
-            struct_elem.pg = page_objs[struct_elem.page_number() - 1]
-        main_xref.first_xref = first_xref
-        first_xref.main_xref = main_xref
-        for xref in [main_xref, first_xref]:
-            xref.catalog_obj = catalog_obj
-            xref.info_obj = info_obj
+        first_xref.trailer["/Size"] = str(main_xref_count + first_xref_count)
+        first_xref.trailer["/Prev"] = f"{0:10}"  # main cross-reference table offset
+        first_xref.trailer["/Root"] = pdf_ref(catalog_obj.id)
+        if xref.info_obj:
+            first_xref.trailer["/Info"] = pdf_ref(xref.info_obj.id)
+        file_id = fpdf.file_id()
+        if file_id == -1:
+            file_id = FILE_ID_PLACEHOLDER
+        if file_id:
+            first_xref.trailer["/ID"] = f"[{file_id}]"
+        main_xref = PDFXrefAndTrailer(self, start_obj_id=0, count=main_xref_count)
+        main_xref.trailer["/Size"] = str(main_xref_count)
+        sig_annotation_id = sig_annotation_obj.id if sig_annotation_obj else None
 
         # 3. Serializing - Append all PDF objects to the buffer:
         assert (
             not self.buffer
         ), f"Nothing should have been appended to the .buffer at this stage: {self.buffer}"
-        assert (
-            not self.offsets
-        ), f"No offset should have been set at this stage: {len(self.offsets)}"
-        for pdf_obj in self.pdf_objs:
-            if isinstance(pdf_obj, ContentWithoutID):
-                # top header, xref table & trailer:
-                trace_label = None
-            else:
-                self.offsets[pdf_obj.id] = len(self.buffer)
-                trace_label = self.trace_labels_per_obj_id.get(pdf_obj.id)
-            if trace_label:
-                with self._trace_size(trace_label):
-                    self._out(pdf_obj.serialize())
-            else:
-                self._out(pdf_obj.serialize())
+        self._out(header.serialize())
+        linearization_offset = len(self.buffer)
+        self.offsets[linearization_obj.id] = linearization_offset
+        serialized_linearization = linearization_obj.serialize()
+        self._out(serialized_linearization)
+        first_xref_offset = len(self.buffer)
+        self._out(first_xref.serialize())
+        for obj in parts.part4:
+            self._out_object(obj, sig_annotation_id)
+        hint_stream_offset = len(self.buffer)
+        hint_stream_obj = self._build_hint_stream(parts, hint_stream_offset)
+        hint_stream_obj.id = hint_stream_id
+        self.offsets[hint_stream_id] = hint_stream_offset
+        self._out(hint_stream_obj.serialize())
+        hint_stream_length = len(self.buffer) - hint_stream_offset
+        for obj in parts.part6:
+            self._out_object(obj, sig_annotation_id)
+        first_page_end_offset = len(self.buffer)
+        for obj in main_objs:
+            self._out_object(obj, sig_annotation_id)
+        main_xref_offset = len(self.buffer)
+        # Offset of the end-of-line marker preceding the entry of object 0:
+        main_xref_1st_entry_offset = main_xref_offset + len(
+            f"xref\n0 {main_xref_count}"
+        )
+        main_xref.startxref = first_xref_offset
+        self._out(main_xref.serialize())
         self._log_final_sections_sizes()
 
         # Now that the file size & all the offsets are known,
-        # substitute the values of the Linearization properties:
-        hs1_offset = self.offsets[hint_stream_obj.id]
-        hs1_length = len(hint_stream_obj.serialize())
-        self.buffer = buffer_subst(
-            self.buffer,
-            HINT_STREAM_OFFSET_LENGTH_PLACEHOLDER,
-            f"[{hs1_offset: 12d} {hs1_length: 12d}]",
-        )
-        self.buffer = buffer_subst(
-            self.buffer,
-            FIRST_PAGE_END_OFFSET_PLACEHOLDER,
-            f"{self.offsets[page_objs[0].id + 1]: 12d}",
-        )
-        self.buffer = buffer_subst(
-            self.buffer,
-            MAIN_XREF_1ST_ENTRY_OFFSET_PLACEHOLDER,
-            f"{self.offsets[main_xref.start_obj_id]: 12d}",
-        )
-        self.buffer = buffer_subst(
-            self.buffer,
-            FILE_LENGTH_PLACEHOLDER,
-            f"{len(self.buffer): 12d}",
-        )
+        # fill in the first-page cross-reference table & the linearization parameters:
+        first_xref.trailer["/Prev"] = f"{main_xref_offset:10}"
+        self._patch(first_xref_offset, first_xref.serialize())
+        for key, placeholder, value in (
+            (
+                "/H",
+                HINT_STREAM_OFFSET_LENGTH_PLACEHOLDER,
+                f"[{hint_stream_offset: 12d} {hint_stream_length: 12d}]",
+            ),
+            ("/E", FIRST_PAGE_END_OFFSET_PLACEHOLDER, f"{first_page_end_offset: 12d}"),
+            (
+                "/T",
+                MAIN_XREF_1ST_ENTRY_OFFSET_PLACEHOLDER,
+                f"{main_xref_1st_entry_offset: 12d}",
+            ),
+            ("/L", FILE_LENGTH_PLACEHOLDER, f"{len(self.buffer): 12d}"),
+        ):
+            entry = f"{key} {placeholder}"
+            self._patch(
+                linearization_offset
+                + serialized_linearization.index(entry)
+                + len(key)
+                + 1,
+                value,
+            )
+        if file_id == FILE_ID_PLACEHOLDER:
+            file_id_offset = self.buffer.index(
+                FILE_ID_PLACEHOLDER.encode(), first_xref_offset
+            )
+            self._patch(file_id_offset, fpdf._default_file_id(self.buffer))
 
-        if fpdf._sign_key:  # pyright: ignore[reportPrivateUsage]
+        if fpdf._sign_credentials:
             self.buffer = sign_content(
                 signer,  # pyright: ignore[reportArgumentType]
                 self.buffer,
-                fpdf._sign_key,  # pyright: ignore[reportPrivateUsage]
-                fpdf._sign_cert,  # pyright: ignore[reportPrivateUsage]
-                fpdf._sign_extra_certs,  # pyright: ignore[reportPrivateUsage]
-                fpdf._sign_hashalgo,  # pyright: ignore[reportPrivateUsage]
-                fpdf._sign_time,  # pyright: ignore[reportPrivateUsage]
+                fpdf._sign_credentials,
+                fpdf._sign_time,
+                self.sig_placeholders_offsets,
             )
 
         return self.buffer
+
+    @staticmethod
+    def _split_in_parts(
+        objs: Sequence[_SerializedObject],
+        catalog_obj: PDFCatalog,
+        page_objs: Sequence[PDFPage],
+    ) -> "_LinearizedParts":
+        "Distributes the PDF objects in the parts 4, 6, 7, 8 & 9 of a linearized file"
+        obj_per_id = {obj.obj_id: obj for obj in objs}
+        page_ids = [page_obj.id for page_obj in page_objs]
+        # The objects used by a page are found by following the references from it,
+        # without crossing the document-level objects & the other pages:
+        placed_ids = {catalog_obj.id, *page_ids}
+        boundaries = set(placed_ids)
+        if catalog_obj.pages is not None:
+            boundaries.add(catalog_obj.pages.id)
+
+        def objects_used(root_id: int) -> set[int]:
+            used: set[int] = set()
+            pending = [root_id]
+            while pending:
+                for obj_id in obj_per_id[pending.pop()].references:
+                    if obj_id not in used and obj_id not in boundaries:
+                        used.add(obj_id)
+                        pending.append(obj_id)
+            return used
+
+        # The interactive form fields are required to open the document:
+        open_document_ids: set[int] = set()
+        if catalog_obj.acro_form:
+            for field_obj in catalog_obj.acro_form.fields:
+                open_document_ids.add(field_obj.id)
+                open_document_ids |= objects_used(field_obj.id)
+        boundaries |= open_document_ids
+        placed_ids |= open_document_ids
+
+        first_page_ids = objects_used(page_ids[0])
+        pages_using: dict[int, list[int]] = {}
+        for page_index, page_id in enumerate(page_ids[1:], start=1):
+            for obj_id in objects_used(page_id) - first_page_ids:
+                pages_using.setdefault(obj_id, []).append(page_index)
+        outline_ids: set[int] = set()
+        if catalog_obj.outlines:
+            outline_ids = {catalog_obj.outlines.id} | objects_used(
+                catalog_obj.outlines.id
+            )
+            outline_ids -= first_page_ids | pages_using.keys()
+
+        parts = _LinearizedParts(
+            part4=[obj_per_id[catalog_obj.id]]
+            + [obj for obj in objs if obj.obj_id in open_document_ids],
+            part6=[obj_per_id[page_ids[0]]],
+            part7=[[obj_per_id[page_id]] for page_id in page_ids[1:]],
+        )
+        for obj in objs:
+            if obj.obj_id in placed_ids:
+                continue
+            if obj.obj_id in first_page_ids:
+                parts.part6.append(obj)
+            elif obj.obj_id in outline_ids:
+                parts.outline.append(obj)
+            elif obj.obj_id not in pages_using:
+                parts.part9.append(obj)
+            elif len(pages_using[obj.obj_id]) == 1:
+                parts.part7[pages_using[obj.obj_id][0] - 1].append(obj)
+            else:
+                parts.part8.append(obj)
+        parts.part8.sort(key=lambda obj: pages_using[obj.obj_id][0])
+        # The outline hierarchy is stored contiguously, as described by its hint table:
+        if catalog_obj.page_mode == PageMode.USE_OUTLINES:
+            # It is then required to display the first page:
+            parts.part6.extend(parts.outline)
+        else:
+            parts.part9[:0] = parts.outline
+        return parts
+
+    def _build_hint_stream(
+        self, parts: _LinearizedParts, hint_stream_offset: int
+    ) -> PDFHintStream:
+        """
+        Builds the page offset hint table, the shared object hint table
+        and the outline hint table, described in section F.4 of the PDF 1.7 specification.
+        Offsets in hint tables are computed as if the hint stream was not present,
+        hence the 1st page object is considered to be located at the hint stream offset.
+        """
+        # Each shared object group contains a single object here.
+        # The groups are the objects of the first-page section, then the shared objects:
+        shared_objs = [*parts.part6, *parts.part8]
+        # References to the first page object itself are not shared objects references:
+        shared_index_per_id = {
+            obj.obj_id: index for index, obj in enumerate(shared_objs) if index > 0
+        }
+        pages = [parts.part6, *parts.part7]
+        # The first page has no shared object reference, its objects are all in part 6:
+        shared_refs_per_page: list[list[int]] = [[]]
+        for page_section in parts.part7:
+            shared_refs_per_page.append(
+                sorted(
+                    _shared_objects_used(page_section, shared_index_per_id, shared_objs)
+                )
+            )
+        objects_counts = [len(page) for page in pages]
+        page_lengths = [sum(obj.size for obj in page) for page in pages]
+        shared_refs_counts = [len(refs) for refs in shared_refs_per_page]
+        max_shared_index = max(
+            (max(refs) for refs in shared_refs_per_page if refs), default=0
+        )
+
+        writer = BitWriter()
+        # Page offset hint table header:
+        writer.write(min(objects_counts), 32)
+        writer.write(hint_stream_offset, 32)
+        objects_counts_bits = _bits_needed(objects_counts)
+        writer.write(objects_counts_bits, 16)
+        writer.write(min(page_lengths), 32)
+        page_lengths_bits = _bits_needed(page_lengths)
+        writer.write(page_lengths_bits, 16)
+        # Like Acrobat, content streams offsets are not provided,
+        # and content streams lengths are approximated by the pages lengths:
+        writer.write(0, 32)
+        writer.write(0, 16)
+        writer.write(min(page_lengths), 32)
+        writer.write(page_lengths_bits, 16)
+        shared_refs_counts_bits = max(shared_refs_counts).bit_length()
+        writer.write(shared_refs_counts_bits, 16)
+        shared_index_bits = max_shared_index.bit_length()
+        writer.write(shared_index_bits, 16)
+        writer.write(0, 16)  # no fractional position of shared objects references
+        writer.write(1, 16)
+        # Page offset hint table per-page entries:
+        writer.write_all(
+            (count - min(objects_counts) for count in objects_counts),
+            objects_counts_bits,
+        )
+        page_lengths_deltas = [length - min(page_lengths) for length in page_lengths]
+        writer.write_all(page_lengths_deltas, page_lengths_bits)
+        writer.write_all(shared_refs_counts, shared_refs_counts_bits)
+        writer.write_all(
+            (index for refs in shared_refs_per_page for index in refs),
+            shared_index_bits,
+        )
+        writer.write_all(page_lengths_deltas, page_lengths_bits)
+        shared_object_hint_table_offset = len(writer.buffer)
+
+        # Shared object hint table header:
+        main_section_offset = hint_stream_offset + page_lengths[0]
+        group_lengths = [obj.size for obj in shared_objs]
+        if parts.part8:
+            writer.write(parts.part8[0].obj_id, 32)
+            writer.write(main_section_offset + sum(page_lengths[1:]), 32)
+        else:
+            writer.write(0, 32)
+            writer.write(0, 32)
+        writer.write(len(parts.part6), 32)
+        writer.write(len(shared_objs), 32)
+        writer.write(0, 16)  # each group contains a single object
+        writer.write(min(group_lengths), 32)
+        group_lengths_bits = _bits_needed(group_lengths)
+        writer.write(group_lengths_bits, 16)
+        # Shared object hint table entries:
+        writer.write_all(
+            (length - min(group_lengths) for length in group_lengths),
+            group_lengths_bits,
+        )
+        writer.write_all((0 for _ in shared_objs), 1)  # no MD5 signature provided
+
+        outline_hint_table_offset = None
+        if parts.outline:
+            # Outline hint table, a generic hint table:
+            outline_hint_table_offset = len(writer.buffer)
+            if parts.outline[0] in parts.part6:
+                outline_offset = hint_stream_offset + sum(
+                    obj.size for obj in parts.part6[: -len(parts.outline)]
+                )
+            else:
+                outline_objs_start = parts.outline[0].obj_id - 1
+                outline_offset = main_section_offset + sum(
+                    obj.size for obj in parts.main_section[:outline_objs_start]
+                )
+            writer.write(parts.outline[0].obj_id, 32)
+            writer.write(outline_offset, 32)
+            writer.write(len(parts.outline), 32)
+            writer.write(sum(obj.size for obj in parts.outline), 32)
+
+        hint_stream_obj = PDFHintStream(
+            bytes(writer.buffer), compress=self.fpdf.compress
+        )
+        hint_stream_obj.s = shared_object_hint_table_offset
+        hint_stream_obj.o = outline_hint_table_offset
+        return hint_stream_obj
+
+    def _out_object(
+        self, obj: _SerializedObject, sig_annotation_id: Optional[int]
+    ) -> None:
+        self.offsets[obj.obj_id] = len(self.buffer)
+        if obj.obj_id == sig_annotation_id:
+            self._locate_signature_placeholders(obj.text)
+        trace_label = self.trace_labels_per_obj_id.get(obj.obj_id)
+        if trace_label:
+            with self._trace_size(trace_label):
+                self._out(obj.text)
+        else:
+            self._out(obj.text)
+
+    def _patch(self, offset: int, value: str) -> None:
+        "Overwrites a fixed-length placeholder already appended to the buffer"
+        data = value.encode("latin-1")
+        assert len(self.buffer) >= offset + len(data)
+        self.buffer[offset : offset + len(data)] = data
+
+
+def _bits_needed(values: Sequence[int]) -> int:
+    "Number of bits needed to store the differences between the values and their minimum"
+    return (max(values) - min(values)).bit_length()
+
+
+def _shared_objects_used(
+    page_section: Sequence[_SerializedObject],
+    shared_index_per_id: dict[int, int],
+    shared_objs: Sequence[_SerializedObject],
+) -> set[int]:
+    "Returns the indices of the shared objects used, directly or not, by a page"
+    used: set[int] = set()
+    pending = [
+        obj_id
+        for obj in page_section
+        for obj_id in obj.references
+        if obj_id in shared_index_per_id
+    ]
+    while pending:
+        index = shared_index_per_id[pending.pop()]
+        if index not in used:
+            used.add(index)
+            pending.extend(
+                obj_id
+                for obj_id in shared_objs[index].references
+                if obj_id in shared_index_per_id
+            )
+    return used
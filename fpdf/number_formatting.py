@@ -0,0 +1,173 @@
+"""
+Formatting of the numbers written in PDF content streams & dictionaries.
+
+Every operator emitted by fpdf2 renders its operands with one of the formatters
+defined in this module:
+
+- `CONTENT_FORMATTER`: coordinates, lengths & font sizes emitted by `FPDF` methods
+  (shapes, text positioning, cell borders, images placement...)
+- `DRAWING_FORMATTER`: numbers emitted by the `fpdf.drawing` API, that is also used
+  to render SVG images, and by PDF objects serialization
+- `PATTERN_FORMATTER`: matrices, colors & bounds of gradients and shading patterns
+
+Their `decimals` attribute is a process-wide setting, that applies to all documents.
+It is **not thread-safe**: it must only be changed when the program starts,
+before any document is generated. Changing it while documents are being generated,
+for example while serving a request, alters the documents rendered concurrently
+by other threads, and can mix several precisions in a single content stream.
+There is no per-document precision setting.
+"""
+
+import re
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from .util import Number
+
+_TRAILING_ZEROS_RE = re.compile(r"\.?0+ ")
+_NEGATIVE_ZERO_RE = re.compile(r"(?<!\S)-(?=0(?:\.0*)? )")
+# Up to this length, formatting numbers one by one benefits from the cache:
+_SHORT_SEQUENCE_LENGTH = 8
+# Maximum length of the representations kept in cache:
+_CACHED_LENGTH = 5
+
+
+class NumberFormatter:
+    """
+    Converts numbers to strings, with a given number of decimal places.
+
+    Args:
+        decimals (int): the number of decimal places of the numbers produced
+        strip_zeros (bool): whether to remove trailing zeros & decimal point,
+            in order to produce minimal representations. Defaults to True.
+        negative_zero (bool): whether to allow "-0" to be produced, when negative
+            numbers are rounded to zero. Defaults to True.
+        cache_size (int): maximum number of formatted values kept in cache.
+            Defaults to 4096.
+    """
+
+    __slots__ = (
+        "_decimals",
+        "_strip_zeros",
+        "_negative_zero",
+        "cache_size",
+        "_format_spec",
+        "_template",
+        "_spaced_template",
+        "_int_suffix",
+        "_cache",
+        "_cached",
+    )
+
+    def __init__(
+        self,
+        decimals: int,
+        strip_zeros: bool = True,
+        negative_zero: bool = True,
+        cache_size: int = 4096,
+    ) -> None:
+        self._strip_zeros = strip_zeros
+        self._negative_zero = negative_zero
+        self.cache_size = cache_size
+        self._cache: dict["Number", str] = {}
+        self.decimals = decimals
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(decimals={self._decimals},"
+            f" strip_zeros={self._strip_zeros}, negative_zero={self._negative_zero})"
+        )
+
+    @property
+    def strip_zeros(self) -> bool:
+        "Whether trailing zeros & decimal point are removed"
+        return self._strip_zeros
+
+    @property
+    def negative_zero(self) -> bool:
+        "Whether -0 can be produced"
+        return self._negative_zero
+
+    @property
+    def decimals(self) -> int:
+        """
+        Number of decimal places of the numbers produced.
+        Changing it is not thread-safe: it must be set before any document is generated.
+        """
+        return self._decimals
+
+    @decimals.setter
+    def decimals(self, decimals: int) -> None:
+        if decimals < 0:
+            raise ValueError(f"Invalid number of decimals: {decimals}")
+        self._decimals = decimals
+        self._format_spec = f".{decimals}f"
+        self._template = f"%.{decimals}f"
+        self._spaced_template = self._template + " "
+        self._int_suffix = "." + "0" * decimals if decimals else ""
+        # Replaced rather than cleared, as other threads may be using it:
+        self._cache = {}
+        # Numbers that need some post-processing once formatted are cached:
+        self._cached = bool(decimals) and (self._strip_zeros or not self._negative_zero)
+
+    def format(self, number: "Number") -> str:
+        "Returns the string representation of a single number."
+        if type(number) is int:  # pylint: disable=unidiomatic-typecheck
+            return str(number) if self._strip_zeros else str(number) + self._int_suffix
+        if not self._cached:
+            return format(number, self._format_spec)
+        cached = self._cache.get(number)
+        if cached is not None:
+            return cached
+        formatted = format(number, self._format_spec)
+        if self._strip_zeros and self._decimals:
+            formatted = formatted.rstrip("0").rstrip(".")
+        if not self._negative_zero and formatted.startswith("-"):
+            if not formatted.strip("-0."):
+                formatted = formatted[1:]
+        # Only short representations, of "round" values, are likely to be repeated.
+        # -0.0 equals 0.0, but may produce a different representation:
+        if number and len(formatted) <= _CACHED_LENGTH:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[number] = formatted
+        return formatted
+
+    def join(self, numbers: Sequence["Number"]) -> str:
+        """
+        Returns the string representations of a sequence of numbers, separated by spaces.
+
+        Long sequences are formatted at once, which is much faster than
+        calling `format()` on each of their numbers.
+        """
+        if self._cached and len(numbers) <= _SHORT_SEQUENCE_LENGTH:
+            return " ".join(map(self.format, numbers))
+        formatted = (self._spaced_template * len(numbers)) % tuple(numbers)
+        if self._strip_zeros and self._decimals:
+            formatted = _TRAILING_ZEROS_RE.sub(" ", formatted)
+        if not self._negative_zero:
+            formatted = _NEGATIVE_ZERO_RE.sub("", formatted)
+        return formatted[:-1]
+
+    def format_many(self, numbers: Sequence["Number"]) -> list[str]:
+        "Returns the string representations of a sequence of numbers, as a list."
+        return self.join(numbers).split()
+
+    def fill(self, template: str, numbers: Sequence["Number"]) -> str:
+        """
+        Replaces each `%s` placeholder of a template by the representation
+        of the corresponding number.
+        """
+        if self._cached:
+            return template % tuple(self.format_many(numbers))
+        return template.replace("%s", self._template) % tuple(numbers)
+
+
+CONTENT_FORMATTER = NumberFormatter(2, strip_zeros=False)
+"Formatter used by `FPDF` methods to render operators in page content streams"
+
+DRAWING_FORMATTER = NumberFormatter(4)
+"Formatter used by the `fpdf.drawing` API & PDF objects serialization"
+
+PATTERN_FORMATTER = NumberFormatter(8, negative_zero=False)
+"Formatter used by gradients & shading patterns"
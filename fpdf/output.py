@@ -15,6 +15,7 @@ import re
 # pylint: disable=protected-access
 from abc import ABC, abstractmethod
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from html import escape as _html_escape
@@ -31,9 +32,15 @@ from .font_type_3 import Type3Font
 from .fonts import CORE_FONTS, CoreFont, TTFFont
 from .image_datastructures import RasterImageInfo
 from .line_break import TotalPagesSubstitutionFragment
+from .number_formatting import CONTENT_FORMATTER
 from .outline import OutlineDictionary, OutlineItemDictionary, build_outline_objs
 from .pattern import Gradient, MeshShading, Pattern, Shading
-from .sign import Signature, sign_content
+from .sign import (
+    _SIGNATURE_BYTERANGE_PLACEHOLDER,
+    _SIGNATURE_CONTENTS_PLACEHOLDER,
+    Signature,
+    sign_content,
+)
 from .syntax import (
     DestinationXYZ,
     Name,
@@ -58,18 +65,20 @@ except ImportError:
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Generator,
     ItemsView,
     Iterator,
     Literal,
     Optional,
     Sequence,
+    SupportsBytes,
     Union,
     cast,
 )
 
 if TYPE_CHECKING:
-    from .drawing import BlendGroup, GraphicsStyle
+    from .drawing import BlendGroup, FormGroup, GraphicsContext, GraphicsStyle
     from .encryption import EncryptionDictionary, StandardSecurityHandler
     from .enums import PageLayout, PageMode
     from .fonts import PDFFontDescriptor
@@ -367,6 +376,7 @@ class PDFXObject(PDFContentStream):
     __slots__ = (  # RAM usage optimization
         "_id",
         "_contents",
+        "_encrypted",
         "filter",
         "length",
         "type",
@@ -383,7 +393,7 @@ class PDFXObject(PDFContentStream):
 
     def __init__(
         self,
-        contents: bytes,
+        contents: bytes | SupportsBytes,
         subtype: str,
         width: float,
         height: float,
@@ -420,6 +430,7 @@ class PDFICCProfile(PDFContentStream):
     __slots__ = (  # RAM usage optimization
         "_id",
         "_contents",
+        "_encrypted",
         "filter",
         "length",
         "n",
@@ -780,6 +791,13 @@ class ResourceCatalog:
             OrderedDict()
         )
         self._ocg_names_by_state: dict[tuple[bool, bool], str] = {}
+        # Callback rendering shared graphics contexts into Form XObjects,
+        # returning their index, or None if they must be rendered inline:
+        self.shared_form_renderer: Optional[
+            Callable[["GraphicsContext", "GraphicsStyle"], Optional[int]]
+        ] = None
+        # When not None, the serialized graphics styles registered are appended to it:
+        self.graphics_styles_recorder: Optional[list[str]] = None
 
     def add(
         self,
@@ -820,8 +838,15 @@ class ResourceCatalog:
         style_dict: Optional[Raw] = style.serialize()
         if style_dict is None:  # empty style does not need an entry
             return None
-        style_str = str(style_dict)
+        return self.register_serialized_graphics_style(str(style_dict))
 
+    def register_serialized_graphics_style(self, style_str: str) -> Name:
+        """
+        Registers a graphics style from its serialized dictionary,
+        as produced by `GraphicsStyle.serialize()`, and returns its name.
+        """
+        if self.graphics_styles_recorder is not None:
+            self.graphics_styles_recorder.append(style_str)
         if style_str not in self.graphics_styles:
             name = Name(
                 f"{self._get_prefix(PDFResourceType.EXT_G_STATE)}{len(self.graphics_styles)}"
@@ -867,6 +892,19 @@ class ResourceCatalog:
         self.form_xobjects.append((index, xobject))
         return index
 
+    def register_form(
+        self, form_group: "FormGroup", index: int, compress: bool = False
+    ) -> None:
+        """
+        Register a Form XObject, rendered once, that will be painted with `/I{index} Do`.
+        The index must be distinct from all image indices,
+        cf. `fpdf.image_datastructures.ImageCache.reserve_form_xobject_index()`.
+        """
+        xobject = form_group_to_xobject(form_group, self, compress)
+        self.form_xobjects.append((index, xobject))
+        if index >= self.next_xobject_index:
+            self.next_xobject_index = index + 1
+
     def scan_stream(self, rendered: str) -> set[tuple[PDFResourceType, str]]:
         """Parse a content stream and return discovered resources"""
         found: set[tuple[PDFResourceType, str]] = set()
@@ -1022,6 +1060,8 @@ class OutputProducer:
         self.trace_labels_per_obj_id: dict[int, str] = {}
         self.sections_size_per_trace_label: dict[str, int] = defaultdict(int)
         self.buffer: bytearray = bytearray()  # resulting output buffer
+        # offsets of the signature ByteRange & Contents placeholders in self.buffer:
+        self.sig_placeholders_offsets: Optional[tuple[int, int]] = None
 
     def bufferize(self) -> bytearray:
         """
@@ -1030,6 +1070,57 @@ class OutputProducer:
         plus a few other properties on PDFPage instances
         """
         fpdf = self.fpdf
+        xref, sig_annotation_obj = self._insert_pdf_objects()
+        self.pdf_objs.append(xref)
+
+        if fpdf._security_handler is not None:
+            self._encrypt_large_streams(fpdf._security_handler)
+
+        # 3. Serializing - Append all PDF objects to the buffer:
+        assert (
+            not self.buffer
+        ), f"Nothing should have been appended to the .buffer at this stage: {self.buffer}"
+        assert (
+            not self.offsets
+        ), f"No offset should have been set at this stage: {len(self.offsets)}"
+
+        for pdf_obj in self.pdf_objs:
+            if isinstance(pdf_obj, ContentWithoutID):
+                # top header, xref table & trailer:
+                trace_label = None
+            else:
+                self.offsets[pdf_obj.id] = len(self.buffer)
+                trace_label = self.trace_labels_per_obj_id.get(pdf_obj.id)
+            serialized = pdf_obj.serialize(_security_handler=fpdf._security_handler)
+            if pdf_obj is sig_annotation_obj:
+                self._locate_signature_placeholders(serialized)
+            if trace_label:
+                with self._trace_size(trace_label):
+                    self._out(serialized)
+            else:
+                self._out(serialized)
+        self._log_final_sections_sizes()
+
+        if fpdf._sign_credentials:
+            self.buffer = sign_content(
+                signer,  # pyright: ignore[reportArgumentType]
+                self.buffer,
+                fpdf._sign_credentials,
+                fpdf._sign_time,
+                self.sig_placeholders_offsets,
+            )
+        return self.buffer
+
+    def _insert_pdf_objects(
+        self,
+    ) -> tuple[PDFXrefAndTrailer, Optional[PDFAnnotation]]:
+        """
+        Inserts the file header & all the PDF objects in .pdf_objs,
+        and injects the references between them.
+        Returns the cross-reference table to append after them,
+        and the signature annotation, if any.
+        """
+        fpdf = self.fpdf
 
         # 1. setup - Insert all PDF objects
         #    and assign unique consecutive numeric IDs to all of them
@@ -1067,7 +1158,6 @@ class OutputProducer:
         encryption_obj = self._add_encryption()
 
         xref = PDFXrefAndTrailer(self)
-        self.pdf_objs.append(xref)
 
         # 2. Plumbing - Inject all PDF object references required:
         pages_root_obj.kids = PDFArray(page_objs)
@@ -1118,42 +1208,38 @@ class OutputProducer:
         xref.catalog_obj = catalog_obj
         xref.info_obj = info_obj
         xref.encryption_obj = encryption_obj
+        return xref, sig_annotation_obj
+
+    def _locate_signature_placeholders(self, serialized_sig_annotation: str) -> None:
+        "Records the offsets of the signature placeholders, before appending them to the buffer"
+        # The annotation is encoded in latin-1 by _out(), so string indices are byte offsets:
+        self.sig_placeholders_offsets = (
+            len(self.buffer)
+            + serialized_sig_annotation.index(_SIGNATURE_BYTERANGE_PLACEHOLDER),
+            len(self.buffer)
+            + serialized_sig_annotation.index(_SIGNATURE_CONTENTS_PLACEHOLDER),
+        )
 
-        # 3. Serializing - Append all PDF objects to the buffer:
-        assert (
-            not self.buffer
-        ), f"Nothing should have been appended to the .buffer at this stage: {self.buffer}"
-        assert (
-            not self.offsets
-        ), f"No offset should have been set at this stage: {len(self.offsets)}"
-
-        for pdf_obj in self.pdf_objs:
-            if isinstance(pdf_obj, ContentWithoutID):
-                # top header, xref table & trailer:
-                trace_label = None
-            else:
-                self.offsets[pdf_obj.id] = len(self.buffer)
-                trace_label = self.trace_labels_per_obj_id.get(pdf_obj.id)
-            if trace_label:
-                with self._trace_size(trace_label):
-                    self._out(
-                        pdf_obj.serialize(_security_handler=fpdf._security_handler)
-                    )
-            else:
-                self._out(pdf_obj.serialize(_security_handler=fpdf._security_handler))
-        self._log_final_sections_sizes()
-
-        if fpdf._sign_key:
-            self.buffer = sign_content(
-                signer,  # pyright: ignore[reportArgumentType]
-                self.buffer,
-                fpdf._sign_key,
-                fpdf._sign_cert,
-                fpdf._sign_extra_certs,
-                fpdf._sign_hashalgo,
-                fpdf._sign_time,
-            )
-        return self.buffer
+    def _encrypt_large_streams(
+        self, security_handler: "StandardSecurityHandler"
+    ) -> None:
+        "Encrypt large content streams on a thread pool, if the security handler allows it"
+        workers = security_handler.workers
+        if workers is None or workers <= 1:
+            return
+        large_streams = [
+            pdf_obj
+            for pdf_obj in self.pdf_objs
+            if isinstance(pdf_obj, PDFContentStream)
+            and pdf_obj.length >= security_handler.PARALLEL_STREAM_MIN_SIZE
+        ]
+        if len(large_streams) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(
+                lambda stream: stream.encrypt(security_handler), large_streams
+            ):
+                pass
 
     def _out(self, data: bytes | bytearray | str) -> None:
         "Append data to the buffer"
@@ -1625,7 +1711,7 @@ class OutputProducer:
         decode_parms = f"<<{info['dp']} /BitsPerComponent {info['bpc']}>>"
         img_obj = PDFXObject(
             subtype="Image",
-            contents=cast(bytes, info["data"]),
+            contents=cast(bytes | SupportsBytes, info["data"]),
             width=cast(int, info["w"]),
             height=cast(int, info["h"]),
             color_space=color_space,
@@ -1722,7 +1808,7 @@ class OutputProducer:
     def _register_form_xobject_placeholders(
         self, img_objs_per_index: dict[int, PDFXObject]
     ) -> None:
-        """Ensure isolated blend forms are part of the XObject set before other resources rely on them."""
+        """Ensure Form XObjects are part of the XObject set before other resources rely on them."""
         for index, xobject in self.fpdf._resource_catalog.form_xobjects:
             if not getattr(xobject, "_registered", False):
                 self._add_pdf_obj(xobject, "images")
@@ -1737,11 +1823,11 @@ class OutputProducer:
         shading_objs_per_name: dict[str, Shading | MeshShading],
         font_objs_per_index: dict[int, PDFFont | PDFType3Font],
     ) -> None:
-        """Populate resource dictionaries for isolated blend Form XObjects."""
+        """Populate resource dictionaries for Form XObjects."""
         for _, xobject in self.fpdf._resource_catalog.form_xobjects:
-            blend_group = getattr(xobject, "_blend_group", None)
-            if blend_group is not None:
-                xobject.resources = blend_group.get_resource_dictionary(  # type: ignore[attr-defined]
+            form_group = getattr(xobject, "_form_group", None)
+            if form_group is not None:
+                xobject.resources = form_group.get_resource_dictionary(  # type: ignore[attr-defined]
                     gfxstate_objs_per_name,
                     pattern_objs_per_name,
                     shading_objs_per_name,
@@ -2246,11 +2332,10 @@ def stream_content_for_raster_image(
     else:
         stream_h = -h
         stream_y = y + h
-    return (
-        f"q {w * scale:.2f} 0 0 {stream_h * scale:.2f}"
-        f" {x * scale:.2f} {stream_y * scale:.2f} cm"
-        f" /I{info['i']} Do Q"
+    width_s, height_s, x_s, y_s = CONTENT_FORMATTER.format_many(
+        (w * scale, stream_h * scale, x * scale, stream_y * scale)
     )
+    return f"q {width_s} 0 0 {height_s} {x_s} {y_s} cm /I{info['i']} Do Q"
 
 
 def _tt_font_widths(font: TTFFont) -> str:
@@ -2412,17 +2497,25 @@ def soft_mask_path_to_xobject(
     return xobject
 
 
-def blend_group_to_xobject(
-    group: "BlendGroup", resource_catalog: ResourceCatalog
+def form_group_to_xobject(
+    group: "FormGroup", resource_catalog: ResourceCatalog, compress: bool = False
 ) -> PDFContentStream:
-    """Convert a blend group into a Form XObject with an isolated transparency group."""
+    """Convert a form group into a Form XObject."""
     stream = group.render(resource_catalog)
-    xobject = PDFContentStream(contents=stream.encode("latin-1"))
-    xobject._blend_group = group  # type: ignore[attr-defined]
+    xobject = PDFContentStream(contents=stream.encode("latin-1"), compress=compress)
+    xobject._form_group = group  # type: ignore[attr-defined]
     xobject._registered = False  # type: ignore[attr-defined]
     xobject.type = Name("XObject")  # type: ignore[attr-defined]
     xobject.subtype = Name("Form")  # type: ignore[attr-defined]
     bbox = group.get_bounding_box()
     xobject.b_box = PDFArray(bbox)  # type: ignore[attr-defined]
+    return xobject
+
+
+def blend_group_to_xobject(
+    group: "BlendGroup", resource_catalog: ResourceCatalog
+) -> PDFContentStream:
+    """Convert a blend group into a Form XObject with an isolated transparency group."""
+    xobject = form_group_to_xobject(group, resource_catalog)
     xobject.group = "<</S /Transparency /CS /DeviceRGB /I true>>"  # type: ignore[attr-defined]
     return xobject
@@ -7,7 +7,7 @@ Usage documentation at: <https://py-pdf.github.io/fpdf2/Patterns.html>
 import math
 import struct
 from abc import ABC
-from typing import TYPE_CHECKING, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
 
 from .drawing_primitives import (
     Color,
@@ -20,8 +20,14 @@ from .drawing_primitives import (
     convert_to_device_color,
 )
 from .enums import GradientSpreadMethod
+from .number_formatting import PATTERN_FORMATTER
 from .syntax import Name, PDFArray, PDFContentStream, PDFObject
-from .util import FloatTolerance, NumberClass, format_number
+from .util import FloatTolerance, NumberClass
+
+try:
+    import numpy
+except (ImportError, RuntimeError):
+    numpy = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from .drawing import BoundingBox
@@ -283,11 +289,8 @@ class Pattern(PDFObject):
 
     @property
     def matrix(self) -> str:
-        return (
-            f"[{format_number(self._matrix.a)} {format_number(self._matrix.b)} "
-            f"{format_number(self._matrix.c)} {format_number(self._matrix.d)} "
-            f"{format_number(self._matrix.e)} {format_number(self._matrix.f)}]"
-        )
+        m = self._matrix
+        return f"[{PATTERN_FORMATTER.join((m.a, m.b, m.c, m.d, m.e, m.f))}]"
 
     def set_matrix(self, matrix: Transform) -> "Pattern":
         self._matrix = matrix
@@ -315,8 +318,8 @@ class Type2Function(PDFObject):
         c2 = self._get_color_components(color_2)
         if len(c1) != len(c2):
             raise ValueError("Type2Function endpoints must have same component count")
-        self.c0 = f'[{" ".join(format_number(c) for c in c1)}]'
-        self.c1 = f'[{" ".join(format_number(c) for c in c2)}]'
+        self.c0 = f"[{PATTERN_FORMATTER.join(c1)}]"
+        self.c1 = f"[{PATTERN_FORMATTER.join(c2)}]"
         self.n = 1
 
     @classmethod
@@ -333,8 +336,8 @@ class Type2FunctionGray(PDFObject):
         super().__init__()
         self.function_type = 2
         self.domain = "[0 1]"
-        self.c0 = f"[{format_number(g0)}]"
-        self.c1 = f"[{format_number(g1)}]"
+        self.c0 = f"[{PATTERN_FORMATTER.format(g0)}]"
+        self.c1 = f"[{PATTERN_FORMATTER.format(g1)}]"
         self.n = 1
 
 
@@ -352,7 +355,7 @@ class Type3Function(PDFObject):
         self.function_type = 3
         self.domain = "[0 1]"
         self._functions = functions
-        self.bounds = f"[{' '.join(format_number(bound) for bound in bounds)}]"
+        self.bounds = f"[{PATTERN_FORMATTER.join(bounds)}]"
         self.encode = f"[{' '.join('0 1' for _ in functions)}]"
 
     @property
@@ -374,7 +377,7 @@ class Shading(PDFObject):
         super().__init__()
         self.shading_type = shading_type
         self.background = (
-            f'[{" ".join(format_number(c) for c in background.colors)}]'
+            f"[{PATTERN_FORMATTER.join(background.colors)}]"
             if background
             else None
         )
@@ -532,7 +535,7 @@ class Gradient(ABC):
                 else PDFArray(
                     [
                         (
-                            format_number(value)
+                            PATTERN_FORMATTER.format(value)
                             if isinstance(value, (int, float))
                             else value
                         )
@@ -722,6 +725,9 @@ class RadialGradient(Gradient):
 class MeshShading(PDFContentStream):
     """
     PDF Shading type 4 (free-form Gouraud triangle mesh) with per-vertex colors.
+
+    `triangles` & `colors` can also be NumPy arrays, of shapes (N, 3, 2)
+    and (N, 3, comp_count). The mesh is encoded with NumPy when it is available.
     """
 
     def __init__(
@@ -730,10 +736,16 @@ class MeshShading(PDFContentStream):
         color_space: str,
         bbox: "BoundingBox",
         comp_count: int,
-        triangles: list[
-            tuple[tuple[float, float], tuple[float, float], tuple[float, float]]
+        triangles: Union[
+            Sequence[
+                tuple[tuple[float, float], tuple[float, float], tuple[float, float]]
+            ],
+            Any,
+        ],
+        colors: Union[
+            Sequence[tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...]]],
+            Any,
         ],
-        colors: list[tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...]]],
         background: Optional["Color"] = None,
         anti_alias: bool = True,
     ):
@@ -741,7 +753,7 @@ class MeshShading(PDFContentStream):
         self.shading_type = 4
         self.color_space = Name(color_space)
         self.background = (
-            f'[{" ".join(format_number(c) for c in background.colors)}]'
+            f"[{PATTERN_FORMATTER.join(background.colors)}]"
             if background
             else None
         )
@@ -764,7 +776,7 @@ class MeshShading(PDFContentStream):
             bbox.y1,
             *([0.0, 1.0] * comp_count),
         ]
-        self.decode = PDFArray([format_number(value) for value in decode_values])
+        self.decode = PDFArray(PATTERN_FORMATTER.format_many(decode_values))
 
         super().__init__(contents=self._encode_stream_raw(), compress=True)
 
@@ -779,6 +791,10 @@ class MeshShading(PDFContentStream):
         sx = maxc / max(xmax - xmin, FloatTolerance.TOLERANCE)
         sy = maxc / max(ymax - ymin, FloatTolerance.TOLERANCE)
         max_comp = (1 << self.bits_per_component) - 1
+        if numpy is not None:
+            encoded = self._encode_stream_vectorized(sx, sy, maxc, max_comp)
+            if encoded is not None:
+                return encoded
 
         def q16(u: float, umin: float, scale: float) -> int:
             ui = int(round((u - umin) * scale))
@@ -806,6 +822,45 @@ class MeshShading(PDFContentStream):
                 )
         return bytes(out)
 
+    def _encode_stream_vectorized(
+        self, sx: float, sy: float, maxc: int, max_comp: int
+    ) -> Optional[bytes]:
+        """
+        NumPy implementation of `_encode_stream_raw()`, producing the same output.
+        Returns None if the vertices colors do not all have the same number of
+        components.
+        """
+        try:
+            points = numpy.asarray(self._triangles, dtype=numpy.float64)
+            colors = numpy.asarray(self._triangle_colors, dtype=numpy.float64)
+        except ValueError:  # inhomogeneous shapes
+            return None
+        if not points.size:
+            return b""
+        if colors.ndim != 3:
+            return None
+        points = points.reshape(-1, 2)
+        colors = colors.reshape(len(points), -1)
+        comp_dtype = ">u2" if self.bits_per_component > 8 else "u1"
+        vertices = numpy.zeros(
+            len(points),
+            dtype=[
+                ("flag", "u1"),  # flag = 0 (no reuse)
+                ("xy", ">u2", (2,)),
+                ("components", comp_dtype, (self._comp_count,)),
+            ],
+        )
+        # Same operations order as the pure Python implementation,
+        # numpy.rint() rounding half to even like round():
+        origin = numpy.array((self._bbox.x0, self._bbox.y0))
+        xy = numpy.rint((points - origin) * numpy.array((sx, sy)))
+        vertices["xy"] = numpy.clip(xy, 0, maxc)
+        # Missing components are set to zero, extra ones are ignored:
+        width = min(colors.shape[1], self._comp_count)
+        components = numpy.rint(colors[:, :width] * max_comp)
+        vertices["components"][:, :width] = numpy.clip(components, 0, max_comp)
+        return vertices.tobytes()
+
     @classmethod
     def get_functions(
         cls,
@@ -1180,6 +1235,17 @@ def shape_sweep_gradient_as_mesh(
                 color0 = start_color_components
                 color1 = start_color_components
             splits = max(1, int(math.ceil(delta_theta / max_angle)))
+            if numpy is not None and splits > 1:
+                t_values = numpy.arange(1, splits + 1) / splits
+                c0 = numpy.asarray(color0[:comp_count], dtype=numpy.float64)
+                c1 = numpy.asarray(color1[:comp_count], dtype=numpy.float64)
+                samples.extend(
+                    zip(
+                        (theta0 + t_values * delta_theta).tolist(),
+                        map(tuple, (c0 + (c1 - c0) * t_values[:, None]).tolist()),
+                    )
+                )
+                continue
             for s in range(1, splits + 1):
                 t = s / splits
                 theta = theta0 + t * delta_theta
@@ -1196,6 +1262,22 @@ def shape_sweep_gradient_as_mesh(
             (theta + cover_span, base_color),
         ]
 
+    # DeviceGray colors have 3 components, but only the first one is encoded:
+    samples = [(theta, color[:comp_count]) for theta, color in samples]
+    if numpy is not None and all(len(color) == comp_count for _, color in samples):
+        triangle_array, color_array = _fan_mesh_arrays(
+            cx, cy, r_inner, r_outer, samples
+        )
+        return MeshShading(
+            color_space=color_space,
+            bbox=bbox,
+            comp_count=comp_count,
+            triangles=triangle_array,
+            colors=color_array,
+            background=None,
+            anti_alias=True,
+        )
+
     triangles: list[
         tuple[tuple[float, float], tuple[float, float], tuple[float, float]]
     ] = []
@@ -1248,6 +1330,37 @@ def shape_sweep_gradient_as_mesh(
     )
 
 
+def _fan_mesh_arrays(
+    cx: float,
+    cy: float,
+    r_inner: float,
+    r_outer: float,
+    samples: list[tuple[float, tuple[float, ...]]],
+) -> tuple[Any, Any]:
+    """
+    NumPy implementation of the triangles of a sweep gradient fan, between 2 circles:
+    2 triangles per pair of consecutive samples, with the same vertices & colors as
+    the pure Python implementation of `shape_sweep_gradient_as_mesh()`.
+    """
+    thetas = [theta for theta, _ in samples]
+    colors = numpy.array([color for _, color in samples], dtype=numpy.float64)
+    # math functions are used, so that the coordinates are exactly the same:
+    cos = numpy.array([math.cos(theta) for theta in thetas])
+    sin = numpy.array([math.sin(theta) for theta in thetas])
+    inner = numpy.column_stack((cx + r_inner * cos, cy + r_inner * sin))
+    outer = numpy.column_stack((cx + r_outer * cos, cy + r_outer * sin))
+    count = len(samples) - 1
+    triangles = numpy.empty((count, 2, 3, 2))
+    triangles[:, 0, 0] = triangles[:, 1, 0] = inner[:-1]
+    triangles[:, 0, 1] = outer[:-1]
+    triangles[:, 0, 2] = triangles[:, 1, 1] = outer[1:]
+    triangles[:, 1, 2] = inner[1:]
+    tri_colors = numpy.empty((count, 2, 3, colors.shape[1]))
+    tri_colors[:, 0, 0] = tri_colors[:, 0, 1] = tri_colors[:, 1, 0] = colors[:-1]
+    tri_colors[:, 0, 2] = tri_colors[:, 1, 1] = tri_colors[:, 1, 2] = colors[1:]
+    return triangles.reshape(-1, 3, 2), tri_colors.reshape(-1, 3, colors.shape[1])
+
+
 def shape_linear_gradient(
     x1: float,
     y1: float,
@@ -0,0 +1,274 @@
+"""
+Pooled & cached fetching of remote resources (images, SVG files...) over HTTP(S).
+
+By default, every remote image URL is fetched by `fpdf.image_parsing.load_image()`
+through a new connection, sequentially.
+A `RemoteResourceFetcher` can be attached to an `fpdf.image_datastructures.ImageCache`
+in order to keep connections alive between requests to the same host,
+to fetch many resources concurrently with a bounded number of connections,
+and to store responses in a local directory, revalidated with conditional requests.
+
+The checks enforced by `fpdf.enums.ResourceAccessPolicy` still apply:
+every URL, including redirection targets, is resolved & validated before being fetched,
+and connections are pinned to the validated IP addresses.
+
+Usage documentation at: <https://py-pdf.github.io/fpdf2/Images.html#fetching-many-remote-images>
+"""
+
+import hashlib
+import http.client
+import ipaddress
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Optional
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+from .enums import ResourceAccessPolicy
+from .errors import FPDFResourceAccessError
+from .image_parsing import (
+    SETTINGS,
+    _PinnedRemoteHTTPConnection,
+    _PinnedRemoteHTTPSConnection,
+    _validate_remote_url_access,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# Errors that can be raised when reusing a connection that the server has closed:
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+_PoolKey = tuple[
+    str, str, int, tuple[ipaddress.IPv4Address | ipaddress.IPv6Address, ...]
+]
+
+
+class RemoteResourceFetcher:
+    """
+    Fetches remote resources over HTTP(S), reusing connections & caching responses.
+
+    Idle connections are kept per host & validated IP addresses, and reused by later requests.
+    At most `max_connections` requests are in flight at any time, across all threads.
+    If `cache_dir` is provided, responses carrying an `ETag` or a `Last-Modified` header
+    are stored in this directory, and later requests for the same URL are sent
+    as conditional requests: on a `304 Not Modified` response, the stored body is used.
+
+    Instances are thread-safe, and can be shared among several `FPDF` instances.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        cache_dir: Optional[str | os.PathLike[str]] = None,
+        timeout: Optional[float] = None,
+        max_redirects: int = 5,
+    ) -> None:
+        """
+        Args:
+            max_connections (int): maximum number of concurrent requests. Defaults to 8.
+            cache_dir: optional folder where responses are stored. It is created if needed.
+            timeout (float): network timeout in seconds.
+                Defaults to `fpdf.image_parsing.SETTINGS.network_timeout`.
+            max_redirects (int): maximum number of HTTP redirections followed per request.
+        """
+        if max_connections <= 0:
+            raise ValueError(
+                f"max_connections must be strictly positive, got: {max_connections}"
+            )
+        self.max_connections = max_connections
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._semaphore = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle_connections: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+
+    def fetch(
+        self,
+        url: str,
+        resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
+    ) -> bytes:
+        "Returns the content of a remote resource, following redirections"
+        for _ in range(self.max_redirects + 1):
+            pinned_addresses = _validate_remote_url_access(url, resource_access_policy)
+            status, reason, headers, body = self._get(url, pinned_addresses)
+            if status in REDIRECT_STATUSES and headers.get("Location"):
+                url = urljoin(url, headers["Location"])
+                continue
+            if status != 200:
+                raise HTTPError(url, status, reason, headers, None)
+            return body
+        raise FPDFResourceAccessError(
+            f"Too many redirections while fetching remote resource: {url!r}"
+        )
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
+    ) -> list[bytes]:
+        "Fetches several remote resources concurrently, and returns their content in order"
+        urls = list(urls)
+        with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+            return list(
+                executor.map(lambda url: self.fetch(url, resource_access_policy), urls)
+            )
+
+    def close(self) -> None:
+        "Closes all idle connections"
+        with self._lock:
+            connections = [
+                conn for conns in self._idle_connections.values() for conn in conns
+            ]
+            self._idle_connections.clear()
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> "RemoteResourceFetcher":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def _get(
+        self,
+        url: str,
+        pinned_addresses: tuple[ipaddress.IPv4Address | ipaddress.IPv6Address, ...],
+    ) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+        parsed_url = urlsplit(url)
+        path = parsed_url.path or "/"
+        if parsed_url.query:
+            path += "?" + parsed_url.query
+        assert parsed_url.hostname
+        default_port = 443 if parsed_url.scheme == "https" else 80
+        pool_key: _PoolKey = (
+            parsed_url.scheme,
+            parsed_url.hostname,
+            parsed_url.port or default_port,
+            pinned_addresses,
+        )
+        request_headers = {"Accept-Encoding": "identity"}
+        cached = self._read_cache(url)
+        if cached is not None:
+            metadata, _ = cached
+            if metadata.get("etag"):
+                request_headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                request_headers["If-Modified-Since"] = metadata["last_modified"]
+        with self._semaphore:
+            conn, reused = self._acquire(pool_key)
+            try:
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed this idle connection, retrying with a new one:
+                conn = self._connect(pool_key)
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+            try:
+                body = response.read()
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(pool_key, conn)
+        status, reason, headers = response.status, response.reason, response.msg
+        if status == 304 and cached is not None:
+            LOGGER.debug("Remote resource %s not modified, using cached copy", url)
+            return 200, reason, headers, cached[1]
+        if status == 200:
+            self._write_cache(url, headers, body)
+        return status, reason, headers, body
+
+    def _acquire(self, pool_key: _PoolKey) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle_connections.get(pool_key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(pool_key), False
+
+    def _release(self, pool_key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle_connections.setdefault(pool_key, []).append(conn)
+
+    def _connect(self, pool_key: _PoolKey) -> http.client.HTTPConnection:
+        scheme, host, port, pinned_addresses = pool_key
+        timeout = SETTINGS.network_timeout if self.timeout is None else self.timeout
+        conn_class = (
+            _PinnedRemoteHTTPSConnection
+            if scheme == "https"
+            else _PinnedRemoteHTTPConnection
+        )
+        return conn_class(
+            host, port, timeout=timeout, pinned_addresses=pinned_addresses
+        )
+
+    def _cache_paths(self, url: str) -> tuple[Path, Path]:
+        assert self.cache_dir is not None
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _read_cache(self, url: str) -> Optional[tuple[dict[str, str], bytes]]:
+        if self.cache_dir is None:
+            return None
+        metadata_path, body_path = self._cache_paths(url)
+        try:
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if metadata.get("url") != url or metadata.get("length") != len(body):
+            return None
+        return metadata, body
+
+    def _write_cache(
+        self, url: str, headers: http.client.HTTPMessage, body: bytes
+    ) -> None:
+        if self.cache_dir is None:
+            return
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        metadata = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "length": len(body),
+        }
+        metadata_path, body_path = self._cache_paths(url)
+        # The metadata is written last, and readers check the body length it records:
+        _write_atomically(body_path, body)
+        _write_atomically(metadata_path, json.dumps(metadata).encode())
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
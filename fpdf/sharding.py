@@ -0,0 +1,299 @@
+"""
+Rendering of a document by shards, in a pool of processes.
+
+A single `FPDF` instance cannot use more than one CPU core.
+`render_sharded()` splits the rendering of a large document between several
+processes, each of them rendering a range of pages into its own `FPDF` instance,
+and merges those shards into a single document:
+
+    from functools import partial
+    from fpdf import FPDF
+    from fpdf.sharding import render_sharded
+
+    def new_document():
+        pdf = FPDF()
+        pdf.add_font("dejavu", fname="DejaVuSans.ttf")
+        pdf.set_font("dejavu", size=12)
+        return pdf
+
+    def render_statements(pdf, first, last):
+        for number in range(first, last):
+            pdf.add_page()
+            pdf.cell(text=f"Statement #{number}")
+
+    producers = [
+        partial(render_statements, first=i, last=i + 1000)
+        for i in range(0, 200_000, 1000)
+    ]
+    pdf = render_sharded(new_document, producers)
+    pdf.output("statements.pdf")
+
+Usage documentation at: <https://py-pdf.github.io/fpdf2/LargeDocuments.html>
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from typing import Callable, Iterable, Optional, cast
+
+from .enums import PDFResourceType
+from .errors import FPDFException
+from .fonts import Glyph, TTFFont
+from .fpdf import FPDF
+from .image_datastructures import (
+    RasterImageInfo,
+    StoredImagePayload,
+    VectorImageInfo,
+)
+from .line_break import TotalPagesSubstitutionFragment
+from .outline import OutlineSection
+from .output import PDFPage
+from .structure_tree import StructureTreeBuilder
+from .syntax import DestinationXYZ, Name
+
+_RESOURCE_NAME_RE = re.compile(rb"/I(\d+) Do|/GS(\d+) gs")
+
+
+def render_sharded(
+    new_document: Callable[[], FPDF],
+    producers: Iterable[Callable[[FPDF], None]],
+    workers: Optional[int] = None,
+) -> FPDF:
+    """
+    Renders each shard of a document in a pool of processes,
+    and returns a document made of the pages of all the shards,
+    in the order of `producers`.
+
+    Each shard is rendered on a new document returned by `new_document()`,
+    that must add all the fonts used, but no page.
+    The document returned is also built by `new_document()`:
+    pages can be added to it once the shards have been merged.
+    `new_document` & `producers` must be picklable, like functions defined
+    at the top level of a module, or `functools.partial` objects wrapping them.
+
+    The shards are rendered independently: `FPDF.page_no()` returns the page number
+    in the current shard, and the alias of the total number of pages is replaced
+    by the number of pages of the final document.
+    Links to destinations defined by other shards must use named destinations.
+    Color fonts, tables of contents, file attachments, patterns, soft masks,
+    Form XObjects & optional content cannot be used in shards.
+
+    Args:
+        new_document (callable): function returning a new `FPDF` document,
+            without pages.
+        producers (iterable): functions receiving the document of a shard,
+            and adding its pages. They must be defined at the top level of a module.
+        workers (int): maximum number of worker processes.
+            Defaults to the `concurrent.futures.ProcessPoolExecutor` default.
+            With `workers=1`, shards are rendered in the current process.
+    """
+    pdf = _new_document(new_document)
+    if workers == 1:
+        for shard in map(partial(_render_shard, new_document), producers):
+            _merge_shard(pdf, shard)
+        return pdf
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard in executor.map(_render_shard, repeat(new_document), producers):
+            _merge_shard(pdf, shard)
+    return pdf
+
+
+def _new_document(new_document: Callable[[], FPDF]) -> FPDF:
+    pdf = new_document()
+    if pdf.pages:
+        raise FPDFException("new_document() must return a document without pages")
+    for font in pdf.fonts.values():
+        if isinstance(font, TTFFont):
+            if font.color_font:
+                raise FPDFException(
+                    f"Color font {font.fontkey} cannot be used in document shards"
+                )
+            # Text rendered with this font is encoded identically by all shards:
+            font.subset.use_glyph_ids()
+    return pdf
+
+
+def _render_shard(
+    new_document: Callable[[], FPDF], producer: Callable[[FPDF], None]
+) -> "_Shard":
+    pdf = _new_document(new_document)
+    producer(pdf)
+    if pdf.page:
+        pdf._render_footer()  # pylint: disable=protected-access
+    return _Shard(pdf)
+
+
+class _Shard:
+    "Pages & resources of a document shard, sent back by worker processes"
+
+    def __init__(self, pdf: FPDF) -> None:
+        # pylint: disable=protected-access
+        catalog = pdf._resource_catalog
+        if (
+            pdf.toc_placeholder
+            or pdf.embedded_files
+            or catalog.resources[PDFResourceType.PATTERN]
+            or catalog.resources[PDFResourceType.SHADING]
+            or catalog.soft_mask_xobjects
+            or catalog.form_xobjects
+            or catalog.optional_content_groups
+        ):
+            raise FPDFException(
+                "Tables of contents, file attachments, patterns, soft masks,"
+                " Form XObjects & optional content cannot be used in document shards"
+            )
+        self.pdf_version = pdf.pdf_version
+        self.pages: list[PDFPage] = list(pdf.pages.values())
+        self.resources_per_page = catalog.resources_per_page
+        self.font_indices = {fontkey: font.i for fontkey, font in pdf.fonts.items()}
+        self.glyphs: dict[str, tuple[dict[Optional[Glyph], int], list[int]]] = {
+            fontkey: (dict(font.subset.items()), font.missing_glyphs)
+            for fontkey, font in pdf.fonts.items()
+            if isinstance(font, TTFFont)
+        }
+        # Fonts cannot be pickled, fragments are bound to those of the final document:
+        self.substitutions: list[tuple[TotalPagesSubstitutionFragment, str]] = []
+        for page in self.pages:
+            for fragment in page.get_text_substitutions():
+                self.substitutions.append((fragment, fragment.font.fontkey))
+                fragment.graphics_state.current_font = None
+        self.images: dict[str, RasterImageInfo | VectorImageInfo] = {}
+        for name, info in pdf.image_cache.images.items():
+            if info.get("usages"):
+                for key in ("data", "smask"):
+                    if isinstance(info.get(key), StoredImagePayload):
+                        info[key] = bytes(cast(StoredImagePayload, info[key]))
+                self.images[name] = info
+        self.icc_profiles = {i: icc for icc, i in pdf.image_cache.icc_profiles.items()}
+        self.graphics_styles = {
+            name: style for style, name in catalog.graphics_styles.items()
+        }
+        self.named_destinations = pdf.named_destinations
+        self.outline: list[OutlineSection] = pdf._outline
+        self.struct_builder: StructureTreeBuilder = pdf.struct_builder
+        # Destinations referring to the pages of this shard, without duplicates:
+        destinations = {id(dest): dest for dest in pdf.links.values()}
+        for dest in self.named_destinations.values():
+            destinations[id(dest)] = dest
+        for section in self.outline:
+            destinations[id(section.dest)] = section.dest
+        for page in self.pages:
+            for annot in page.annots or ():
+                for annot_dest in (annot.dest, getattr(annot.a, "dest", None)):
+                    if isinstance(annot_dest, DestinationXYZ):
+                        destinations[id(annot_dest)] = annot_dest
+        self.destinations = list(destinations.values())
+
+
+def _merge_shard(pdf: FPDF, shard: _Shard) -> None:
+    # pylint: disable=protected-access
+    offset = pdf.pages_count
+    catalog = pdf._resource_catalog
+    for fontkey, index in shard.font_indices.items():
+        if fontkey not in pdf.fonts or pdf.fonts[fontkey].i != index:
+            raise FPDFException(
+                f"Font {fontkey} used by a document shard"
+                " must be added by new_document()"
+            )
+    for fontkey, (glyphs, missing_glyphs) in shard.glyphs.items():
+        font = cast(TTFFont, pdf.fonts[fontkey])
+        font.subset.update(glyphs)
+        font.missing_glyphs.extend(
+            glyph for glyph in missing_glyphs if glyph not in font.missing_glyphs
+        )
+    for fragment, fontkey in shard.substitutions:
+        fragment.font = pdf.fonts[fontkey]
+
+    image_indices: dict[int, int] = {}
+    for name, info in shard.images.items():
+        shard_index = cast(int, info["i"])
+        cached = pdf.image_cache.images.get(name)
+        if cached is None:
+            if info.get("iccp_i") is not None:
+                profiles = pdf.image_cache.icc_profiles
+                icc = shard.icc_profiles[cast(int, info["iccp_i"])]
+                info["iccp_i"] = profiles.setdefault(icc, len(profiles))
+            info["i"] = pdf.image_cache.next_xobject_index()
+            pdf.image_cache.images[name] = info
+        else:
+            cached["usages"] = cast(int, cached["usages"]) + cast(int, info["usages"])
+        image_indices[shard_index] = cast(int, pdf.image_cache.images[name]["i"])
+    style_names = {
+        name: catalog.register_serialized_graphics_style(style)
+        for name, style in shard.graphics_styles.items()
+    }
+
+    # Resources are renamed in content streams only if their names differ:
+    renamed_images = {
+        str(old).encode(): str(new).encode()
+        for old, new in image_indices.items()
+        if old != new
+    }
+    renamed_styles = {
+        old[2:].encode(): new[2:].encode()
+        for old, new in style_names.items()
+        if old != new
+    }
+
+    def rename(match: re.Match[bytes]) -> bytes:
+        if match[1] is not None:
+            return b"/I%s Do" % renamed_images.get(match[1], match[1])
+        return b"/GS%s gs" % renamed_styles.get(match[2], match[2])
+
+    for page_number, page in enumerate(shard.pages, offset + 1):
+        page.set_index(page_number)
+        if renamed_images or renamed_styles:
+            assert isinstance(page.contents, bytearray)
+            page.contents = bytearray(_RESOURCE_NAME_RE.sub(rename, page.contents))
+        pdf.pages[page_number] = page
+    for (page_number, resource_type), resources in shard.resources_per_page.items():
+        for resource in resources:
+            if resource_type == PDFResourceType.X_OBJECT:
+                resource = image_indices[cast(int, resource)]
+            elif resource_type == PDFResourceType.EXT_G_STATE:
+                resource = style_names[cast(Name, resource)]
+            catalog.add(resource_type, resource, page_number + offset)
+
+    for dest in shard.destinations:
+        if dest.page_number:  # else it is an undefined named destination
+            dest.page_number += offset
+    for name, dest in shard.named_destinations.items():
+        defined = pdf.named_destinations.get(name)
+        if defined is not None and defined.page_number and dest.page_number:
+            raise FPDFException(
+                f"Named destination {name!r} is defined by several document shards"
+            )
+        if defined is None or not defined.page_number:
+            pdf.named_destinations[name] = dest
+    for section in shard.outline:
+        section.page_number += offset
+        pdf._outline.append(section)
+    _merge_structure_tree(pdf, shard.struct_builder, offset)
+    pdf._set_min_pdf_version(shard.pdf_version)
+
+    # The pages of the shard are complete, including the footer of the last one:
+    pdf.page = pdf.pages_count
+    pdf._footer_rendered = True
+
+
+def _merge_structure_tree(
+    pdf: FPDF, struct_builder: StructureTreeBuilder, offset: int
+) -> None:
+    # pylint: disable=protected-access
+    builder = pdf.struct_builder
+    struct_parents_ids: dict[int, int] = {}
+    for page_number, struct_parents_id in struct_builder.spid_per_page_number.items():
+        new_id = len(builder.spid_per_page_number)
+        struct_parents_ids[struct_parents_id] = new_id
+        builder.spid_per_page_number[page_number + offset] = new_id
+        pdf.pages[page_number + offset].struct_parents = new_id
+    parent_tree = struct_builder.struct_tree_root.parent_tree
+    for struct_parents_id, struct_elems in parent_tree.nums.items():
+        builder.struct_tree_root.parent_tree.nums[
+            struct_parents_ids[struct_parents_id]
+        ].extend(struct_elems)
+    for struct_elem in struct_builder.doc_struct_elem.k:
+        struct_elem.p = builder.doc_struct_elem
+        struct_elem._page_number += offset
+        builder.doc_struct_elem.k.append(struct_elem)
@@ -1,7 +1,8 @@
 """
 Module dedicated to document signature generation.
 
-The contents of this module are internal to fpdf2, and not part of the public API.
+Apart from `SigningCredentials` & `sign_documents()`,
+the contents of this module are internal to fpdf2, and not part of the public API.
 They may change at any time without prior warning or any deprecation period,
 in non-backward-compatible ways.
 
@@ -11,21 +12,20 @@ Usage documentation at: <https://py-pdf.github.io/fpdf2/Signing.html>
 # pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportUnknownVariableType=false
 
 import hashlib
-from datetime import timezone
-from typing import TYPE_CHECKING, Any, Optional
-from unittest.mock import patch
+import os
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
 
 from .syntax import Name, PDFDate, build_obj_dict, create_dictionary_string as pdf_dict
-from .util import buffer_subst
 
 if TYPE_CHECKING:
-    from datetime import datetime
-
     from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
     from cryptography.x509 import Certificate
     from endesive import signer
 
     from .encryption import StandardSecurityHandler
+    from .fpdf import FPDF
 
 
 class Signature:
@@ -63,60 +63,177 @@ class Signature:
         return pdf_dict(obj_dict)
 
 
+class SigningCredentials:
+    """
+    A private key & its certificates chain, loaded once,
+    that can be used to sign many documents with `fpdf.fpdf.FPDF.sign_with_credentials()`
+    or `sign_documents()`.
+    The certificates are converted once to the ASN.1 structures expected by `endesive`.
+    """
+
+    def __init__(
+        self,
+        key: Optional["PrivateKeyTypes"],
+        cert: "Certificate",
+        extra_certs: Optional[Sequence["Certificate"]] = None,
+        hashalgo: str = "sha256",
+    ) -> None:
+        """
+        Args:
+            key: certificate private key
+            cert (cryptography.x509.Certificate): certificate
+            extra_certs (list[cryptography.x509.Certificate]): list of additional PKCS12 certificates
+            hashalgo (str): hashing algorithm used, passed to `hashlib.new`
+        """
+        self.key = key
+        self.cert = cert
+        self.extra_certs = list(extra_certs) if extra_certs is not None else []
+        self.hashalgo = hashalgo
+        self._asn1_cert: Any = None
+        self._asn1_extra_certs: list[Any] = []
+
+    @classmethod
+    def from_pkcs12(
+        cls,
+        pkcs_filepath: str | os.PathLike[str],
+        password: Optional[bytes] = None,
+        hashalgo: str = "sha256",
+    ) -> "SigningCredentials":
+        """
+        Args:
+            pkcs_filepath (str): file path to a .pfx or .p12 PKCS12,
+                in the binary format described by RFC 7292
+            password (bytes-like): the password to use to decrypt the data.
+                `None` if the PKCS12 is not encrypted.
+            hashalgo (str): hashing algorithm used, passed to `hashlib.new`
+        """
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives.serialization import pkcs12
+
+        with open(pkcs_filepath, "rb") as pkcs_file:
+            key, cert, extra_certs = pkcs12.load_key_and_certificates(
+                pkcs_file.read(), password
+            )
+        assert cert is not None
+        return cls(key, cert, extra_certs, hashalgo)
+
+    def asn1_certs(
+        self, signer: "signer"  # pyright: ignore[reportGeneralTypeIssues]
+    ) -> tuple[Any, list[Any]]:
+        "Returns the certificates converted by endesive, performing this conversion only once"
+        if self._asn1_cert is None:
+            self._asn1_extra_certs = [
+                signer.cert2asn(cert) for cert in self.extra_certs
+            ]
+            self._asn1_cert = signer.cert2asn(self.cert)
+        return self._asn1_cert, self._asn1_extra_certs
+
+
+def sign_documents(
+    documents: Iterable["FPDF"],
+    credentials: SigningCredentials,
+    **kwargs: Any,
+) -> Iterator[bytearray]:
+    """
+    Signs many documents with the same credentials, loaded once,
+    and yields their content, as returned by `fpdf.fpdf.FPDF.output()`.
+    `documents` can be a generator, so that documents are only built one at a time.
+
+    Args:
+        documents: `FPDF` instances, not signed yet
+        credentials (SigningCredentials): key & certificates used for all signatures
+        **kwargs: optional arguments passed to `fpdf.fpdf.FPDF.sign_with_credentials()`,
+            like `contact_info`, `location` or `reason`
+    """
+    for pdf in documents:
+        pdf.sign_with_credentials(credentials, **kwargs)
+        yield pdf.output()
+
+
+# Signing time of the current context, returned by _EndesiveDatetime.now():
+_SIGNING_TIME: ContextVar[Optional["datetime"]] = ContextVar(
+    "_SIGNING_TIME", default=None
+)
+
+
+class _EndesiveDatetime:
+    """
+    Replacement for the `datetime` class used by `endesive.signer`,
+    in order to get control over signed_time, initialized by endesive.signer.sign()
+    to be datetime.now(), at the time of endesive v2.0.9.
+    It is installed once, and behaves like `datetime` outside of `sign_content()`.
+    """
+
+    @staticmethod
+    def now(tz: Any = None) -> "datetime":
+        sign_time = _SIGNING_TIME.get()
+        if sign_time is None:
+            return datetime.now(tz)
+        return sign_time.astimezone(timezone.utc)
+
+
 def sign_content(
     signer: "signer",  # pyright: ignore[reportGeneralTypeIssues]
     buffer: bytearray,
-    key: Optional["PrivateKeyTypes"],
-    cert: "Certificate",
-    extra_certs: list["Certificate"],
-    hashalgo: str,
+    credentials: SigningCredentials,
     sign_time: "datetime",
+    placeholders_offsets: Optional[tuple[int, int]] = None,
 ) -> bytearray:
     """
-    Perform PDF signing based on the content of the buffer, performing substitutions on it.
-    The signing operation does not alter the buffer size
+    Perform PDF signing based on the content of the buffer, performing substitutions on it in place.
+    The signing operation does not alter the buffer size.
+
+    `placeholders_offsets` are the offsets of the ByteRange & Contents placeholders in the buffer,
+    recorded while serializing the signature. If not provided, they are searched for.
     """
+    sig_placeholder = _SIGNATURE_CONTENTS_PLACEHOLDER.encode("latin1")
+    if placeholders_offsets:
+        byte_range_index, start_index = placeholders_offsets
+    else:
+        byte_range_index = buffer.find(_SIGNATURE_BYTERANGE_PLACEHOLDER.encode())
+        start_index = buffer.find(sig_placeholder)
+    end_index = start_index + len(sig_placeholder)
+    # Sanity check, otherwise we would corrupt the document:
+    assert (
+        buffer[start_index:end_index] == sig_placeholder
+    ), "Signature placeholder not found at its expected offset"
     # We start by substituting the ByteRange,
     # that defines which part of the document content the signature is based on.
     # This is basically ALL the content EXCEPT the signature content itself.
-    sig_placeholder = _SIGNATURE_CONTENTS_PLACEHOLDER.encode("latin1")
-    start_index = buffer.find(sig_placeholder)
-    end_index = start_index + len(sig_placeholder)
     content_range = (0, start_index - 1, end_index + 1, len(buffer) - end_index - 1)
     # pylint: disable=consider-using-f-string
-    buffer = buffer_subst(
-        buffer,
-        _SIGNATURE_BYTERANGE_PLACEHOLDER,
-        "[%010d %010d %010d %010d]" % content_range,
-    )
-
-    # We compute the ByteRange hash, of everything before & after the placeholder:
-    content_hash = hashlib.new(hashalgo)
-    content_hash.update(buffer[: content_range[1]])  # before
-    content_hash.update(buffer[content_range[2] :])  # after
-
-    # This monkey-patching is needed, at the time of endesive v2.0.9,
-    # to get control over signed_time, initialized by endesive.signer.sign() to be datetime.now():
-    class mock_datetime:
-        @staticmethod
-        def now(tz: Any) -> "datetime":  # pylint: disable=unused-argument
-            return sign_time.astimezone(timezone.utc)
-
-    sign = patch("endesive.signer.datetime", mock_datetime)(signer.sign)
-
-    contents = sign(
-        datau=None,
-        key=key,
-        cert=cert,
-        othercerts=extra_certs,
-        hashalgo=hashalgo,
-        attrs=True,
-        signed_value=content_hash.digest(),
-    )
-    contents = _pkcs11_aligned(contents).encode("latin1")
+    byte_range = ("[%010d %010d %010d %010d]" % content_range).encode()
+    assert len(byte_range) == len(_SIGNATURE_BYTERANGE_PLACEHOLDER)
+    buffer[byte_range_index : byte_range_index + len(byte_range)] = byte_range
+
+    # We compute the ByteRange hash, of everything before & after the placeholder,
+    # without copying those parts of the buffer:
+    content_hash = hashlib.new(credentials.hashalgo)
+    with memoryview(buffer) as buffer_view:
+        content_hash.update(buffer_view[: content_range[1]])  # before
+        content_hash.update(buffer_view[content_range[2] :])  # after
+
+    if signer.datetime is not _EndesiveDatetime:
+        signer.datetime = _EndesiveDatetime
+    cert, extra_certs = credentials.asn1_certs(signer)
+    token = _SIGNING_TIME.set(sign_time)
+    try:
+        contents = signer.sign(
+            datau=None,
+            key=credentials.key,
+            cert=cert,
+            othercerts=extra_certs,
+            hashalgo=credentials.hashalgo,
+            attrs=True,
+            signed_value=content_hash.digest(),
+        )
+    finally:
+        _SIGNING_TIME.reset(token)
+    signature = _pkcs11_aligned(contents).encode("latin1")
     # Sanity check, otherwise we will break the xref table:
-    assert len(sig_placeholder) == len(contents)
-    return buffer.replace(sig_placeholder, contents, 1)
+    assert len(sig_placeholder) == len(signature)
+    buffer[start_index:end_index] = signature
+    return buffer
 
 
 def _pkcs11_aligned(data: tuple[int, ...]) -> str:
@@ -17,7 +17,15 @@ import warnings
 from copy import deepcopy
 from dataclasses import dataclass
 from os import PathLike
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+)
 
 from fontTools.svgLib.path import (
     parse_path,  # pyright: ignore[reportUnknownVariableType]
@@ -30,16 +38,19 @@ from .enums import (
     ResourceAccessPolicy,
     StrokeCapStyle,
 )
-from .errors import FPDFSvgLimitExceeded
+from .errors import FPDFException, FPDFSvgLimitExceeded
 
 try:
     from defusedxml.ElementTree import fromstring as parse_xml_str
+    from defusedxml.ElementTree import iterparse
 except ImportError:
     warnings.warn(
         "defusedxml could not be imported - fpdf2 will not be able to sanitize SVG images provided"
     )
     # nosemgrep: python.lang.security.use-defused-xml.use-defused-xml
     from xml.etree.ElementTree import fromstring as parse_xml_str  # nosec
+    # nosemgrep: python.lang.security.use-defused-xml.use-defused-xml
+    from xml.etree.ElementTree import iterparse  # nosec
 
 from . import html
 from .drawing import (
@@ -48,8 +59,12 @@ from .drawing import (
     GradientPaint,
     GraphicsContext,
     GraphicsStyle,
+    PaintBlendComposite,
+    PaintComposite,
     PaintedPath,
+    PaintSoftMask,
     PathPen,
+    SharedGraphicsContext,
     Text,
     TextRun,
 )
@@ -91,6 +106,7 @@ TRANSFORM_GETTER = re.compile(
 
 CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
 CSS_BLOCK_RE = re.compile(r"(?s)([^{}]+)\{([^{}]*)\}")
+URL_REF_RE = re.compile(r"url\(\s*['\"]?(#[^)'\"\s]+)")
 
 SVG_SWITCH_CONDITIONAL_ATTRIBUTES = (
     "requiredFeatures",
@@ -146,12 +162,26 @@ class SVGLimits:
             raise ValueError(f"{name} must be a positive integer or None")
 
 
+# Minimum number of elements resolved from a reference by all the <use> tags to it,
+# for the reference to be rendered once as a Form XObject painted by each <use> tag.
+# Below that, copying the reference makes for a smaller document, as the copies
+# are compressed well while each Form XObject adds about 200 bytes:
+SHARED_REFERENCE_MIN_COST = 100
+
+
 def _resolved_element_cost(item: Any) -> int:
     if isinstance(item, GraphicsContext):
         return 1 + sum(_resolved_element_cost(child) for child in item.path_items)
     return 1
 
 
+def _use_ref(use_tag: "Element") -> Optional[str]:
+    for candidate in xmlns_lookup("xlink", "href", "id"):
+        if candidate in use_tag.attrib:
+            return use_tag.attrib[candidate]
+    return None
+
+
 unit_splitter = re.compile(r"\s*(?P<value>[-+]?[\d\.]+)\s*(?P<unit>%|[a-zA-Z]*)")
 
 # none of these are supported right now
@@ -513,13 +543,51 @@ def apply_svg_transform_to_user_space_gradients(
             isinstance(paint, GradientPaint)
             and paint.units == GradientUnits.USER_SPACE_ON_USE
         ):
+            # Paints can be shared between nodes & between placements of a cached SVG:
+            paint = _clone_gradient_paint(paint)
             paint.gradient_transform = paint.gradient_transform @ current_transform
+            setattr(node.style, paint_attr, paint)
 
     for item in node.path_items:
         if isinstance(item, (GraphicsContext, PaintedPath)):
             apply_svg_transform_to_user_space_gradients(item, current_transform)
 
 
+def can_render_as_form_xobject(
+    node: GraphicsContext | PaintedPath, allow_text: bool = True
+) -> bool:
+    """
+    Returns False if the node contains content that must be rendered directly on the page:
+    gradient paints, whose patterns are positioned in page space,
+    and composites, that are ignored when computing bounding boxes.
+    If `allow_text` is False, texts, whose bounding boxes are only estimated,
+    also prevent it.
+    """
+    if isinstance(node, PaintedPath):
+        return can_render_as_form_xobject(node.get_graphics_context(), allow_text)
+    if isinstance(node.style.fill_color, GradientPaint) or isinstance(
+        node.style.stroke_color, GradientPaint
+    ):
+        return False
+    soft_mask = node.style.soft_mask
+    if isinstance(soft_mask, PaintSoftMask) and not can_render_as_form_xobject(
+        soft_mask.mask_path, allow_text
+    ):
+        return False
+    for item in node.path_items:
+        if isinstance(item, (PaintComposite, PaintBlendComposite)):
+            return False
+        if not allow_text and isinstance(item, Text):
+            return False
+        if isinstance(item, SharedGraphicsContext):
+            item = item.context
+        if isinstance(
+            item, (GraphicsContext, PaintedPath)
+        ) and not can_render_as_form_xobject(item, allow_text):
+            return False
+    return True
+
+
 def _preserve_ws(style_map: dict[str, Any], tag: "Element") -> bool:
     # CSS ‘white-space’ wins; otherwise XML’s xml:space
     ws = (style_map.get("white-space") or "").strip()
@@ -983,6 +1051,27 @@ class SVGObject:
         image_cache: Optional[ImageCache] = None,
         resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
         svg_limits: Optional[SVGLimits] = None,
+    ) -> None:
+        self._init_conversion_state(image_cache, resource_access_policy, svg_limits)
+        # disabling bandit rule as we use defusedxml:
+        svg_tree: "Element" = parse_xml_str(svg_text)  # nosec B314
+
+        if svg_tree.tag not in xmlns_lookup("svg", "svg"):
+            raise ValueError(f"root tag must be svg, not {svg_tree.tag}")
+
+        self._collect_css_styles(svg_tree)
+        self.extract_shape_info(svg_tree)
+        self._check_svg_limits(svg_tree)
+        for use_tag in xmlns_lookup("svg", "use"):
+            for element in svg_tree.iter(use_tag):
+                self._count_use(_use_ref(element))
+        self.convert_graphics(svg_tree)
+
+    def _init_conversion_state(
+        self,
+        image_cache: Optional[ImageCache],
+        resource_access_policy: ResourceAccessPolicy,
+        svg_limits: Optional[SVGLimits],
     ) -> None:
         self.image_cache = image_cache  # Needed to render images
         self.resource_access_policy = resource_access_policy
@@ -990,6 +1079,9 @@ class SVGObject:
         self._resolved_element_count = 0
         self.cross_references: dict[str, Any] = {}
         self._cross_reference_costs: dict[str, int] = {}
+        # Number of <use> tags referencing each ID:
+        self._use_counts: dict[str, int] = {}
+        self._shared_references: dict[str, SharedGraphicsContext] = {}
         self.symbol_info: dict[str, SymbolInfo] = {}
         self.css_class_styles: dict[str, dict[str, Any]] = {}
         self.gradient_definitions: dict[str, GradientPaint] = (
@@ -997,16 +1089,6 @@ class SVGObject:
         )  # Store parsed gradients by ID
         self.width: Optional[Percent | float] = None
         self.height: Optional[Percent | float] = None
-        # disabling bandit rule as we use defusedxml:
-        svg_tree: "Element" = parse_xml_str(svg_text)  # nosec B314
-
-        if svg_tree.tag not in xmlns_lookup("svg", "svg"):
-            raise ValueError(f"root tag must be svg, not {svg_tree.tag}")
-
-        self._collect_css_styles(svg_tree)
-        self.extract_shape_info(svg_tree)
-        self._check_svg_limits(svg_tree)
-        self.convert_graphics(svg_tree)
 
     @force_nodocument
     def update_xref(self, key: Optional[str], referenced: Any) -> None:
@@ -1015,6 +1097,10 @@ class SVGObject:
             self.cross_references[key] = referenced
             self._cross_reference_costs[key] = _resolved_element_cost(referenced)
 
+    def _count_use(self, ref: Optional[str]) -> None:
+        if ref:
+            self._use_counts[ref] = self._use_counts.get(ref, 0) + 1
+
     def _record_resolved_elements(self, count: int) -> None:
         max_resolved_elements = self.svg_limits.max_resolved_elements
         if max_resolved_elements is None:
@@ -1033,12 +1119,6 @@ class SVGObject:
             if (element_id := element.attrib.get("id"))
         }
 
-        def use_ref(use_tag: "Element") -> Optional[str]:
-            for candidate in xmlns_lookup("xlink", "href", "id"):
-                if candidate in use_tag.attrib:
-                    return use_tag.attrib[candidate]
-            return None
-
         max_use_depth = self.svg_limits.max_use_depth
         memo: dict[int, int] = {}
         active_refs: set[str] = set()
@@ -1060,7 +1140,7 @@ class SVGObject:
             for child in element.iter():
                 if child.tag not in xmlns_lookup("svg", "use"):
                     continue
-                ref = use_ref(child)
+                ref = _use_ref(child)
                 if not ref:
                     continue
                 referenced = elements_by_id.get(ref)
@@ -1115,7 +1195,7 @@ class SVGObject:
                 return projected_cost_memo[element_id]
 
             if element.tag in use_tags:
-                ref = use_ref(element)
+                ref = _use_ref(element)
                 if ref is None:
                     return 1
                 referenced = elements_by_id.get(ref)
@@ -1519,15 +1599,20 @@ class SVGObject:
     @force_nodocument
     def convert_graphics(self, root_tag: "Element") -> None:
         """Convert the graphics contained in the SVG into the PDF representation."""
-        base_group = GraphicsContext()
-        base_group.style.stroke_width = None
-        base_group.style.auto_close = False
-        base_group.style.stroke_cap_style = StrokeCapStyle.BUTT
+        base_group = self._new_base_group()
 
         self.build_group(root_tag, base_group)
 
         self.base_group = base_group
 
+    @staticmethod
+    def _new_base_group() -> GraphicsContext:
+        base_group = GraphicsContext()
+        base_group.style.stroke_width = None
+        base_group.style.auto_close = False
+        base_group.style.stroke_cap_style = StrokeCapStyle.BUTT
+        return base_group
+
     def transform_to_page_viewport(
         self, pdf: "FPDF", align_viewbox: bool = True
     ) -> tuple[float, float, GraphicsContext]:
@@ -1559,6 +1644,7 @@ class SVGObject:
         height: float | Percent,
         align_viewbox: bool = True,
         ignore_svg_top_attrs: bool = False,
+        viewbox: Optional[list[float]] = None,
     ) -> tuple[float, float, GraphicsContext]:
         """
         Size the converted SVG paths to an arbitrarily sized viewport.
@@ -1577,6 +1663,7 @@ class SVGObject:
             ignore_svg_top_attrs (bool): ignore <svg> top attributes like "width", "height"
                 or "preserveAspectRatio" when figuring the image dimensions.
                 Require width & height to be provided as parameters.
+            viewbox (list): the viewBox to use instead of the one of the <svg> tag.
 
         Returns:
             A tuple of (width, height, `fpdf.drawing.GraphicsContext`), where width and
@@ -1622,8 +1709,10 @@ class SVGObject:
         else:
             transform = Transform.scaling(1 / scale)
 
-        if self.viewbox:
-            vx, vy, vw, vh = self.viewbox
+        if viewbox is None:
+            viewbox = self.viewbox
+        if viewbox:
+            vx, vy, vw, vh = viewbox
 
             if (vw == 0) or (vh == 0):
                 return 0, 0, GraphicsContext()
@@ -1788,7 +1877,23 @@ class SVGObject:
                 f"use {xref} references nonexistent ref id {ref}"
             ) from None
         self._record_resolved_elements(1 + referenced_cost)
-        pdf_group.add_item(referenced)
+        if (
+            referenced_cost * self._use_counts.get(ref, 0) >= SHARED_REFERENCE_MIN_COST
+            and isinstance(referenced, (GraphicsContext, PaintedPath))
+            and can_render_as_form_xobject(referenced, allow_text=False)
+        ):
+            # Rendered once in a Form XObject, that each <use> paints:
+            shared = self._shared_references.get(ref)
+            if shared is None:
+                if isinstance(referenced, PaintedPath):
+                    context = GraphicsContext()
+                    context.add_item(referenced, clone=False)
+                else:
+                    context = referenced
+                shared = self._shared_references[ref] = SharedGraphicsContext(context)
+            pdf_group.add_item(shared, clone=False)
+        else:
+            pdf_group.add_item(referenced)
 
         placement_transform = None
         if "x" in xref.attrib or "y" in xref.attrib:
@@ -2230,6 +2335,402 @@ class SVGObject:
         return path
 
 
+class _StreamedItems:
+    """
+    Placeholder for the children of a `GraphicsContext` that are rendered incrementally.
+    It captures the graphics style resolved for them,
+    and marks where they belong in the rendered context.
+    """
+
+    __slots__ = ("style",)
+
+    MARKER = "\x00"  # never part of the operators rendered by fpdf2
+
+    def __init__(self) -> None:
+        self.style = GraphicsStyle()
+
+    # pylint: disable=unused-argument
+    @force_nodocument
+    def render(
+        self,
+        resource_registry: "ResourceCatalog",
+        style: GraphicsStyle,
+        last_item: "Renderable",
+        initial_point: Point,
+    ) -> tuple[str, "Renderable", Point]:
+        self.style = style
+        return self.MARKER, last_item, initial_point
+
+    @property
+    def end_point(self) -> Point:
+        return Point(0, 0)
+
+    def bounding_box(self, start: Point) -> tuple[BoundingBox, Point]:
+        return BoundingBox.empty(), start
+
+
+class _StreamedGroup:
+    "A SVG container element whose children are rendered while they are parsed"
+
+    __slots__ = ("element", "context", "style_map", "transform", "style", "closing")
+
+    def __init__(
+        self,
+        element: "Element",
+        context: GraphicsContext,
+        style_map: dict[str, Any],
+        transform: Transform,
+    ) -> None:
+        self.element = element
+        self.context = context
+        self.style_map = style_map  # SVG style properties inherited by the children
+        self.transform = transform  # user space transform, for gradients
+        # Set once the group is opened, i.e. before rendering its first child:
+        self.style = GraphicsStyle()
+        self.closing = ""
+
+
+class IncrementalSVGObject(SVGObject):
+    """
+    A representation of an SVG that is converted to a PDF representation
+    incrementally, while it is being drawn.
+
+    The SVG document is never loaded entirely in memory. A first pass over the
+    document collects the CSS style sheets, the content of `<defs>` tags, and the
+    IDs of the elements that are referenced by other ones.
+    While drawing the image, a second pass converts its elements one at a time,
+    and the PDF operators of each graphics element are emitted as soon as it is
+    converted. Elements are then discarded, unless they are referenced.
+    This keeps memory usage bounded when inserting very large drawings.
+
+    Compared to `SVGObject`, this conversion mode has some limitations:
+
+    * the image can only be drawn once
+    * the SVG source is read twice, hence it must be a file path or a seekable file
+    * `<use>` elements can only reference the `<defs>` content, and the elements
+      that appear before them
+    * `SVGLimits` are checked while the image is being drawn
+    """
+
+    # pylint: disable=unused-argument
+    @classmethod
+    def from_file(
+        cls,
+        filename: str | PathLike[str],
+        *args: Any,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> "IncrementalSVGObject":
+        """
+        Create an `IncrementalSVGObject` from the file at `filename`.
+        The file is read again while the image is being drawn.
+
+        Args:
+            filename (path-like): the path to a file containing SVG data.
+            *args: forwarded directly to the initializer. For subclass use.
+            encoding (str): ignored, the XML parser detects the file encoding.
+            **kwargs: forwarded directly to the initializer. For subclass use.
+
+        Returns:
+            An `IncrementalSVGObject`, ready to be drawn.
+        """
+        return cls(filename, *args, **kwargs)
+
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self,
+        source: str | PathLike[str] | BinaryIO,
+        image_cache: Optional[ImageCache] = None,
+        resource_access_policy: ResourceAccessPolicy = ResourceAccessPolicy.DEFAULT,
+        svg_limits: Optional[SVGLimits] = None,
+    ) -> None:
+        self._init_conversion_state(image_cache, resource_access_policy, svg_limits)
+        self._source: Optional[str | PathLike[str] | BinaryIO] = source
+        self._referenced_ids: set[str] = set()
+        self._use_depths: dict[str, int] = {}
+        self._root_style_map: dict[str, Any] = {}
+        self.base_group = self._new_base_group()
+        # All the elements inside <defs> tags are retained:
+        self._retaining_xrefs = True
+        self._parse_definitions()
+        self._retaining_xrefs = False
+
+    def _iterparse(self) -> Iterator[tuple[str, "Element"]]:
+        assert self._source is not None
+        if not isinstance(self._source, (str, PathLike)):
+            self._source.seek(0)
+        # disabling bandit rule as we use defusedxml:
+        events: Iterator[tuple[str, "Element"]] = iterparse(  # nosec B314
+            self._source, events=("start", "end")
+        )
+        return events
+
+    def _parse_definitions(self) -> None:
+        """
+        First pass over the SVG document, that collects the image dimensions,
+        the CSS style sheets, the content of <defs> tags,
+        and the IDs of the elements referenced by other ones.
+        """
+        defs_tags = xmlns_lookup("svg", "defs")
+        use_tags = xmlns_lookup("svg", "use")
+        parents: list["Element"] = []
+        defs_depth = 0
+        for event, element in self._iterparse():
+            if event == "start":
+                if not parents:
+                    if element.tag not in xmlns_lookup("svg", "svg"):
+                        raise ValueError(f"root tag must be svg, not {element.tag}")
+                    self.extract_shape_info(element)
+                if element.tag in use_tags:
+                    ref = _use_ref(element)
+                    self._count_use(ref)
+                    if ref:
+                        self._referenced_ids.add(ref)
+                for value in element.attrib.values():
+                    self._referenced_ids.update(URL_REF_RE.findall(value))
+                if element.tag in defs_tags:
+                    defs_depth += 1
+                parents.append(element)
+                continue
+            parents.pop()
+            if element.tag in xmlns_lookup("svg", "style"):
+                self._collect_css_styles(element)
+            elif element.tag in defs_tags:
+                defs_depth -= 1
+                if not defs_depth:  # nested <defs> are handled with their parent
+                    self._check_use_depths(element)
+                    self.handle_defs(element)
+            if parents:
+                if not defs_depth:  # releasing the parsed element
+                    parents[-1].remove(element)
+            else:  # this is the root <svg> element
+                self._root_style_map = self._style_map_for(element)
+
+    @force_nodocument
+    def update_xref(self, key: Optional[str], referenced: Any) -> None:
+        # Outside of <defs>, only the elements referenced by other ones are retained:
+        if self._retaining_xrefs or (
+            key and ("#" + key if not key.startswith("#") else key)
+            in self._referenced_ids
+        ):
+            super().update_xref(key, referenced)
+
+    @force_nodocument
+    def build_xref(self, xref: "Element") -> GraphicsContext:
+        ref = _use_ref(xref)
+        if ref is not None and ref not in self.cross_references:
+            LOGGER.warning(
+                "Ignoring SVG <use> reference to %s: incrementally converted images"
+                " can only reference <defs> content and previous elements",
+                ref,
+            )
+            return GraphicsContext()
+        return super().build_xref(xref)
+
+    def _check_use_depths(self, element: "Element") -> None:
+        """
+        Incremental counterpart of the max_use_depth check of `_check_svg_limits()`.
+        As <use> elements can only reference elements that are already converted,
+        the depth of every element ID is recorded once.
+        """
+        max_use_depth = self.svg_limits.max_use_depth
+        use_tags = xmlns_lookup("svg", "use")
+
+        def use_depth(tag: "Element") -> int:
+            depth = 0
+            if tag.tag in use_tags:
+                ref = _use_ref(tag)
+                if ref:
+                    depth = 1 + self._use_depths.get(ref, 0)
+                if max_use_depth is not None and depth > max_use_depth:
+                    raise FPDFSvgLimitExceeded(
+                        "SVG complexity exceeds the configured "
+                        f"max_use_depth limit ({max_use_depth})"
+                    )
+            for child in tag:
+                depth = max(depth, use_depth(child))
+            element_id = tag.attrib.get("id")
+            if depth and element_id:
+                self._use_depths[f"#{element_id}"] = depth
+            return depth
+
+        use_depth(element)
+
+    @staticmethod
+    def _render_opening(
+        group: GraphicsContext,
+        resource_registry: "ResourceCatalog",
+        style: GraphicsStyle,
+        last_item: "Renderable",
+        initial_point: Point,
+    ) -> tuple[str, str, GraphicsStyle]:
+        """
+        Render a graphics context whose children are not converted yet.
+
+        Returns:
+            A tuple of (opening, closing, style): the PDF operators to output
+            before & after its children, and the graphics style of its children.
+        """
+        streamed_items = _StreamedItems()
+        group.path_items = [streamed_items]
+        try:
+            render_list, _, _ = group.build_render_list(
+                resource_registry, style, last_item, initial_point
+            )
+        finally:
+            group.path_items = []
+        index = render_list.index(_StreamedItems.MARKER)
+        return (
+            " ".join(render_list[:index]),
+            " ".join(render_list[index + 1 :]),
+            streamed_items.style,
+        )
+
+    def render_incrementally(
+        self,
+        resource_registry: "ResourceCatalog",
+        style: GraphicsStyle,
+        last_item: "Renderable",
+        initial_point: Point,
+    ) -> Iterator[str]:
+        """
+        Convert the SVG elements while reading them,
+        yielding the PDF representation of each one as soon as it is converted.
+
+        `base_group.transform` must be set before calling this method,
+        cf. `SVGObject.transform_to_rect_viewport()`.
+
+        Args:
+            resource_registry (ResourceCatalog): the parent document's graphics
+                state registry.
+            style (GraphicsStyle): the current resolved graphics style.
+            last_item: the previous path element.
+            initial_point: last position set by a "M" or "m" command.
+
+        Raises:
+            FPDFSvgLimitExceeded: if the SVG exceeds the configured `SVGLimits`.
+        """
+        if self._source is None:
+            raise FPDFException(
+                "An incrementally converted SVG image can only be drawn once"
+            )
+        events = self._iterparse()
+        self._source = None
+        _, root = next(events)
+        self._record_resolved_elements(1)
+        apply_styles(self.base_group, root, self._root_style_map)
+        groups = [
+            _StreamedGroup(
+                root,
+                self.base_group,
+                self._root_style_map,
+                self.base_group.transform or Transform.identity(),
+            )
+        ]
+        # Groups are only rendered once they have some content:
+        opened_groups_count = 0
+        group_tags = xmlns_lookup("svg", "g", "a")
+        skipped_tags = xmlns_lookup("svg", "defs", "style")  # handled by 1st pass
+        # A child element that is converted as a whole, once it has been parsed:
+        pending: Optional["Element"] = None
+        for event, element in events:
+            parent = groups[-1]
+            if pending is not None:
+                if event == "end" and element is pending:
+                    pending = None
+                    container = GraphicsContext()
+                    if element.tag not in skipped_tags:
+                        self._check_use_depths(element)
+                        self._build_group_child(container, element, parent.style_map)
+                    for item in container.path_items:
+                        while opened_groups_count < len(groups):
+                            group = groups[opened_groups_count]
+                            opening, group.closing, group.style = (
+                                self._render_opening(
+                                    group.context,
+                                    resource_registry,
+                                    (
+                                        groups[opened_groups_count - 1].style
+                                        if opened_groups_count
+                                        else style
+                                    ),
+                                    last_item,
+                                    initial_point,
+                                )
+                            )
+                            yield opening
+                            opened_groups_count += 1
+                        if isinstance(item, (GraphicsContext, PaintedPath)):
+                            apply_svg_transform_to_user_space_gradients(
+                                item, parent.transform
+                            )
+                        rendered, last_item, initial_point = item.render(
+                            resource_registry, parent.style, last_item, initial_point
+                        )
+                        if rendered:
+                            yield rendered
+                    # Releasing the parsed element:
+                    parent.element.remove(element)
+            elif event == "start":
+                element_id = element.attrib.get("id")
+                if element.tag not in group_tags or (
+                    element_id and f"#{element_id}" in self._referenced_ids
+                ):
+                    pending = element
+                    continue
+                if element.tag in xmlns_lookup("svg", "a"):
+                    LOGGER.warning(
+                        "Ignoring unsupported SVG tag: <a> (contributions are welcome to add support for it)",
+                    )
+                style_map = dict(parent.style_map)
+                style_map.update(self._style_map_for(element))
+                pdf_group = GraphicsContext()
+                self._record_resolved_elements(1)
+                apply_styles(pdf_group, element, style_map)
+                transform = parent.transform
+                if pdf_group.transform is not None:
+                    transform = transform @ pdf_group.transform
+                groups.append(_StreamedGroup(element, pdf_group, style_map, transform))
+            else:  # end of a streamed group
+                groups.pop()
+                if opened_groups_count > len(groups):
+                    opened_groups_count -= 1
+                    yield parent.closing
+                if groups:
+                    groups[-1].element.remove(element)
+
+    def draw_to_page(
+        self,
+        pdf: "FPDF",
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        debug_stream: Optional[bool] = None,
+    ) -> None:
+        """
+        Directly draw the SVG to the given PDF's current page, converting it meanwhile.
+
+        The page viewport is used for sizing the SVG.
+
+        Args:
+            pdf (fpdf.fpdf.FPDF): the document to which the converted SVG is rendered.
+            x (Number): abscissa of the converted SVG's top-left corner.
+            y (Number): ordinate of the converted SVG's top-left corner.
+            debug_stream (io.TextIO): *DEPRECATED* unused.
+        """
+        self.image_cache = pdf.image_cache  # Needed to render images
+        self.resource_access_policy = pdf.resource_access_policy
+        _, _, path = self.transform_to_page_viewport(pdf)
+        old_x, old_y = pdf.x, pdf.y
+        try:
+            if x is not None and y is not None:
+                pdf.set_xy(0, 0)
+                assert path.transform is not None
+                path.transform = path.transform @ Transform.translation(x, y)
+            pdf._draw_svg_incrementally(self)  # pyright: ignore[reportPrivateUsage]
+        finally:
+            pdf.set_xy(old_x, old_y)
+
+
 class SVGImage(NamedTuple):
     href: str
     x: float
@@ -76,6 +76,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    SupportsBytes,
     TypeAlias,
     Union,
     runtime_checkable,
@@ -219,7 +220,7 @@ class PDFObject:
         return "\n".join(output)
 
     # pylint: disable=no-self-use
-    def content_stream(self) -> bytes:
+    def content_stream(self) -> bytes | bytearray:
         "Subclasses can override this method to indicate the presence of a content stream"
         return b""
 
@@ -243,19 +244,39 @@ class PDFContentStream(PDFObject):
     # Passed to zlib.compress() - In range 0-9 - Default is currently equivalent to 6:
     _COMPRESSION_LEVEL = -1
 
-    def __init__(self, contents: bytes | bytearray, compress: bool = False):
+    def __init__(
+        self, contents: bytes | bytearray | SupportsBytes, compress: bool = False
+    ):
         super().__init__()
-        self._contents = (
-            zlib.compress(contents, level=self._COMPRESSION_LEVEL)
-            if compress
-            else bytes(contents)
-        )
+        self._contents: bytes | bytearray | SupportsBytes
+        self._encrypted = False
+        if compress:
+            self._contents = zlib.compress(
+                bytes(contents), level=self._COMPRESSION_LEVEL
+            )
+        elif isinstance(contents, (bytes, bytearray)):
+            self._contents = bytes(contents)
+        else:
+            # e.g. image data stored on disk, only read when serializing this object:
+            self._contents = contents
         self.filter = Name("FlateDecode") if compress else None
-        self.length = len(self._contents)
+        self.length = len(self._contents)  # type: ignore[arg-type]
 
     # method override
-    def content_stream(self) -> bytes:
-        return self._contents
+    def content_stream(self) -> bytes | bytearray:
+        if isinstance(self._contents, (bytes, bytearray)):
+            return self._contents
+        return bytes(self._contents)
+
+    def encrypt(self, security_handler: "StandardSecurityHandler") -> None:
+        "Encrypts the contents of this stream, once"
+        if self._encrypted:
+            return
+        self._contents = security_handler.encrypt_stream(
+            self.content_stream(), self.id
+        )
+        self.length = len(self._contents)
+        self._encrypted = True
 
     # method override
     def serialize(
@@ -265,10 +286,7 @@ class PDFContentStream(PDFObject):
     ) -> str:
         if _security_handler:
             assert not obj_dict
-            if not isinstance(self._contents, (bytearray, bytes)):
-                self._contents = self._contents.encode("latin-1")
-            self._contents = _security_handler.encrypt_stream(self._contents, self.id)
-            self.length = len(self._contents)
+            self.encrypt(_security_handler)
         return super().serialize(obj_dict, _security_handler)
 
 
@@ -30,6 +30,7 @@ from .enums import (
 )
 from .errors import FPDFException
 from .fonts import CORE_FONTS, FontFace
+from .number_formatting import CONTENT_FORMATTER
 from .util import ImageType, Number, NumberClass, Padding
 
 if TYPE_CHECKING:
@@ -974,19 +975,20 @@ def draw_box_borders(
 
     if fill_color:
         op = "B" if border == 1 else "f"
-        sl.append(f"{x1:.2f} {y2:.2f} " f"{x2 - x1:.2f} {y1 - y2:.2f} re {op}")
+        sl.append(f"{CONTENT_FORMATTER.join((x1, y2, x2 - x1, y1 - y2))} re {op}")
     elif border == 1:
-        sl.append(f"{x1:.2f} {y2:.2f} " f"{x2 - x1:.2f} {y1 - y2:.2f} re S")
+        sl.append(f"{CONTENT_FORMATTER.join((x1, y2, x2 - x1, y1 - y2))} re S")
 
     if isinstance(border, str):
+        x1_s, y1_s, x2_s, y2_s = CONTENT_FORMATTER.format_many((x1, y1, x2, y2))
         if "L" in border:
-            sl.append(f"{x1:.2f} {y2:.2f} m " f"{x1:.2f} {y1:.2f} l S")
+            sl.append(f"{x1_s} {y2_s} m {x1_s} {y1_s} l S")
         if "B" in border:
-            sl.append(f"{x1:.2f} {y2:.2f} m " f"{x2:.2f} {y2:.2f} l S")
+            sl.append(f"{x1_s} {y2_s} m {x2_s} {y2_s} l S")
         if "R" in border:
-            sl.append(f"{x2:.2f} {y2:.2f} m " f"{x2:.2f} {y1:.2f} l S")
+            sl.append(f"{x2_s} {y2_s} m {x2_s} {y1_s} l S")
         if "T" in border:
-            sl.append(f"{x1:.2f} {y1:.2f} m " f"{x2:.2f} {y1:.2f} l S")
+            sl.append(f"{x1_s} {y1_s} m {x2_s} {y1_s} l S")
 
     s = " ".join(sl)
     pdf._out(  # pyright: ignore[reportPrivateUsage] # pylint: disable=protected-access
@@ -13,12 +13,37 @@ import json
 import locale
 import os
 import warnings
-from typing import Any, Optional, Sequence
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
 from .deprecation import get_stack_level
-from .enums import WrapMode
+from .drawing import FormGroup
+from .enums import PDFResourceType, WrapMode
 from .errors import FPDFException
 from .fpdf import FPDF
+from .number_formatting import CONTENT_FORMATTER
+
+if TYPE_CHECKING:
+    from .output import ResourceCatalog
+
+# Element types that are always rendered on each page by a compiled template:
+# barcodes are bound to data & write() adds links to the current page
+_DYNAMIC_TYPES = ("BC", "C39", "W")
+# Element types that are considered static by default by FlexTemplate.compile():
+_STATIC_TYPES = ("B", "E", "L")
 
 
 def _rgb(col: int) -> tuple[float, float, float]:
@@ -32,6 +57,37 @@ def _rgb_as_str(col: int) -> str:
     return f"{r / 255:.3f} {g / 255:.3f} {b / 255:.3f} rg"
 
 
+def _scale_element(element: dict[str, Any], scale: float) -> dict[str, Any]:
+    ele = element.copy()  # don't want to modify the callers original
+    if scale != 1.0:
+        ele["x1"] = ele["x1"] * scale
+        ele["y1"] = ele["y1"] * scale
+        ele["x2"] = ele["x1"] + ((ele["x2"] - element["x1"]) * scale)
+        ele["y2"] = ele["y1"] + ((ele["y2"] - element["y1"]) * scale)
+    ele["scale"] = scale
+    return ele
+
+
+class _StaticLayer(FormGroup):
+    "Page content stream of template elements, rendered once into a Form XObject"
+
+    __slots__ = ("stream",)
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, stream: str, bounds: tuple[float, float, float, float]):
+        self.stream = stream
+        self.resources: set[tuple[PDFResourceType, str]] = set()
+        self.bounds = bounds
+
+    def render(self, resource_registry: "ResourceCatalog") -> str:
+        self.resources = resource_registry.scan_stream(self.stream)
+        return self.stream
+
+    def get_bounding_box(self) -> tuple[float, float, float, float]:
+        assert self.bounds is not None
+        return self.bounds
+
+
 class FlexTemplate:
     """
     A flexible templating class.
@@ -56,6 +112,14 @@ class FlexTemplate:
             raise TypeError("'pdf' must be an instance of fpdf.FPDF()")
         self.pdf = pdf
         self.splitting_pdf: Optional[FPDF] = None  # for split_multicell()
+        # Elements grouped in static & dynamic layers by compile():
+        self._layers: Optional[list[tuple[bool, list[dict[str, Any]]]]] = None
+        # Names of the dynamic elements provided to compile():
+        self._dynamic_names: set[str] = set()
+        # Layers with their elements geometry, per scale:
+        self._scaled_layers: dict[float, list[tuple[bool, list[dict[str, Any]]]]] = {}
+        # Form XObjects of static layers, per scale, layer & graphics state:
+        self._static_forms: dict[tuple[Any, ...], int] = {}
         if elements:
             self.load_elements(elements)
         self.handlers = {
@@ -104,6 +168,9 @@ class FlexTemplate:
 
         self.elements: Sequence[dict[str, Any]] = elements
         self.keys: list[str] = []
+        self._layers = None
+        self._scaled_layers = {}
+        self._static_forms = {}
         for e in elements:
             # priority is optional, but we need a default for sorting.
             if not "priority" in e:
@@ -280,6 +347,9 @@ class FlexTemplate:
                         kargs[cfg[0]] = cfg[1](vs)  # type: ignore[operator]
                 self.elements.append(kargs)
         self.keys = [val["name"].lower() for val in self.elements]
+        self._layers = None
+        self._scaled_layers = {}
+        self._static_forms = {}
 
     def __setitem__(self, name: str, value: Any) -> None:
         assert isinstance(
@@ -700,39 +770,187 @@ class FlexTemplate:
             rotate (float): Rotate the inserted template around its (offset) origin.
             scale (float): Scale the inserted template by this factor.
         """
+        if self._layers is not None:
+            self._render_layers(offsetx, offsety, rotate, scale)
+            self.texts = {}  # reset modified entries for the next page
+            return
         sorted_elements = sorted(self.elements, key=lambda x: x["priority"])
         with self.pdf.local_context():
             for element in sorted_elements:
-                ele = element.copy()  # don't want to modify the callers original
+                ele = _scale_element(element, scale)
                 ele["text"] = self.texts.get(ele["name"].lower(), ele.get("text", ""))
-                if scale != 1.0:
-                    ele["x1"] = ele["x1"] * scale
-                    ele["y1"] = ele["y1"] * scale
-                    ele["x2"] = ele["x1"] + ((ele["x2"] - element["x1"]) * scale)
-                    ele["y2"] = ele["y1"] + ((ele["y2"] - element["y1"]) * scale)
-                if offsetx:
-                    ele["x1"] = ele["x1"] + offsetx
-                    ele["x2"] = ele["x2"] + offsetx
-                if offsety:
-                    ele["y1"] = ele["y1"] + offsety
-                    ele["y2"] = ele["y2"] + offsety
-                ele["scale"] = scale
-                handler_name = ele["type"].upper()
-                if rotate:  # don't rotate by 0.0 degrees
-                    with self.pdf.rotation(rotate, offsetx, offsety):
-                        if "rotate" in ele and ele["rotate"]:
-                            with self.pdf.rotation(ele["rotate"], ele["x1"], ele["y1"]):
-                                self.handlers[handler_name](**ele)
-                        else:
-                            self.handlers[handler_name](**ele)
-                else:
-                    if "rotate" in ele and ele["rotate"]:
-                        with self.pdf.rotation(ele["rotate"], ele["x1"], ele["y1"]):
-                            self.handlers[handler_name](**ele)
-                    else:
-                        self.handlers[handler_name](**ele)
+                self._render_element(ele, offsetx, offsety, rotate)
         self.texts = {}  # reset modified entries for the next page
 
+    def _render_element(
+        self, ele: dict[str, Any], offsetx: float, offsety: float, rotate: float
+    ) -> None:
+        if offsetx:
+            ele["x1"] = ele["x1"] + offsetx
+            ele["x2"] = ele["x2"] + offsetx
+        if offsety:
+            ele["y1"] = ele["y1"] + offsety
+            ele["y2"] = ele["y2"] + offsety
+        handler = self.handlers[ele["type"].upper()]
+        with (
+            self.pdf.rotation(rotate, offsetx, offsety)
+            if rotate  # don't rotate by 0.0 degrees
+            else nullcontext()
+        ):
+            if "rotate" in ele and ele["rotate"]:
+                with self.pdf.rotation(ele["rotate"], ele["x1"], ele["y1"]):
+                    handler(**ele)
+            else:
+                handler(**ele)
+
+    def compile(self, dynamic: Optional[Iterable[str]] = None) -> None:
+        """
+        Prepare the template for the rendering of many pages,
+        by splitting its elements between static & dynamic ones.
+
+        Consecutive static elements, in priority order, are rendered once
+        into a Form XObject, that `render()` then paints on each page,
+        while the dynamic elements keep being rendered on each call to `render()`.
+        A Form XObject is rendered for each scale the template is rendered with.
+
+        Args:
+            dynamic (iterable of str): names of the elements whose content varies
+                between pages. By default, only the lines, boxes & ellipses are static.
+                Barcodes & elements of type "W" are always dynamic.
+        """
+        if dynamic is None:
+            names = {
+                e["name"].lower()
+                for e in self.elements
+                if e["type"].upper() not in _STATIC_TYPES
+            }
+        else:
+            names = set()
+            for name in dynamic:
+                if name.lower() not in self.keys:
+                    raise FPDFException(f"Element not loaded, cannot compile: {name}")
+                names.add(name.lower())
+        layers: list[tuple[bool, list[dict[str, Any]]]] = []
+        for element in sorted(self.elements, key=lambda x: x["priority"]):
+            static = (
+                element["type"].upper() not in _DYNAMIC_TYPES
+                and element["name"].lower() not in names
+            )
+            if layers and layers[-1][0] == static:
+                layers[-1][1].append(element)
+            else:
+                layers.append((static, [element]))
+        self._layers = layers
+        self._dynamic_names = names
+        # The Form XObjects of the previous layers must not be painted anymore:
+        self._scaled_layers = {}
+        self._static_forms = {}
+
+    def _use_pdf(self, pdf: FPDF) -> None:
+        "Makes the template render its elements into another document"
+        self.pdf = pdf
+        self._static_forms = {}  # Form XObjects belong to a single document
+
+    def _render_layers(
+        self, offsetx: float, offsety: float, rotate: float, scale: float
+    ) -> None:
+        assert self._layers is not None
+        scaled_layers = self._scaled_layers.get(scale)
+        if scaled_layers is None:
+            scaled_layers = self._scaled_layers[scale] = [
+                (static, [_scale_element(element, scale) for element in elements])
+                for static, elements in self._layers
+            ]
+        with self.pdf.local_context():
+            for layer_index, (static, elements) in enumerate(scaled_layers):
+                if static:
+                    for ele in elements:
+                        text = self.texts.get(ele["name"].lower())
+                        if text is not None and text != ele.get("text", ""):
+                            raise FPDFException(
+                                f"Element {ele['name']} is static in this compiled"
+                                " template: its content cannot be set"
+                            )
+                    index = self._static_form(layer_index, scale, elements)
+                    if index is not None:
+                        self._paint_static_form(index, offsetx, offsety, rotate)
+                        continue
+                for element in elements:
+                    ele = element.copy()
+                    ele["text"] = self.texts.get(
+                        ele["name"].lower(), ele.get("text", "")
+                    )
+                    self._render_element(ele, offsetx, offsety, rotate)
+
+    def _static_form(
+        self, layer_index: int, scale: float, elements: list[dict[str, Any]]
+    ) -> Optional[int]:
+        """
+        Returns the index of the Form XObject that a static layer is rendered into,
+        rendering it on first use.
+        Returns None if the layer must be rendered directly on the page.
+        """
+        # pylint: disable=protected-access
+        pdf = self.pdf
+        # The content of the Form XObject relies on the graphics state
+        # in effect when it is rendered, which is also the one inherited where
+        # it is painted: a Form XObject is rendered for each graphics state.
+        state = pdf._get_current_graphics_state().as_kwargs()
+        del state["current_font_is_set_on_page"]
+        for name, value in state.items():
+            if isinstance(value, dict):
+                state[name] = tuple(sorted(value.items()))
+        try:
+            key = (layer_index, scale, pdf.h, *state.values())
+            index = self._static_forms.get(key)
+        except TypeError:  # unhashable graphics state property
+            return None
+        if index is not None:
+            return index
+        page = pdf.pages[pdf.page]
+        contents, page.contents = page.contents, bytearray()
+        auto_page_break = pdf.auto_page_break
+        # Static elements cannot trigger page breaks:
+        pdf.auto_page_break = False
+        try:
+            with pdf.local_context():
+                # The current font must be selected in the Form XObject itself:
+                pdf.current_font_is_set_on_page = False
+                for element in elements:
+                    ele = element.copy()
+                    ele["text"] = ele.get("text", "")
+                    self._render_element(ele, 0, 0, 0)
+            stream = bytes(page.contents).decode("latin-1")
+        finally:
+            page.contents = contents
+            pdf.auto_page_break = auto_page_break
+        # Rotated elements & texts may extend beyond the page,
+        # and the template can be moved anywhere by render() offsets:
+        w_pt, h_pt = pdf.w_pt * max(scale, 1), pdf.h_pt * max(scale, 1)
+        form_group = _StaticLayer(stream, (-w_pt, -h_pt, 2 * w_pt, 2 * h_pt))
+        index = self._static_forms[key] = pdf.image_cache.reserve_form_xobject_index()
+        pdf._resource_catalog.register_form(form_group, index, pdf.compress)
+        return index
+
+    def _paint_static_form(
+        self, index: int, offsetx: float, offsety: float, rotate: float
+    ) -> None:
+        # pylint: disable=protected-access
+        pdf = self.pdf
+        with (
+            pdf.rotation(rotate, offsetx, offsety)
+            if rotate  # don't rotate by 0.0 degrees
+            else nullcontext()
+        ):
+            if offsetx or offsety:
+                translation = CONTENT_FORMATTER.join(
+                    (offsetx * pdf.k, -offsety * pdf.k)
+                )
+                pdf._out(f"q 1 0 0 1 {translation} cm /I{index} Do Q")
+            else:
+                pdf._out(f"/I{index} Do")
+        pdf._resource_catalog.add(PDFResourceType.X_OBJECT, index, pdf.page)
+
 
 class Template(FlexTemplate):
     """
@@ -793,13 +1011,30 @@ class Template(FlexTemplate):
             # nosemgrep: python.lang.security.dangerous-globals-use.dangerous-globals-use
             if not isinstance(locals()[arg], str):
                 raise TypeError(f'Argument "{arg}" must be of type str.')
-        pdf = FPDF(format=format, orientation=orientation, unit=unit)
-        pdf.set_title(title)
-        pdf.set_author(author)
-        pdf.set_creator(creator)
-        pdf.set_subject(subject)
-        pdf.set_keywords(keywords)
-        super().__init__(pdf=pdf, elements=elements)
+        self._document_args: dict[str, Any] = {
+            "format": format,
+            "orientation": orientation,
+            "unit": unit,
+            "title": title,
+            "author": author,
+            "subject": subject,
+            "creator": creator,
+            "keywords": keywords,
+        }
+        super().__init__(pdf=self._new_pdf(), elements=elements)
+
+    def _new_pdf(self) -> FPDF:
+        "Creates a new document, with the settings provided to the constructor"
+        args = self._document_args
+        pdf = FPDF(
+            format=args["format"], orientation=args["orientation"], unit=args["unit"]
+        )
+        pdf.set_title(args["title"])
+        pdf.set_author(args["author"])
+        pdf.set_creator(args["creator"])
+        pdf.set_subject(args["subject"])
+        pdf.set_keywords(args["keywords"])
+        return pdf
 
     def add_page(self) -> None:
         """Finish the current page, and proceed to the next one."""
@@ -828,3 +1063,143 @@ class Template(FlexTemplate):
         super().render()
         if outfile:
             self.pdf.output(outfile)
+
+    def render_many(
+        self,
+        records: Iterable[Mapping[str, Any] | Iterable[Mapping[str, Any]]],
+        out_dir: Optional[str | os.PathLike[str]] = None,
+        workers: Optional[int] = None,
+        setup: Optional[Callable[[FPDF], None]] = None,
+        file_name: str = "{index}.pdf",
+    ) -> Iterator["RenderedRecord"]:
+        """
+        Renders one document per record, in a pool of processes,
+        and yields a `RenderedRecord` for each record, in the order of `records`.
+
+        Each worker process builds this template once, and reuses it
+        for its share of the records. `records` can be a generator:
+        only a bounded number of records are pending at any time.
+        The records, `setup` & the elements of this template must be picklable.
+
+        Args:
+            records (iterable): the values of the template elements for each document,
+                as mappings of element names to values: one mapping per page,
+                or a mapping for documents made of a single page.
+            out_dir (str, path-like object): optional directory where the documents
+                are written.
+                If not provided, the content of the documents is yielded as `bytes`.
+            workers (int): maximum number of worker processes.
+                Defaults to the `concurrent.futures.ProcessPoolExecutor` default.
+                With `workers=1`, documents are rendered in the current process.
+            setup (callable): optional function receiving each new `FPDF` document,
+                before any page is added to it, in order to add fonts for example.
+                It must be defined at the top level of a module.
+            file_name (str): name of the files written in `out_dir`,
+                formatted with the index of the record.
+        """
+        merge = _MailMerge(self, setup, out_dir, file_name)
+        if workers == 1:
+            for index, record in enumerate(records):
+                yield merge.render(index, record)
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(merge,)
+        ) as executor:
+            max_pending = 4 * (workers or os.cpu_count() or 1)
+            pending: deque[tuple[int, Future[RenderedRecord]]] = deque()
+            for index, record in enumerate(records):
+                future = executor.submit(_render_in_worker, index, record)
+                pending.append((index, future))
+                if len(pending) >= max_pending:
+                    yield _result(*pending.popleft())
+            while pending:
+                yield _result(*pending.popleft())
+
+
+class RenderedRecord(NamedTuple):
+    "Outcome of the rendering of a record by `Template.render_many()`"
+
+    record_index: int
+    "Position of the record in the records provided"
+    data: Optional[bytes] = None
+    "Content of the document, if no output directory was provided"
+    path: Optional[Path] = None
+    "Path of the document written, if an output directory was provided"
+    error: Optional[BaseException] = None
+    "Exception raised while rendering this record, if any"
+
+
+class _MailMerge:
+    "Renders the documents of `Template.render_many()`, in a worker process or not"
+
+    def __init__(
+        self,
+        template: Template,
+        setup: Optional[Callable[[FPDF], None]],
+        out_dir: Optional[str | os.PathLike[str]],
+        file_name: str,
+    ) -> None:
+        # pylint: disable=protected-access
+        self.document_args = template._document_args
+        self.elements = list(template.elements)
+        self.dynamic_names = (
+            None if template._layers is None else sorted(template._dynamic_names)
+        )
+        self.setup = setup
+        self.out_dir = None if out_dir is None else Path(out_dir)
+        self.file_name = file_name
+        self.template: Optional[Template] = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Templates are built by each worker process:
+        return {**self.__dict__, "template": None}
+
+    def render(
+        self, index: int, record: Mapping[str, Any] | Iterable[Mapping[str, Any]]
+    ) -> RenderedRecord:
+        # pylint: disable=protected-access
+        try:
+            if self.template is None:
+                self.template = Template(elements=self.elements, **self.document_args)
+                if self.dynamic_names is not None:
+                    self.template.compile(self.dynamic_names)
+            template = self.template
+            template._use_pdf(template._new_pdf())
+            template.texts = {}
+            if self.setup:
+                self.setup(template.pdf)
+            for page in [record] if isinstance(record, Mapping) else record:
+                template.add_page()
+                for name, value in page.items():
+                    template[name] = value
+            template.render()
+            if self.out_dir is None:
+                return RenderedRecord(index, data=bytes(template.pdf.output()))
+            path = self.out_dir / self.file_name.format(index=index)
+            template.pdf.output(str(path))
+            return RenderedRecord(index, path=path)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return RenderedRecord(index, error=error)
+
+
+_WORKER_MAIL_MERGE: Optional[_MailMerge] = None
+
+
+def _init_worker(merge: _MailMerge) -> None:
+    global _WORKER_MAIL_MERGE  # pylint: disable=global-statement
+    _WORKER_MAIL_MERGE = merge
+
+
+def _render_in_worker(
+    index: int, record: Mapping[str, Any] | Iterable[Mapping[str, Any]]
+) -> RenderedRecord:
+    assert _WORKER_MAIL_MERGE is not None
+    return _WORKER_MAIL_MERGE.render(index, record)
+
+
+def _result(index: int, future: "Future[RenderedRecord]") -> RenderedRecord:
+    try:
+        return future.result()
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        # Like records or exceptions that cannot be pickled:
+        return RenderedRecord(index, error=error)
@@ -852,6 +852,9 @@ class TextColumns(TextRegion, TextColumnarMixin):
         if not self._paragraphs:
             return
         text_lines = self.collect_lines()
+        # The paragraphs are consumed, so that they are not processed again by
+        # the next calls to render(), except for the one still being written:
+        del self._paragraphs[: -1 if self._active_paragraph else None]
         if not text_lines:
             return
         page_bottom = self.pdf.h - self.pdf.b_margin
@@ -7,6 +7,7 @@ in non-backward-compatible ways.
 """
 
 import decimal
+from array import array
 
 # nosemgrep: python.lang.compatibility.python37.python37-compatibility-importlib2 (min Python is 3.9)
 from importlib import resources
@@ -17,17 +18,25 @@ from typing import (
     BinaryIO,
     Iterable,
     NamedTuple,
+    Optional,
     Sequence,
     TypeVar,
     Union,
     overload,
 )
 
+from .number_formatting import DRAWING_FORMATTER, PATTERN_FORMATTER, NumberFormatter
+
 if TYPE_CHECKING:
     from PIL.Image import Image as PILImage
 
     from .svg import SVGObject
 
+try:
+    import numpy
+except (ImportError, RuntimeError):
+    numpy = None  # type: ignore[assignment]
+
 ImageType = Union[str, bytes, BinaryIO, "PILImage", Path, None]
 ImageClass = (str, bytes, BinaryIO, "PILImage", Path)
 ImageData = Union["SVGObject", "PILImage", bytes, BinaryIO, Path, None]
@@ -170,7 +179,106 @@ def number_to_str(number: Number) -> str:
     """
     # this approach tries to produce minimal representations of floating point numbers
     # but can also produce "-0".
-    return f"{number:.4f}".rstrip("0").rstrip(".")
+    return DRAWING_FORMATTER.format(number)
+
+
+def numbers_to_str(numbers: Sequence[float]) -> list[str]:
+    """
+    Convert a sequence of numbers to their minimal string representations,
+    identical to the ones produced by `number_to_str`.
+
+    All the numbers are formatted at once, which is much faster than calling
+    `number_to_str` on each of them when there are many.
+    """
+    return DRAWING_FORMATTER.format_many(numbers)
+
+
+def _buffer_numbers(numbers: Any) -> Any:
+    """
+    Returns the numbers of an `array.array` or a `memoryview` as a flat memoryview,
+    read according to their typecode, or the object itself if it is not one of those.
+    """
+    if isinstance(numbers, (bytes, bytearray)):
+        raise TypeError(
+            "Raw bytes cannot be interpreted as numbers:"
+            ' use an array.array("d") or a memoryview cast to "d" instead'
+        )
+    if isinstance(numbers, (array, memoryview)):
+        view = memoryview(numbers)
+        return view.cast("B").cast(view.format)  # type: ignore[call-overload]
+    return numbers
+
+
+def scale_rows(
+    rows: Any, scales: Sequence[float], offsets: Sequence[float]
+) -> list[float]:
+    """
+    Compute `value * scale + offset` for each column of some rows of numbers,
+    and return the results as a flat list, row after row.
+
+    Args:
+        rows: a NumPy array of shape (N, len(scales)), a sequence of N sequences of
+            numbers, or an `array.array` or `memoryview` of N * len(scales) numbers.
+        scales (Sequence[float]): the factor to apply to each column.
+        offsets (Sequence[float]): the offset to add to each column.
+
+    Computations are vectorized when NumPy is available.
+    Arrays of doubles are read by NumPy without being copied.
+    """
+    width = len(scales)
+    rows = _buffer_numbers(rows)
+    if numpy is not None:
+        matrix = numpy.asarray(rows, dtype=numpy.float64)
+        return _scale_matrix(matrix.reshape(-1, width), scales, offsets)
+    if isinstance(rows, memoryview):
+        values = [float(value) for value in rows]
+    else:
+        values = [float(value) for row in rows for value in row]
+    return _scale_values(values, scales, offsets)
+
+
+def scale_columns(
+    columns: Sequence[Any], scales: Sequence[float], offsets: Sequence[float]
+) -> list[float]:
+    """
+    Compute `value * scale + offset` for each column of numbers,
+    and return the results as a flat list, row after row.
+
+    Args:
+        columns: one NumPy array, sequence of numbers, `array.array` or `memoryview`
+            per column. They must all have the same length.
+        scales (Sequence[float]): the factor to apply to each column.
+        offsets (Sequence[float]): the offset to add to each column.
+
+    Computations are vectorized when NumPy is available.
+    Arrays of doubles are read by NumPy without being copied.
+    """
+    columns = [_buffer_numbers(column) for column in columns]
+    if numpy is not None:
+        matrix = numpy.column_stack(
+            [numpy.asarray(column, dtype=numpy.float64) for column in columns]
+        )
+        return _scale_matrix(matrix, scales, offsets)
+    values = [float(value) for row in zip(*columns) for value in row]
+    return _scale_values(values, scales, offsets)
+
+
+def _scale_matrix(
+    matrix: Any, scales: Sequence[float], offsets: Sequence[float]
+) -> list[float]:
+    result: list[float] = (matrix * scales + offsets).ravel().tolist()
+    return result
+
+
+def _scale_values(
+    values: list[float], scales: Sequence[float], offsets: Sequence[float]
+) -> list[float]:
+    width = len(scales)
+    for column, (scale, offset) in enumerate(zip(scales, offsets)):
+        values[column::width] = [
+            value * scale + offset for value in values[column::width]
+        ]
+    return values
 
 
 ROMAN_NUMERAL_MAP = (
@@ -214,20 +322,11 @@ def builtin_srgb2014_bytes() -> bytes:
     return (resources.files(pkg) / "sRGB2014.icc").read_bytes()
 
 
-def format_number(x: float, digits: int = 8) -> str:
-    # snap tiny values to zero to avoid "-0" and scientific notation
-    if abs(x) < 1e-12:
-        x = 0.0
-    s = f"{x:.{digits}f}"
-    if "." in s:
-        s = s.rstrip("0").rstrip(".")
-    if s == "-0":
-        s = "0"
-    if s.startswith("."):
-        s = "0" + s
-    if s.startswith("-."):
-        s = s.replace("-.", "-0.", 1)
-    return s
+def format_number(x: float, digits: Optional[int] = None) -> str:
+    "Convert a number to a minimal string representation, never producing -0"
+    if digits is None or digits == PATTERN_FORMATTER.decimals:
+        return PATTERN_FORMATTER.format(x)
+    return NumberFormatter(digits, negative_zero=False, cache_size=0).format(x)
 
 
 def get_parsed_unicode_range(
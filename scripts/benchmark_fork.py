@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Benchmark of FPDF.fork(): how many one-page documents are produced per second,
+when configuring each of them from scratch, or forking a configured prototype?"""
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter
+
+from fpdf import FPDF, TextStyle
+
+DOCUMENTS_COUNT = 100
+HERE = Path(__file__).resolve().parent
+FONTS_DIR = HERE / "../test/fonts"
+LOGO = HERE / "../docs/fpdf2-logo.png"
+
+
+def configure():
+    pdf = FPDF()
+    pdf.add_font("dejavu", fname=FONTS_DIR / "DejaVuSans.ttf")
+    pdf.add_font("dejavu", style="B", fname=FONTS_DIR / "DejaVuSans-Bold.ttf")
+    pdf.add_font("roboto", fname=FONTS_DIR / "Roboto-Regular.ttf")
+    pdf.set_font("roboto", size=10)
+    pdf.set_fallback_fonts(["dejavu"])
+    pdf.set_section_title_styles(TextStyle(font_family="dejavu", font_style="B"))
+    pdf.preload_images([LOGO])
+    return pdf
+
+
+def render_invoice(pdf, number):
+    pdf.add_page()
+    pdf.image(LOGO, x=150, y=10, w=40)
+    pdf.start_section(f"Invoice #{number}")
+    for line in range(20):
+        pdf.cell(120, 5, f"Item {line}: {number * line * 1.37:.2f} €", border=1)
+        pdf.ln()
+    pdf.output(BytesIO())
+
+
+def benchmark(new_document):
+    start = perf_counter()
+    for number in range(DOCUMENTS_COUNT):
+        render_invoice(new_document(), number)
+    return DOCUMENTS_COUNT / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(__doc__)
+    print(f"configure():       {benchmark(configure):8.1f} documents/s")
+    print(f"prototype.fork():  {benchmark(configure().fork):8.1f} documents/s")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Throughput benchmark of fpdf.sharding.render_sharded(): how many pages of a single
+document are produced per second, depending on the number of worker processes?"""
+import os
+import sys
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter
+
+from fpdf import FPDF
+from fpdf.sharding import render_sharded
+
+PAGES_COUNT = 4000
+SHARD_SIZE = 250
+HERE = Path(__file__).resolve().parent
+FONT = HERE / "../test/fonts/DejaVuSans.ttf"
+LOGO = HERE / "../docs/fpdf2-logo.png"
+
+
+def new_document():
+    pdf = FPDF()
+    pdf.add_font("dejavu", fname=FONT)
+    pdf.set_font("dejavu", size=10)
+    return pdf
+
+
+def render_statements(pdf, first, last):
+    for i in range(first, last):
+        pdf.add_page()
+        pdf.image(LOGO, x=150, y=10, w=40)
+        pdf.start_section(f"Statement #{i}")
+        pdf.cell(text=f"Statement #{i} – Customer #{i * 7}")
+        pdf.ln(15)
+        for line in range(40):
+            pdf.cell(120, 5, f"Operation {line}: {i * line * 1.37:.2f} €", border=1)
+            pdf.ln()
+
+
+def benchmark(workers):
+    producers = [
+        partial(render_statements, first=first, last=first + SHARD_SIZE)
+        for first in range(0, PAGES_COUNT, SHARD_SIZE)
+    ]
+    start = perf_counter()
+    pdf = render_sharded(new_document, producers, workers=workers)
+    pdf.output(BytesIO())
+    return PAGES_COUNT / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(__doc__)
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    workers = 1
+    while workers <= max_workers:
+        pages_per_sec = benchmark(workers)
+        print(f"workers={workers:<3} {pages_per_sec:8.1f} pages/s")
+        workers *= 2
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Throughput benchmark of Template.render_many(): how many single-page documents
+are rendered per second, depending on the number of worker processes?"""
+import os
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from fpdf import Template
+
+RECORDS_COUNT = 2000
+HERE = Path(__file__).resolve().parent
+LOGO = HERE / "../docs/fpdf2-logo.png"
+ELEMENTS = [
+    {"name": "frame", "type": "B", "x1": 10, "y1": 10, "x2": 200, "y2": 287},
+    {"name": "logo", "type": "I", "x1": 150, "y1": 15, "x2": 190, "y2": 40},
+    {"name": "company", "type": "T", "x1": 15, "y1": 15, "x2": 100, "y2": 25},
+    {"name": "sep", "type": "L", "x1": 15, "y1": 45, "x2": 195, "y2": 45},
+    {"name": "customer", "type": "T", "x1": 15, "y1": 50, "x2": 195, "y2": 60},
+    {"name": "address", "type": "T", "x1": 15, "y1": 60, "x2": 195, "y2": 70},
+    {"name": "amount", "type": "T", "x1": 15, "y1": 80, "x2": 195, "y2": 90},
+    {"name": "barcode", "type": "BC", "x1": 15, "y1": 250, "x2": 100, "y2": 265},
+]
+for element in ELEMENTS:
+    if element["name"] == "logo":
+        element["text"] = str(LOGO)
+    elif element["name"] == "company":
+        element["text"] = "ACME Corp."
+
+
+def records():
+    for i in range(RECORDS_COUNT):
+        yield {
+            "customer": f"Customer #{i}",
+            "address": f"{i} Main Street, Springfield",
+            "amount": f"Amount due: {i * 3.5:.2f} EUR",
+            "barcode": f"{i:010d}",
+        }
+
+
+def benchmark(workers, out_dir):
+    tmpl = Template(elements=ELEMENTS)
+    tmpl.compile(dynamic=["customer", "address", "amount", "barcode"])
+    start = perf_counter()
+    for result in tmpl.render_many(records(), out_dir=out_dir, workers=workers):
+        if result.error:
+            raise result.error
+    return RECORDS_COUNT / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(__doc__)
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    workers = 1
+    with TemporaryDirectory() as out_dir:
+        while workers <= max_workers:
+            docs_per_sec = benchmark(workers, out_dir)
+            print(f"workers={workers:<3} {docs_per_sec:8.1f} documents/s")
+            workers *= 2
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from fpdf import FPDF
+from fpdf.font_type_3 import COLOR_GLYPH_CACHE
+from test.conftest import EPOCH
+
+HERE = Path(__file__).resolve().parent
+IMAGES_DIR = HERE.parent / "image"
+
+
+@pytest.fixture
+def glyph_cache():
+    max_size = COLOR_GLYPH_CACHE.max_size
+    COLOR_GLYPH_CACHE.clear()
+    yield COLOR_GLYPH_CACHE
+    COLOR_GLYPH_CACHE.max_size = max_size
+    COLOR_GLYPH_CACHE.clear()
+
+
+def _build_doc(font_file, text, with_other_resources=False):
+    pdf = FPDF()
+    pdf.creation_date = EPOCH
+    pdf.add_font("color", "", HERE / font_file)
+    pdf.add_page()
+    if with_other_resources:
+        with pdf.local_context(fill_opacity=0.5):
+            pdf.rect(10, 10, 50, 50, style="F")
+        pdf.image(IMAGES_DIR / "png_images" / "0839d93f8e77e21acd0ac40a80b14b7b.png")
+    pdf.set_font("color", size=24)
+    pdf.multi_cell(w=pdf.epw, text=text)
+    return bytes(pdf.output())
+
+
+@pytest.mark.parametrize(
+    "font_file, text",
+    (
+        ("BungeeColor-Regular-COLRv0.ttf", "BUNGEE COLOR"),
+        ("BungeeSpice-Regular-COLRv1.ttf", "BUNGEE SPICE"),
+        ("Nabla-Regular-COLRv1-VariableFont_EDPT,EHLT.ttf", "NABLA"),
+        ("BungeeColor-Regular-SVG.ttf", "BUNGEE SVG"),
+        ("Compyx-Regular-SBIX.ttf", "compyx sbix"),
+    ),
+)
+def test_color_glyph_cache_output_unchanged(glyph_cache, font_file, text):
+    glyph_cache.max_size = 0
+    expected = _build_doc(font_file, text)
+    assert not glyph_cache
+    glyph_cache.max_size = 4096
+    assert _build_doc(font_file, text) == expected
+    assert glyph_cache.hits == 0
+    assert _build_doc(font_file, text) == expected
+    assert glyph_cache.hits == len(glyph_cache) > 0
+
+
+@pytest.mark.parametrize(
+    "font_file", ("BungeeSpice-Regular-COLRv1.ttf", "Compyx-Regular-SBIX.ttf")
+)
+def test_color_glyph_cache_resources_renamed(glyph_cache, font_file):
+    glyph_cache.max_size = 0
+    expected = _build_doc(font_file, "ABC abc", with_other_resources=True)
+    glyph_cache.max_size = 4096
+    _build_doc(font_file, "ABC abc")
+    assert _build_doc(font_file, "ABC abc", with_other_resources=True) == expected
+    assert glyph_cache.hits > 0
@@ -4,6 +4,7 @@ import copy
 import math
 from pathlib import Path
 import re
+import tracemalloc
 
 from fpdf.enums import (
     BlendMode,
@@ -16,16 +17,21 @@ from fpdf.errors import FPDFException
 from fpdf.fpdf import FPDF
 from fpdf.output import ResourceCatalog
 from fpdf.syntax import Name
+from fpdf.util import numbers_to_str
 from test.conftest import assert_pdf_equal
 from fpdf.drawing import (
+    BezierCurve,
     ClippingPath,
+    Close,
     DrawingContext,
     GraphicsContext,
     GraphicsStyle,
+    HorizontalLine,
     ImplicitClose,
     Line,
     Move,
     PaintedPath,
+    PathSegments,
     RelativeLine,
     render_pdf_primitive,
 )
@@ -111,6 +117,12 @@ class TestUtilities:
     def test_number_to_str(self, number, converted):
         assert number_to_str(number) == converted
 
+    def test_numbers_to_str(self):
+        numbers = [param.values[0] for param in parameters.numbers]
+        converted = [param.values[1] for param in parameters.numbers]
+        assert numbers_to_str(numbers) == converted
+        assert numbers_to_str([]) == []
+
     @pytest.mark.parametrize("primitive, result", parameters.pdf_primitives)
     def test_render_primitive(self, primitive, result):
         assert render_pdf_primitive(primitive) == result
@@ -754,6 +766,126 @@ class TestClippingPath(CommonPathTests):
     comp_index = 1
 
 
+class TestCompactPaintedPath:
+    @pytest.mark.parametrize(
+        "method_calls, elements, rendered", parameters.painted_path_elements
+    )
+    def test_render(self, method_calls, elements, rendered):
+        style = GraphicsStyle()
+        style.paint_rule = "auto"
+        point = Point(0, 0)
+        for path_class, comp_index in ((PaintedPath, 0), (ClippingPath, 1)):
+            pth = path_class(compact=True)
+            for method, args in method_calls:
+                method(pth, *args)
+            rend, _, __ = pth.render(ResourceCatalog(), style, Move(point), point)
+            assert rend == rendered[comp_index]
+
+    def test_path_segments(self):
+        pth = PaintedPath(compact=True)
+        pth.move_to(1, 2).line_to(3, 4).curve_to(5, 6, 7, 8, 9, 10)
+        pth.close()
+        pth.line_to(5, 5)
+        pth.horizontal_line_to(8)
+        pth.line_to(1, 1)
+
+        segments, horizontal_line, last_segments = pth._graphics_context.path_items
+        assert isinstance(segments, PathSegments)
+        assert list(segments) == [
+            Move(Point(1, 2)),
+            Line(Point(3, 4)),
+            BezierCurve(Point(5, 6), Point(7, 8), Point(9, 10)),
+            Close(),
+            # the relative move following the close is resolved:
+            Move(Point(1, 2)),
+            Line(Point(5, 5)),
+        ]
+        assert segments.end_point == Point(5, 5)
+        assert horizontal_line == HorizontalLine(8)
+        assert list(last_segments) == [Line(Point(1, 1))]
+
+        pth.remove_last_path_element()
+        pth.remove_last_path_element()
+        assert pth._graphics_context.path_items == [segments]
+        pth.remove_last_path_element()
+        assert len(segments) == 5
+        assert len(segments.coords) == 12
+
+        copied = copy.deepcopy(pth)
+        assert copied._graphics_context.path_items == [segments]
+        assert copied._graphics_context.path_items[0] is not segments
+
+    def test_implicit_close_insertion(self):
+        pth = PaintedPath(compact=True)
+        pth.move_to(0, 0)
+        pth.line_to(1, 1)
+        pth.move_to(2, 2)
+        pth.line_to(3, 3)
+
+        (segments,) = pth._graphics_context.path_items
+        assert list(segments) == [
+            Move(Point(0, 0)),
+            Line(Point(1, 1)),
+            ImplicitClose(),
+            Move(Point(2, 2)),
+            Line(Point(3, 3)),
+        ]
+
+    def test_bounding_box(self):
+        for compact in (False, True):
+            pth = PaintedPath(compact=compact)
+            pth.move_to(10, 10).line_to(20, 5).curve_to(30, 0, 40, 30, 50, 20)
+            pth.close()
+            pth.line_to(0, 15)
+            pth.style.stroke_width = 0
+            bbox, end = pth.bounding_box(Point(0, 0))
+            assert bbox.to_tuple() == pytest.approx((0, 4.4332282, 50, 22.0556606))
+            assert end == Point(0, 15)
+
+    def test_transformed_bounding_box(self):
+        segments = PathSegments()
+        for item in (Move(Point(0, 0)), Line(Point(10, 10)), Line(Point(20, 0))):
+            segments.append(item)
+        rotation = Transform.rotation_d(45)
+        bbox, end = segments.bounding_box(Point(0, 0), rotation)
+        # the points are transformed, rather than the resulting bbox:
+        assert bbox.to_tuple() == pytest.approx((0, 0, 14.1421356, 14.1421356))
+        assert end == Point(20, 0)
+        assert segments.transformed(rotation).bounding_box(Point(0, 0))[0] == bbox
+
+    def test_compact_drawing(self, tmp_path):
+        pdfs = []
+        for compact in (False, True):
+            pdf = FPDF()
+            pdf.add_page()
+            with pdf.new_path(10, 150, compact=compact) as path:
+                path.style.stroke_color = "#0000ff"
+                path.style.fill_color = None
+                for i in range(1000):
+                    path.line_to(10 + i * 0.19, 150 - 50 * math.sin(i / 50))
+            with pdf.new_path(compact=compact) as path:
+                path.style.fill_color = "#ff0000"
+                for i in range(10):
+                    path.move_to(20 + 15 * i, 50)
+                    path.curve_to(25 + 15 * i, 40, 30 + 15 * i, 60, 30 + 15 * i, 50)
+                    path.close()
+            pdfs.append(bytes(pdf.pages[1].contents))
+        assert pdfs[0] == pdfs[1]
+
+    def test_memory_usage(self):
+        memory_usages = []
+        for compact in (False, True):
+            tracemalloc.start()
+            try:
+                pth = PaintedPath(compact=compact)
+                for i in range(10000):
+                    pth.line_to(i, i % 10)
+                memory_usages.append(tracemalloc.get_traced_memory()[0])
+            finally:
+                tracemalloc.stop()
+        assert memory_usages[1] < memory_usages[0] / 5
+
+
 # these tests are all more or less redundant with the PaintedPath tests in terms of
 # functionality, but having them implemented may give more information about where a
 # regression occurs, if one does.
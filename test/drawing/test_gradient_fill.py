@@ -2,16 +2,19 @@ import math
 from pathlib import Path
 
 import pytest
+import fpdf.pattern
 from fpdf import FPDF
 from fpdf.pattern import (
     LinearGradient,
+    MeshShading,
     RadialGradient,
     SweepGradient,
     shape_linear_gradient,
     shape_radial_gradient,
+    shape_sweep_gradient_as_mesh,
 )
-from fpdf.drawing_primitives import DeviceRGB
-from fpdf.drawing import PaintedPath, Transform, GradientPaint
+from fpdf.drawing_primitives import DeviceGray, DeviceRGB
+from fpdf.drawing import BoundingBox, PaintedPath, Transform, GradientPaint
 from fpdf.enums import GradientSpreadMethod
 
 from test.conftest import assert_pdf_equal
@@ -595,3 +598,75 @@ def test_gradient_alpha_variance(tmp_path: Path):
     assert_pdf_equal(
         pdf, HERE / "generated_pdf" / "gradient_alpha_variance.pdf", tmp_path
     )
+
+
+@pytest.mark.parametrize("spread_method", list(GradientSpreadMethod))
+@pytest.mark.parametrize("end_angle", (math.tau, 1.5 * math.pi, -1.0))
+@pytest.mark.parametrize(
+    "stops",
+    (
+        [(i / 9, f"#{i * 25:02x}80{255 - i * 25:02x}") for i in range(10)],
+        [(i / 4, DeviceGray(i / 4)) for i in range(5)],
+    ),
+    ids=("rgb", "gray"),
+)
+def test_sweep_gradient_mesh_encoding_without_numpy(
+    monkeypatch, spread_method, end_angle, stops
+):
+    pytest.importorskip("numpy")
+    bbox = BoundingBox(0, 0, 100, 80)
+
+    def encode():
+        mesh = shape_sweep_gradient_as_mesh(
+            50, 40, 0.3, end_angle, stops, spread_method, bbox
+        )
+        return bytes(mesh.content_stream())
+
+    vectorized = encode()
+    monkeypatch.setattr(fpdf.pattern, "numpy", None)
+    assert encode() == vectorized
+
+
+def test_sweep_gradient_alpha_mesh_encoding_without_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    bbox = BoundingBox(0, 0, 100, 80)
+
+    def encode():
+        gradient = SweepGradient(
+            50,
+            40,
+            0,
+            6.283,
+            [(0, DeviceRGB(1, 0, 0, 0.2)), (1, DeviceRGB(0, 0, 1, 1))],
+        )
+        return bytes(gradient.get_alpha_shading_object(bbox).content_stream())
+
+    vectorized = encode()
+    monkeypatch.setattr(fpdf.pattern, "numpy", None)
+    assert encode() == vectorized
+
+
+def test_mesh_shading_encoding_with_missing_components(monkeypatch):
+    pytest.importorskip("numpy")
+    triangles = [((0, 0), (10, 0), (5, 10)), ((-1, 5), (12, 5), (5, 0.5))]
+    colors = [
+        ((0.0, 0.5, 1.0), (1.0, 0.5, 0.0), (0.25, 0.25, 0.25)),
+        ((1.5, -1.0, 0.5), (0.2, 0.2, 0.2), (0.7, 0.1, 0.9)),
+    ]
+
+    def encode(colors):
+        return bytes(
+            MeshShading(
+                color_space="DeviceRGB",
+                bbox=BoundingBox(0, 0, 10, 10),
+                comp_count=3,
+                triangles=triangles,
+                colors=colors,
+            ).content_stream()
+        )
+
+    vectorized = encode(colors)
+    truncated = encode([colors[0], ((1.5, -1.0), (0.2, 0.2, 0.2), (0.7, 0.1))])
+    monkeypatch.setattr(fpdf.pattern, "numpy", None)
+    assert encode(colors) == vectorized
+    assert encode([colors[0], ((1.5, -1.0), (0.2, 0.2, 0.2), (0.7, 0.1))]) == truncated
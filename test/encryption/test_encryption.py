@@ -3,13 +3,17 @@ from os import devnull
 from pathlib import Path
 
 import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, modes
+from cryptography.hazmat.primitives.ciphers.algorithms import AES128
+from cryptography.hazmat.primitives.padding import PKCS7
 
 from fpdf import FPDF
 from fpdf.actions import GoToAction
+from fpdf import encryption
 from fpdf.encryption import StandardSecurityHandler as sh
 from fpdf.enums import AccessPermission, EncryptionMethod
 from fpdf.errors import FPDFException
-from test.conftest import assert_pdf_equal
+from test.conftest import EPOCH, assert_pdf_equal
 
 HERE = Path(__file__).resolve().parent
 
@@ -328,3 +332,83 @@ def test_goto_named_destination(tmp_path):
         HERE / "encryption_goto_named_destination.pdf",
         tmp_path,
     )
+
+
+@pytest.mark.parametrize("use_cryptography", [True, False])
+@pytest.mark.parametrize(
+    "key, plaintext, ciphertext",
+    [  # Test vectors from https://en.wikipedia.org/wiki/RC4#Test_vectors
+        (b"Key", b"Plaintext", "bbf316e8d940af0ad3"),
+        (b"Wiki", b"pedia", "1021bf0420"),
+        (b"Secret", b"Attack at dawn", "45a01f645fc35b383552544b9bf5"),
+        (b"Key", b"", ""),
+    ],
+)
+def test_arc4(monkeypatch, use_cryptography, key, plaintext, ciphertext):
+    if not use_cryptography:
+        monkeypatch.setattr(encryption, "CryptographyARC4", None)
+    result = encryption.ARC4().encrypt(key, plaintext)
+    assert isinstance(result, bytes)
+    assert result.hex() == ciphertext
+
+
+def test_object_keys_cache():
+    pdf = FPDF()
+    pdf.set_encryption(owner_password="fpdf2")
+    pdf.output(devnull)
+    security_handler = pdf._security_handler
+    first = security_handler.encrypt_bytes(b"some text", 7)
+    assert set(security_handler._object_keys) >= {7}
+    assert security_handler._object_keys[7] == security_handler.object_key(7)
+    assert security_handler.encrypt_bytes(b"some text", 7) == first
+    assert security_handler.encrypt_bytes(b"some text", 8) != first
+
+
+def test_arc4_implementations_match(monkeypatch):
+    key, text = bytes(range(16)), bytes(range(256)) * 40
+    expected = encryption.ARC4().encrypt(key, text)
+    monkeypatch.setattr(encryption, "CryptographyARC4", None)
+    assert encryption.ARC4().encrypt(key, text) == expected
+
+
+@pytest.mark.parametrize("length", [0, 1, 15, 16, 17, 100_000])
+def test_encrypt_aes_padding(length):
+    pdf = FPDF()
+    pdf.set_encryption(
+        owner_password="fpdf2", encryption_method=EncryptionMethod.AES_128
+    )
+    security_handler = pdf._security_handler
+    key, data = bytes(range(16)), bytes(i % 251 for i in range(length))
+    encrypted = security_handler.encrypt_AES_cryptography(key, data)
+    assert len(encrypted) == 16 + (length // 16 + 1) * 16
+    iv, ciphertext = bytes(encrypted[:16]), bytes(encrypted[16:])
+    decryptor = Cipher(AES128(key), modes.CBC(iv)).decryptor()
+    unpadder = PKCS7(128).unpadder()
+    padded = decryptor.update(ciphertext) + decryptor.finalize()
+    assert unpadder.update(padded) + unpadder.finalize() == data
+
+
+@pytest.mark.parametrize(
+    "encryption_method", [EncryptionMethod.RC4, EncryptionMethod.AES_256]
+)
+def test_encryption_workers(encryption_method):
+    def build_pdf(workers):
+        pdf = FPDF()
+        pdf.set_creation_date(EPOCH)
+        pdf.file_id = lambda: pdf._default_file_id(bytearray([0xFF]))
+        pdf.add_page()
+        for i in range(3):
+            pdf.embed_file(
+                basename=f"file{i}.bin",
+                bytes=bytes([i]) * (2 * sh.PARALLEL_STREAM_MIN_SIZE),
+                compress=False,
+            )
+        pdf.set_encryption(
+            owner_password="fpdf2",
+            encryption_method=encryption_method,
+            workers=workers,
+        )
+        pdf._security_handler.get_random_bytes = bytes
+        return bytes(pdf.output())
+
+    assert build_pdf(workers=4) == build_pdf(workers=None)
@@ -1,3 +1,4 @@
+import io
 import logging
 from pathlib import Path
 
@@ -5,6 +6,7 @@ import pytest
 
 from fpdf import FPDF, FontFace, HTMLMixin, TextStyle, TitleStyle
 from fpdf.drawing import DeviceRGB
+from fpdf.enums import TextEmphasis
 from fpdf.errors import FPDFException
 from test.conftest import assert_pdf_equal, LOREM_IPSUM, assert_same_file
 
@@ -1291,3 +1293,52 @@ def test_html_ol_nested_in_ul(tmp_path):  # cf. issue #1358
           </li>
         </ul>""")
     assert_pdf_equal(pdf, HERE / "html_ol_nested_in_ul.pdf", tmp_path)
+
+
+STREAMED_HTML = (
+    "<h1>Report &amp; summary</h1>"
+    + "".join(
+        f"<p>Paragraph {i}: <b>bold</b> text &eacute;t&eacute; &lt;{i}&gt;</p>"
+        for i in range(30)
+    )
+    + "<ul><li>first</li><li>second <i>item</i></li></ul>"
+    + "<table><tr><th>Name</th><th>Value</th></tr>"
+    + "".join(f"<tr><td>row {i}</td><td>{i * 1000}</td></tr>" for i in range(20))
+    + "</table><pre>  pre\n  formatted</pre>"
+)
+
+
+@pytest.mark.parametrize("chunk_size", (1, 7, 100, 64 * 1024))
+def test_html_write_from_chunks(chunk_size, tmp_path):
+    def build_doc(html):
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.write_html(html)
+        return pdf
+
+    expected = build_doc(STREAMED_HTML)
+    chunks = (
+        STREAMED_HTML[i : i + chunk_size]
+        for i in range(0, len(STREAMED_HTML), chunk_size)
+    )
+    assert_pdf_equal(build_doc(chunks), expected, tmp_path)
+    assert_pdf_equal(build_doc(io.StringIO(STREAMED_HTML)), expected, tmp_path)
+
+
+def test_html_style_resolution_cache():
+    # pylint: disable=protected-access
+    pdf = FPDF()
+    pdf.add_page()
+    html2pdf = pdf.HTML2FPDF_CLASS(pdf)
+    css_style = html2pdf._parse_css_style("color: red; font-size: 12pt")
+    assert css_style == {"color": "red", "font-size": "12pt"}
+    assert html2pdf._parse_css_style("color: red; font-size: 12pt") is css_style
+    assert html2pdf._color_as_decimal("red") == DeviceRGB(1, 0, 0)
+    html2pdf.feed("<b>bold</b><b>bold again</b>")
+    assert len(html2pdf._resolved_tag_styles) == 1
+    # Replacing an entry of tag_styles invalidates its resolved styles:
+    html2pdf.tag_styles["b"] = FontFace(emphasis="ITALICS", color="#00f")
+    emphasis = html2pdf.font_emphasis
+    html2pdf._apply_tag_style("b")
+    assert html2pdf.font_emphasis == emphasis | TextEmphasis.I
+    assert html2pdf.font_color == DeviceRGB(0, 0, 1)
@@ -0,0 +1,86 @@
+from html import escape
+
+import pytest
+
+from fpdf import FPDF, HTMLProgram
+from fpdf.html import HTML2FPDF
+from test.conftest import assert_pdf_equal
+
+INVOICE_HTML = """<h1>Invoice #{{ number }}</h1>
+<p style="color: #333; font-size: 12pt">Customer: <b>{{customer}}</b> &amp; co</p>
+<table><thead><tr><th>Item</th><th>Price</th></tr></thead><tbody>
+<tr><td>{{item}}</td><td align="right">{{price}}</td></tr>
+<tr><td bgcolor="{{color}}">Shipping</td><td align="right">5.00</td></tr>
+</tbody></table>
+<ul><li>Paid</li><li><a href="https://example.com/{{number}}">Details</a></li></ul>
+<pre>  {{item}}  </pre>"""
+
+
+def _contexts():
+    for i in range(5):
+        yield {
+            "number": i,
+            "customer": f"<ACME {i}>",
+            "item": "Widget & co" * i,
+            "price": f"{10 * i}.00",
+            "color": "#ff0000" if i % 2 else "#00ff00",
+        }
+
+
+def _substitute(html, context):
+    for name, value in context.items():
+        html = html.replace("{{ %s }}" % name, "{{%s}}" % name)
+        html = html.replace("{{%s}}" % name, escape(str(value)))
+    return html
+
+
+def test_html_program_render_matches_write_html(tmp_path):
+    expected = FPDF()
+    expected.add_page()
+    for context in _contexts():
+        expected.write_html(_substitute(INVOICE_HTML, context))
+    pdf = FPDF()
+    pdf.add_page()
+    program = pdf.compile_html(INVOICE_HTML)
+    assert isinstance(program, HTMLProgram)
+    assert program.placeholders == {"number", "customer", "item", "price", "color"}
+    for context in _contexts():
+        program.render(pdf, context)
+    assert_pdf_equal(pdf, expected, tmp_path)
+
+
+def test_html_program_render_with_write_html_parameters(tmp_path):
+    kwargs = {"table_line_separators": True, "ul_bullet_char": "circle"}
+    html = "<ul><li>{{a}}</li></ul><table><tr><td>{{b}}</td></tr></table>"
+    expected = FPDF()
+    expected.add_page()
+    expected.write_html(html.replace("{{a}}", "A").replace("{{b}}", "B"), **kwargs)
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.compile_html(html, **kwargs).render(pdf, {"a": "A", "b": "B"})
+    assert_pdf_equal(pdf, expected, tmp_path)
+
+
+def test_html_program_missing_placeholder():
+    pdf = FPDF()
+    pdf.add_page()
+    program = pdf.compile_html("<p>{{first}} {{last}}</p>")
+    with pytest.raises(KeyError, match="last"):
+        program.render(pdf, {"first": "Jane"})
+
+
+def test_html_program_custom_html2fpdf_class():
+    start_tags = []
+
+    class CustomHTML2FPDF(HTML2FPDF):
+        def handle_starttag(self, tag, attrs):
+            start_tags.append((tag, attrs))
+            super().handle_starttag(tag, attrs)
+
+    class CustomFPDF(FPDF):
+        HTML2FPDF_CLASS = CustomHTML2FPDF
+
+    pdf = CustomFPDF()
+    pdf.add_page()
+    pdf.compile_html('<p align="{{align}}">Text</p>').render(pdf, {"align": "center"})
+    assert start_tags == [("p", [("align", "center")])]
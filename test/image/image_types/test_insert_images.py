@@ -211,7 +211,7 @@ def test_insert_pillow(tmp_path):
     pdf.add_page()
     img = Image.open(HERE / "insert_images_insert_png.png")
     pdf.image(img, x=15, y=15, h=140)
-    assert_pdf_equal(pdf, HERE / "image_types_insert_png.pdf", tmp_path)
+    assert_pdf_equal(pdf, HERE / "image_types_insert_png_pillow.pdf", tmp_path)
 
 
 def test_insert_pillow_issue_139(tmp_path):
@@ -233,12 +233,12 @@ def test_insert_bytesio(tmp_path):
     img_bytes = io.BytesIO()
     img.save(img_bytes, "PNG")
     pdf.image(img_bytes, x=15, y=15, h=140)
-    assert_pdf_equal(pdf, HERE / "image_types_insert_png.pdf", tmp_path)
+    assert_pdf_equal(pdf, HERE / "image_types_insert_png_bytesio.pdf", tmp_path)
     assert not img_bytes.closed  # cf. issue #881
 
 
 def test_insert_tempfile(tmp_path):
-    """Compare unnamed temporary file vs the same reference files as test_insert_bytesio"""
+    """Compare unnamed temporary file vs the same reference files as test_insert_png"""
     pdf = fpdf.FPDF()
     pdf.add_page()
     with tempfile.TemporaryFile() as img_file:
@@ -255,4 +255,4 @@ def test_insert_bytes(tmp_path):
     img_bytes = io.BytesIO()
     img.save(img_bytes, "PNG")
     pdf.image(img_bytes.getvalue(), x=15, y=15, h=140)
-    assert_pdf_equal(pdf, HERE / "image_types_insert_png.pdf", tmp_path)
+    assert_pdf_equal(pdf, HERE / "image_types_insert_png_bytesio.pdf", tmp_path)
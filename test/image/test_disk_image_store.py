@@ -0,0 +1,84 @@
+from glob import glob
+from pathlib import Path
+
+import pytest
+
+from fpdf import FPDF
+from fpdf.image_datastructures import DiskImageStore, StoredImagePayload
+
+from test.conftest import EPOCH
+
+HERE = Path(__file__).resolve().parent
+PNG_FILES = sorted(glob(f"{HERE}/png_images/*.png"))
+JPG_FILE = HERE / "image_types" / "insert_images_insert_jpg_icc.jpg"
+
+
+def _build_pdf(image_store=None, oversized=None, encrypted=False):
+    pdf = FPDF()
+    pdf.set_creation_date(EPOCH)
+    pdf.image_cache.image_store = image_store
+    if oversized:
+        pdf.oversized_images = oversized
+    if encrypted:
+        pdf.set_encryption(owner_password="fpdf2")
+    pdf.add_page()
+    for img in PNG_FILES + [JPG_FILE]:
+        pdf.image(img, h=20)
+    return pdf, bytes(pdf.output())
+
+
+def test_disk_image_store_output_identical():
+    _, expected = _build_pdf()
+    with DiskImageStore() as image_store:
+        pdf, output = _build_pdf(image_store)
+        assert output == expected
+        payloads = [
+            info[key]
+            for info in pdf.image_cache.images.values()
+            for key in ("data", "smask")
+            if key in info
+        ]
+        assert all(isinstance(payload, StoredImagePayload) for payload in payloads)
+        assert image_store.size == sum(len(payload) for payload in payloads)
+
+
+def test_disk_image_store_with_downscaled_images():
+    _, expected = _build_pdf(oversized="DOWNSCALE")
+    with DiskImageStore() as image_store:
+        pdf, output = _build_pdf(image_store, oversized="DOWNSCALE")
+        assert output == expected
+        lowres_infos = [
+            info
+            for name, info in pdf.image_cache.images.items()
+            if name.startswith("lowres-")
+        ]
+        assert lowres_infos
+        assert all(
+            isinstance(info["data"], StoredImagePayload) for info in lowres_infos
+        )
+
+
+def test_disk_image_store_with_encryption():
+    with DiskImageStore() as image_store:
+        _, output = _build_pdf(image_store, encrypted=True)
+    assert b"/Encrypt" in output
+
+
+def test_disk_image_store_read_after_growth(tmp_path):
+    with DiskImageStore(tmp_path) as image_store:
+        first = image_store.store(b"first")
+        assert bytes(first) == b"first"
+        second = image_store.store(b"second payload")
+        empty = image_store.store(b"")
+        assert bytes(second) == b"second payload"
+        assert bytes(first) == b"first"
+        assert bytes(empty) == b""
+        assert image_store.size == 19
+
+
+def test_disk_image_store_closed():
+    image_store = DiskImageStore()
+    payload = image_store.store(b"data")
+    image_store.close()
+    with pytest.raises(ValueError):
+        bytes(payload)
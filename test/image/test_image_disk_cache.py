@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fpdf import FPDF
+from fpdf.image_disk_cache import ImageDiskCache
+from fpdf.image_datastructures import RasterImageInfo
+from fpdf.image_parsing import get_img_info
+
+from test.conftest import EPOCH
+
+HERE = Path(__file__).resolve().parent
+PNG_FILES = sorted(glob(f"{HERE}/png_images/*.png"))
+JPG_FILE = HERE / "image_types" / "insert_images_insert_jpg_icc.jpg"
+PNG_WITH_ALPHA_FILE = HERE / "png_images" / "ba2b2b6e72ca0e4683bb640e2d5572f8.png"
+OTHER_IMAGE_FILES = sorted(
+    path
+    for path in (HERE / "image_types").glob("*.*")
+    if path.suffix in (".bmp", ".gif", ".jpg", ".png", ".tiff")
+) + sorted((HERE / "png_indexed").glob("*.png"))
+
+
+def _build_pdf(disk_cache=None, images=PNG_FILES):
+    pdf = FPDF()
+    pdf.set_creation_date(EPOCH)
+    pdf.image_cache.disk_cache = disk_cache
+    pdf.add_page()
+    for img in images:
+        pdf.image(img, h=20)
+    return bytes(pdf.output())
+
+
+def test_image_disk_cache_hit_skips_pillow(tmp_path):
+    images = PNG_FILES[:4] + [JPG_FILE.read_bytes()]
+    expected = _build_pdf(images=images)
+    disk_cache = ImageDiskCache(tmp_path)
+    assert _build_pdf(disk_cache, images=images) == expected
+    assert len(list(tmp_path.glob("*/*.img"))) == len(images)
+    with patch("fpdf.image_parsing.get_img_info") as get_img_info:
+        assert _build_pdf(ImageDiskCache(tmp_path), images=images) == expected
+    get_img_info.assert_not_called()
+
+
+def test_image_disk_cache_key_depends_on_settings():
+    source = b"image bytes"
+    keys = {
+        ImageDiskCache.key(source, "AUTO", None, -1),
+        ImageDiskCache.key(source, "DCTDecode", None, -1),
+        ImageDiskCache.key(source, "AUTO", (10, 10), -1),
+        ImageDiskCache.key(source, "AUTO", None, 9),
+        ImageDiskCache.key(b"other image bytes", "AUTO", None, -1),
+    }
+    assert len(keys) == 5
+
+
+def test_image_disk_cache_round_trip(tmp_path):
+    disk_cache = ImageDiskCache(tmp_path)
+    info = RasterImageInfo(
+        data=b"\x00\x01", smask=b"", iccp=None, w=2, h=1, cs="DeviceRGB", inverted=False
+    )
+    disk_cache.put("ab" * 32, info)
+    assert disk_cache.get("ab" * 32) == info
+    assert disk_cache.get("cd" * 32) is None
+
+
+@pytest.mark.parametrize(
+    "img_path, image_filter",
+    [(img_path, "AUTO") for img_path in PNG_FILES + OTHER_IMAGE_FILES]
+    + [
+        (img_path, image_filter)
+        for img_path in (JPG_FILE, PNG_WITH_ALPHA_FILE)
+        for image_filter in ("FlateDecode", "DCTDecode", "JPXDecode", "LZWDecode")
+    ],
+    ids=lambda param: Path(param).name if isinstance(param, (str, Path)) else param,
+)
+def test_image_disk_cache_round_trip_of_image_info(tmp_path, img_path, image_filter):
+    info = get_img_info(img_path, image_filter=image_filter)
+    disk_cache = ImageDiskCache(tmp_path)
+    disk_cache.put("ab" * 32, info)
+    assert disk_cache.get("ab" * 32) == info
+
+
+def test_image_disk_cache_unsupported_value(tmp_path, caplog):
+    disk_cache = ImageDiskCache(tmp_path)
+    disk_cache.put("ab" * 32, RasterImageInfo(data=b"\x00", w=1, h=1, decode=(0, 1)))
+    assert "unsupported value type for decode" in caplog.text
+    assert disk_cache.get("ab" * 32) is None
+    assert not list(tmp_path.glob("*/*"))
+
+
+def test_image_disk_cache_corrupted_entry(tmp_path):
+    disk_cache = ImageDiskCache(tmp_path)
+    disk_cache.put("ab" * 32, RasterImageInfo(data=b"\x00" * 10, w=1, h=1))
+    (entry,) = tmp_path.glob("*/*.img")
+    entry.write_bytes(entry.read_bytes()[:-3])
+    assert disk_cache.get("ab" * 32) is None
+    assert not entry.exists()
+
+
+def test_image_disk_cache_eviction(tmp_path):
+    disk_cache = ImageDiskCache(tmp_path, max_size=2500)
+    for i in range(5):
+        disk_cache.put(f"{i:02}" * 32, RasterImageInfo(data=bytes(1000)))
+    assert disk_cache.get("00" * 32) is None
+    assert disk_cache.get("04" * 32) is not None
+    total_size = sum(path.stat().st_size for path in tmp_path.glob("*/*.img"))
+    assert total_size <= 2500
+
+
+def test_image_disk_cache_eviction_is_amortized(tmp_path, monkeypatch):
+    disk_cache = ImageDiskCache(tmp_path, max_size=10_500)
+    evict_calls = []
+    evict = disk_cache.evict
+    monkeypatch.setattr(disk_cache, "evict", lambda: evict_calls.append(evict()))
+    for i in range(30):
+        disk_cache.put(f"{i:02}" * 32, RasterImageInfo(data=bytes(1000)))
+    # The directory is scanned on the first insert, when the cache gets full
+    # on the 10th insert, then every 3 inserts, once the cache is full again:
+    assert len(evict_calls) == 8
+    total_size = sum(path.stat().st_size for path in tmp_path.glob("*/*.img"))
+    assert total_size <= 10_500
+
+
+def test_image_disk_cache_concurrent_writers(tmp_path):
+    def write(i):
+        disk_cache = ImageDiskCache(tmp_path)
+        disk_cache.put("ab" * 32, RasterImageInfo(data=bytes([i % 256]) * 100_000))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(32)))
+    info = ImageDiskCache(tmp_path).get("ab" * 32)
+    assert len(info["data"]) == 100_000
+    assert len(set(info["data"])) == 1
+    assert not list(tmp_path.glob("*/*.tmp"))
+
+
+def test_image_disk_cache_invalid_max_size(tmp_path):
+    with pytest.raises(ValueError):
+        ImageDiskCache(tmp_path, max_size=0)
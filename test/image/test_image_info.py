@@ -3,6 +3,8 @@ import zlib
 from io import BytesIO
 from pathlib import Path
 
+from PIL import Image
+
 import fpdf
 
 HERE = Path(__file__).resolve().parent
@@ -102,3 +104,47 @@ def test_get_img_info_data_gray():
         b"\xe0O\r\xf7\xee2\xe0O\r\xfb\xf62\xe0O\r\xf3\xe62\xe0O\ru\xb5\x0c\xf8SC\\,"
         b"\x03\xfe\xd4`g\xcb\x80?5\xc8\xc92\xe0O\rL\xcc\x00\x17\xb3\xfc\x18"
     )
+
+
+def test_get_img_info_png_idat_passthrough():
+    png_bytes = (HERE / "png_test_suite" / "basn3p04.png").read_bytes()
+    info = fpdf.image_parsing.get_img_info(BytesIO(png_bytes))
+    # The compressed pixels are embedded as they are, without being decoded:
+    assert info["data"] in png_bytes
+    assert info["bpc"] == 4
+    assert info["cs"] == "Indexed"
+    assert info["dp"] == "/Predictor 15 /Colors 1 /Columns 32"
+
+
+def test_png_passthrough_only_for_eligible_pngs():
+    png_passthrough_info = fpdf.image_parsing._png_passthrough_info
+    for filename in ("basn0g08.png", "basn0g16.png", "basn2c16.png", "basn3p08.png"):
+        png_bytes = (HERE / "png_test_suite" / filename).read_bytes()
+        assert png_passthrough_info(png_bytes) is not None, filename
+    for filename in (
+        "basi2c08.png",  # interlaced
+        "basn0g01.png",  # bitonal, better compressed with CCITTFaxDecode
+        "basn4a08.png",  # gray with alpha channel
+        "basn6a08.png",  # RGBA
+        "tbrn2c08.png",  # transparency via a tRNS chunk
+        "xcrn0g04.png",  # corrupted
+    ):
+        png_bytes = (HERE / "png_test_suite" / filename).read_bytes()
+        assert png_passthrough_info(png_bytes) is None, filename
+
+
+def test_png_16_bits_per_component_requires_pdf_1_5():
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.image(HERE / "png_test_suite" / "basn2c16.png")
+    assert pdf.pdf_version == "1.5"
+
+
+def test_png_passthrough_only_for_well_compressed_pngs():
+    img = Image.open(HERE / "png_test_suite" / "basn2c08.png")
+    for compress_level, passthrough in ((9, True), (0, False)):
+        png_bytes = BytesIO()
+        img.save(png_bytes, "PNG", compress_level=compress_level)
+        png_bytes = png_bytes.getvalue()
+        info = fpdf.image_parsing.get_img_info(BytesIO(png_bytes))
+        assert (info["data"] in png_bytes) is passthrough, compress_level
@@ -9,6 +9,7 @@ from unittest.mock import patch
 from urllib.request import HTTPRedirectHandler, Request
 
 import pytest
+from PIL import Image
 
 import fpdf
 from fpdf.image_datastructures import ImageCache
@@ -465,3 +466,42 @@ def test_text_columns_downscale_reload_uses_document_resource_access_policy():
         with pytest.raises(fpdf.FPDFResourceAccessError):
             with pdf.text_columns() as cols:
                 cols.image("https://public.example/image.png", width=1, height=1)
+
+
+def test_image_key_for_pil_images_and_bytes():
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    with patch(
+        "fpdf.image_parsing._pil_image_hash", side_effect=AssertionError
+    ), patch("fpdf.image_parsing.hashlib.new", side_effect=AssertionError):
+        for _ in range(2):
+            with Image.open(BytesIO(PNG_BYTES)) as img:
+                pdf.image(img, image_key="logo-pil")
+            pdf.image(PNG_BYTES, image_key="logo-bytes")
+            pdf.image(BytesIO(PNG_BYTES), image_key="logo-bytesio")
+    assert list(pdf.image_cache.images) == ["logo-pil", "logo-bytes", "logo-bytesio"]
+    assert [info["usages"] for info in pdf.image_cache.images.values()] == [2, 2, 2]
+
+
+def test_pil_image_hash_does_not_copy_pixels():
+    with Image.open(BytesIO(PNG_BYTES)) as img:
+        img.load()
+        with patch.object(Image.Image, "tobytes", side_effect=AssertionError):
+            key = fpdf.image_parsing._raster_image_key(img)[0]
+        assert key == fpdf.image_parsing._raster_image_key(img.copy())[0]
+
+
+def test_pil_image_hash_depends_on_mode_and_size():
+    keys = {
+        fpdf.image_parsing._raster_image_key(Image.new("L", size, 0))[0]
+        for size in ((10, 20), (20, 10), (200, 1))
+    }
+    keys.add(fpdf.image_parsing._raster_image_key(Image.new("1", (80, 20), 0))[0])
+    assert len(keys) == 4
+
+
+def test_svg_bytes_detection_with_leading_whitespaces():
+    svg = b'\n  <svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+    assert fpdf.image_parsing._is_svg(svg)
+    assert fpdf.image_parsing._is_svg_bytesio(BytesIO(svg))
+    assert not fpdf.image_parsing._is_svg(PNG_BYTES)
@@ -0,0 +1,86 @@
+from glob import glob
+from pathlib import Path
+
+import pytest
+
+from fpdf import FPDF
+from fpdf.errors import FPDFResourceAccessError
+from fpdf.enums import ResourceAccessPolicy
+from fpdf.image_datastructures import ImageCache, RasterImageInfo, VectorImageInfo
+from fpdf.image_parsing import preload_images
+
+from test.conftest import EPOCH
+
+HERE = Path(__file__).resolve().parent
+PNG_FILES = sorted(glob(f"{HERE}/png_images/*.png"))
+SVG_FILE = HERE.parent / "svg" / "svg_sources" / "SVG_logo.svg"
+
+
+def _build_pdf(preload_workers=None):
+    pdf = FPDF()
+    pdf.set_creation_date(EPOCH)
+    if preload_workers is not None:
+        pdf.preload_images(PNG_FILES, workers=preload_workers)
+    pdf.add_page()
+    for img_path in PNG_FILES:
+        pdf.image(img_path, h=20)
+    return bytes(pdf.output())
+
+
+def test_preload_images_output_identical_to_direct_insertion():
+    expected = _build_pdf()
+    assert _build_pdf(preload_workers=4) == expected
+    assert _build_pdf(preload_workers=1) == expected
+
+
+def test_preload_images_deterministic_indices():
+    image_cache = ImageCache()
+    results = preload_images(image_cache, PNG_FILES, workers=4)
+    assert [name for name, _, _ in results] == PNG_FILES
+    assert [info["i"] for _, _, info in results] == list(
+        range(1, len(PNG_FILES) + 1)
+    )
+    assert all(info["usages"] == 0 for _, _, info in results)
+
+
+def test_preload_images_unused_images_are_not_embedded():
+    pdf = FPDF()
+    pdf.preload_images(PNG_FILES[:3])
+    pdf.add_page()
+    pdf.image(PNG_FILES[1], h=20)
+    pdf.output()
+    usages = [info["usages"] for info in pdf.image_cache.images.values()]
+    assert usages == [0, 1, 0]
+
+
+def test_preload_images_duplicates_and_cached_images():
+    image_cache = ImageCache()
+    (_, _, first_info), *_ = preload_images(image_cache, PNG_FILES[:1])
+    png_bytes = Path(PNG_FILES[1]).read_bytes()
+    results = preload_images(
+        image_cache, [PNG_FILES[0], png_bytes, PNG_FILES[0], png_bytes], workers=2
+    )
+    assert len(image_cache.images) == 2
+    assert results[0][2] is first_info
+    assert results[2][2] is first_info
+    assert results[1][2] is results[3][2]
+    assert isinstance(results[1][2], RasterImageInfo)
+
+
+def test_preload_images_with_svg():
+    image_cache = ImageCache()
+    results = preload_images(image_cache, [PNG_FILES[0], SVG_FILE])
+    assert isinstance(results[0][2], RasterImageInfo)
+    assert isinstance(results[1][2], VectorImageInfo)
+    assert len(image_cache.images) == 1
+
+
+def test_preload_images_respects_resource_access_policy():
+    image_cache = ImageCache()
+    with pytest.raises(FPDFResourceAccessError):
+        preload_images(
+            image_cache,
+            PNG_FILES[:2],
+            resource_access_policy=ResourceAccessPolicy.NONE,
+        )
+    assert not image_cache.images
@@ -0,0 +1,178 @@
+import hashlib
+import threading
+import time
+from glob import glob
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+
+import pytest
+
+import fpdf
+from fpdf.remote_fetcher import RemoteResourceFetcher
+
+from test.conftest import EPOCH
+
+HERE = Path(__file__).resolve().parent
+PNG_FILES = sorted(glob(f"{HERE}/png_images/*.png"))[:6]
+
+
+class ImageServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, files, delay=0):
+        super().__init__(("127.0.0.1", 0), ImageRequestHandler)
+        self.files = files
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.client_ports = set()
+        self.statuses = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class ImageRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # enables keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.client_ports.add(self.client_address[1])
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            self._respond()
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _respond(self):
+        server = self.server
+        if self.path.startswith("/redirect/"):
+            self._send(302, headers={"Location": self.path[len("/redirect") :]})
+            return
+        content = server.files.get(self.path)
+        if content is None:
+            self._send(404)
+            return
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})
+            return
+        self._send(200, content, headers={"ETag": etag, "Content-Type": "image/png"})
+
+    def _send(self, status, body=b"", headers=None):
+        with self.server.lock:
+            self.server.statuses.append(status)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def image_server(request):
+    delay = getattr(request, "param", 0)
+    files = {
+        f"/img{i}.png": Path(path).read_bytes() for i, path in enumerate(PNG_FILES)
+    }
+    server = ImageServer(files, delay=delay)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _urls(server):
+    return [f"{server.base_url}{path}" for path in server.files]
+
+
+def test_remote_fetcher_reuses_connections(image_server):
+    with RemoteResourceFetcher() as fetcher:
+        for url, path in zip(_urls(image_server), PNG_FILES):
+            assert (
+                fetcher.fetch(url, fpdf.ResourceAccessPolicy.ALL)
+                == Path(path).read_bytes()
+            )
+    assert len(image_server.client_ports) == 1
+
+
+@pytest.mark.parametrize("image_server", [0.2], indirect=True)
+def test_remote_fetcher_concurrency_limit(image_server):
+    urls = _urls(image_server)
+    with RemoteResourceFetcher(max_connections=2) as fetcher:
+        start = time.perf_counter()
+        contents = fetcher.fetch_many(urls, fpdf.ResourceAccessPolicy.ALL)
+        duration = time.perf_counter() - start
+    assert contents == [Path(path).read_bytes() for path in PNG_FILES]
+    assert image_server.max_in_flight == 2
+    # 6 requests of 0.2s each, 2 at a time:
+    assert duration < 0.2 * len(urls)
+
+
+def test_remote_fetcher_etag_cache(image_server, tmp_path):
+    urls = _urls(image_server)
+    with RemoteResourceFetcher(cache_dir=tmp_path) as fetcher:
+        first = fetcher.fetch_many(urls, fpdf.ResourceAccessPolicy.ALL)
+    assert image_server.statuses == [200] * len(urls)
+    with RemoteResourceFetcher(cache_dir=tmp_path) as fetcher:
+        assert fetcher.fetch_many(urls, fpdf.ResourceAccessPolicy.ALL) == first
+    assert image_server.statuses == [200] * len(urls) + [304] * len(urls)
+
+
+def test_remote_fetcher_follows_redirects(image_server):
+    with RemoteResourceFetcher() as fetcher:
+        content = fetcher.fetch(
+            f"{image_server.base_url}/redirect/img0.png",
+            fpdf.ResourceAccessPolicy.ALL,
+        )
+    assert content == Path(PNG_FILES[0]).read_bytes()
+    assert image_server.statuses == [302, 200]
+
+
+def test_remote_fetcher_http_error(image_server):
+    with RemoteResourceFetcher() as fetcher:
+        with pytest.raises(HTTPError) as error:
+            fetcher.fetch(
+                f"{image_server.base_url}/missing.png", fpdf.ResourceAccessPolicy.ALL
+            )
+    assert error.value.code == 404
+
+
+def test_remote_fetcher_enforces_resource_access_policy(image_server):
+    with RemoteResourceFetcher() as fetcher:
+        with pytest.raises(fpdf.FPDFResourceAccessError):
+            fetcher.fetch(_urls(image_server)[0])
+    assert not image_server.statuses
+
+
+def _build_pdf(images, remote_fetcher=None, preload=False):
+    pdf = fpdf.FPDF()
+    pdf.set_creation_date(EPOCH)
+    pdf.resource_access_policy = fpdf.ResourceAccessPolicy.ALL
+    pdf.image_cache.remote_fetcher = remote_fetcher
+    if preload:
+        pdf.preload_images(images)
+    pdf.add_page()
+    for img in images:
+        pdf.image(img, h=20)
+    return bytes(pdf.output())
+
+
+def test_remote_fetcher_image_insertion(image_server):
+    expected = _build_pdf(PNG_FILES)
+    with RemoteResourceFetcher(max_connections=4) as fetcher:
+        assert _build_pdf(_urls(image_server), fetcher) == expected
+        assert _build_pdf(_urls(image_server), fetcher, preload=True) == expected
+    assert image_server.statuses == [200] * 2 * len(PNG_FILES)
@@ -47,6 +47,31 @@ def test_svg_image_no_viewbox(tmp_path):
     assert_pdf_equal(pdf, HERE / "svg_image_no_viewbox.pdf", tmp_path)
 
 
+def test_svg_image_no_viewbox_repeated():
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    for y in (10, 100):
+        # The warning is emitted on every placement of the cached SVG image:
+        with pytest.warns(UserWarning, match='has no "viewBox"'):
+            img = pdf.image(SVG_SRCDIR / "simple_rect_no_viewbox.svg", x=10, y=y)
+        assert img["rendered_width"] == 100
+        assert img["rendered_height"] == 200
+    ((svg, _),) = pdf.image_cache.svg_images.values()
+    assert svg.viewbox is None
+
+
+def test_svg_image_text_without_viewbox_nor_dimensions():
+    svg_data = (
+        b'<svg xmlns="http://www.w3.org/2000/svg">'
+        b'<text x="0" y="15" font-size="12">Hello</text></svg>'
+    )
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.image(svg_data, x=10, y=10, w=50, h=20)
+    # The text bounding box is only estimated, hence it is drawn directly on the page:
+    assert not pdf._resource_catalog.form_xobjects
+
+
 def test_svg_image_with_custom_width(tmp_path):
     pdf = fpdf.FPDF()
     pdf.add_page()
@@ -237,3 +262,42 @@ def test_svg_image_alt_text_two_pages(tmp_path):
     pdf.add_page()
     pdf.image(test_file, alt_text=IMG_DESCRIPTION, w=50, h=50)
     assert_pdf_equal(pdf, HERE / "svg_image_alt_text_two_pages.pdf", tmp_path)
+
+
+def test_svg_image_repeated(tmp_path):
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    for i in range(12):
+        pdf.image(
+            SVG_SRCDIR / "SVG_logo.svg", x=10 + 48 * (i % 4), y=10 + 48 * (i // 4), w=40
+        )
+    # The SVG image is only parsed once, and rendered once in a Form XObject:
+    assert len(pdf.image_cache.svg_images) == 1
+    assert len(pdf._resource_catalog.form_xobjects) == 1
+    assert_pdf_equal(pdf, HERE / "svg_image_repeated.pdf", tmp_path)
+
+
+def test_svg_image_repeated_with_distinct_styles(tmp_path):
+    svg_data = (
+        b'<svg width="60" height="60" xmlns="http://www.w3.org/2000/svg">'
+        b'  <rect x="10" y="10" width="40" height="40" stroke-width="2"/>'
+        b"</svg>"
+    )
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.image(svg_data, x=10, y=10)
+    pdf.image(
+        HERE / "png_images/ba2b2b6e72ca0e4683bb640e2d5572f8.png", x=80, y=10, w=60
+    )
+    pdf.set_fill_color(0, 128, 255)
+    pdf.image(svg_data, x=10, y=80)
+    pdf.image(svg_data, x=80, y=80)
+    assert len(pdf.image_cache.svg_images) == 1
+    # One Form XObject per fill color, with indices distinct from the raster image one:
+    form_indices = [index for index, _ in pdf._resource_catalog.form_xobjects]
+    raster_image_indices = [info["i"] for info in pdf.image_cache.images.values()]
+    assert len(form_indices) == 2
+    assert not set(form_indices) & set(raster_image_indices)
+    assert_pdf_equal(
+        pdf, HERE / "svg_image_repeated_with_distinct_styles.pdf", tmp_path
+    )
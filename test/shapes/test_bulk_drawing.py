@@ -0,0 +1,134 @@
+from array import array
+from pathlib import Path
+
+import pytest
+
+import fpdf
+from fpdf.enums import MarkerShape
+from test.conftest import assert_pdf_equal
+
+HERE = Path(__file__).resolve().parent
+
+TRIANGLES = [[(10, 10), (40, 10), (25, 35)], [(50, 10), (80, 10), (65, 35)]]
+
+
+def _page_content(draw):
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    draw(pdf)
+    return bytes(pdf.pages[1].contents)
+
+
+def test_polylines(tmp_path):
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.set_draw_color(0, 0, 255)
+    pdf.set_fill_color(255, 0, 0)
+    pdf.polylines(TRIANGLES)
+    pdf.polylines(
+        [[(x, y + 40) for x, y in triangle] for triangle in TRIANGLES],
+        polygon=True,
+        style="DF",
+    )
+    assert_pdf_equal(pdf, HERE / "polylines.pdf", tmp_path)
+
+
+def test_rects(tmp_path):
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.set_fill_color(255, 0, 0)
+    pdf.rects([(10, 10, 20, 10), (40, 10, 10, 20), (60, 10, 30, 30)], style="F")
+    pdf.rects([(10, 50, 80, 20)], style="DF")
+    assert_pdf_equal(pdf, HERE / "rects.pdf", tmp_path)
+
+
+def test_markers(tmp_path):
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.set_draw_color(0, 0, 255)
+    pdf.set_fill_color(255, 0, 0)
+    for i, shape in enumerate(MarkerShape):
+        xs = [20 + 35 * i, 30 + 35 * i]
+        pdf.markers(xs, [20, 30], shape=shape, size=6, style="DF")
+        pdf.markers(xs, [50, 60], shape=shape, size=6, style="DF", form_xobject=True)
+    assert_pdf_equal(pdf, HERE / "markers.pdf", tmp_path)
+
+
+def test_markers_form_xobject_reused():
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.markers([10, 20], [10, 20], form_xobject=True)
+    pdf.markers([30], [30], form_xobject=True)
+    pdf.markers([40], [40], size=2, form_xobject=True)
+    assert len(pdf._resource_catalog.form_xobjects) == 2
+    content = bytes(pdf.pages[1].contents).decode()
+    assert content.count("/I1 Do") == 3
+    assert content.count("/I2 Do") == 1
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_bulk_drawing_buffer_inputs(monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(fpdf.util, "numpy", None)
+    expected = _page_content(lambda pdf: pdf.polylines(TRIANGLES))
+    assert expected == _page_content(
+        lambda pdf: pdf.polylines(
+            [array("d", [v for point in points for v in point]) for points in TRIANGLES]
+        )
+    )
+    expected = _page_content(lambda pdf: pdf.markers([10, 20.5], [30, 40.25]))
+    assert expected == _page_content(
+        lambda pdf: pdf.markers(array("d", [10, 20.5]), array("d", [30, 40.25]))
+    )
+    expected = _page_content(lambda pdf: pdf.rects([(10, 20, 30, 40)]))
+    assert expected == _page_content(
+        lambda pdf: pdf.rects(memoryview(array("d", [10, 20, 30, 40])))
+    )
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_bulk_drawing_non_double_buffer_inputs(monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(fpdf.util, "numpy", None)
+    rects = [(10, 10, 20, 20), (40, 40, 10, 10)]
+    values = [v for rect in rects for v in rect]
+    expected = _page_content(lambda pdf: pdf.rects(rects))
+    assert expected == _page_content(lambda pdf: pdf.rects(array("i", values)))
+    assert expected == _page_content(
+        lambda pdf: pdf.rects(memoryview(array("f", values)))
+    )
+    expected = _page_content(lambda pdf: pdf.markers([10, 20], [30, 40]))
+    assert expected == _page_content(
+        lambda pdf: pdf.markers(array("h", [10, 20]), array("q", [30, 40]))
+    )
+    expected = _page_content(lambda pdf: pdf.polylines(TRIANGLES))
+    assert expected == _page_content(
+        lambda pdf: pdf.polylines(
+            [array("f", [v for point in points for v in point]) for points in TRIANGLES]
+        )
+    )
+    with pytest.raises(TypeError):
+        _page_content(lambda pdf: pdf.rects(array("d", [10, 10, 20, 20]).tobytes()))
+
+
+def test_bulk_drawing_numpy_inputs():
+    numpy = pytest.importorskip("numpy")
+    expected = _page_content(lambda pdf: pdf.polylines(TRIANGLES))
+    assert expected == _page_content(
+        lambda pdf: pdf.polylines([numpy.array(points) for points in TRIANGLES])
+    )
+    expected = _page_content(lambda pdf: pdf.markers([10, 20.5], [30, 40.25]))
+    assert expected == _page_content(
+        lambda pdf: pdf.markers(numpy.array([10, 20.5]), numpy.array([30, 40.25]))
+    )
+    expected = _page_content(lambda pdf: pdf.rects([(10, 20, 30, 40)]))
+    assert expected == _page_content(
+        lambda pdf: pdf.rects(numpy.array([(10, 20, 30, 40)]))
+    )
+
+
+def test_markers_with_mismatching_coordinates():
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    with pytest.raises(ValueError):
+        pdf.markers([10, 20], [10])
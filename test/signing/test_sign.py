@@ -1,7 +1,19 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+from endesive import signer
 
-from pathlib import Path
 from fpdf import FPDF
+from fpdf.output import OutputProducer
+from fpdf.sign import (
+    _SIGNATURE_BYTERANGE_PLACEHOLDER,
+    _SIGNATURE_CONTENTS_PLACEHOLDER,
+    SigningCredentials,
+    sign_content,
+    sign_documents,
+)
 from test.conftest import USING_ZLIB_NG, assert_pdf_equal, check_signature, EPOCH
 
 HERE = Path(__file__).resolve().parent
@@ -41,3 +53,76 @@ def test_sign_pkcs12_with_link(tmp_path):
     )
     assert_pdf_equal(pdf, HERE / "sign_pkcs12_with_link.pdf", tmp_path)
     check_signature(pdf, TRUSTED_CERT_PEMS)
+
+
+def test_sign_pkcs12_linearized():
+    pdf = FPDF()
+    pdf.set_creation_date(EPOCH)
+    pdf.set_font("Helvetica", size=30)
+    pdf.add_page()
+    pdf.text(x=80, y=50, text="Page 1/2")
+    pdf.add_page()
+    pdf.text(x=80, y=50, text="Page 2/2")
+    pdf.sign_pkcs12(HERE / "signing-certificate.p12", password=b"fpdf2")
+    check_signature(pdf, TRUSTED_CERT_PEMS, linearize=True)
+
+
+def _build_statement(i):
+    pdf = FPDF()
+    pdf.set_creation_date(EPOCH)
+    pdf.set_font("Helvetica", size=20)
+    pdf.add_page()
+    pdf.text(x=20, y=30, text=f"Statement #{i}")
+    return pdf
+
+
+def test_sign_documents():
+    credentials = SigningCredentials.from_pkcs12(
+        HERE / "signing-certificate.p12", password=b"fpdf2"
+    )
+    expected = []
+    for i in range(3):
+        pdf = _build_statement(i)
+        pdf.sign_pkcs12(HERE / "signing-certificate.p12", password=b"fpdf2")
+        expected.append(bytes(pdf.output()))
+    documents = (_build_statement(i) for i in range(3))
+    signed = [bytes(output) for output in sign_documents(documents, credentials)]
+    assert signed == expected
+    check_signature(_build_signed_statement(credentials), TRUSTED_CERT_PEMS)
+
+
+def _build_signed_statement(credentials):
+    pdf = _build_statement(0)
+    pdf.sign_with_credentials(credentials, reason="monthly statement")
+    return pdf
+
+
+def test_sign_content_placeholders_offsets():
+    credentials = SigningCredentials.from_pkcs12(
+        HERE / "signing-certificate.p12", password=b"fpdf2"
+    )
+    pdf = _build_signed_statement(credentials)
+    output_producer = OutputProducer(pdf)
+    with patch("fpdf.output.sign_content", side_effect=lambda *args: args[1]):
+        unsigned = output_producer.bufferize()
+    offsets = output_producer.sig_placeholders_offsets
+    assert offsets == (
+        unsigned.index(_SIGNATURE_BYTERANGE_PLACEHOLDER.encode()),
+        unsigned.index(_SIGNATURE_CONTENTS_PLACEHOLDER.encode()),
+    )
+    signed_with_offsets = sign_content(
+        signer, bytearray(unsigned), credentials, EPOCH, offsets
+    )
+    assert sign_content(signer, unsigned, credentials, EPOCH) == signed_with_offsets
+
+
+def test_sign_does_not_alter_endesive_clock():
+    pdf = _build_signed_statement(
+        SigningCredentials.from_pkcs12(
+            HERE / "signing-certificate.p12", password=b"fpdf2"
+        )
+    )
+    pdf.output()
+    assert abs(signer.datetime.now(timezone.utc) - datetime.now(timezone.utc)) < (
+        timedelta(minutes=1)
+    )
@@ -1,4 +1,5 @@
 # pylint: disable=no-self-use, protected-access
+from copy import deepcopy
 from io import BytesIO
 from pathlib import Path
 
@@ -476,3 +477,49 @@ def test_user_space_gradient_tracks_svg_image_transform(tmp_path):
         GENERATED_PDF_DIR / "gradient_user_space_tracks_svg_transform.pdf",
         tmp_path,
     )
+
+
+def test_svg_use_shared_form_xobject():
+    uses = "".join(f'<use href="#star" x="{i * 10}" y="{i}"/>' for i in range(50))
+    svg_data = (
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 500 60">'
+        '<defs><path id="star" d="M5,0 L8,10 L0,4 L10,4 L2,10 Z" fill="red"/></defs>'
+        f'{uses}<g stroke="blue">{uses}</g></svg>'
+    )
+    pdf = fpdf.FPDF()
+    pdf.compress = False
+    pdf.add_page()
+    pdf.image(BytesIO(svg_data.encode()), x=10, y=10, w=190)
+    streams = [
+        bytes(form.content_stream()).decode()
+        for _, form in pdf._resource_catalog.form_xobjects
+    ]
+    # One Form XObject for the star, unstroked & stroked, and one for the SVG image:
+    assert len(streams) == 3
+    assert all(stream.count(" l ") == 4 for stream in streams[:2])
+    assert streams[2].count(" Do") == 100
+    assert " l " not in streams[2]
+
+
+@pytest.mark.parametrize("use_count", (1, 3))
+def test_svg_use_small_reference_is_inlined(use_count):
+    uses = '<use href="#r"/>' * use_count
+    svg = fpdf.svg.SVGObject(
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">'
+        f'<defs><rect id="r" width="1" height="1"/></defs>{uses}</svg>'
+    )
+    assert len(svg.base_group.path_items) == use_count
+    for use_group in svg.base_group.path_items:
+        assert isinstance(use_group.path_items[0], fpdf.drawing.PaintedPath)
+
+
+def test_graphics_context_deepcopy_shares_path_elements():
+    path = fpdf.drawing.PaintedPath()
+    path.move_to(0, 0).line_to(1, 1).line_to(2, 0)
+    copied = deepcopy(path.get_graphics_context())
+    for item, copied_item in zip(
+        path.get_graphics_context().path_items, copied.path_items
+    ):
+        assert copied_item is item
+    copied.path_items.pop()
+    assert len(path.get_graphics_context().path_items) == 3
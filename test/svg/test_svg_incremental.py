@@ -0,0 +1,145 @@
+import logging
+import re
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+import fpdf
+from fpdf.errors import FPDFSvgLimitExceeded
+from fpdf.svg import IncrementalSVGObject, SVGLimits, SVGObject
+from ..conftest import assert_pdf_equal
+
+from . import parameters
+
+HERE = Path(__file__).resolve().parent
+GENERATED_PDF_DIR = HERE / "generated_pdf"
+
+
+def _page_operators(pdf):
+    content = bytes(pdf.pages[1].contents).decode("latin-1")
+    # Graphics states are registered in a different order,
+    # and empty groups are not rendered by incremental conversion:
+    content = re.sub(r"/GS\d+", "/GS", content)
+    while (stripped := re.sub(r"\bq\s+Q\b", "", content)) != content:
+        content = stripped
+    return content.split()
+
+
+def _many_paths_svg(paths_count):
+    paths = "".join(
+        f'<path d="M{i % 100},{i // 100} l5,5 l5,-5 z" fill="#{i % 256:02x}8040"/>'
+        for i in range(paths_count)
+    )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">'
+        f'<g id="layer1" stroke="black">{paths}</g></svg>'
+    ).encode()
+
+
+@pytest.mark.parametrize("svg_file", parameters.test_svg_sources)
+def test_svg_incremental_conversion_matches_svg_object(svg_file):
+    operators = []
+    for svg_class in (SVGObject, IncrementalSVGObject):
+        pdf = fpdf.FPDF(unit="pt")
+        pdf.add_page()
+        svg_class.from_file(svg_file).draw_to_page(pdf)
+        operators.append(_page_operators(pdf))
+    assert operators[0] == operators[1]
+
+
+def test_svg_incremental_image(tmp_path):
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.image(
+        parameters.svgfile("SVG_logo.svg"), x=20, y=20, w=80, incremental_svg=True
+    )
+    pdf.image(
+        parameters.svgfile("gradient_linear.svg"),
+        x=110,
+        y=20,
+        w=80,
+        incremental_svg=True,
+    )
+    assert_pdf_equal(pdf, GENERATED_PDF_DIR / "svg_incremental_image.pdf", tmp_path)
+
+
+def test_svg_incremental_memory_usage():
+    svg = _many_paths_svg(2000)
+    peak_memory_usages = []
+    for incremental_svg in (False, True):
+        pdf = fpdf.FPDF()
+        pdf.add_page()
+        tracemalloc.start()
+        try:
+            pdf.image(BytesIO(svg), w=100, incremental_svg=incremental_svg)
+            peak_memory_usages.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    assert peak_memory_usages[1] < peak_memory_usages[0] / 5
+
+
+def test_svg_incremental_retained_elements():
+    svg = IncrementalSVGObject(
+        BytesIO(
+            b"""<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">
+              <use href="#def"/>
+              <defs><rect id="def" width="1" height="1"/></defs>
+              <rect id="referenced" width="2" height="2"/>
+              <rect id="unreferenced" width="3" height="3"/>
+              <use href="#referenced" x="5"/>
+            </svg>"""
+        )
+    )
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    svg.draw_to_page(pdf)
+    assert set(svg.cross_references) == {"#def", "#referenced"}
+    with pytest.raises(fpdf.FPDFException, match="can only be drawn once"):
+        svg.draw_to_page(pdf)
+
+
+def test_svg_incremental_forward_reference(caplog):
+    svg = IncrementalSVGObject(
+        BytesIO(
+            b"""<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">
+              <use href="#later"/>
+              <rect id="later" width="2" height="2"/>
+            </svg>"""
+        )
+    )
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    with caplog.at_level(logging.WARNING):
+        svg.draw_to_page(pdf)
+    assert "Ignoring SVG <use> reference to #later" in caplog.text
+
+
+def test_svg_incremental_max_resolved_elements():
+    pdf = fpdf.FPDF()
+    pdf.svg_limits = SVGLimits(max_resolved_elements=1000)
+    pdf.add_page()
+    pdf.rect(10, 10, 10, 10)
+    page_content = bytes(pdf.pages[1].contents)
+    with pytest.raises(FPDFSvgLimitExceeded, match="max_resolved_elements"):
+        pdf.image(BytesIO(_many_paths_svg(2000)), w=100, incremental_svg=True)
+    # The partially drawn image has been removed:
+    assert bytes(pdf.pages[1].contents) == page_content
+
+
+def test_svg_incremental_max_use_depth():
+    groups = ['<g id="g0"><rect width="1" height="1"/></g>']
+    for level in range(1, 5):
+        groups.append(f'<g id="g{level}"><use href="#g{level - 1}"/></g>')
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1" viewBox="0 0 1 1">'
+        "<defs>" + "".join(groups) + '</defs><use href="#g4"/></svg>'
+    ).encode()
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.svg_limits = SVGLimits(max_use_depth=5)
+    pdf.image(BytesIO(svg), w=10, incremental_svg=True)
+    pdf.svg_limits = SVGLimits(max_use_depth=4)
+    with pytest.raises(FPDFSvgLimitExceeded, match="max_use_depth"):
+        pdf.image(BytesIO(svg), w=10, incremental_svg=True)
@@ -2,6 +2,7 @@ from pathlib import Path
 from pytest import raises
 import qrcode
 from fpdf.fpdf import FPDF
+from fpdf.errors import FPDFException
 from fpdf.template import FlexTemplate
 from ..conftest import assert_pdf_equal
 from test.template.charwrap_test_elements import elements as charwrap_elements
@@ -716,3 +717,90 @@ def test_flextemplate_keep_aspect_ratio_badinput():
     pdf = FPDF()
     with raises(TypeError):
         FlexTemplate(pdf, tmpl)
+
+
+COMPILED_ELEMENTS = [
+    {"name": "frame", "type": "B", "x1": 0, "y1": 0, "x2": 80, "y2": 40, "size": 0.5},
+    {"name": "sep", "type": "L", "x1": 5, "y1": 12, "x2": 75, "y2": 12},
+    {
+        "name": "company",
+        "type": "T",
+        "x1": 5,
+        "y1": 3,
+        "x2": 75,
+        "y2": 10,
+        "text": "ACME Corp.",
+        "bold": True,
+    },
+    {"name": "customer", "type": "T", "x1": 5, "y1": 15, "x2": 75, "y2": 22},
+    {
+        "name": "stamp",
+        "type": "B",
+        "x1": 60,
+        "y1": 25,
+        "x2": 75,
+        "y2": 35,
+        "background": 0xFF0000,
+        "priority": 1,
+    },
+]
+
+
+def test_flextemplate_compiled(tmp_path):
+    pdf = FPDF()
+    templ = FlexTemplate(pdf, COMPILED_ELEMENTS)
+    templ.compile(dynamic=["customer"])
+    for page in range(2):
+        pdf.add_page()
+        for i in range(3):
+            templ["customer"] = f"Customer #{page}-{i}"
+            templ.render(offsetx=20, offsety=20 + 60 * i, rotate=10 * i)
+        templ.render(offsetx=120, offsety=20, scale=0.5)
+    contents = bytes(pdf.pages[2].contents)
+    # Static layers before & after the dynamic elements:
+    assert contents.count(b" Do") == 8
+    assert b"ACME" not in contents
+    assert_pdf_equal(pdf, HERE / "flextemplate_compiled.pdf", tmp_path)
+
+
+def test_flextemplate_recompiled(tmp_path):
+    pdf = FPDF()
+    templ = FlexTemplate(pdf, COMPILED_ELEMENTS)
+    templ.compile(dynamic=["company"])
+    pdf.add_page()
+    templ.render()
+    templ.compile(dynamic=[])
+    pdf.add_page()
+    templ.render()
+    templ.load_elements(COMPILED_ELEMENTS[:2])
+    templ.compile(dynamic=[])
+    pdf.add_page()
+    templ.render()
+    # Each page is rendered like with a new template:
+    expected = FPDF()
+    for elements, dynamic in (
+        (COMPILED_ELEMENTS, ["company"]),
+        (COMPILED_ELEMENTS, []),
+        (COMPILED_ELEMENTS[:2], []),
+    ):
+        expected_templ = FlexTemplate(expected, elements)
+        expected_templ.compile(dynamic=dynamic)
+        expected.add_page()
+        expected_templ.render()
+    assert b"ACME" not in bytes(pdf.pages[2].contents)
+    assert_pdf_equal(pdf, expected, tmp_path)
+
+
+def test_flextemplate_compiled_badinput():
+    pdf = FPDF()
+    pdf.add_page()
+    templ = FlexTemplate(pdf, COMPILED_ELEMENTS)
+    with raises(FPDFException):
+        templ.compile(dynamic=["unknown"])
+    templ.compile()
+    templ["company"] = "Other Corp."
+    templ.render()  # text elements are dynamic by default
+    templ.compile(dynamic=[])
+    templ["company"] = "Other Corp."
+    with raises(FPDFException):
+        templ.render()
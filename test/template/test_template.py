@@ -2,7 +2,7 @@ from pathlib import Path
 from pytest import raises, warns
 import qrcode
 from fpdf.template import Template, FPDFException
-from ..conftest import assert_pdf_equal
+from ..conftest import EPOCH, assert_pdf_equal
 from test.template.charwrap_test_elements import elements as charwrap_elements
 
 HERE = Path(__file__).resolve().parent
@@ -616,3 +616,53 @@ def test_template_wrapmode(tmp_path):
     tmpl = Template(elements=charwrap_elements)
     tmpl.add_page()
     assert_pdf_equal(tmpl, HERE / "template_wrapmode.pdf", tmp_path)
+
+
+MAIL_MERGE_ELEMENTS = [
+    {"name": "frame", "type": "B", "x1": 10, "y1": 10, "x2": 200, "y2": 100},
+    {"name": "company", "type": "T", "x1": 15, "y1": 15, "x2": 100, "y2": 25},
+    {"name": "customer", "type": "T", "x1": 15, "y1": 30, "x2": 100, "y2": 40},
+]
+
+
+def fixed_creation_date(pdf):
+    pdf.creation_date = EPOCH
+
+
+def test_template_render_many():
+    tmpl = Template(elements=MAIL_MERGE_ELEMENTS, title="Mail merge")
+    tmpl.compile(dynamic=["customer"])
+    records = [
+        {"customer": "Jane Doe"},
+        [{"customer": "John Doe"}, {"customer": "John Doe (page 2)"}],
+    ]
+    results = list(tmpl.render_many(records, workers=1, setup=fixed_creation_date))
+    assert [result.record_index for result in results] == [0, 1]
+    for result, record in zip(results, records):
+        assert result.error is None and result.path is None
+        expected = Template(elements=MAIL_MERGE_ELEMENTS, title="Mail merge")
+        expected.compile(dynamic=["customer"])
+        fixed_creation_date(expected.pdf)
+        for page in [record] if isinstance(record, dict) else record:
+            expected.add_page()
+            expected["customer"] = page["customer"]
+        expected.render()
+        assert result.data == bytes(expected.pdf.output())
+
+
+def test_template_render_many_in_processes(tmp_path):
+    tmpl = Template(elements=MAIL_MERGE_ELEMENTS)
+    records = [{"customer": f"Customer {i}"} for i in range(6)]
+    records[3] = {"unknown": "value"}
+    results = list(
+        tmpl.render_many(
+            records, out_dir=tmp_path, workers=2, file_name="invoice-{index}.pdf"
+        )
+    )
+    assert [result.record_index for result in results] == list(range(6))
+    assert isinstance(results[3].error, FPDFException)
+    for result in results[:3] + results[4:]:
+        assert result.error is None and result.data is None
+        assert result.path == tmp_path / f"invoice-{result.record_index}.pdf"
+        assert result.path.read_bytes().startswith(b"%PDF-")
+    assert not (tmp_path / "invoice-3.pdf").exists()
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+
+from fpdf import FPDF, FPDFException, TextStyle
+from fpdf.enums import OutputIntentSubType
+from fpdf.output import PDFICCProfile
+from fpdf.util import builtin_srgb2014_bytes
+from test.conftest import EPOCH, assert_pdf_equal
+
+HERE = Path(__file__).resolve().parent
+FONTS_DIR = HERE / "fonts"
+LOGO = HERE / "image" / "png_images" / "c636287a4d7cb1a36362f7f236564cef.png"
+FILE_ID = "<0123456789ABCDEF0123456789ABCDEF><0123456789ABCDEF0123456789ABCDEF>"
+
+
+class PDF(FPDF):
+    def footer(self):
+        self.set_y(-15)
+        self.cell(0, 10, f"Page {self.page_no()}/{{nb}}", align="C")
+
+
+def configure(pdf_class=PDF):
+    pdf = pdf_class()
+    pdf.add_font("dejavu", fname=FONTS_DIR / "DejaVuSans.ttf")
+    pdf.add_font("roboto", fname=FONTS_DIR / "Roboto-Regular.ttf")
+    pdf.set_font("roboto", size=14)
+    pdf.set_fallback_fonts(["dejavu"])
+    pdf.set_section_title_styles(TextStyle(font_size_pt=20, color=(200, 0, 0)))
+    pdf.set_text_color(0, 0, 128)
+    pdf.set_margins(20, 20)
+    pdf.set_author("fpdf2")
+    pdf.add_output_intent(
+        OutputIntentSubType.PDFA,
+        "sRGB",
+        "IEC 61966-2-1:1999",
+        "http://www.color.org",
+        PDFICCProfile(contents=builtin_srgb2014_bytes(), n=3, alternate="DeviceRGB"),
+        "sRGB2014 (v2)",
+    )
+    pdf.preload_images([LOGO])
+    return pdf
+
+
+def render(pdf, name):
+    pdf.creation_date = EPOCH
+    pdf.add_page()
+    pdf.start_section(f"Invoice for {name}")
+    pdf.image(LOGO, w=30)
+    pdf.multi_cell(w=0, text=f"Dear {name}, this is your invoice ✓ — ☃")
+    return pdf
+
+
+def test_fork(tmp_path):
+    prototype = configure()
+    alice = prototype.fork()
+    bob = PDF.from_prototype(prototype)
+    assert isinstance(alice, PDF) and isinstance(bob, PDF)
+    assert_pdf_equal(render(alice, "Alice"), HERE / "fork.pdf", tmp_path)
+    render(bob, "Bob")
+    assert alice.pages_count == bob.pages_count == 1
+    # A forked document produces the same output as a newly configured one:
+    assert_pdf_equal(render(configure(), "Alice"), HERE / "fork.pdf", tmp_path)
+    # The prototype is left unchanged, and can be forked again:
+    assert not prototype.pages
+    assert prototype.fonts["roboto"].subset is not alice.fonts["roboto"].subset
+    assert len(prototype.fonts["roboto"].subset) == 2  # reserved glyphs
+    assert prototype.fonts["roboto"].cw is alice.fonts["roboto"].cw
+    ((image_name, prototype_info),) = prototype.image_cache.images.items()
+    assert prototype_info["usages"] == 0
+    assert alice.image_cache.images[image_name]["data"] is prototype_info["data"]
+    assert_pdf_equal(render(prototype.fork(), "Alice"), HERE / "fork.pdf", tmp_path)
+
+
+@pytest.mark.parametrize(
+    "font_file, variations",
+    (
+        ("Roboto-Variable.ttf", {"wght": 700}),
+        ("noto-sans-v42-latin-regular.woff2", None),
+        ("Roboto-Regular-without-notdef.ttf", None),
+    ),
+)
+def test_fork_modified_font(font_file, variations):
+    def configure_with_font():
+        pdf = FPDF()
+        pdf.add_font("font", fname=FONTS_DIR / font_file, variations=variations)
+        pdf.set_font("font", size=24)
+        pdf.set_text_shaping(True)
+        return pdf
+
+    def render_with_font(pdf):
+        pdf.creation_date = EPOCH
+        pdf.add_page()
+        pdf.cell(text="Forked fonts")
+        return bytes(pdf.output())
+
+    prototype = configure_with_font()
+    expected = render_with_font(configure_with_font())
+    assert render_with_font(prototype.fork()) == expected
+    assert render_with_font(prototype.fork()) == expected
+
+
+def test_fork_encrypted_document():
+    def configure_encrypted():
+        pdf = FPDF()
+        pdf.set_font("helvetica", size=12)
+        pdf.set_encryption(owner_password="fpdf2", user_password="1234")
+        pdf.file_id = lambda: FILE_ID
+        return pdf
+
+    def render_encrypted(pdf):
+        pdf.creation_date = EPOCH
+        pdf.add_page()
+        pdf.cell(text="Confidential")
+        return bytes(pdf.output())
+
+    prototype = configure_encrypted()
+    forked = prototype.fork()
+    assert forked._security_handler.fpdf is forked
+    assert render_encrypted(forked) == render_encrypted(configure_encrypted())
+
+
+def test_fork_badinput():
+    pdf = configure()
+    pdf.add_page()
+    with pytest.raises(FPDFException, match="without pages"):
+        pdf.fork()
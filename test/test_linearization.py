@@ -1,20 +1,176 @@
+import re
+import zlib
 from pathlib import Path
 
 import pytest
 
-from fpdf import FPDF
-from test.conftest import assert_pdf_equal
+from fpdf import FPDF, FPDFException
+from test.conftest import assert_pdf_equal, EPOCH
 
 HERE = Path(__file__).resolve().parent
+PNG_IMG_DIR = HERE / "image/png_images"
 
 
-@pytest.mark.xfail(
-    reason="Implementation not finished, cf. https://github.com/py-pdf/fpdf2/issues/62"
-)
 def test_linearization(tmp_path):
     pdf = FPDF()
     pdf.add_page()
-    pdf.image(
-        HERE / "image/png_images/66ac49ef3f48ac9482049e1ab57a53e9.png", x=150, y=150
-    )
+    pdf.image(PNG_IMG_DIR / "66ac49ef3f48ac9482049e1ab57a53e9.png", x=150, y=150)
     assert_pdf_equal(pdf, HERE / "linearization.pdf", tmp_path, linearize=True)
+
+
+def _build_multi_pages_doc():
+    pdf = FPDF()
+    pdf.set_creation_date(EPOCH)
+    pdf.add_font("DejaVu", fname=HERE / "fonts/DejaVuSans.ttf")
+    pdf.set_font("helvetica", size=24)
+    pdf.add_page()
+    pdf.cell(text="Cover page")
+    pdf.start_section("Cover")
+    for page_number in range(2, 6):
+        pdf.add_page(orientation="L" if page_number == 3 else "P")
+        pdf.start_section(f"Page {page_number}")
+        # This font & image are shared by all pages but the 1st one:
+        pdf.set_font("DejaVu", size=14)
+        pdf.cell(text=f"Page {page_number} - Ŝ")
+        pdf.image(PNG_IMG_DIR / "ba2b2b6e72ca0e4683bb640e2d5572f8.png", x=50, y=50)
+        if page_number == 4:  # this image is private to this page
+            pdf.image(PNG_IMG_DIR / "66ac49ef3f48ac9482049e1ab57a53e9.png", y=100)
+        pdf.link(x=10, y=10, w=20, h=20, link=pdf.add_link(page=1))
+    return pdf
+
+
+def test_linearization_multiple_pages(tmp_path):
+    assert_pdf_equal(
+        _build_multi_pages_doc(),
+        HERE / "linearization_multiple_pages.pdf",
+        tmp_path,
+        linearize=True,
+    )
+
+
+def test_linearization_with_outlines_page_mode(tmp_path):
+    pdf = _build_multi_pages_doc()
+    pdf.page_mode = "USE_OUTLINES"
+    assert_pdf_equal(
+        pdf, HERE / "linearization_use_outlines.pdf", tmp_path, linearize=True
+    )
+
+
+def test_linearization_hint_tables():
+    pdf = _build_multi_pages_doc()
+    pdf_bytes = bytes(pdf.output(linearize=True))
+    offset_per_obj_id = {
+        int(match.group(1)): match.start(1)
+        for match in re.finditer(rb"(?<=\n)(\d+) 0 obj\n", pdf_bytes)
+    }
+    linearization = _parse_dict(pdf_bytes, min(offset_per_obj_id.values()))
+    assert linearization["/L"] == len(pdf_bytes)
+    assert linearization["/N"] == pdf.pages_count == 5
+    hint_offset, hint_length = re.match(
+        rb"\[\s*(\d+)\s+(\d+)\]", linearization["/H"]
+    ).groups()
+    hint_offset, hint_length = int(hint_offset), int(hint_length)
+    hint_stream = _parse_dict(pdf_bytes, hint_offset)
+    data_start = pdf_bytes.index(b"stream\n", hint_offset) + len(b"stream\n")
+    hint_data = zlib.decompress(
+        pdf_bytes[data_start : data_start + hint_stream["/Length"]]
+    )
+
+    def without_hint_stream(offset):
+        return offset - hint_length if offset > hint_offset else offset
+
+    reader = _BitReader(hint_data)
+    # Page offset hint table:
+    least_objects_count = reader.read(32)
+    first_page_offset = reader.read(32)
+    objects_count_bits = reader.read(16)
+    least_page_length = reader.read(32)
+    page_length_bits = reader.read(16)
+    reader.read(32 + 16 + 32 + 16)  # content stream offsets & lengths
+    shared_refs_count_bits = reader.read(16)
+    shared_identifier_bits = reader.read(16)
+    reader.read(16 + 16)  # fractional positions of shared objects references
+    objects_counts = [
+        least_objects_count + delta
+        for delta in reader.read_all(objects_count_bits, pdf.pages_count)
+    ]
+    page_lengths = [
+        least_page_length + delta
+        for delta in reader.read_all(page_length_bits, pdf.pages_count)
+    ]
+    shared_refs_counts = reader.read_all(shared_refs_count_bits, pdf.pages_count)
+    shared_identifiers = reader.read_all(
+        shared_identifier_bits, sum(shared_refs_counts)
+    )
+
+    # The first page section starts with the page object referenced by /O:
+    first_page_obj_id = linearization["/O"]
+    first_page_obj_offset = offset_per_obj_id[first_page_obj_id]
+    assert without_hint_stream(first_page_obj_offset) == first_page_offset
+    assert offset_per_obj_id[first_page_obj_id] == hint_offset + hint_length
+    assert first_page_offset + page_lengths[0] == without_hint_stream(
+        linearization["/E"]
+    )
+    # The other pages sections follow, starting with object number 1,
+    # and each page section starts with its page object:
+    obj_id, offset = 1, linearization["/E"]
+    for objects_count, page_length in zip(objects_counts[1:], page_lengths[1:]):
+        assert offset_per_obj_id[obj_id] == offset
+        assert re.match(
+            rb"\d+ 0 obj\n<<\n(/[^\n]+\n)*/Type /Page\n", pdf_bytes[offset:]
+        )
+        obj_id += objects_count
+        offset += page_length
+    assert shared_refs_counts[0] == 0
+    assert all(count > 0 for count in shared_refs_counts[1:])
+
+    # Shared object hint table:
+    reader = _BitReader(hint_data[hint_stream["/S"] :])
+    first_shared_obj_id = reader.read(32)
+    first_shared_offset = reader.read(32)
+    first_page_groups_count = reader.read(32)
+    groups_count = reader.read(32)
+    assert reader.read(16) == 0  # a single object per group
+    assert first_page_groups_count == objects_counts[0]
+    assert groups_count > first_page_groups_count  # there are shared objects
+    # Shared objects are located right after the last page section:
+    assert first_shared_obj_id == obj_id
+    assert offset_per_obj_id[first_shared_obj_id] == offset
+    assert without_hint_stream(offset) == first_shared_offset
+    assert max(shared_identifiers) < groups_count
+
+
+def test_linearization_of_encrypted_document():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_encryption(owner_password="fpdf2")
+    with pytest.raises(FPDFException):
+        pdf.output(linearize=True)
+
+
+def _parse_dict(pdf_bytes, obj_offset):
+    "Minimal parser of the direct numeric & array values of a dictionary object"
+    dict_end = pdf_bytes.index(b">>", obj_offset)
+    values = {}
+    for key, value in re.findall(
+        rb"(/\w+)\s+(\[[^\]]*\]|\d+)", pdf_bytes[obj_offset:dict_end]
+    ):
+        values[key.decode()] = value if value.startswith(b"[") else int(value)
+    return values
+
+
+class _BitReader:
+    def __init__(self, data):
+        self.bits = "".join(f"{byte:08b}" for byte in data)
+        self.position = 0
+
+    def read(self, bits):
+        value = int(self.bits[self.position : self.position + bits] or "0", 2)
+        self.position += bits
+        return value
+
+    def read_all(self, bits, count):
+        "Reads a hint table item for each page or group, ending on a byte boundary"
+        values = [self.read(bits) for _ in range(count)]
+        self.position += -self.position % 8
+        return values
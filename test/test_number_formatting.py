@@ -0,0 +1,119 @@
+from decimal import Decimal
+
+import pytest
+
+from fpdf import FPDF
+from fpdf.number_formatting import (
+    CONTENT_FORMATTER,
+    DRAWING_FORMATTER,
+    PATTERN_FORMATTER,
+    NumberFormatter,
+)
+
+
+NUMBERS = (0, 0.0, -0.0, 3, -7, 1.5, -0.00004, 0.00005, 2.0, -2.5, 123.456789, 1e-13)
+NUMBERS += tuple(i / 7 - 20 for i in range(300))
+
+
+@pytest.fixture
+def restore_formatters():
+    decimals = [f.decimals for f in (CONTENT_FORMATTER, DRAWING_FORMATTER)]
+    yield
+    CONTENT_FORMATTER.decimals, DRAWING_FORMATTER.decimals = decimals
+
+
+@pytest.mark.parametrize(
+    "formatter, number, formatted",
+    (
+        (NumberFormatter(4), 1.23456, "1.2346"),
+        (NumberFormatter(4), 1.5, "1.5"),
+        (NumberFormatter(4), 2.0, "2"),
+        (NumberFormatter(4), 10, "10"),
+        (NumberFormatter(4), -0.00001, "-0"),
+        (NumberFormatter(4, negative_zero=False), -0.00001, "0"),
+        (NumberFormatter(2, strip_zeros=False), 1.5, "1.50"),
+        (NumberFormatter(2, strip_zeros=False), 10, "10.00"),
+        (NumberFormatter(0), 12.7, "13"),
+        (NumberFormatter(0), 100.0, "100"),
+        (NumberFormatter(3), Decimal("1.2345"), "1.234"),
+    ),
+)
+def test_number_formatter(formatter, number, formatted):
+    assert formatter.format(number) == formatted
+    assert formatter.format(number) == formatted  # cached
+    assert formatter.join([number]) == formatted
+
+
+@pytest.mark.parametrize(
+    "formatter, reference_format",
+    (
+        (CONTENT_FORMATTER, lambda x: f"{x:.2f}"),
+        (DRAWING_FORMATTER, lambda x: f"{x:.4f}".rstrip("0").rstrip(".")),
+        (
+            PATTERN_FORMATTER,
+            lambda x: f"{0 if abs(x) < 5e-9 else x:.8f}".rstrip("0").rstrip("."),
+        ),
+    ),
+)
+def test_number_formatter_batches(formatter, reference_format):
+    expected = [reference_format(number) for number in NUMBERS]
+    assert [formatter.format(number) for number in NUMBERS] == expected
+    assert formatter.format_many(NUMBERS) == expected
+    assert formatter.join(NUMBERS) == " ".join(expected)
+    assert formatter.join(NUMBERS[:3]) == " ".join(expected[:3])
+    assert formatter.join(()) == ""
+
+
+def test_number_formatter_fill():
+    assert CONTENT_FORMATTER.fill("%s %s m", (1, -2.5)) == "1.00 -2.50 m"
+    assert DRAWING_FORMATTER.fill("%s %s m", (1, -2.5)) == "1 -2.5 m"
+
+
+def test_number_formatter_decimals_change():
+    formatter = NumberFormatter(4)
+    assert formatter.format(1.23456) == "1.2346"
+    assert formatter.format(0.25) == "0.25"
+    cache = formatter._cache  # pylint: disable=protected-access
+    formatter.decimals = 1
+    # The cache possibly used by other threads is left untouched:
+    assert cache == {0.25: "0.25"}
+    assert formatter.format(0.25) == "0.2"
+    assert formatter.format(1.23456) == "1.2"
+    assert formatter.join((1.23456, 2.98)) == "1.2 3"
+    with pytest.raises(ValueError):
+        formatter.decimals = -1
+
+
+def test_number_formatter_bounded_cache():
+    formatter = NumberFormatter(4, cache_size=10)
+    for i in range(100):
+        assert formatter.format(i / 8) == str(i / 8).rstrip("0").rstrip(".")
+    assert len(formatter._cache) <= 10  # pylint: disable=protected-access
+    # Numbers with long representations are not cached:
+    formatter.format(1 / 3)
+    assert 1 / 3 not in formatter._cache  # pylint: disable=protected-access
+
+
+def _build_doc():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("helvetica", size=13.3333)
+    pdf.set_line_width(0.333)
+    for i in range(20):
+        pdf.ellipse(10 + i / 3, 20 + i / 7, 30 + i / 11, 15)
+        pdf.cell(50, 10, f"Cell {i}", border=1)
+    with pdf.new_path(x=10, y=10) as path:
+        for i in range(50):
+            path.line_to(10 + i / 3, 10 + i / 7)
+    return pdf
+
+
+def test_lower_precision_shrinks_output(restore_formatters):
+    # pylint: disable=unused-argument
+    default_contents = bytes(_build_doc().pages[1].contents)
+    assert b"13.33 Tf" in default_contents
+    CONTENT_FORMATTER.decimals = 1
+    DRAWING_FORMATTER.decimals = 1
+    contents = bytes(_build_doc().pages[1].contents)
+    assert b"13.3 Tf" in contents
+    assert len(contents) < len(default_contents) * 0.9
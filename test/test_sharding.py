@@ -0,0 +1,88 @@
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from fpdf import FPDF, FPDFException, TextStyle
+from fpdf.sharding import render_sharded
+from test.conftest import EPOCH, assert_pdf_equal
+
+HERE = Path(__file__).resolve().parent
+PNG_DIR = HERE / "image" / "png_images"
+LOGOS = (
+    PNG_DIR / "c636287a4d7cb1a36362f7f236564cef.png",
+    PNG_DIR / "e59ec0cfb8ab64558099543dc19f8378.png",
+)
+
+
+class PDF(FPDF):
+    def footer(self):
+        self.set_y(-15)
+        self.cell(0, 10, "Page {nb}", align="C")
+
+
+def new_document():
+    pdf = PDF()
+    pdf.creation_date = EPOCH
+    pdf.add_font("dejavu", fname=HERE / "fonts" / "DejaVuSans.ttf")
+    pdf.set_font("dejavu", size=14)
+    pdf.set_section_title_styles(TextStyle(font_size_pt=16))
+    return pdf
+
+
+def render_shard(pdf, shard):
+    for i in range(3):
+        pdf.add_page()
+        pdf.start_section(f"Shard {shard} - page {i}")
+        pdf.cell(text=f"Shard {shard} — page {i} — {'é' * shard}✓")
+        pdf.ln()
+        if i == 1:
+            pdf.image(LOGOS[shard % 2], w=30)
+        with pdf.local_context(fill_opacity=0.2 + shard / 10):
+            pdf.rect(10, 200, 50, 20, style="F")
+        pdf.set_link(name=f"shard{shard}-page{i}")
+        # Link to a destination defined by another shard:
+        pdf.cell(text="Next shard", link=f"#shard{(shard + 1) % 3}-page0")
+        pdf.ln()
+        # Link to a destination defined by the same shard:
+        pdf.cell(text="First page of this shard", link=pdf.add_link(page=pdf.page - i))
+
+
+def test_render_sharded(tmp_path):
+    producers = [partial(render_shard, shard=shard) for shard in range(3)]
+    pdf = render_sharded(new_document, producers, workers=2)
+    assert pdf.pages_count == 9
+    pdf.add_page()
+    pdf.cell(text="Back cover")
+    assert_pdf_equal(pdf, HERE / "render_sharded.pdf", tmp_path)
+    in_process = render_sharded(new_document, producers, workers=1)
+    in_process.add_page()
+    in_process.cell(text="Back cover")
+    assert bytes(in_process.output()) == bytes(pdf.output())
+
+
+def new_document_with_page():
+    pdf = new_document()
+    pdf.add_page()
+    return pdf
+
+
+def add_font_in_shard(pdf):
+    pdf.add_font("dejavu-bold", fname=HERE / "fonts" / "DejaVuSans-Bold.ttf")
+    pdf.set_font("dejavu-bold")
+    pdf.add_page()
+    pdf.cell(text="Hello")
+
+
+def define_destination(pdf):
+    pdf.add_page()
+    pdf.set_link(name="intro")
+
+
+def test_render_sharded_badinput():
+    with pytest.raises(FPDFException, match="without pages"):
+        render_sharded(new_document_with_page, [define_destination], workers=1)
+    with pytest.raises(FPDFException, match="must be added by new_document"):
+        render_sharded(new_document, [add_font_in_shard], workers=1)
+    with pytest.raises(FPDFException, match="defined by several document shards"):
+        render_sharded(new_document, [define_destination] * 2, workers=1)
@@ -468,3 +468,24 @@ def test_tcols_ln_with_custom_height():
     # not to the first line of the next paragraph.
     assert heights[1] == 16
     assert heights[2] == heights[3] == heights[0]
+
+
+def test_tcols_render_consumes_paragraphs():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=12)
+    cols = pdf.text_columns()
+    with cols.paragraph() as par:
+        par.write(text="First paragraph")
+    cols.write(text="Second paragraph")
+    cols.render()
+    # pylint: disable=protected-access
+    assert len(cols._paragraphs) == 1  # the paragraph still being written
+    y = pdf.y
+    cols.write(text=", continued")
+    cols.render()
+    assert pdf.y > y
+    assert len(cols._paragraphs) == 1
+    cols.end_paragraph()
+    cols.render()
+    assert not cols._paragraphs